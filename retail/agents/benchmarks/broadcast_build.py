@@ -0,0 +1,171 @@
+"""Microbenchmark for building broadcast messages with an S3 image header.
+
+Times ``Broadcast.build_broadcast_template_message`` for a campaign
+whose template header is an S3-keyed image, once per mode:
+
+- ``uncached``: the presigned-URL cache is disabled, so every message
+  builds its own ``S3Service`` (a boto3 client) and signs the header,
+  which is what every message paid before the cache existed.
+- ``cached``: messages go through a ``PresignedUrlCache``; only the
+  first warmup message signs.
+
+Signing uses the real boto3 client, which needs no network to presign;
+placeholder credentials are supplied for the run when none are set.
+The shared cache is a process-local ``LocMemCache`` unless
+``use_configured_cache`` is set, in which case the Django ``default``
+cache (Redis) is used and its round trip is part of the measurement.
+"""
+
+import os
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, List, Optional
+from unittest.mock import MagicMock, patch
+
+from django.core.cache.backends.locmem import LocMemCache
+from django.test import override_settings
+
+from retail.agents.benchmarks.webhook_pipeline import summarize_latencies
+from retail.agents.domains.agent_webhook.services import broadcast as broadcast_module
+from retail.agents.domains.agent_webhook.services.broadcast import Broadcast
+from retail.services.aws_s3.presigned_url_cache import PresignedUrlCache
+
+
+_PLACEHOLDER_AWS_ENV = {
+    "AWS_ACCESS_KEY_ID": "benchmark",
+    "AWS_SECRET_ACCESS_KEY": "benchmark",
+    "AWS_DEFAULT_REGION": "us-east-1",
+}
+
+
+@dataclass
+class BroadcastBuildConfig:
+    """Knobs for a single microbenchmark run."""
+
+    messages: int = 500
+    warmup: int = 5
+    header_key: str = "templates/benchmark/campaign_header.png"
+    use_configured_cache: bool = False
+
+
+@dataclass
+class ModeResult:
+    latencies_us: List[float] = field(default_factory=list)
+    wall_seconds: float = 0.0
+    s3_services_built: int = 0
+    urls_signed: int = 0
+
+    def as_dict(self) -> Dict[str, Any]:
+        count = len(self.latencies_us)
+        return {
+            "per_message_us": summarize_latencies(self.latencies_us),
+            "wall_seconds": round(self.wall_seconds, 4),
+            "messages_per_second": (
+                round(count / self.wall_seconds, 2) if self.wall_seconds else 0.0
+            ),
+            "s3_services_built": self.s3_services_built,
+            "urls_signed": self.urls_signed,
+        }
+
+
+@dataclass
+class BroadcastBuildReport:
+    config: BroadcastBuildConfig
+    modes: Dict[str, ModeResult] = field(default_factory=dict)
+
+    def as_dict(self) -> Dict[str, Any]:
+        modes = {name: result.as_dict() for name, result in self.modes.items()}
+        report = {
+            "benchmark": "broadcast_build_header_presign",
+            "config": asdict(self.config),
+            "modes": modes,
+        }
+        if "uncached" in modes and "cached" in modes:
+            cached_mean = modes["cached"]["per_message_us"]["mean"]
+            uncached_mean = modes["uncached"]["per_message_us"]["mean"]
+            report["speedup"] = (
+                round(uncached_mean / cached_mean, 1) if cached_mean else None
+            )
+        return report
+
+
+class BroadcastBuildBenchmark:
+    """Runs the ``uncached`` and ``cached`` modes and reports both."""
+
+    def __init__(self, config: Optional[BroadcastBuildConfig] = None):
+        self.config = config or BroadcastBuildConfig()
+        self.handler = Broadcast(flows_service=MagicMock(), audit_func=MagicMock())
+        self.template = MagicMock()
+        self.template.current_version.template_name = "benchmark_campaign"
+        self.template.metadata = {
+            "header": {"header_type": "IMAGE", "text": self.config.header_key},
+            "language": "pt_BR",
+        }
+
+    def run(self) -> BroadcastBuildReport:
+        report = BroadcastBuildReport(config=self.config)
+        aws_env = {
+            name: value
+            for name, value in _PLACEHOLDER_AWS_ENV.items()
+            if not os.environ.get(name)
+        }
+        with patch.dict(os.environ, aws_env):
+            with override_settings(S3_PRESIGNED_URL_CACHE_SECONDS=0):
+                report.modes["uncached"] = self._run_mode(PresignedUrlCache())
+            cached = PresignedUrlCache(cache_backend=self._shared_cache())
+            cached.backend.delete(cached.cache_key(self.config.header_key))
+            report.modes["cached"] = self._run_mode(cached)
+        return report
+
+    def _shared_cache(self):
+        if self.config.use_configured_cache:
+            return None
+        backend = LocMemCache("broadcast-build-benchmark", {})
+        backend.clear()
+        return backend
+
+    def _run_mode(self, presigned_urls: PresignedUrlCache) -> ModeResult:
+        result = ModeResult()
+        real_s3_service = broadcast_module.S3Service
+
+        def counting_s3_service(*args, **kwargs):
+            service = real_s3_service(*args, **kwargs)
+            sign = service.generate_presigned_url
+
+            def counting_sign(*sign_args, **sign_kwargs):
+                result.urls_signed += 1
+                return sign(*sign_args, **sign_kwargs)
+
+            result.s3_services_built += 1
+            service.generate_presigned_url = counting_sign
+            return service
+
+        with patch.object(
+            broadcast_module, "S3Service", side_effect=counting_s3_service
+        ), patch.object(
+            broadcast_module, "get_presigned_url_cache", return_value=presigned_urls
+        ):
+            for index in range(self.config.warmup):
+                self._build(index)
+            result.s3_services_built = result.urls_signed = 0
+
+            started = time.perf_counter()
+            for index in range(self.config.messages):
+                message_started = time.perf_counter()
+                self._build(index)
+                result.latencies_us.append(
+                    (time.perf_counter() - message_started) * 1_000_000
+                )
+            result.wall_seconds = time.perf_counter() - started
+        return result
+
+    def _build(self, index: int) -> Dict[str, Any]:
+        return self.handler.build_broadcast_template_message(
+            data={
+                "template_variables": {"1": f"Cliente {index}", "2": str(index)},
+                "contact_urn": f"whatsapp:55119{index:08d}",
+            },
+            channel_uuid="benchmark-channel",
+            project_uuid="benchmark-project",
+            template=self.template,
+        )
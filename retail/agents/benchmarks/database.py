@@ -0,0 +1,24 @@
+"""Throwaway database shared by the benchmark management commands.
+
+Benchmarks write real rows, so they never run against the configured
+database: ``benchmark_database`` swaps the default connection to a
+test database for the duration of the block and drops it afterwards
+(unless ``keepdb`` asks to reuse it between runs).
+"""
+
+from contextlib import contextmanager
+
+from django.db import connection
+from django.test.utils import setup_test_environment, teardown_test_environment
+
+
+@contextmanager
+def benchmark_database(keepdb: bool = False):
+    setup_test_environment()
+    old_name = connection.settings_dict["NAME"]
+    connection.creation.create_test_db(verbosity=0, autoclobber=True, keepdb=keepdb)
+    try:
+        yield
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0, keepdb=keepdb)
+        teardown_test_environment()
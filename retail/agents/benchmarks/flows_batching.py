@@ -0,0 +1,244 @@
+"""Throughput benchmark for batched versus per-contact Flows dispatch.
+
+Sends the same set of contacts to a stub Flows server over real HTTP,
+once per mode, through ``FlowsService`` and the production
+``FlowsClient`` (``RequestClient`` included):
+
+- ``unbatched``: one ``whatsapp_broadcasts`` call per contact, which is
+  what ``Broadcast.send_message`` does with batching disabled.
+- ``batched``: contacts are grouped with ``batch_digest`` (the key the
+  ``FlowsBroadcastBatcher`` uses) and each group is posted in chunks of
+  ``max_urns`` URNs, as ``flush_batched_dispatch`` does.
+
+The stub server runs in a background thread on ``127.0.0.1``, answers
+the module-token request made by ``InternalAuthentication`` and
+sleeps ``flows_latency_ms`` per broadcast call to stand in for Flows'
+own processing time. The Redis round trips of parking a contact and
+the PENDING row bookkeeping are not part of the measurement; the
+report isolates the HTTP fan-out the batching removes. The circuit
+breaker is disabled for the run so no Redis is needed.
+"""
+
+import json
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional
+
+from django.test import override_settings
+
+from retail.agents.benchmarks.webhook_pipeline import summarize_latencies
+from retail.agents.domains.agent_webhook.services.broadcast_batcher import (
+    BatchedDispatch,
+    batch_digest,
+)
+from retail.clients.flows.client import FlowsClient
+from retail.services.flows.service import FlowsService
+
+
+BROADCASTS_PATH = "/api/v2/internals/whatsapp_broadcasts"
+TOKEN_PATH = "/oidc/token"
+
+
+@dataclass
+class FlowsBatchingConfig:
+    """Knobs for a single benchmark run."""
+
+    contacts: int = 500
+    # Number of distinct rendered payloads the contacts are spread over;
+    # 1 is a campaign where every contact gets the same message.
+    distinct_payloads: int = 5
+    max_urns: int = 100
+    flows_latency_ms: float = 5.0
+
+
+class StubFlowsServer:
+    """Local HTTP server standing in for Flows and its token endpoint."""
+
+    def __init__(self, latency_ms: float = 0.0):
+        self.latency_ms = latency_ms
+        self.broadcast_calls = 0
+        self.urns_received = 0
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler_class())
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def __enter__(self) -> "StubFlowsServer":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+
+    def _record_broadcast(self, payload: Dict[str, Any]) -> int:
+        with self._lock:
+            self.broadcast_calls += 1
+            self.urns_received += len(payload.get("urns") or [])
+            return self.broadcast_calls
+
+    def _handler_class(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+                if self.path == TOKEN_PATH:
+                    self._reply({"access_token": "benchmark"})
+                    return
+                if self.path != BROADCASTS_PATH:
+                    self._reply({"detail": "not found"}, status=404)
+                    return
+                broadcast_id = stub._record_broadcast(json.loads(body or b"{}"))
+                if stub.latency_ms:
+                    time.sleep(stub.latency_ms / 1000.0)
+                self._reply({"id": broadcast_id, "status": "queued"})
+
+            def _reply(self, payload: Dict[str, Any], status: int = 200) -> None:
+                encoded = json.dumps(payload).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(encoded)))
+                self.end_headers()
+                self.wfile.write(encoded)
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+
+@dataclass
+class ModeResult:
+    call_latencies_ms: List[float] = field(default_factory=list)
+    wall_seconds: float = 0.0
+    flows_calls: int = 0
+    contacts: int = 0
+
+    def as_dict(self) -> Dict[str, Any]:
+        def per_second(count: int) -> float:
+            return round(count / self.wall_seconds, 2) if self.wall_seconds else 0.0
+
+        return {
+            "per_call_ms": summarize_latencies(self.call_latencies_ms),
+            "wall_seconds": round(self.wall_seconds, 4),
+            "flows_calls": self.flows_calls,
+            "contacts": self.contacts,
+            "calls_per_second": per_second(self.flows_calls),
+            "contacts_per_second": per_second(self.contacts),
+        }
+
+
+@dataclass
+class FlowsBatchingReport:
+    config: FlowsBatchingConfig
+    modes: Dict[str, ModeResult] = field(default_factory=dict)
+
+    def as_dict(self) -> Dict[str, Any]:
+        modes = {name: result.as_dict() for name, result in self.modes.items()}
+        report = {
+            "benchmark": "flows_broadcast_batching",
+            "config": asdict(self.config),
+            "modes": modes,
+        }
+        if "unbatched" in modes and "batched" in modes:
+            unbatched = modes["unbatched"]["contacts_per_second"]
+            batched = modes["batched"]["contacts_per_second"]
+            report["speedup"] = round(batched / unbatched, 1) if unbatched else None
+        return report
+
+
+class FlowsBatchingBenchmark:
+    """Runs the ``unbatched`` and ``batched`` modes and reports both."""
+
+    def __init__(self, config: Optional[FlowsBatchingConfig] = None):
+        self.config = config or FlowsBatchingConfig()
+
+    def messages(self) -> List[Dict[str, Any]]:
+        return [
+            {
+                "project": "benchmark-project",
+                "channel": "benchmark-channel",
+                "urns": [f"whatsapp:55119{index:08d}"],
+                "msg": {
+                    "template": {
+                        "name": "benchmark_campaign",
+                        "variables": [
+                            f"Oferta {index % max(1, self.config.distinct_payloads)}"
+                        ],
+                    }
+                },
+            }
+            for index in range(self.config.contacts)
+        ]
+
+    def run(self) -> FlowsBatchingReport:
+        report = FlowsBatchingReport(config=self.config)
+        with StubFlowsServer(latency_ms=self.config.flows_latency_ms) as server:
+            with override_settings(
+                FLOWS_REST_ENDPOINT=server.base_url,
+                OIDC_OP_TOKEN_ENDPOINT=f"{server.base_url}{TOKEN_PATH}",
+                CIRCUIT_BREAKER_ENABLED=False,
+            ):
+                flows_service = FlowsService(client=FlowsClient())
+                report.modes["unbatched"] = self._run_mode(
+                    server, flows_service, self._unbatched_calls()
+                )
+                report.modes["batched"] = self._run_mode(
+                    server, flows_service, self._batched_calls()
+                )
+        return report
+
+    def _unbatched_calls(self) -> List[Dict[str, Any]]:
+        return self.messages()
+
+    def _batched_calls(self) -> List[Dict[str, Any]]:
+        batches: Dict[str, BatchedDispatch] = {}
+        urns: Dict[str, List[str]] = {}
+        for message in self.messages():
+            key = batch_digest(message)
+            batches.setdefault(
+                key,
+                BatchedDispatch(
+                    batch_key=key,
+                    message={k: v for k, v in message.items() if k != "urns"},
+                ),
+            )
+            urns.setdefault(key, []).extend(message["urns"])
+
+        max_urns = max(1, self.config.max_urns)
+        calls = []
+        for key, batch in batches.items():
+            for start in range(0, len(urns[key]), max_urns):
+                chunk = urns[key][start:][:max_urns]
+                calls.append(batch.message_for(chunk))
+        return calls
+
+    @staticmethod
+    def _run_mode(
+        server: StubFlowsServer,
+        flows_service: FlowsService,
+        calls: List[Dict[str, Any]],
+    ) -> ModeResult:
+        result = ModeResult()
+        calls_before, urns_before = server.broadcast_calls, server.urns_received
+
+        started = time.perf_counter()
+        for message in calls:
+            call_started = time.perf_counter()
+            flows_service.send_whatsapp_broadcast(message)
+            result.call_latencies_ms.append(
+                (time.perf_counter() - call_started) * 1000.0
+            )
+        result.wall_seconds = time.perf_counter() - started
+
+        result.flows_calls = server.broadcast_calls - calls_before
+        result.contacts = server.urns_received - urns_before
+        return result
@@ -0,0 +1,146 @@
+"""Local stand-ins for the external dependencies of the webhook pipeline.
+
+The benchmark exercises our own code paths (view, task, use case,
+buffer, flush) end to end, so only the network hops we do not own are
+replaced:
+
+- ``FakeLambdaClient``: returns a canned, boto3-shaped ``invoke``
+  response instead of calling AWS Lambda.
+- ``StubFlowsClient``: answers ``send_whatsapp_broadcast`` with a
+  Flows-shaped body carrying a fresh broadcast id.
+- ``InMemoryS3Service``: keeps trace files in a dict instead of S3.
+
+Each stand-in can sleep for a fixed latency to approximate the real
+round trip, and records how often it was hit so the report can show
+calls per execution. Postgres and Redis are the real local services.
+"""
+
+import io
+import itertools
+import json
+import threading
+import time
+from typing import Any, BinaryIO, Dict, Optional
+from uuid import uuid4
+
+from retail.clients.aws_s3.client import S3MultipartUpload
+from retail.interfaces.clients.aws_lambda.client import AwsLambdaClientInterface
+from retail.interfaces.clients.flows.interface import FlowsClientInterface
+from retail.interfaces.services.aws_s3 import S3ServiceInterface
+
+
+def _sleep_ms(latency_ms: float) -> None:
+    if latency_ms > 0:
+        time.sleep(latency_ms / 1000.0)
+
+
+class FakeLambdaClient(AwsLambdaClientInterface):
+    """Lambda client that answers every invoke with a canned payload."""
+
+    def __init__(self, response_payload: Dict[str, Any], latency_ms: float = 0.0):
+        self.response_payload = response_payload
+        self.latency_ms = latency_ms
+        self.invocations = 0
+
+    def create_function(self, function_name: str, zip_bytes: bytes):
+        raise NotImplementedError("FakeLambdaClient only supports invoke")
+
+    def update_function_code(self, function_name: str, zip_bytes: bytes):
+        raise NotImplementedError("FakeLambdaClient only supports invoke")
+
+    def invoke(self, function_name: str, payload: dict) -> Dict[str, Any]:
+        self.invocations += 1
+        _sleep_ms(self.latency_ms)
+        body = json.dumps(self.response_payload).encode("utf-8")
+        return {"StatusCode": 200, "Payload": io.BytesIO(body)}
+
+
+class StubFlowsClient(FlowsClientInterface):
+    """Flows client that acknowledges broadcasts without any HTTP call."""
+
+    def __init__(self, latency_ms: float = 0.0):
+        self.latency_ms = latency_ms
+        self.broadcasts_sent = 0
+        self.template_uuid = str(uuid4())
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def get_user_api_token(self, user_email: str, project_uuid: str):
+        return {"api_token": "benchmark-token"}
+
+    def send_whatsapp_broadcast(self, payload: Dict, jwt_token: str = None) -> Dict:
+        _sleep_ms(self.latency_ms)
+        with self._lock:
+            self.broadcasts_sent += 1
+            broadcast_id = next(self._ids)
+        return {
+            "id": broadcast_id,
+            "status": "queued",
+            "metadata": {"template": {"uuid": self.template_uuid}},
+        }
+
+
+class _InMemoryMultipartApi:
+    """boto3-shaped multipart calls that land in an ``InMemoryS3Service``."""
+
+    def __init__(self, service: "InMemoryS3Service"):
+        self.service = service
+        self.parts: Dict[int, bytes] = {}
+
+    def create_multipart_upload(self, **kwargs) -> Dict[str, Any]:
+        return {"UploadId": uuid4().hex}
+
+    def upload_part(self, PartNumber: int, Body: bytes, **kwargs) -> Dict[str, Any]:
+        self.parts[PartNumber] = Body
+        return {"ETag": f'"{PartNumber}"'}
+
+    def complete_multipart_upload(self, Key: str, **kwargs) -> None:
+        content = b"".join(self.parts[number] for number in sorted(self.parts))
+        self.service.put_object(Key, content)
+
+    def abort_multipart_upload(self, **kwargs) -> None:
+        self.parts.clear()
+
+
+class InMemoryS3Service(S3ServiceInterface):
+    """Dict-backed S3 service used for execution traces."""
+
+    def __init__(self, latency_ms: float = 0.0):
+        self.latency_ms = latency_ms
+        self.objects: Dict[str, bytes] = {}
+        self.puts = 0
+        self._lock = threading.Lock()
+
+    def upload_file(self, file, key: str) -> str:
+        return self.put_object(key, file.read())
+
+    def upload_fileobj(
+        self,
+        fileobj: BinaryIO,
+        key: str,
+        content_type: str = "application/octet-stream",
+    ) -> str:
+        return self.put_object(key, fileobj.read(), content_type=content_type)
+
+    def open_multipart_upload(
+        self,
+        key: str,
+        content_type: str = "application/octet-stream",
+        content_encoding: Optional[str] = None,
+    ) -> BinaryIO:
+        return S3MultipartUpload(_InMemoryMultipartApi(self), "benchmark-bucket", key)
+
+    def generate_presigned_url(self, key: str, expiration: int = 3600) -> str:
+        return f"https://benchmark-bucket.local/{key}?expires={expiration}"
+
+    def get_object(self, key: str) -> Optional[bytes]:
+        return self.objects.get(key)
+
+    def put_object(
+        self, key: str, content: bytes, content_type: str = "application/json"
+    ) -> str:
+        _sleep_ms(self.latency_ms)
+        with self._lock:
+            self.objects[key] = content
+            self.puts += 1
+        return key
@@ -0,0 +1,435 @@
+"""End-to-end throughput benchmark for the agent webhook pipeline.
+
+Drives the real chain ``AgentWebhookView`` → ``task_agent_webhook`` →
+``AgentWebhookUseCase.execute`` → ``FlushExecutionsUseCase`` against
+the configured Postgres and Redis, with Lambda, Flows and the traces
+bucket replaced by the stand-ins in ``stand_ins``. Each execution is
+posted to the view through the Django test client; the enqueue is
+captured and the task is run in-process with ``apply`` so its latency
+can be measured on its own. The flush runs every ``flush_every``
+executions, the same way the beat task drains the queue.
+
+The report is a plain dict (see ``BenchmarkReport.as_dict``) so the
+management command can dump it as JSON and two branches can be
+compared with a diff. It covers throughput, p50/p99 latency per stage,
+and DB queries / Redis commands per execution split by stage.
+
+Must run against a disposable database: the harness seeds its own
+project, agent and template and leaves every row it creates behind.
+"""
+
+import math
+import statistics
+import time
+from contextlib import ExitStack, contextmanager
+from dataclasses import asdict, dataclass, field
+from typing import Any, Callable, Dict, Iterator, List, Optional
+from unittest.mock import patch
+from uuid import uuid4
+
+from django.db import connection
+from django.db.models import Count
+from django.test import Client, override_settings
+from django.urls import reverse
+from redis.client import Pipeline, Redis
+
+from retail.agents.benchmarks.stand_ins import (
+    FakeLambdaClient,
+    InMemoryS3Service,
+    StubFlowsClient,
+)
+from retail.agents.domains.agent_execution.models import AgentExecution
+from retail.agents.domains.agent_execution.services.traces_storage import (
+    ExecutionTracesStorageService,
+)
+from retail.agents.domains.agent_execution.usecases.flush_executions import (
+    FlushExecutionsUseCase,
+)
+from retail.agents.domains.agent_integration.models import (
+    Credential,
+    IntegratedAgent,
+)
+from retail.agents.domains.agent_management.models import Agent
+from retail.projects.models import Project
+from retail.services.aws_lambda import AwsLambdaService
+from retail.services.flows.service import FlowsService
+from retail.templates.models import Template, Version
+from retail.vtex.tasks import task_agent_webhook
+
+
+BENCHMARK_TEMPLATE_NAME = "benchmark_order_update"
+
+
+@dataclass
+class BenchmarkConfig:
+    """Knobs for a single benchmark run."""
+
+    executions: int = 200
+    warmup: int = 10
+    flush_every: int = 50
+    lambda_latency_ms: float = 0.0
+    flows_latency_ms: float = 0.0
+    s3_latency_ms: float = 0.0
+
+
+@dataclass
+class StageCounters:
+    """DB and Redis activity observed while a stage was running."""
+
+    db_queries: int = 0
+    db_time_ms: float = 0.0
+    redis_commands: int = 0
+    redis_round_trips: int = 0
+
+    def per_execution(self, executions: int) -> Dict[str, float]:
+        divisor = max(executions, 1)
+        return {
+            "db_queries": round(self.db_queries / divisor, 3),
+            "db_time_ms": round(self.db_time_ms / divisor, 3),
+            "redis_commands": round(self.redis_commands / divisor, 3),
+            "redis_round_trips": round(self.redis_round_trips / divisor, 3),
+        }
+
+
+@dataclass
+class BenchmarkReport:
+    """Machine-readable outcome of a benchmark run."""
+
+    config: BenchmarkConfig
+    executions: int = 0
+    wall_seconds: float = 0.0
+    view_latencies_ms: List[float] = field(default_factory=list)
+    task_latencies_ms: List[float] = field(default_factory=list)
+    flush_latencies_ms: List[float] = field(default_factory=list)
+    flushed: int = 0
+    stages: Dict[str, StageCounters] = field(
+        default_factory=lambda: {
+            "view": StageCounters(),
+            "task": StageCounters(),
+            "flush": StageCounters(),
+        }
+    )
+    outcomes: Dict[str, int] = field(default_factory=dict)
+    stand_in_calls: Dict[str, int] = field(default_factory=dict)
+
+    def as_dict(self) -> Dict[str, Any]:
+        total = StageCounters()
+        for counters in self.stages.values():
+            total.db_queries += counters.db_queries
+            total.db_time_ms += counters.db_time_ms
+            total.redis_commands += counters.redis_commands
+            total.redis_round_trips += counters.redis_round_trips
+
+        return {
+            "benchmark": "agent_webhook_pipeline",
+            "config": asdict(self.config),
+            "executions": self.executions,
+            "wall_seconds": round(self.wall_seconds, 4),
+            "executions_per_second": (
+                round(self.executions / self.wall_seconds, 2)
+                if self.wall_seconds
+                else 0.0
+            ),
+            "latency_ms": {
+                "view": summarize_latencies(self.view_latencies_ms),
+                "task": summarize_latencies(self.task_latencies_ms),
+                "flush_tick": summarize_latencies(self.flush_latencies_ms),
+            },
+            "flushed": self.flushed,
+            "per_execution": total.per_execution(self.executions),
+            "per_execution_by_stage": {
+                name: counters.per_execution(self.executions)
+                for name, counters in self.stages.items()
+            },
+            "outcomes": dict(self.outcomes),
+            "stand_in_calls": dict(self.stand_in_calls),
+        }
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile; ``0.0`` for an empty sample."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100.0 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def summarize_latencies(values: List[float]) -> Dict[str, float]:
+    if not values:
+        return {"count": 0, "p50": 0.0, "p99": 0.0, "mean": 0.0, "max": 0.0}
+    return {
+        "count": len(values),
+        "p50": round(percentile(values, 50), 3),
+        "p99": round(percentile(values, 99), 3),
+        "mean": round(statistics.fmean(values), 3),
+        "max": round(max(values), 3),
+    }
+
+
+class _RedisCommandCounter:
+    """Count Redis commands and network round trips issued by redis-py.
+
+    Plain commands are one command and one round trip each; pipeline
+    commands are counted as they are queued and the pipeline flush is
+    one round trip.
+    """
+
+    def __init__(self) -> None:
+        self.commands = 0
+        self.round_trips = 0
+
+    @contextmanager
+    def installed(self) -> Iterator["_RedisCommandCounter"]:
+        counter = self
+        original_execute_command = Redis.execute_command
+        original_pipeline_command = Pipeline.execute_command
+        original_pipeline_execute = Pipeline.execute
+
+        def execute_command(self, *args, **kwargs):
+            counter.commands += 1
+            counter.round_trips += 1
+            return original_execute_command(self, *args, **kwargs)
+
+        def pipeline_command(self, *args, **kwargs):
+            counter.commands += 1
+            return original_pipeline_command(self, *args, **kwargs)
+
+        def pipeline_execute(self, *args, **kwargs):
+            counter.round_trips += 1
+            return original_pipeline_execute(self, *args, **kwargs)
+
+        with patch.object(Redis, "execute_command", execute_command), patch.object(
+            Pipeline, "execute_command", pipeline_command
+        ), patch.object(Pipeline, "execute", pipeline_execute):
+            yield self
+
+
+class _QueryCounter:
+    """``connection.execute_wrapper`` hook counting queries and DB time."""
+
+    def __init__(self) -> None:
+        self.queries = 0
+        self.time_ms = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.queries += 1
+            self.time_ms += (time.perf_counter() - started) * 1000.0
+
+
+class AgentWebhookPipelineBenchmark:
+    """Seed fixtures, install stand-ins and measure the webhook pipeline."""
+
+    def __init__(self, config: Optional[BenchmarkConfig] = None):
+        self.config = config or BenchmarkConfig()
+        self.lambda_client = FakeLambdaClient(
+            response_payload={},
+            latency_ms=self.config.lambda_latency_ms,
+        )
+        self.flows_client = StubFlowsClient(latency_ms=self.config.flows_latency_ms)
+        self.s3_service = InMemoryS3Service(latency_ms=self.config.s3_latency_ms)
+        self.traces_storage = ExecutionTracesStorageService(s3_service=self.s3_service)
+        self.client = Client()
+        self._pending_tasks: List[Dict[str, Any]] = []
+        self._redis_counter = _RedisCommandCounter()
+        self.integrated_agent: Optional[IntegratedAgent] = None
+
+    def seed(self) -> IntegratedAgent:
+        """Create the project, agent and approved template the run uses."""
+        project = Project.objects.create(
+            uuid=uuid4(), name="Benchmark Store", vtex_account="benchmarkstore"
+        )
+        agent = Agent.objects.create(
+            uuid=uuid4(),
+            name="Benchmark Agent",
+            slug="benchmark-agent",
+            description="Agent used by the webhook pipeline benchmark",
+            project=project,
+            lambda_arn="arn:aws:lambda:local:000000000000:function:benchmark",
+        )
+        integrated_agent = IntegratedAgent.objects.create(
+            agent=agent,
+            project=project,
+            channel_uuid=uuid4(),
+            contact_percentage=100,
+        )
+        Credential.objects.create(
+            key="api_key",
+            label="API Key",
+            value="benchmark",
+            integrated_agent=integrated_agent,
+        )
+        template = Template.objects.create(
+            name=BENCHMARK_TEMPLATE_NAME,
+            integrated_agent=integrated_agent,
+            rule_code="def rule(payload): return True",
+            metadata={"language": "pt_BR"},
+        )
+        version = Version.objects.create(
+            template=template,
+            template_name=f"weni_{BENCHMARK_TEMPLATE_NAME}",
+            integrations_app_uuid=uuid4(),
+            project=project,
+            status="APPROVED",
+        )
+        template.current_version = version
+        template.save(update_fields=["current_version"])
+
+        self.lambda_client.response_payload = {
+            "status": 0,
+            "template": BENCHMARK_TEMPLATE_NAME,
+            "contact_urn": "whatsapp:5511999999999",
+            "template_variables": {"1": "Maria", "2": "#1234"},
+        }
+        self.integrated_agent = integrated_agent
+        return integrated_agent
+
+    def run(self) -> BenchmarkReport:
+        """Seed, warm up, then measure ``config.executions`` executions."""
+        integrated_agent = self.integrated_agent or self.seed()
+        report = BenchmarkReport(config=self.config)
+
+        with self._stand_ins():
+            for index in range(self.config.warmup):
+                self._run_one(integrated_agent, index, report=None)
+            self._drain(report=None)
+            warmup_ids = set(AgentExecution.objects.values_list("pk", flat=True))
+
+            started = time.perf_counter()
+            for index in range(self.config.executions):
+                self._run_one(integrated_agent, index, report=report)
+                if (index + 1) % max(self.config.flush_every, 1) == 0:
+                    self._flush(report)
+            self._drain(report)
+            report.wall_seconds = time.perf_counter() - started
+
+        report.executions = self.config.executions
+        report.outcomes = {
+            row["status"]: row["total"]
+            for row in AgentExecution.objects.exclude(pk__in=warmup_ids)
+            .values("status")
+            .annotate(total=Count("pk"))
+        }
+        report.stand_in_calls = {
+            "lambda_invocations": self.lambda_client.invocations,
+            "flows_broadcasts": self.flows_client.broadcasts_sent,
+            "s3_puts": self.s3_service.puts,
+        }
+        return report
+
+    def _run_one(
+        self,
+        integrated_agent: IntegratedAgent,
+        index: int,
+        report: Optional[BenchmarkReport],
+    ) -> None:
+        url = reverse("agent-webhook", kwargs={"webhook_uuid": integrated_agent.uuid})
+        payload = {"OrderId": f"BENCH-{index:08d}", "State": "invoiced"}
+
+        view_ms = self._measure(
+            lambda: self.client.post(url, payload, content_type="application/json"),
+            report.stages["view"] if report else None,
+        )
+
+        task_ms = 0.0
+        while self._pending_tasks:
+            call = self._pending_tasks.pop(0)
+            task_ms += self._measure(
+                lambda: task_agent_webhook.apply(args=call["args"]),
+                report.stages["task"] if report else None,
+            )
+
+        if report is not None:
+            report.view_latencies_ms.append(view_ms)
+            report.task_latencies_ms.append(task_ms)
+
+    def _flush(self, report: Optional[BenchmarkReport]) -> int:
+        use_case = FlushExecutionsUseCase(traces_storage=self.traces_storage)
+        result = None
+
+        def _execute():
+            nonlocal result
+            result = use_case.execute()
+
+        elapsed = self._measure(_execute, report.stages["flush"] if report else None)
+        if report is not None:
+            report.flush_latencies_ms.append(elapsed)
+            report.flushed += result.flushed
+        return result.flushed
+
+    def _drain(self, report: Optional[BenchmarkReport]) -> None:
+        while self._flush(report):
+            pass
+
+    def _measure(
+        self, fn: Callable[[], Any], counters: Optional[StageCounters]
+    ) -> float:
+        query_counter = _QueryCounter()
+        commands_before = self._redis_counter.commands
+        round_trips_before = self._redis_counter.round_trips
+
+        started = time.perf_counter()
+        with connection.execute_wrapper(query_counter):
+            fn()
+        elapsed_ms = (time.perf_counter() - started) * 1000.0
+
+        if counters is not None:
+            counters.db_queries += query_counter.queries
+            counters.db_time_ms += query_counter.time_ms
+            counters.redis_commands += self._redis_counter.commands - commands_before
+            counters.redis_round_trips += (
+                self._redis_counter.round_trips - round_trips_before
+            )
+        return elapsed_ms
+
+    def _capture_apply_async(self, args=None, kwargs=None, **options):
+        self._pending_tasks.append({"args": args or [], "kwargs": kwargs or {}})
+
+    @contextmanager
+    def _stand_ins(self) -> Iterator[None]:
+        active_agent_module = (
+            "retail.agents.domains.agent_webhook.services.active_agent"
+        )
+        broadcast_module = "retail.agents.domains.agent_webhook.services.broadcast"
+        buffer_module = "retail.agents.domains.agent_execution.services.buffer"
+
+        with ExitStack() as stack:
+            stack.enter_context(override_settings(AGENT_EXECUTION_LOGGING_ENABLED=True))
+            stack.enter_context(
+                patch(
+                    f"{active_agent_module}.AwsLambdaService",
+                    side_effect=lambda: AwsLambdaService(client=self.lambda_client),
+                )
+            )
+            stack.enter_context(
+                patch(
+                    f"{active_agent_module}.JWTUsecase.generate_jwt_token",
+                    return_value="benchmark-jwt",
+                )
+            )
+            stack.enter_context(
+                patch(
+                    f"{broadcast_module}.FlowsService",
+                    side_effect=lambda: FlowsService(client=self.flows_client),
+                )
+            )
+            stack.enter_context(patch(f"{broadcast_module}.send_commerce_webhook_data"))
+            stack.enter_context(
+                patch(
+                    f"{buffer_module}.get_shared_traces_storage",
+                    return_value=self.traces_storage,
+                )
+            )
+            stack.enter_context(
+                patch.object(
+                    task_agent_webhook,
+                    "apply_async",
+                    side_effect=self._capture_apply_async,
+                )
+            )
+            stack.enter_context(self._redis_counter.installed())
+            yield
@@ -4,7 +4,8 @@ Lightweight in-memory fakes used to avoid pulling in fakeredis just
 for these tests. They cover the subset of commands the buffer service
 issues against the django_redis connection: list ops (rpush/lrange),
 hash ops (hset/hgetall), string ops (set/get/incr), sorted-set ops
-(zadd/zrem/zrangebyscore/zscore/zcard), pipelines, and unlink. Hash
+(zadd/zrem/zrangebyscore/zscore/zcard), bitmap ops (setbit/getbit),
+pipelines, and unlink. Hash
 field names and values are tracked as bytes the same way the real
 client returns them, so any bytes/str confusion in the service code
 surfaces immediately.
@@ -30,6 +31,8 @@ class FakeRedisConnection:
         # buffer relies on for the flush queue: ZADD / ZREM /
         # ZRANGEBYSCORE / ZSCORE.
         self.zsets: Dict[str, Dict[bytes, float]] = {}
+        # Bitmaps keyed by name, holding the offsets whose bit is set.
+        self.bitmaps: Dict[str, set] = {}
         self.expirations: Dict[str, int] = {}
         self.command_log: List[Tuple[str, tuple, dict]] = []
         self.pipeline_execute_count: int = 0
@@ -62,6 +65,27 @@ class FakeRedisConnection:
         self._record("llen", (key,), {})
         return len(self.lists.get(key, []))
 
+    def ltrim(self, key: str, start: int, end: int) -> bool:
+        self._record("ltrim", (key, start, end), {})
+        bucket = self.lists.get(key, [])
+        stop = len(bucket) if end == -1 else end + 1
+        kept = bucket[start:stop]
+        if kept:
+            self.lists[key] = kept
+        else:
+            self.lists.pop(key, None)
+        return True
+
+    def lrem(self, key: str, count: int, value) -> int:
+        self._record("lrem", (key, count, value), {})
+        bucket = self.lists.get(key, [])
+        target = self._b(value)
+        removed = 0
+        while target in bucket and (count == 0 or removed < abs(count)):
+            bucket.remove(target)
+            removed += 1
+        return removed
+
     def expire(self, key: str, ttl: int) -> bool:
         self._record("expire", (key, ttl), {})
         if (
@@ -69,6 +93,7 @@ class FakeRedisConnection:
             and key not in self.strings
             and key not in self.hashes
             and key not in self.zsets
+            and key not in self.bitmaps
         ):
             return False
         self.expirations[key] = ttl
@@ -94,6 +119,10 @@ class FakeRedisConnection:
         self._record("get", (key,), {})
         return self.strings.get(key)
 
+    def mget(self, *keys) -> List[Optional[bytes]]:
+        self._record("mget", keys, {})
+        return [self.strings.get(key) for key in keys]
+
     def incr(self, key: str, amount: int = 1) -> int:
         """Atomic INCR mirroring redis-py semantics.
 
@@ -117,6 +146,7 @@ class FakeRedisConnection:
                 or key in self.lists
                 or key in self.hashes
                 or key in self.zsets
+                or key in self.bitmaps
             )
         )
 
@@ -143,6 +173,9 @@ class FakeRedisConnection:
             if key in self.zsets:
                 del self.zsets[key]
                 removed += 1
+            if key in self.bitmaps:
+                del self.bitmaps[key]
+                removed += 1
             self.expirations.pop(key, None)
         return removed
 
@@ -290,6 +323,20 @@ class FakeRedisConnection:
         self._record("hkeys", (key,), {})
         return list(self.hashes.get(key, {}).keys())
 
+    def setbit(self, key: str, offset: int, value: int) -> int:
+        self._record("setbit", (key, offset, value), {})
+        bits = self.bitmaps.setdefault(key, set())
+        previous = int(offset in bits)
+        if value:
+            bits.add(offset)
+        else:
+            bits.discard(offset)
+        return previous
+
+    def getbit(self, key: str, offset: int) -> int:
+        self._record("getbit", (key, offset), {})
+        return int(offset in self.bitmaps.get(key, ()))
+
     def pipeline(self, transaction: bool = True, **_kwargs) -> "FakeRedisPipeline":
         return FakeRedisPipeline(self, transaction=transaction)
 
@@ -307,6 +354,8 @@ class FakeRedisPipeline:
     _SUPPORTED = {
         "rpush",
         "lrange",
+        "ltrim",
+        "lrem",
         "expire",
         "set",
         "get",
@@ -321,6 +370,8 @@ class FakeRedisPipeline:
         "zrem",
         "zscore",
         "zrangebyscore",
+        "setbit",
+        "getbit",
     }
 
     def __init__(self, connection: FakeRedisConnection, transaction: bool = True):
@@ -38,6 +38,12 @@ from retail.agents.tasks import (
     _FLUSH_TICK_KEY,
     task_flush_execution_logs,
 )
+from retail.broadcasts.services.broadcast_message_buffer import (
+    BroadcastMessageBuffer,
+)
+from retail.broadcasts.usecases.flush_broadcast_messages import (
+    FlushBufferedBroadcastMessagesUseCase,
+)
 
 
 @override_settings(EXECUTION_TRACES_BUCKET="test-traces-bucket")
@@ -67,9 +73,7 @@ class FlushTaskWrapperTests(TestCase):
 
     def test_task_calls_flush_use_case_and_returns_its_result(self):
         patcher, mock_use_case = self._patch_use_case(flushed=3, stuck=0)
-        with patcher, patch(
-            "retail.agents.tasks._next_flush_tick", return_value=1
-        ):
+        with patcher, patch("retail.agents.tasks._next_flush_tick", return_value=1):
             result = task_flush_execution_logs.run()
 
         self.assertEqual(result, {"flushed": 3, "stuck_finalized": 0})
@@ -78,9 +82,7 @@ class FlushTaskWrapperTests(TestCase):
     @override_settings(AGENT_EXECUTION_STUCK_SWEEP_EVERY_N_TICKS=10)
     def test_task_triggers_stuck_sweep_every_nth_tick(self):
         patcher, mock_use_case = self._patch_use_case(flushed=0, stuck=1)
-        with patcher, patch(
-            "retail.agents.tasks._next_flush_tick", return_value=10
-        ):
+        with patcher, patch("retail.agents.tasks._next_flush_tick", return_value=10):
             task_flush_execution_logs.run()
 
         mock_use_case.execute.assert_called_once_with(do_stuck_sweep=True)
@@ -88,9 +90,7 @@ class FlushTaskWrapperTests(TestCase):
     @override_settings(AGENT_EXECUTION_STUCK_SWEEP_EVERY_N_TICKS=10)
     def test_task_skips_sweep_when_tick_is_not_a_multiple(self):
         patcher, mock_use_case = self._patch_use_case()
-        with patcher, patch(
-            "retail.agents.tasks._next_flush_tick", return_value=3
-        ):
+        with patcher, patch("retail.agents.tasks._next_flush_tick", return_value=3):
             task_flush_execution_logs.run()
 
         mock_use_case.execute.assert_called_once_with(do_stuck_sweep=False)
@@ -99,18 +99,14 @@ class FlushTaskWrapperTests(TestCase):
         """``_next_flush_tick`` returns 0 on Redis failure, which never
         satisfies ``tick % N == 0`` for the real cadence."""
         patcher, mock_use_case = self._patch_use_case()
-        with patcher, patch(
-            "retail.agents.tasks._next_flush_tick", return_value=0
-        ):
+        with patcher, patch("retail.agents.tasks._next_flush_tick", return_value=0):
             task_flush_execution_logs.run()
 
         mock_use_case.execute.assert_called_once_with(do_stuck_sweep=False)
 
     def test_task_swallows_buffer_exceptions(self):
         patcher, _ = self._patch_use_case(side_effect=RuntimeError("boom"))
-        with patcher, patch(
-            "retail.agents.tasks._next_flush_tick", return_value=1
-        ):
+        with patcher, patch("retail.agents.tasks._next_flush_tick", return_value=1):
             result = task_flush_execution_logs.run()
 
         self.assertEqual(result, {"flushed": 0, "stuck_finalized": 0})
@@ -281,6 +277,60 @@ class FlushBufferIntegrationTests(TestCase):
         self.assertEqual(row.status, AgentExecutionStatus.ERROR)
         self.assertEqual(row.error_message, "Execution timed out")
 
+    def test_flush_writes_buffered_broadcast_messages_first(self):
+        """A buffered BroadcastMessage is written before the execution
+        row that references it is updated."""
+        broadcast_flush = MagicMock()
+        broadcast_flush.message_buffer.enabled = True
+
+        FlushExecutionsUseCase(
+            buffer=self.buffer,
+            traces_storage=self.traces_storage,
+            broadcast_message_flush=broadcast_flush,
+        ).execute()
+
+        broadcast_flush.execute.assert_called_once_with()
+
+    def test_flush_unlinks_broadcast_messages_that_will_never_be_written(self):
+        """A row dropped from the broadcast buffer (duplicate dispatch,
+        expired key) must not fail the foreign key of the whole batch;
+        a row still buffered holds only its own execution back."""
+        lost, buffered = uuid4(), uuid4()
+        self.fake_redis.set(f"broadcast_message_buffer:row:{buffered}", "1")
+        executions = {}
+        for row_uuid in (lost, buffered):
+            execution_uuid = self.buffer.start_execution(
+                integrated_agent_uuid=None,
+                contact_urn="unknown",
+                webhook_payload={},
+            )
+            self.buffer.update_metadata(
+                execution_uuid=execution_uuid,
+                status=AgentExecutionStatus.SUCCESS,
+                broadcast_message_uuid=row_uuid,
+            )
+            executions[row_uuid] = execution_uuid
+
+        result = FlushExecutionsUseCase(
+            buffer=self.buffer,
+            traces_storage=self.traces_storage,
+            broadcast_message_flush=FlushBufferedBroadcastMessagesUseCase(
+                message_buffer=BroadcastMessageBuffer(redis_client=self.fake_redis)
+            ),
+        ).execute()
+
+        self.assertEqual(result.flushed, 1)
+        unlinked = AgentExecution.objects.get(uuid=executions[lost])
+        self.assertEqual(unlinked.status, AgentExecutionStatus.SUCCESS)
+        self.assertIsNone(unlinked.broadcast_message_id)
+        held = AgentExecution.objects.get(uuid=executions[buffered])
+        self.assertEqual(held.status, AgentExecutionStatus.PROCESSING)
+        self.assertIsNotNone(
+            self.fake_redis.zscore(
+                self.buffer.FLUSH_QUEUE_KEY, str(executions[buffered])
+            )
+        )
+
 
 @override_settings(
     EXECUTION_TRACES_BUCKET="test-traces-bucket",
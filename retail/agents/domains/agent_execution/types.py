@@ -24,3 +24,4 @@ class ExecutionTraceType(models.TextChoices):
     BROADCAST_RESPONSE = "broadcast_response", "Broadcast response"
     ERROR = "error", "Error"
     SKIP = "skip", "Skip"
+    TASK_RESOURCES = "task_resources", "Task resources"
@@ -5,6 +5,13 @@ writes traces to S3 in parallel, applies per-row UPDATEs for terminal
 entries and a single batched UPDATE for timed-out entries, then
 unlinks the Redis state. Optionally runs the SQL stuck sweep on the
 same tick — that lives in ``SweepStuckExecutionsUseCase``.
+
+When ``BroadcastMessage`` rows are write-behind buffered they are
+flushed first, so ``AgentExecution.broadcast_message`` is only set once
+its row exists. An execution whose row is still buffered is left for
+the next tick; one whose row will never be written (dropped as a
+duplicate dispatch or expired from Redis) is flushed without the link
+instead of failing the foreign key check for the whole batch.
 """
 
 import logging
@@ -35,6 +42,10 @@ from retail.agents.domains.agent_execution.services.traces_storage import (
 from retail.agents.domains.agent_execution.usecases.sweep_stuck_executions import (
     SweepStuckExecutionsUseCase,
 )
+from retail.broadcasts.models import BroadcastMessage
+from retail.broadcasts.usecases.flush_broadcast_messages import (
+    FlushBufferedBroadcastMessagesUseCase,
+)
 
 
 logger = logging.getLogger(__name__)
@@ -87,6 +98,14 @@ def _build_integrated_agent_pk_map(uuids: set[UUID]) -> Dict[UUID, int]:
     }
 
 
+def _existing_broadcast_messages(uuids: set[UUID]) -> set[UUID]:
+    if not uuids:
+        return set()
+    return set(
+        BroadcastMessage.objects.filter(uuid__in=uuids).values_list("uuid", flat=True)
+    )
+
+
 def _coerce_uuid(value: Any) -> Optional[UUID]:
     if value is None or value == "":
         return None
@@ -150,10 +169,14 @@ class FlushExecutionsUseCase:
         buffer: Optional[ExecutionBufferService] = None,
         traces_storage: Optional[ExecutionTracesStorageService] = None,
         sweep_use_case: Optional[SweepStuckExecutionsUseCase] = None,
+        broadcast_message_flush: Optional[FlushBufferedBroadcastMessagesUseCase] = None,
     ):
         self.buffer = buffer or ExecutionBufferService(traces_storage=traces_storage)
         self._traces_storage = traces_storage
         self.sweep_use_case = sweep_use_case
+        self.broadcast_message_flush = (
+            broadcast_message_flush or FlushBufferedBroadcastMessagesUseCase()
+        )
         self.flush_batch_size = getattr(
             settings,
             "AGENT_EXECUTION_FLUSH_BATCH_SIZE",
@@ -184,6 +207,8 @@ class FlushExecutionsUseCase:
             )
             return FlushResult()
 
+        self._flush_buffered_broadcast_messages()
+
         now_ts = timezone.now().timestamp()
         try:
             ready_raw = (
@@ -225,6 +250,16 @@ class FlushExecutionsUseCase:
             )
         return FlushResult(flushed=flushed, stuck_finalized=stuck_finalized)
 
+    def _flush_buffered_broadcast_messages(self) -> None:
+        if not self.broadcast_message_flush.message_buffer.enabled:
+            return
+        try:
+            self.broadcast_message_flush.execute()
+        except Exception:
+            logger.exception(
+                "[EXEC_LOG] Could not flush buffered broadcast messages first"
+            )
+
     def _process_flush_batch(self, uuids: List[str], redis_client) -> int:
         if not uuids:
             return 0
@@ -279,6 +314,8 @@ class FlushExecutionsUseCase:
             ]
             timeout_entries = [u for u in timeout_entries if u not in s3_failures]
 
+        terminal_entries = self._resolve_broadcast_messages(terminal_entries)
+
         try:
             with transaction.atomic():
                 self._update_terminal_rows(terminal_entries)
@@ -304,6 +341,53 @@ class FlushExecutionsUseCase:
 
         return len(successful)
 
+    def _resolve_broadcast_messages(
+        self, terminal_entries: List[Tuple[str, Dict[str, Any]]]
+    ) -> List[Tuple[str, Dict[str, Any]]]:
+        """Hold back or unlink entries whose BroadcastMessage row is missing.
+
+        Only rows absent from Postgres are looked up in the broadcast
+        buffer. A flush removes the buffered marker after committing the
+        row, so the rows found in neither place are checked against
+        Postgres once more before their link is dropped.
+        """
+        referenced = {
+            _coerce_uuid(data.get("broadcast_message_uuid"))
+            for _, data in terminal_entries
+        }
+        referenced.discard(None)
+        missing = referenced - _existing_broadcast_messages(referenced)
+        if not missing:
+            return terminal_entries
+
+        try:
+            buffered = self.broadcast_message_flush.message_buffer.still_buffered(
+                missing
+            )
+        except Exception:
+            logger.exception(
+                "[EXEC_LOG] Could not check buffered broadcast messages; "
+                "assuming they are still buffered"
+            )
+            buffered = missing
+        unwritten = missing - buffered
+        unwritten -= _existing_broadcast_messages(unwritten)
+
+        resolved: List[Tuple[str, Dict[str, Any]]] = []
+        for uuid_str, data in terminal_entries:
+            row_uuid = _coerce_uuid(data.get("broadcast_message_uuid"))
+            if row_uuid is None or row_uuid not in missing:
+                resolved.append((uuid_str, data))
+            elif row_uuid in unwritten:
+                logger.warning(
+                    "[EXEC_LOG] BroadcastMessage %s of execution %s was never "
+                    "written; flushing without the link",
+                    row_uuid,
+                    uuid_str,
+                )
+                resolved.append((uuid_str, {**data, "broadcast_message_uuid": None}))
+        return resolved
+
     @staticmethod
     def _update_terminal_rows(
         terminal_entries: List[Tuple[str, Dict[str, Any]]],
@@ -1,4 +1,6 @@
 from django.db import models
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 from django.contrib.postgres.fields import ArrayField
 
 from uuid import uuid4
@@ -58,3 +60,13 @@ class Credential(models.Model):
 
     def __str__(self) -> str:
         return f"{self.label} - {self.integrated_agent.agent.name}"
+
+
+@receiver([post_save, post_delete], sender=Credential)
+def invalidate_dispatch_snapshot_on_credential_change(sender, instance, **kwargs):
+    """Drops the owning agent's cached dispatch snapshot (credentials)."""
+    from retail.agents.domains.agent_webhook.services.dispatch_snapshot import (
+        invalidate_dispatch_snapshot,
+    )
+
+    invalidate_dispatch_snapshot(instance.integrated_agent_id)
@@ -1,8 +1,10 @@
+import contextvars
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from urllib.parse import urlparse
 
-from typing import Dict, List, TypedDict, Mapping, Any, Optional
+from typing import Dict, List, NamedTuple, TypedDict, Mapping, Any, Optional, Tuple
 
 from uuid import UUID
 
@@ -31,8 +33,10 @@ from retail.templates.usecases.create_library_template import (
 )
 from retail.templates.usecases._base_template_creator import TemplateBuilderMixin
 from retail.templates.usecases._meta_library_template_fetch import (
+    TemplateInfo,
     fetch_meta_library_template_metadata,
 )
+from retail.templates.models import Template, Version
 from retail.templates.usecases.create_custom_template import (
     CreateCustomTemplateUseCase,
     CreateCustomTemplateData,
@@ -50,6 +54,9 @@ from retail.agents.domains.agent_integration.services.payment_recovery_hook impo
     DEFAULT_SALES_CHANNELS,
     build_payment_recovery_hook_payload,
 )
+from retail.agents.domains.agent_webhook.services.dispatch_snapshot import (
+    invalidate_dispatch_snapshot,
+)
 from retail.vtex.usecases.proxy_vtex import ProxyVtexUsecase
 from retail.services.vtex_io.service import VtexIOService
 
@@ -58,6 +65,14 @@ logger = logging.getLogger(__name__)
 
 _DIRECT_SEND_FALLBACK_LANGUAGE = "pt_BR"
 
+DEFAULT_META_LIBRARY_FETCH_WORKERS = 4
+
+
+class _ProvisionedTemplate(NamedTuple):
+    pre_approved: PreApprovedTemplate
+    template: Template
+    version: Version
+
 
 class MetaButtonFormat(TypedDict):
     url: str
@@ -375,67 +390,154 @@ class AssignAgentUseCase:
     ) -> None:
         """Persist library-catalog templates locally for the Direct Send path.
 
+        Library metadata for every template is fetched concurrently before
+        anything is written, so a missing translation fails the assignment
+        without a partial write.
+
         Anchor: FR-003c (pt_BR fallback) / FR-003d (atomic rollback) /
         Research Decision 5 (skip Integrations Engine).
         """
-        template_builder = TemplateBuilderMixin()
         project_language = integrated_agent.config.get(
             "initial_template_language", DEFAULT_TEMPLATE_LANGUAGE
         )
 
-        for pre_approved in library_pre_approveds:
-            content, actual_language = self._fetch_direct_send_template_content(
-                pre_approved=pre_approved,
-                project=integrated_agent.project,
-                integrated_agent=integrated_agent,
-                project_language=project_language,
-            )
-
-            template, version = template_builder.build_template_and_version(
-                payload={
-                    "template_name": pre_approved.name,
-                    "app_uuid": app_uuid,
-                    "project_uuid": project_uuid,
-                },
-                integrated_agent=integrated_agent,
-            )
+        contents = self._fetch_direct_send_templates_content(
+            library_pre_approveds, integrated_agent, project_language
+        )
 
+        provisioned: List[_ProvisionedTemplate] = []
+        for pre_approved, (content, actual_language) in zip(
+            library_pre_approveds, contents
+        ):
             content_metadata = dict(content["metadata"])
             self._drop_non_interactive_header_footer(content_metadata)
 
-            template.metadata = {
-                **content_metadata,
-                "direct_send": {
-                    "fetched_from_meta_library": True,
-                    "fetched_at": datetime.now(timezone.utc).isoformat(),
-                    "requested_language": project_language,
-                    "actual_language": actual_language,
+            template = Template(
+                name=pre_approved.name,
+                metadata={
+                    **content_metadata,
+                    "direct_send": {
+                        "fetched_from_meta_library": True,
+                        "fetched_at": datetime.now(timezone.utc).isoformat(),
+                        "requested_language": project_language,
+                        "actual_language": actual_language,
+                    },
                 },
-            }
-            template.config = pre_approved.config or {}
-            template.parent = pre_approved
-            template.start_condition = pre_approved.start_condition
-            template.display_name = pre_approved.display_name
-            template.current_version = version
-            template.integrated_agent = integrated_agent
-            template.save()
-
-            version.template_name = pre_approved.name
-            version.status = "APPROVED"
-            version.save()
+                config=pre_approved.config or {},
+                parent=pre_approved,
+                start_condition=pre_approved.start_condition,
+                display_name=pre_approved.display_name,
+                integrated_agent=integrated_agent,
+            )
+            version = Version(
+                template=template,
+                template_name=pre_approved.name,
+                status="APPROVED",
+                integrations_app_uuid=app_uuid,
+                project=integrated_agent.project,
+            )
+            provisioned.append(_ProvisionedTemplate(pre_approved, template, version))
 
-            integrated_agent.ignore_templates.append(pre_approved.slug)
-            integrated_agent.save(update_fields=["ignore_templates"])
+        self._bulk_create_templates(integrated_agent, provisioned)
 
+        for pre_approved, (_, actual_language) in zip(library_pre_approveds, contents):
             logger.info(
                 f"[DirectSend] template_persisted: project_uuid={integrated_agent.project.uuid} "
                 f"agent={integrated_agent.uuid} template={pre_approved.name} "
                 f"requested_language={project_language} actual_language={actual_language}"
             )
 
+    def _bulk_create_templates(
+        self,
+        integrated_agent: IntegratedAgent,
+        provisioned: List["_ProvisionedTemplate"],
+    ) -> None:
+        """Write provisioned templates and versions with a constant number of queries.
+
+        Fields are validated as ``TemplateBuilderMixin`` does with
+        ``full_clean``, minus the per-row foreign key and uniqueness lookups
+        the inserts enforce themselves. Then one INSERT for the templates,
+        one for the versions, one UPDATE pointing templates at their version
+        and one UPDATE recording every pre-approved slug in
+        ``ignore_templates``, all inside one transaction. ``bulk_create``
+        skips the ``post_save`` receivers, so the agent's dispatch snapshot
+        is invalidated explicitly.
+        """
+        if not provisioned:
+            return
+
+        templates = [entry.template for entry in provisioned]
+        versions = [entry.version for entry in provisioned]
+        for template, version in zip(templates, versions):
+            template.clean_fields(
+                exclude=["parent", "current_version", "integrated_agent"]
+            )
+            version.clean_fields(exclude=["template", "project"])
+
+        with transaction.atomic():
+            Template.objects.bulk_create(templates)
+            Version.objects.bulk_create(versions)
+
+            for template, version in zip(templates, versions):
+                template.current_version = version
+            Template.objects.bulk_update(templates, ["current_version"])
+
+            integrated_agent.ignore_templates.extend(
+                entry.pre_approved.slug for entry in provisioned
+            )
+            integrated_agent.save(update_fields=["ignore_templates"])
+
+        invalidate_dispatch_snapshot(integrated_agent.id)
+
+    def _fetch_direct_send_templates_content(
+        self,
+        pre_approveds: List[PreApprovedTemplate],
+        integrated_agent: IntegratedAgent,
+        project_language: str,
+    ) -> List[Tuple[TemplateInfo, str]]:
+        """Fetch ``(content, actual_language)`` for every template concurrently.
+
+        At most ``META_LIBRARY_FETCH_WORKERS`` fetches run at a time and
+        results keep the order of ``pre_approveds``. The first template (in
+        that order) that cannot be fetched raises.
+        """
+        if not pre_approveds:
+            return []
+
+        # Resolved here, not lazily inside the workers.
+        meta_service = self.meta_service
+        workers = max(
+            1,
+            min(
+                getattr(
+                    settings,
+                    "META_LIBRARY_FETCH_WORKERS",
+                    DEFAULT_META_LIBRARY_FETCH_WORKERS,
+                ),
+                len(pre_approveds),
+            ),
+        )
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                # A copy of this context per fetch keeps the pooled Meta
+                # calls in the task's HTTP accounting.
+                executor.submit(
+                    contextvars.copy_context().run,
+                    self._fetch_direct_send_template_content,
+                    meta_service=meta_service,
+                    pre_approved=pre_approved,
+                    project=integrated_agent.project,
+                    integrated_agent=integrated_agent,
+                    project_language=project_language,
+                )
+                for pre_approved in pre_approveds
+            ]
+            return [future.result() for future in futures]
+
     def _fetch_direct_send_template_content(
         self,
         *,
+        meta_service: MetaServiceInterface,
         pre_approved: PreApprovedTemplate,
         project: Project,
         integrated_agent: IntegratedAgent,
@@ -448,13 +550,13 @@ class AssignAgentUseCase:
         Anchor: FR-003c / FR-003d.
         """
         content = self._safely_fetch_direct_send_metadata(
-            pre_approved.name, project_language
+            meta_service, pre_approved.name, project_language
         )
         actual_language = project_language
 
         if content is None and project_language != _DIRECT_SEND_FALLBACK_LANGUAGE:
             content = fetch_meta_library_template_metadata(
-                self.meta_service, pre_approved.name, _DIRECT_SEND_FALLBACK_LANGUAGE
+                meta_service, pre_approved.name, _DIRECT_SEND_FALLBACK_LANGUAGE
             )
             if content is not None:
                 actual_language = _DIRECT_SEND_FALLBACK_LANGUAGE
@@ -501,7 +603,7 @@ class AssignAgentUseCase:
             metadata.pop("header", None)
 
     def _safely_fetch_direct_send_metadata(
-        self, template_name: str, language: str
+        self, meta_service: MetaServiceInterface, template_name: str, language: str
     ) -> Optional[Dict[str, Any]]:
         """First-locale fetch that translates adapter rejections to ``None``.
 
@@ -512,7 +614,7 @@ class AssignAgentUseCase:
         """
         try:
             return fetch_meta_library_template_metadata(
-                self.meta_service, template_name, language
+                meta_service, template_name, language
             )
         except DirectSendUnsupportedComponentError:
             if language == _DIRECT_SEND_FALLBACK_LANGUAGE:
@@ -9,8 +9,17 @@ from uuid import UUID
 
 from datetime import datetime
 
+from retail.agents.domains.agent_execution.context import get_current_execution_uuid
+from retail.agents.domains.agent_execution.services.logger import ExecutionLoggerService
 from retail.agents.domains.agent_integration.models import IntegratedAgent
 from retail.broadcasts.models import BroadcastMessage
+from retail.agents.domains.agent_webhook.services.broadcast_batcher import (
+    BatchedDispatch,
+    FlowsBroadcastBatcher,
+)
+from retail.agents.domains.agent_webhook.services.dispatch_snapshot import (
+    AgentDispatchSnapshotService,
+)
 from retail.agents.domains.agent_webhook.services.direct_send_constants import (
     MAX_BODY_LENGTH,
     MAX_BUTTON_LABEL_LENGTH,
@@ -25,15 +34,23 @@ from retail.agents.domains.agent_webhook.services.direct_send_payload_builder im
     is_valid_direct_send_template_name,
     substitute_template_variables,
 )
+from retail.broadcasts.usecases.complete_batched_broadcast import (
+    CompleteBatchedBroadcastDTO,
+    CompleteBatchedBroadcastUseCase,
+)
 from retail.broadcasts.usecases.record_broadcast_sent import (
     BroadcastDispatchContext,
     RecordBroadcastSentDTO,
     RecordBroadcastSentUseCase,
 )
 from retail.clients.exceptions import CustomAPIException
+from retail.interfaces.services.execution_logger import (
+    ExecutionLoggerServiceInterface,
+)
 from retail.services.flows.service import FlowsService
 from retail.templates.models import Template
 from retail.interfaces.services.aws_s3 import S3ServiceInterface
+from retail.services.aws_s3.presigned_url_cache import get_presigned_url_cache
 from retail.services.aws_s3.service import S3Service
 
 from weni_datalake_sdk.clients.client import send_commerce_webhook_data
@@ -68,10 +85,20 @@ class BroadcastDispatchResult:
 
 class Broadcast:
     def __init__(
-        self, flows_service: Optional[FlowsService] = None, audit_func: Callable = None
+        self,
+        flows_service: Optional[FlowsService] = None,
+        audit_func: Callable = None,
+        dispatch_snapshots: Optional[AgentDispatchSnapshotService] = None,
+        batcher: Optional[FlowsBroadcastBatcher] = None,
+        exec_logger: Optional[ExecutionLoggerServiceInterface] = None,
     ):
         self.flows_service = flows_service or FlowsService()
         self.audit_func = audit_func or send_commerce_webhook_data
+        self.dispatch_snapshots = dispatch_snapshots or AgentDispatchSnapshotService()
+        self.batcher = batcher or FlowsBroadcastBatcher()
+        self.exec_logger: ExecutionLoggerServiceInterface = (
+            exec_logger or ExecutionLoggerService()
+        )
 
     def build_broadcast_template_message(
         self,
@@ -104,7 +131,6 @@ class Broadcast:
             Dict[str, Any]: A formatted message dictionary for the Flows Broadcast API.
             Returns an empty dictionary if required fields are missing or invalid.
         """
-        s3_service = s3_service or S3Service()
         template_variables = data.get("template_variables", {})
         contact_urn = data.get("contact_urn")
         template_name = template.current_version.template_name
@@ -337,14 +363,19 @@ class Broadcast:
             return f"image/jpeg:{image_url}"  # Fallback to jpeg
 
     def _build_image_attachment_from_s3(
-        self, s3_key: str, s3_service: S3ServiceInterface
+        self, s3_key: str, s3_service: Optional[S3ServiceInterface] = None
     ) -> str:
         """
         Build image attachment string from S3 key (existing logic).
 
+        The presigned URL comes from the shared ``PresignedUrlCache``, so
+        every message of a campaign reuses the same signature and an
+        ``S3Service`` is only built when the key has to be signed again.
+
         Args:
             s3_key (str): S3 key for the image.
-            s3_service (S3ServiceInterface): S3 service instance.
+            s3_service (Optional[S3ServiceInterface]): S3 service used on a
+                cache miss; a default ``S3Service`` is built when omitted.
 
         Returns:
             str: Formatted attachment string with presigned URL.
@@ -361,7 +392,10 @@ class Broadcast:
                 f"Could not detect image type for {s3_key}, using jpeg as fallback"
             )
 
-        return f"image/{image_subtype}:{s3_service.generate_presigned_url(s3_key)}"
+        presigned_url = get_presigned_url_cache().get_url(
+            s3_key, lambda: s3_service or S3Service()
+        )
+        return f"image/{image_subtype}:{presigned_url}"
 
     def can_send_to_contact(
         self, integrated_agent: IntegratedAgent, data: Dict[str, Any]
@@ -448,6 +482,10 @@ class Broadcast:
         ``dispatch_context`` carries the commercial origin (order_form_id /
         order_id) so the persisted BroadcastMessage row can later be
         matched against an ``invoiced`` event for conversion attribution.
+
+        When batching is enabled the send is parked instead (see
+        ``_enqueue_for_batch``) and the returned response is
+        ``{"status": "pending", "batched": True}``.
         """
         project_uuid = str(integrated_agent.project.uuid)
         vtex_account = integrated_agent.project.vtex_account
@@ -456,6 +494,13 @@ class Broadcast:
             "template", {}
         ).get("name", "unknown")
 
+        if self.batcher.enabled:
+            batched = self._enqueue_for_batch(
+                message, integrated_agent, lambda_data, dispatch_context
+            )
+            if batched is not None:
+                return batched
+
         try:
             response = self.flows_service.send_whatsapp_broadcast(message)
         except CustomAPIException as exc:
@@ -505,6 +550,193 @@ class Broadcast:
             broadcast_message_uuid=broadcast_message_uuid,
         )
 
+    def _enqueue_for_batch(
+        self,
+        message: Dict[str, Any],
+        integrated_agent: IntegratedAgent,
+        lambda_data: Optional[Dict[str, Any]],
+        dispatch_context: Optional[BroadcastDispatchContext],
+    ) -> Optional[BroadcastDispatchResult]:
+        """Park a single-contact send for a batched Flows dispatch.
+
+        The BroadcastMessage row is recorded PENDING first and parked
+        together with the running execution, which
+        ``flush_batched_dispatch`` completes once Flows has answered.
+        Returns ``None`` when the send cannot be parked, after dropping
+        the PENDING row, so the caller sends it directly.
+        """
+        if len(message.get("urns") or []) != 1:
+            return None
+
+        resolved_template: Optional[Template] = None
+        if lambda_data:
+            try:
+                resolved_template = self.get_current_template(
+                    integrated_agent, lambda_data
+                )
+            except Exception as exc:
+                logger.warning(
+                    f"Could not resolve template for BroadcastMessage record: {exc}"
+                )
+
+        broadcast_message = self._record_broadcast_message(
+            message=message,
+            response={},
+            integrated_agent=integrated_agent,
+            template=resolved_template,
+            dispatch_context=dispatch_context,
+            pending=True,
+        )
+        if broadcast_message is None:
+            return None
+
+        if not self.batcher.enqueue(
+            message,
+            broadcast_message.uuid,
+            lambda_data,
+            execution_uuid=get_current_execution_uuid(),
+            template_uuid=resolved_template.uuid if resolved_template else None,
+        ):
+            broadcast_message.delete()
+            return None
+
+        return BroadcastDispatchResult(
+            response={"status": "pending", "batched": True},
+            broadcast_message_uuid=broadcast_message.uuid,
+        )
+
+    def flush_batched_dispatch(self, batch_key: str) -> int:
+        """Send one drained batch as a multi-URN Flows broadcast.
+
+        Completes the PENDING rows with the shared ``broadcast_id`` and
+        registers one audit event per contact, as an individual dispatch
+        would. The drained contacts are never put back: a failed call
+        may still have reached Flows, so whatever prevents the dispatch
+        marks their rows FAILED instead of risking a second send. Each
+        contact's execution is closed here rather than by the webhook
+        that parked it. Returns the number of contacts the batch carried.
+        """
+        batch = self.batcher.drain(batch_key)
+        if not batch.contacts:
+            return 0
+
+        if batch.message is None:
+            self._fail_batched_dispatch(
+                batch, "Batched broadcast payload expired before dispatch"
+            )
+            return len(batch.contacts)
+
+        message = batch.message_for(batch.urns)
+        try:
+            response = self.flows_service.send_whatsapp_broadcast(message)
+        except CustomAPIException as exc:
+            status_code = getattr(exc, "status_code", None)
+            error_detail = getattr(exc, "detail", str(exc))
+            self._fail_batched_dispatch(
+                batch,
+                f"{type(exc).__name__}(status_code={status_code}): {error_detail}",
+                flows_response={"error": str(error_detail), "status_code": status_code},
+            )
+            return len(batch.contacts)
+        except Exception as exc:
+            logger.exception(f"[FLOWS_BATCH] Error sending batch {batch_key}: {exc}")
+            self._fail_batched_dispatch(batch, f"{type(exc).__name__}: {exc}")
+            return len(batch.contacts)
+
+        broadcast_id = self._extract_broadcast_id(response)
+        CompleteBatchedBroadcastUseCase().execute(
+            CompleteBatchedBroadcastDTO(
+                broadcast_message_uuids=self._batched_row_uuids(batch),
+                broadcast_id=broadcast_id,
+                flows_template_uuid=self._extract_flows_template_uuid(response),
+                flows_response=response or {},
+            )
+        )
+        self._register_batched_events(batch, response)
+
+        for contact in batch.contacts:
+            if contact.execution_uuid is None:
+                continue
+            try:
+                self.exec_logger.log_broadcast_sent(
+                    broadcast_response=response or {},
+                    execution_uuid=contact.execution_uuid,
+                    template_uuid=contact.template_uuid,
+                    broadcast_id=broadcast_id,
+                    broadcast_message_uuid=contact.broadcast_message_uuid,
+                )
+            except Exception as exc:
+                logger.warning(
+                    f"Could not log batched broadcast for execution "
+                    f"{contact.execution_uuid}: {exc}"
+                )
+
+        logger.info(
+            f"Batched broadcast sent. Batch: {batch_key}, "
+            f"Contacts: {len(batch.contacts)}, Response: {response}"
+        )
+        return len(batch.contacts)
+
+    @staticmethod
+    def _batched_row_uuids(batch: BatchedDispatch) -> List[UUID]:
+        return [contact.broadcast_message_uuid for contact in batch.contacts]
+
+    def _fail_batched_dispatch(
+        self,
+        batch: BatchedDispatch,
+        error_message: str,
+        flows_response: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Mark every row and execution of an undispatched batch as failed."""
+        CompleteBatchedBroadcastUseCase().execute(
+            CompleteBatchedBroadcastDTO(
+                broadcast_message_uuids=self._batched_row_uuids(batch),
+                broadcast_id=None,
+                flows_template_uuid=None,
+                flows_response=flows_response or {},
+                error_message=error_message,
+            )
+        )
+        for contact in batch.contacts:
+            if contact.execution_uuid is None:
+                continue
+            try:
+                self.exec_logger.log_execution_error(
+                    error_message=f"Error sending broadcast message: {error_message}",
+                    execution_uuid=contact.execution_uuid,
+                    error_data={"phase": "broadcast_send", "batch": batch.batch_key},
+                )
+            except Exception as exc:
+                logger.warning(
+                    f"Could not log batched broadcast failure for execution "
+                    f"{contact.execution_uuid}: {exc}"
+                )
+
+    def _register_batched_events(
+        self, batch: BatchedDispatch, response: Dict[str, Any]
+    ) -> None:
+        rows = BroadcastMessage.objects.filter(
+            uuid__in=[contact.broadcast_message_uuid for contact in batch.contacts]
+        ).select_related("integrated_agent__project", "integrated_agent__agent")
+        agents = {row.uuid: row.integrated_agent for row in rows}
+
+        for contact in batch.contacts:
+            integrated_agent = agents.get(contact.broadcast_message_uuid)
+            if integrated_agent is None:
+                continue
+            try:
+                self._register_broadcast_event(
+                    batch.message_for([contact.urn]),
+                    response,
+                    integrated_agent,
+                    contact.lambda_data,
+                )
+            except Exception as exc:
+                logger.warning(
+                    f"Could not register batched broadcast event for "
+                    f"{contact.urn}: {exc}"
+                )
+
     def _record_broadcast_message(
         self,
         message: Dict[str, Any],
@@ -512,6 +744,7 @@ class Broadcast:
         integrated_agent: IntegratedAgent,
         template: Optional[Template],
         dispatch_context: Optional[BroadcastDispatchContext] = None,
+        pending: bool = False,
     ) -> Optional[BroadcastMessage]:
         """Persist a BroadcastMessage row for end-to-end tracking.
 
@@ -542,6 +775,7 @@ class Broadcast:
                     flows_template_uuid=flows_template_uuid,
                     flows_response=response or {},
                     dispatch_context=dispatch_context,
+                    pending=pending,
                 )
             )
         except Exception as exc:
@@ -681,15 +915,19 @@ class Broadcast:
             )
             return None
 
-        template = (
-            integrated_agent.templates.filter(
-                name=template_name,
-                is_active=True,
-                current_version__isnull=False,
+        snapshot = self.dispatch_snapshots.get(integrated_agent)
+        if snapshot is not None:
+            template = snapshot.templates.get(template_name)
+        else:
+            template = (
+                integrated_agent.templates.filter(
+                    name=template_name,
+                    is_active=True,
+                    current_version__isnull=False,
+                )
+                .select_related("current_version")
+                .first()
             )
-            .select_related("current_version")
-            .first()
-        )
 
         status = template.current_version.status if template else "NOT_FOUND"
 
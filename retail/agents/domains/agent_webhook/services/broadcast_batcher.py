@@ -0,0 +1,267 @@
+"""Groups single-contact broadcast sends into multi-URN Flows calls.
+
+``Broadcast.send_message`` posts one ``whatsapp_broadcasts`` request per
+contact even though the Flows payload already takes a list of ``urns``.
+When ``FLOWS_BROADCAST_BATCH_WINDOW_SECONDS`` is positive, sends whose
+payload is identical apart from the URN (same channel, template and
+rendered variables) are parked in Redis under a key derived from that
+payload and dispatched together by ``task_flush_flows_broadcast_batch``:
+
+- ``{prefix}:{digest}:message`` holds the shared payload without URNs;
+- ``{prefix}:{digest}:items`` is a list of contacts, each carrying its
+  URN, the UUID of its PENDING ``BroadcastMessage`` row, the execution
+  it belongs to and the Lambda data needed for the per-contact audit
+  event;
+- ``{prefix}:{digest}:scheduled`` is set by the first enqueuer of a
+  window, which is the only one that schedules the flush.
+
+A batch reaching ``FLOWS_BROADCAST_BATCH_MAX_URNS`` is flushed straight
+away; whatever a flush leaves behind (the overflow, or a URN queued
+twice) is flushed again immediately. Every key expires after
+``KEY_TTL_SECONDS`` so an abandoned batch cannot pin Redis memory.
+
+``enqueue`` returns ``False`` whenever the contact could not be parked
+(Redis or the broker unavailable) and callers then send it directly.
+"""
+
+import hashlib
+import json
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+from uuid import UUID
+
+from django.conf import settings
+from django_redis import get_redis_connection
+
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "flows_broadcast_batch"
+DEFAULT_MAX_URNS = 100
+KEY_TTL_SECONDS = 3600
+
+
+def batch_digest(message: Dict[str, Any]) -> str:
+    """Return the digest of ``message`` with its ``urns`` left out."""
+    shared = {key: value for key, value in message.items() if key != "urns"}
+    canonical = json.dumps(shared, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha1(canonical.encode("utf-8")).hexdigest()
+
+
+def _optional_uuid(value: Optional[str]) -> Optional[UUID]:
+    return UUID(value) if value else None
+
+
+def _schedule_flush_task(batch_key: str, countdown: int) -> None:
+    from retail.agents.tasks import task_flush_flows_broadcast_batch
+
+    task_flush_flows_broadcast_batch.apply_async(args=[batch_key], countdown=countdown)
+
+
+@dataclass(frozen=True)
+class BatchedContact:
+    urn: str
+    broadcast_message_uuid: UUID
+    lambda_data: Optional[Dict[str, Any]] = None
+    execution_uuid: Optional[UUID] = None
+    template_uuid: Optional[UUID] = None
+
+
+@dataclass
+class BatchedDispatch:
+    """Contacts drained from one batch, ready for a single Flows call."""
+
+    batch_key: str
+    message: Optional[Dict[str, Any]]
+    contacts: List[BatchedContact] = field(default_factory=list)
+
+    @property
+    def urns(self) -> List[str]:
+        return [contact.urn for contact in self.contacts]
+
+    def message_for(self, urns: List[str]) -> Dict[str, Any]:
+        return {**(self.message or {}), "urns": list(urns)}
+
+
+class FlowsBroadcastBatcher:
+    """Parks sends in Redis and drains them one batch at a time."""
+
+    def __init__(
+        self,
+        redis_client=None,
+        schedule_flush: Optional[Callable[[str, int], None]] = None,
+    ):
+        self._redis_client = redis_client
+        self.schedule_flush = schedule_flush or _schedule_flush_task
+
+    @property
+    def window_seconds(self) -> int:
+        return int(getattr(settings, "FLOWS_BROADCAST_BATCH_WINDOW_SECONDS", 0))
+
+    @property
+    def max_urns(self) -> int:
+        value = getattr(settings, "FLOWS_BROADCAST_BATCH_MAX_URNS", DEFAULT_MAX_URNS)
+        return max(1, int(value))
+
+    @property
+    def enabled(self) -> bool:
+        return self.window_seconds > 0
+
+    @property
+    def redis(self):
+        if self._redis_client is None:
+            self._redis_client = get_redis_connection("default")
+        return self._redis_client
+
+    @staticmethod
+    def _keys(batch_key: str) -> Dict[str, str]:
+        base = f"{KEY_PREFIX}:{batch_key}"
+        return {
+            "message": f"{base}:message",
+            "items": f"{base}:items",
+            "scheduled": f"{base}:scheduled",
+        }
+
+    def enqueue(
+        self,
+        message: Dict[str, Any],
+        broadcast_message_uuid: UUID,
+        lambda_data: Optional[Dict[str, Any]] = None,
+        execution_uuid: Optional[UUID] = None,
+        template_uuid: Optional[UUID] = None,
+    ) -> bool:
+        """Park the single-URN ``message``; ``False`` means send it directly."""
+        urns = message.get("urns") or []
+        if len(urns) != 1:
+            return False
+
+        batch_key = batch_digest(message)
+        keys = self._keys(batch_key)
+        shared = {key: value for key, value in message.items() if key != "urns"}
+        item = json.dumps(
+            {
+                "urn": urns[0],
+                "broadcast_message_uuid": str(broadcast_message_uuid),
+                "lambda_data": lambda_data,
+                "execution_uuid": str(execution_uuid) if execution_uuid else None,
+                "template_uuid": str(template_uuid) if template_uuid else None,
+            },
+            default=str,
+        )
+
+        try:
+            pipe = self.redis.pipeline()
+            pipe.set(
+                keys["message"], json.dumps(shared, default=str), ex=KEY_TTL_SECONDS
+            )
+            pipe.rpush(keys["items"], item)
+            pipe.expire(keys["items"], KEY_TTL_SECONDS)
+            pipe.set(keys["scheduled"], "1", ex=KEY_TTL_SECONDS, nx=True)
+            _, size, _, first_of_window = pipe.execute()
+        except Exception as exc:
+            logger.warning(
+                f"[FLOWS_BATCH] Could not enqueue {urns[0]} into batch "
+                f"{batch_key}, sending directly: {exc}"
+            )
+            return False
+
+        countdown = None
+        if size == self.max_urns:
+            countdown = 0
+        elif first_of_window:
+            countdown = self.window_seconds
+
+        if countdown is not None:
+            try:
+                self.schedule_flush(batch_key, countdown)
+            except Exception as exc:
+                logger.warning(
+                    f"[FLOWS_BATCH] Could not schedule flush of batch {batch_key}, "
+                    f"sending {urns[0]} directly: {exc}"
+                )
+                self._withdraw(keys, item, release_schedule=bool(first_of_window))
+                return False
+
+        logger.info(
+            f"[FLOWS_BATCH] enqueued: batch={batch_key} urn={urns[0]} "
+            f"broadcast_uuid={broadcast_message_uuid} size={size}"
+        )
+        return True
+
+    def _withdraw(
+        self, keys: Dict[str, str], item: str, release_schedule: bool
+    ) -> None:
+        try:
+            self.redis.lrem(keys["items"], 1, item)
+            if release_schedule:
+                self.redis.delete(keys["scheduled"])
+        except Exception as exc:
+            logger.error(
+                f"[FLOWS_BATCH] Could not withdraw item from {keys['items']}; it may "
+                f"be sent twice: {exc}"
+            )
+
+    def drain(self, batch_key: str) -> BatchedDispatch:
+        """Pop up to ``max_urns`` distinct contacts of ``batch_key``.
+
+        A URN queued twice inside the same batch is pushed back so it
+        goes out in the next call: one Flows broadcast can only carry
+        it once. If contacts remain, the next flush is scheduled now.
+        """
+        keys = self._keys(batch_key)
+        max_urns = self.max_urns
+
+        pipe = self.redis.pipeline()
+        pipe.lrange(keys["items"], 0, max_urns - 1)
+        pipe.ltrim(keys["items"], max_urns, -1)
+        pipe.get(keys["message"])
+        pipe.delete(keys["scheduled"])
+        raw_items, _, raw_message, _ = pipe.execute()
+
+        dispatch = BatchedDispatch(
+            batch_key=batch_key,
+            message=json.loads(raw_message) if raw_message else None,
+        )
+        seen = set()
+        requeue = []
+        for raw_item in raw_items:
+            item = json.loads(raw_item)
+            if item["urn"] in seen:
+                requeue.append(raw_item)
+                continue
+            seen.add(item["urn"])
+            dispatch.contacts.append(
+                BatchedContact(
+                    urn=item["urn"],
+                    broadcast_message_uuid=UUID(item["broadcast_message_uuid"]),
+                    lambda_data=item.get("lambda_data"),
+                    execution_uuid=_optional_uuid(item.get("execution_uuid")),
+                    template_uuid=_optional_uuid(item.get("template_uuid")),
+                )
+            )
+
+        try:
+            if requeue:
+                self.redis.rpush(keys["items"], *requeue)
+            if self.redis.llen(keys["items"]) and self.redis.set(
+                keys["scheduled"], "1", ex=KEY_TTL_SECONDS, nx=True
+            ):
+                self._schedule_remaining(keys, batch_key)
+        except Exception as exc:
+            # The drained contacts are already off the list: they must
+            # still go out, so a failure here only concerns the rest.
+            logger.error(
+                f"[FLOWS_BATCH] Could not reschedule batch {batch_key}; the "
+                f"contacts left in it wait for the next enqueue: {exc}"
+            )
+
+        return dispatch
+
+    def _schedule_remaining(self, keys: Dict[str, str], batch_key: str) -> None:
+        try:
+            self.schedule_flush(batch_key, 0)
+        except Exception:
+            # Let the next enqueue of this batch schedule it again.
+            self.redis.delete(keys["scheduled"])
+            raise
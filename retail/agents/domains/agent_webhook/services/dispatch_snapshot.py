@@ -0,0 +1,165 @@
+"""Cached per-agent snapshot of what the webhook dispatch path reads.
+
+Every execution of an integrated agent used to query Postgres for its
+credentials (``_addapt_credentials``), its project rules
+(``_set_project_rules``) and, up to three times, its current template
+(``Broadcast.get_current_template``). Those rows change rarely, so
+``AgentDispatchSnapshotService`` loads them with one query each into an
+``AgentDispatchSnapshot`` and stores it as a single cache entry per
+``IntegratedAgent``.
+
+The key carries ``SNAPSHOT_VERSION`` so a deploy that changes the
+snapshot layout never reads entries written by the previous release.
+Entries are dropped by the ``post_save``/``post_delete`` receivers on
+``Template``, ``Version`` and ``Credential`` (once immediately and once
+after commit, so a reader racing the write cannot re-cache the old
+rows) and expire after ``AGENT_DISPATCH_SNAPSHOT_TTL`` as a backstop.
+
+The snapshot is memoised on the service instance, so one use case
+execution costs at most one cache read. When the cache backend is
+unreachable ``get`` returns ``None`` and callers fall back to their
+per-call queries until ``_cache_gate`` lets the backend be tried again.
+Lookups are emitted as the StatsD counter
+``agent.dispatch_snapshot.lookups``, tagged ``result`` (``hit``,
+``miss`` or ``unavailable``); nothing is counted when StatsD is disabled.
+"""
+
+import logging
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+from retail.agents.domains.agent_integration.models import IntegratedAgent
+from retail.observability.backoff import BackoffGate
+from retail.observability.statsd import get_statsd_client
+from retail.templates.models import Template
+
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_VERSION = 1
+KEY_PREFIX = "agent_dispatch_snapshot"
+DEFAULT_TTL_SECONDS = 600
+
+# Module level because a service instance only lives for one execution.
+_cache_gate = BackoffGate(
+    logger, "[DISPATCH_SNAPSHOT] Cache unavailable, querying the database"
+)
+
+
+def snapshot_cache_key(integrated_agent_id: int) -> str:
+    return f"{KEY_PREFIX}:v{SNAPSHOT_VERSION}:{integrated_agent_id}"
+
+
+def _count(result: str) -> None:
+    """Count a lookup by outcome (hit, miss, unavailable)."""
+    statsd = get_statsd_client()
+    if statsd.enabled:
+        statsd.send([("agent.dispatch_snapshot.lookups", 1, "c", {"result": result})])
+
+
+@dataclass
+class AgentDispatchSnapshot:
+    """Dispatch-time view of one IntegratedAgent's templates and credentials."""
+
+    credentials: Dict[str, str] = field(default_factory=dict)
+    project_rules: List[Dict[str, str]] = field(default_factory=list)
+    # Active templates with a current version, by name; the first by pk
+    # wins, matching ``.first()`` on the unordered queryset it replaces.
+    templates: Dict[str, Template] = field(default_factory=dict)
+
+    @classmethod
+    def build(cls, integrated_agent: IntegratedAgent) -> "AgentDispatchSnapshot":
+        snapshot = cls(
+            credentials={
+                credential.key: credential.value
+                for credential in integrated_agent.credentials.all()
+            }
+        )
+        templates = (
+            integrated_agent.templates.filter(is_active=True)
+            .select_related("current_version")
+            .order_by("pk")
+        )
+        for template in templates:
+            if template.parent_id is None and template.rule_code:
+                snapshot.project_rules.append(
+                    {"source": template.rule_code, "template": template.name}
+                )
+            if template.current_version_id is not None:
+                snapshot.templates.setdefault(template.name, template)
+        return snapshot
+
+
+class AgentDispatchSnapshotService:
+    """Loads (and caches) the ``AgentDispatchSnapshot`` of an agent."""
+
+    def __init__(self, ttl: Optional[int] = None):
+        self.ttl = ttl
+        self._loaded: Dict[int, Optional[AgentDispatchSnapshot]] = {}
+
+    @property
+    def enabled(self) -> bool:
+        return self._ttl() > 0
+
+    def _ttl(self) -> int:
+        if self.ttl is not None:
+            return self.ttl
+        return getattr(settings, "AGENT_DISPATCH_SNAPSHOT_TTL", DEFAULT_TTL_SECONDS)
+
+    def get(self, integrated_agent: IntegratedAgent) -> Optional[AgentDispatchSnapshot]:
+        """Return the agent's snapshot, or ``None`` if callers must query."""
+        if not self.enabled:
+            return None
+        if integrated_agent.pk not in self._loaded:
+            self._loaded[integrated_agent.pk] = self._load(integrated_agent)
+        return self._loaded[integrated_agent.pk]
+
+    def _load(
+        self, integrated_agent: IntegratedAgent
+    ) -> Optional[AgentDispatchSnapshot]:
+        if not _cache_gate.available:
+            _count("unavailable")
+            return None
+
+        key = snapshot_cache_key(integrated_agent.pk)
+        try:
+            snapshot = cache.get(key)
+        except Exception as exc:
+            _cache_gate.trip(exc)
+            _count("unavailable")
+            return None
+
+        if snapshot is not None:
+            _count("hit")
+            return snapshot
+
+        _count("miss")
+        snapshot = AgentDispatchSnapshot.build(integrated_agent)
+        try:
+            cache.set(key, snapshot, timeout=self._ttl())
+        except Exception as exc:
+            _cache_gate.trip(exc)
+        return snapshot
+
+
+def invalidate_dispatch_snapshot(integrated_agent_id: Optional[int]) -> None:
+    """Drop the cached snapshot of ``integrated_agent_id``, now and on commit."""
+    if integrated_agent_id is None:
+        return
+
+    key = snapshot_cache_key(integrated_agent_id)
+
+    # Deliberately ignores the retry backoff: writes are rare and a
+    # skipped delete would leave a stale snapshot for the whole TTL.
+    def _delete() -> None:
+        try:
+            cache.delete(key)
+        except Exception as exc:
+            _cache_gate.trip(exc)
+
+    _delete()
+    transaction.on_commit(_delete)
@@ -15,6 +15,9 @@ from retail.agents.domains.agent_webhook.services.broadcast import (
 from retail.agents.domains.agent_webhook.services.active_agent import (
     ActiveAgent,
 )
+from retail.agents.domains.agent_webhook.services.dispatch_snapshot import (
+    AgentDispatchSnapshotService,
+)
 from retail.agents.domains.agent_webhook.services.integrated_agent_resolver import (
     IntegratedAgentWebhookResolver,
 )
@@ -42,9 +45,13 @@ class AgentWebhookUseCase:
         cache: Optional[IntegratedAgentCacheHandler] = None,
         exec_logger: Optional[ExecutionLoggerServiceInterface] = None,
         integrated_agent_resolver: Optional[IntegratedAgentWebhookResolver] = None,
+        dispatch_snapshots: Optional[AgentDispatchSnapshotService] = None,
     ):
         self.active_agent = active_agent or ActiveAgent()
-        self.broadcast_handler = broadcast or Broadcast()
+        self.dispatch_snapshots = dispatch_snapshots or AgentDispatchSnapshotService()
+        self.broadcast_handler = broadcast or Broadcast(
+            dispatch_snapshots=self.dispatch_snapshots
+        )
         self.cache_handler = cache or IntegratedAgentCacheHandlerRedis()
         self.integrated_agent_resolver = (
             integrated_agent_resolver
@@ -64,6 +71,10 @@ class AgentWebhookUseCase:
 
     def _addapt_credentials(self, integrated_agent: IntegratedAgent) -> Dict[str, str]:
         """Convert integrated agent credentials to dictionary format."""
+        snapshot = self.dispatch_snapshots.get(integrated_agent)
+        if snapshot is not None:
+            return dict(snapshot.credentials)
+
         credentials = integrated_agent.credentials.all()
 
         credentials_dict = {}
@@ -88,6 +99,11 @@ class AgentWebhookUseCase:
     def _set_project_rules(
         self, integrated_agent: IntegratedAgent, data: "RequestData"
     ) -> None:
+        snapshot = self.dispatch_snapshots.get(integrated_agent)
+        if snapshot is not None:
+            data.set_project_rules([dict(rule) for rule in snapshot.project_rules])
+            return
+
         templates = integrated_agent.templates.filter(
             is_active=True, parent__isnull=True
         ).values("rule_code", "name")
@@ -201,6 +217,15 @@ class AgentWebhookUseCase:
 
         broadcast_response = dispatch_result.response
         broadcast_message_uuid = dispatch_result.broadcast_message_uuid
+        if broadcast_response and broadcast_response.get("batched"):
+            # Parked for a multi-URN dispatch: the flush logs the
+            # outcome on this execution once Flows has answered.
+            logger.info(
+                f"Broadcast parked for batched dispatch: "
+                f"broadcast_message_uuid={broadcast_message_uuid}"
+            )
+            return data
+
         template_uuid = template.uuid if template and template is not False else None
         broadcast_id = broadcast_response.get("id") if broadcast_response else None
 
@@ -0,0 +1,86 @@
+"""Run the agent webhook pipeline benchmark and print a JSON report.
+
+Usage::
+
+    python manage.py benchmark_agent_webhook --executions 500 \\
+        --lambda-latency-ms 80 --output before.json
+
+The run happens inside a throwaway test database (created and dropped
+by this command) against the Redis configured in ``REDIS_URL``; see
+``retail.agents.benchmarks.webhook_pipeline`` for what is measured.
+"""
+
+import json
+import subprocess
+
+from django.core.management.base import BaseCommand
+
+from retail.agents.benchmarks.database import benchmark_database
+from retail.agents.benchmarks.webhook_pipeline import (
+    AgentWebhookPipelineBenchmark,
+    BenchmarkConfig,
+)
+
+
+def _git_revision() -> str:
+    try:
+        return (
+            subprocess.check_output(
+                ["git", "rev-parse", "--short", "HEAD"], stderr=subprocess.DEVNULL
+            )
+            .decode()
+            .strip()
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+class Command(BaseCommand):
+    help = "Benchmark the agent webhook pipeline end to end and emit a JSON report."
+
+    def add_arguments(self, parser):
+        defaults = BenchmarkConfig()
+        parser.add_argument("--executions", type=int, default=defaults.executions)
+        parser.add_argument("--warmup", type=int, default=defaults.warmup)
+        parser.add_argument("--flush-every", type=int, default=defaults.flush_every)
+        parser.add_argument(
+            "--lambda-latency-ms", type=float, default=defaults.lambda_latency_ms
+        )
+        parser.add_argument(
+            "--flows-latency-ms", type=float, default=defaults.flows_latency_ms
+        )
+        parser.add_argument(
+            "--s3-latency-ms", type=float, default=defaults.s3_latency_ms
+        )
+        parser.add_argument(
+            "--output",
+            help="Write the JSON report to this path instead of stdout.",
+        )
+        parser.add_argument(
+            "--keepdb",
+            action="store_true",
+            help="Reuse the benchmark database between runs.",
+        )
+
+    def handle(self, *args, **options):
+        config = BenchmarkConfig(
+            executions=options["executions"],
+            warmup=options["warmup"],
+            flush_every=options["flush_every"],
+            lambda_latency_ms=options["lambda_latency_ms"],
+            flows_latency_ms=options["flows_latency_ms"],
+            s3_latency_ms=options["s3_latency_ms"],
+        )
+
+        with benchmark_database(keepdb=options["keepdb"]):
+            report = AgentWebhookPipelineBenchmark(config).run().as_dict()
+
+        report["git_revision"] = _git_revision()
+        rendered = json.dumps(report, indent=2, sort_keys=True)
+
+        if options["output"]:
+            with open(options["output"], "w") as fp:
+                fp.write(rendered + "\n")
+            self.stdout.write(f"Benchmark report written to {options['output']}")
+        else:
+            self.stdout.write(rendered)
@@ -0,0 +1,56 @@
+"""Time broadcast message building with and without the presigned-URL cache.
+
+Usage::
+
+    python manage.py benchmark_broadcast_build --messages 2000 \\
+        --output presign.json
+
+No database is touched. See ``retail.agents.benchmarks.broadcast_build``
+for what is measured.
+"""
+
+import json
+
+from django.core.management.base import BaseCommand
+
+from retail.agents.benchmarks.broadcast_build import (
+    BroadcastBuildBenchmark,
+    BroadcastBuildConfig,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark per-message build time of S3-headered broadcasts and emit "
+        "a JSON report."
+    )
+
+    def add_arguments(self, parser):
+        defaults = BroadcastBuildConfig()
+        parser.add_argument("--messages", type=int, default=defaults.messages)
+        parser.add_argument("--warmup", type=int, default=defaults.warmup)
+        parser.add_argument(
+            "--use-configured-cache",
+            action="store_true",
+            help="Share URLs through the default Django cache instead of LocMemCache.",
+        )
+        parser.add_argument(
+            "--output",
+            help="Write the JSON report to this path instead of stdout.",
+        )
+
+    def handle(self, *args, **options):
+        config = BroadcastBuildConfig(
+            messages=options["messages"],
+            warmup=options["warmup"],
+            use_configured_cache=options["use_configured_cache"],
+        )
+        report = BroadcastBuildBenchmark(config).run().as_dict()
+        rendered = json.dumps(report, indent=2, sort_keys=True)
+
+        if options["output"]:
+            with open(options["output"], "w") as fp:
+                fp.write(rendered + "\n")
+            self.stdout.write(f"Benchmark report written to {options['output']}")
+        else:
+            self.stdout.write(rendered)
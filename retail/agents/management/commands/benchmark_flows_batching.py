@@ -0,0 +1,62 @@
+"""Compare per-contact and batched multi-URN Flows dispatch throughput.
+
+Usage::
+
+    python manage.py benchmark_flows_batching --contacts 2000 \\
+        --distinct-payloads 10 --max-urns 100 --output batching.json
+
+A stub Flows server is started on localhost; no database, Redis or
+real Flows is touched. See ``retail.agents.benchmarks.flows_batching``
+for what is measured.
+"""
+
+import json
+
+from django.core.management.base import BaseCommand
+
+from retail.agents.benchmarks.flows_batching import (
+    FlowsBatchingBenchmark,
+    FlowsBatchingConfig,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark Flows calls and contacts per second with and without "
+        "multi-URN batching and emit a JSON report."
+    )
+
+    def add_arguments(self, parser):
+        defaults = FlowsBatchingConfig()
+        parser.add_argument("--contacts", type=int, default=defaults.contacts)
+        parser.add_argument(
+            "--distinct-payloads", type=int, default=defaults.distinct_payloads
+        )
+        parser.add_argument("--max-urns", type=int, default=defaults.max_urns)
+        parser.add_argument(
+            "--flows-latency-ms",
+            type=float,
+            default=defaults.flows_latency_ms,
+            help="Time the stub Flows server spends on each broadcast call.",
+        )
+        parser.add_argument(
+            "--output",
+            help="Write the JSON report to this path instead of stdout.",
+        )
+
+    def handle(self, *args, **options):
+        config = FlowsBatchingConfig(
+            contacts=options["contacts"],
+            distinct_payloads=options["distinct_payloads"],
+            max_urns=options["max_urns"],
+            flows_latency_ms=options["flows_latency_ms"],
+        )
+        report = FlowsBatchingBenchmark(config).run().as_dict()
+        rendered = json.dumps(report, indent=2, sort_keys=True)
+
+        if options["output"]:
+            with open(options["output"], "w") as fp:
+                fp.write(rendered + "\n")
+            self.stdout.write(f"Benchmark report written to {options['output']}")
+        else:
+            self.stdout.write(rendered)
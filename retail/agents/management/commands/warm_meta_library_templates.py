@@ -0,0 +1,100 @@
+"""Pre-warm the shared Meta library template cache.
+
+Usage::
+
+    python manage.py warm_meta_library_templates [--language es_MX ...] \\
+        [--workers 8]
+
+Fetches every template name referenced by a ``PreApprovedTemplate`` in
+each language and stores the result (or the fact that Meta has no such
+translation) in the cache read by
+``MetaService.fetch_library_template_by_name_and_language``. Without
+``--language`` the languages are ``pt_BR`` plus every
+``initial_template_language`` already recorded on an integrated agent.
+Existing entries are overwritten.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from retail.agents.domains.agent_integration.models import IntegratedAgent
+from retail.agents.domains.agent_integration.usecases.assign import (
+    DEFAULT_META_LIBRARY_FETCH_WORKERS,
+)
+from retail.agents.domains.agent_management.models import PreApprovedTemplate
+from retail.agents.shared.country_code_utils import DEFAULT_TEMPLATE_LANGUAGE
+from retail.services.meta import MetaService
+
+
+class Command(BaseCommand):
+    help = (
+        "Fetch every Meta library template referenced by a pre-approved "
+        "template into the shared cache."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--language",
+            action="append",
+            dest="languages",
+            help="Language to warm (repeatable). Defaults to the languages in use.",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=getattr(
+                settings,
+                "META_LIBRARY_FETCH_WORKERS",
+                DEFAULT_META_LIBRARY_FETCH_WORKERS,
+            ),
+            help="How many templates are fetched from Meta at the same time.",
+        )
+
+    def handle(self, *args, **options):
+        names = sorted(
+            set(
+                PreApprovedTemplate.objects.exclude(name="").values_list(
+                    "name", flat=True
+                )
+            )
+        )
+        languages = options["languages"] or self._languages_in_use()
+        pairs = [(name, language) for name in names for language in languages]
+        if not pairs:
+            self.stdout.write("No library templates to warm.")
+            return
+
+        meta_service = MetaService()
+        workers = max(1, min(options["workers"], len(pairs)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            outcomes = list(
+                executor.map(lambda pair: self._warm(meta_service, *pair), pairs)
+            )
+
+        found = outcomes.count("found")
+        missing = outcomes.count("missing")
+        failed = outcomes.count("failed")
+        self.stdout.write(
+            f"Warmed {len(pairs)} library templates in {len(languages)} language(s): "
+            f"{found} found, {missing} missing, {failed} failed."
+        )
+
+    def _warm(self, meta_service: MetaService, name: str, language: str) -> str:
+        try:
+            template = meta_service.refresh_library_template(name, language)
+        except Exception as exc:
+            self.stderr.write(f"Failed to warm {name} ({language}): {exc}")
+            return "failed"
+        return "found" if template is not None else "missing"
+
+    @staticmethod
+    def _languages_in_use() -> List[str]:
+        recorded: List[Optional[str]] = list(
+            IntegratedAgent.objects.filter(config__has_key="initial_template_language")
+            .values_list("config__initial_template_language", flat=True)
+            .distinct()
+        )
+        return sorted({DEFAULT_TEMPLATE_LANGUAGE, *filter(None, recorded)})
@@ -28,6 +28,7 @@ from retail.agents.domains.agent_integration.usecases.delivered_order_tracking i
 from retail.agents.domains.agent_integration.usecases.payment_recovery import (
     PaymentRecoveryWebhookUseCase,
 )
+from retail.agents.domains.agent_webhook.services.broadcast import Broadcast
 
 
 logger = logging.getLogger(__name__)
@@ -240,3 +241,18 @@ def task_payment_recovery_webhook(
             f"vtex_account={vtex_account} agent_uuid={integrated_agent_uuid} "
             f"result={result} data={webhook_data}"
         )
+
+
+@shared_task(name="task_flush_flows_broadcast_batch")
+def task_flush_flows_broadcast_batch(batch_key: str) -> int:
+    """Send one batch of parked broadcast sends as a multi-URN Flows call.
+
+    Scheduled by ``FlowsBroadcastBatcher.enqueue`` when a batch window
+    opens or fills up. Returns the number of contacts dispatched, or 0
+    on failure so a broken batch never retries into a duplicate send.
+    """
+    try:
+        return Broadcast().flush_batched_dispatch(batch_key)
+    except Exception:
+        logger.exception(f"[FLOWS_BATCH] Error flushing broadcast batch {batch_key}")
+        return 0
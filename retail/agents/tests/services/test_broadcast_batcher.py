@@ -0,0 +1,227 @@
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+from django.test import TestCase, override_settings
+
+from retail.agents.domains.agent_execution.context import (
+    clear_execution_context,
+    set_current_execution_uuid,
+)
+from retail.agents.domains.agent_execution.tests._fakes import FakeRedisConnection
+from retail.agents.domains.agent_integration.models import IntegratedAgent
+from retail.agents.domains.agent_management.models import Agent
+from retail.agents.domains.agent_webhook.services.broadcast import Broadcast
+from retail.agents.domains.agent_webhook.services.broadcast_batcher import (
+    FlowsBroadcastBatcher,
+    batch_digest,
+)
+from retail.broadcasts.models import BroadcastMessage, BroadcastStatus
+from retail.clients.exceptions import CustomAPIException
+from retail.projects.models import Project
+
+
+class BrokenRedis:
+    def pipeline(self, *args, **kwargs):
+        raise ConnectionError("redis down")
+
+
+@override_settings(
+    FLOWS_BROADCAST_BATCH_WINDOW_SECONDS=2, FLOWS_BROADCAST_BATCH_MAX_URNS=3
+)
+class FlowsBroadcastBatcherTest(TestCase):
+    def setUp(self):
+        self.project = Project.objects.create(
+            uuid=uuid4(), name="Batch Project", vtex_account="batch-store"
+        )
+        agent = Agent.objects.create(
+            name="Campaign Agent", project=self.project, credentials={}
+        )
+        self.integrated_agent = IntegratedAgent.objects.create(
+            agent=agent, project=self.project, channel_uuid=uuid4()
+        )
+        self.redis = FakeRedisConnection()
+        self.scheduled = []
+        self.flows_service = MagicMock()
+        self.flows_service.send_whatsapp_broadcast.return_value = {
+            "id": 9001,
+            "status": "queued",
+        }
+        self.audit_func = MagicMock()
+        self.exec_logger = MagicMock()
+        self.broadcast = Broadcast(
+            flows_service=self.flows_service,
+            audit_func=self.audit_func,
+            exec_logger=self.exec_logger,
+            batcher=FlowsBroadcastBatcher(
+                redis_client=self.redis,
+                schedule_flush=lambda key, countdown: self.scheduled.append(
+                    (key, countdown)
+                ),
+            ),
+        )
+
+    def _message(self, urn, name="Black Friday"):
+        return {
+            "project": str(self.project.uuid),
+            "urns": [urn],
+            "channel": str(self.integrated_agent.channel_uuid),
+            "msg": {"template": {"name": "campaign", "variables": [name]}},
+        }
+
+    def _send(self, urn, execution_uuid=None, **kwargs):
+        set_current_execution_uuid(execution_uuid)
+        self.addCleanup(clear_execution_context)
+        return self.broadcast.send_message(
+            self._message(urn, **kwargs), self.integrated_agent
+        )
+
+    def test_identical_sends_share_one_multi_urn_flows_call(self):
+        results = [self._send(f"whatsapp:55119000000{i}") for i in range(2)]
+
+        self.flows_service.send_whatsapp_broadcast.assert_not_called()
+        self.assertEqual(
+            self.scheduled, [(batch_digest(self._message("whatsapp:x")), 2)]
+        )
+        self.assertEqual(results[0].response, {"status": "pending", "batched": True})
+        self.assertEqual(
+            BroadcastMessage.objects.filter(status=BroadcastStatus.PENDING).count(), 2
+        )
+
+        sent = self.broadcast.flush_batched_dispatch(self.scheduled[0][0])
+
+        self.assertEqual(sent, 2)
+        self.flows_service.send_whatsapp_broadcast.assert_called_once()
+        message = self.flows_service.send_whatsapp_broadcast.call_args.args[0]
+        self.assertEqual(
+            message["urns"], ["whatsapp:551190000000", "whatsapp:551190000001"]
+        )
+        rows = BroadcastMessage.objects.filter(
+            uuid__in=[result.broadcast_message_uuid for result in results]
+        )
+        self.assertEqual(
+            {(row.broadcast_id, row.status) for row in rows},
+            {(9001, BroadcastStatus.QUEUED)},
+        )
+        audited_urns = [
+            call.args[1]["contact_urn"] for call in self.audit_func.call_args_list
+        ]
+        self.assertEqual(
+            audited_urns, ["whatsapp:551190000000", "whatsapp:551190000001"]
+        )
+
+    def test_different_variables_go_to_different_batches(self):
+        self._send("whatsapp:5511900000001", name="Ana")
+        self._send("whatsapp:5511900000002", name="Bia")
+
+        self.assertEqual(len({key for key, _ in self.scheduled}), 2)
+
+    def test_full_batch_is_flushed_without_waiting_for_the_window(self):
+        for i in range(3):
+            self._send(f"whatsapp:55119000000{i}")
+
+        self.assertEqual([countdown for _, countdown in self.scheduled], [2, 0])
+
+    def test_repeated_urn_is_sent_in_the_next_call(self):
+        self.flows_service.send_whatsapp_broadcast.side_effect = [
+            {"id": 9001, "status": "queued"},
+            {"id": 9002, "status": "queued"},
+        ]
+        self._send("whatsapp:5511900000001")
+        self._send("whatsapp:5511900000001")
+        batch_key = self.scheduled[0][0]
+
+        self.broadcast.flush_batched_dispatch(batch_key)
+        self.assertEqual(self.scheduled[-1], (batch_key, 0))
+        self.broadcast.flush_batched_dispatch(batch_key)
+
+        calls = self.flows_service.send_whatsapp_broadcast.call_args_list
+        self.assertEqual(
+            [call.args[0]["urns"] for call in calls],
+            [["whatsapp:5511900000001"], ["whatsapp:5511900000001"]],
+        )
+        self.assertEqual(
+            sorted(BroadcastMessage.objects.values_list("broadcast_id", flat=True)),
+            [9001, 9002],
+        )
+
+    def test_flows_rejection_fails_every_row_of_the_batch(self):
+        self.flows_service.send_whatsapp_broadcast.side_effect = CustomAPIException(
+            detail="bad template", status_code=400
+        )
+        self._send("whatsapp:5511900000001")
+        self._send("whatsapp:5511900000002")
+
+        self.broadcast.flush_batched_dispatch(self.scheduled[0][0])
+
+        rows = BroadcastMessage.objects.all()
+        self.assertEqual({row.status for row in rows}, {BroadcastStatus.FAILED})
+        self.assertTrue(all("bad template" in row.error_message for row in rows))
+        self.assertTrue(all(row.broadcast_id is None for row in rows))
+        self.audit_func.assert_not_called()
+
+    def test_executions_are_completed_once_the_batch_is_sent(self):
+        executions = [uuid4(), uuid4()]
+        results = [
+            self._send(f"whatsapp:55119000000{i}", execution_uuid=execution)
+            for i, execution in enumerate(executions)
+        ]
+        self.exec_logger.log_broadcast_sent.assert_not_called()
+
+        self.broadcast.flush_batched_dispatch(self.scheduled[0][0])
+
+        logged = {
+            call.kwargs["execution_uuid"]: call.kwargs
+            for call in self.exec_logger.log_broadcast_sent.call_args_list
+        }
+        self.assertEqual(set(logged), set(executions))
+        for execution, result in zip(executions, results):
+            self.assertEqual(logged[execution]["broadcast_id"], 9001)
+            self.assertEqual(
+                logged[execution]["broadcast_message_uuid"],
+                result.broadcast_message_uuid,
+            )
+
+    def test_unexpected_send_error_fails_the_drained_contacts(self):
+        self.flows_service.send_whatsapp_broadcast.side_effect = TimeoutError(
+            "flows timed out"
+        )
+        execution = uuid4()
+        self._send("whatsapp:5511900000001", execution_uuid=execution)
+        batch_key = self.scheduled[0][0]
+
+        with self.assertLogs(
+            "retail.agents.domains.agent_webhook.services.broadcast", "ERROR"
+        ):
+            self.broadcast.flush_batched_dispatch(batch_key)
+
+        row = BroadcastMessage.objects.get()
+        self.assertEqual(row.status, BroadcastStatus.FAILED)
+        self.assertIn("flows timed out", row.error_message)
+        self.assertEqual(
+            self.exec_logger.log_execution_error.call_args.kwargs["execution_uuid"],
+            execution,
+        )
+        self.exec_logger.log_broadcast_sent.assert_not_called()
+        self.assertEqual(self.broadcast.flush_batched_dispatch(batch_key), 0)
+
+    def test_sends_directly_when_redis_is_unavailable(self):
+        self.broadcast.batcher = FlowsBroadcastBatcher(redis_client=BrokenRedis())
+
+        with self.assertLogs(
+            "retail.agents.domains.agent_webhook.services.broadcast_batcher",
+            "WARNING",
+        ):
+            result = self._send("whatsapp:5511900000001")
+
+        self.flows_service.send_whatsapp_broadcast.assert_called_once()
+        row = BroadcastMessage.objects.get()
+        self.assertEqual(row.uuid, result.broadcast_message_uuid)
+        self.assertEqual(row.broadcast_id, 9001)
+        self.assertEqual(row.status, BroadcastStatus.QUEUED)
+
+    @override_settings(FLOWS_BROADCAST_BATCH_WINDOW_SECONDS=0)
+    def test_disabled_batching_sends_each_contact(self):
+        self._send("whatsapp:5511900000001")
+
+        self.flows_service.send_whatsapp_broadcast.assert_called_once()
+        self.assertEqual(self.redis.command_log, [])
@@ -0,0 +1,172 @@
+from unittest.mock import MagicMock, patch
+from uuid import uuid4
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from retail.agents.domains.agent_integration.models import Credential, IntegratedAgent
+from retail.agents.domains.agent_management.models import Agent
+from retail.agents.domains.agent_webhook.services import (
+    dispatch_snapshot as dispatch_snapshot_module,
+)
+from retail.agents.domains.agent_webhook.services.broadcast import Broadcast
+from retail.agents.domains.agent_webhook.services.dispatch_snapshot import (
+    AgentDispatchSnapshotService,
+)
+from retail.agents.domains.agent_webhook.usecases.webhook import AgentWebhookUseCase
+from retail.interfaces.clients.aws_lambda.client import RequestData
+from retail.projects.models import Project
+from retail.templates.models import Template, Version
+
+
+@override_settings(
+    CACHES={
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "agent-dispatch-snapshot",
+        }
+    },
+    AGENT_DISPATCH_SNAPSHOT_TTL=600,
+)
+class AgentDispatchSnapshotTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        dispatch_snapshot_module._cache_gate.reset()
+        self.addCleanup(dispatch_snapshot_module._cache_gate.reset)
+
+        self.project = Project.objects.create(
+            uuid=uuid4(), name="Snapshot Project", vtex_account="snapshot-store"
+        )
+        agent = Agent.objects.create(
+            name="Order Status Agent",
+            lambda_arn="arn:aws:lambda:snapshot",
+            project=self.project,
+            credentials={},
+        )
+        self.integrated_agent = IntegratedAgent.objects.create(
+            agent=agent, project=self.project, channel_uuid=uuid4()
+        )
+        self.credential = Credential.objects.create(
+            key="app_key",
+            label="App key",
+            value="secret-1",
+            integrated_agent=self.integrated_agent,
+        )
+        self.template = Template.objects.create(
+            name="order_invoiced",
+            rule_code="def rule(): return True",
+            integrated_agent=self.integrated_agent,
+        )
+        self.version = Version.objects.create(
+            template=self.template,
+            template_name="weni_order_invoiced",
+            integrations_app_uuid=uuid4(),
+            project=self.project,
+            status="APPROVED",
+        )
+        self.template.current_version = self.version
+        self.template.save(update_fields=["current_version"])
+
+    def _webhook_use_case(self):
+        snapshots = AgentDispatchSnapshotService()
+        return AgentWebhookUseCase(
+            active_agent=MagicMock(),
+            broadcast=Broadcast(
+                flows_service=MagicMock(),
+                audit_func=MagicMock(),
+                dispatch_snapshots=snapshots,
+            ),
+            cache=MagicMock(),
+            exec_logger=MagicMock(),
+            integrated_agent_resolver=MagicMock(),
+            dispatch_snapshots=snapshots,
+        )
+
+    def _resolve_dispatch_inputs(self, use_case):
+        data = RequestData(params={}, payload={})
+        credentials = use_case._addapt_credentials(self.integrated_agent)
+        use_case._set_project_rules(self.integrated_agent, data)
+        template = use_case.broadcast_handler.get_current_template(
+            self.integrated_agent, {"template": "order_invoiced"}
+        )
+        return credentials, data.project_rules, template
+
+    def test_second_execution_reads_everything_from_one_cache_entry(self):
+        self._resolve_dispatch_inputs(self._webhook_use_case())
+
+        with self.assertNumQueries(0):
+            credentials, rules, template = self._resolve_dispatch_inputs(
+                self._webhook_use_case()
+            )
+
+        self.assertEqual(credentials, {"app_key": "secret-1"})
+        self.assertEqual(
+            rules,
+            [{"source": "def rule(): return True", "template": "order_invoiced"}],
+        )
+        self.assertEqual(template.pk, self.template.pk)
+        self.assertEqual(template.current_version.status, "APPROVED")
+
+    @patch.object(dispatch_snapshot_module, "get_statsd_client")
+    def test_counts_hits_and_misses(self, mock_get_statsd_client):
+        statsd = mock_get_statsd_client.return_value
+        statsd.enabled = True
+
+        AgentDispatchSnapshotService().get(self.integrated_agent)
+        AgentDispatchSnapshotService().get(self.integrated_agent)
+
+        results = [
+            metric[3]["result"]
+            for call in statsd.send.call_args_list
+            for metric in call.args[0]
+        ]
+        self.assertEqual(results, ["miss", "hit"])
+
+    def test_version_status_change_invalidates_the_snapshot(self):
+        self._resolve_dispatch_inputs(self._webhook_use_case())
+
+        self.version.status = "PAUSED"
+        self.version.save(update_fields=["status"])
+
+        with self.assertLogs(
+            "retail.agents.domains.agent_webhook.services.broadcast", "WARNING"
+        ):
+            _, _, template = self._resolve_dispatch_inputs(self._webhook_use_case())
+        self.assertIsNone(template)
+
+    def test_credential_change_invalidates_the_snapshot(self):
+        self._resolve_dispatch_inputs(self._webhook_use_case())
+
+        self.credential.value = "secret-2"
+        self.credential.save()
+
+        credentials, _, _ = self._resolve_dispatch_inputs(self._webhook_use_case())
+        self.assertEqual(credentials, {"app_key": "secret-2"})
+
+    def test_template_deactivation_drops_its_rule(self):
+        self._resolve_dispatch_inputs(self._webhook_use_case())
+
+        self.template.is_active = False
+        self.template.save(update_fields=["is_active"])
+
+        _, rules, _ = self._resolve_dispatch_inputs(self._webhook_use_case())
+        self.assertEqual(rules, [])
+
+    @override_settings(AGENT_DISPATCH_SNAPSHOT_TTL=0)
+    def test_disabled_snapshot_is_never_cached(self):
+        self.assertIsNone(AgentDispatchSnapshotService().get(self.integrated_agent))
+        self.assertIsNone(
+            cache.get(f"agent_dispatch_snapshot:v1:{self.integrated_agent.pk}")
+        )
+
+    def test_falls_back_to_queries_when_the_cache_is_down(self):
+        with patch.object(
+            dispatch_snapshot_module.cache, "get", side_effect=ConnectionError("down")
+        ), self.assertLogs(dispatch_snapshot_module.logger, "WARNING"):
+            credentials, rules, template = self._resolve_dispatch_inputs(
+                self._webhook_use_case()
+            )
+
+        self.assertEqual(credentials, {"app_key": "secret-1"})
+        self.assertEqual(len(rules), 1)
+        self.assertEqual(template.pk, self.template.pk)
@@ -0,0 +1,26 @@
+"""Smoke test for the broadcast build microbenchmark harness."""
+
+from django.test import TestCase
+
+from retail.agents.benchmarks.broadcast_build import (
+    BroadcastBuildBenchmark,
+    BroadcastBuildConfig,
+)
+
+
+class BroadcastBuildBenchmarkTests(TestCase):
+    def test_reports_both_modes_and_signs_once_when_cached(self):
+        report = (
+            BroadcastBuildBenchmark(BroadcastBuildConfig(messages=3, warmup=1))
+            .run()
+            .as_dict()
+        )
+
+        uncached, cached = report["modes"]["uncached"], report["modes"]["cached"]
+        self.assertEqual(uncached["per_message_us"]["count"], 3)
+        self.assertEqual(uncached["urls_signed"], 3)
+        self.assertEqual(uncached["s3_services_built"], 3)
+        self.assertEqual(cached["per_message_us"]["count"], 3)
+        self.assertEqual(cached["urls_signed"], 0)
+        self.assertEqual(cached["s3_services_built"], 0)
+        self.assertIn("speedup", report)
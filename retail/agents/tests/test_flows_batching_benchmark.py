@@ -0,0 +1,29 @@
+"""Smoke test for the Flows batching benchmark harness."""
+
+from django.test import TestCase
+
+from retail.agents.benchmarks.flows_batching import (
+    FlowsBatchingBenchmark,
+    FlowsBatchingConfig,
+)
+
+
+class FlowsBatchingBenchmarkTests(TestCase):
+    def test_batched_mode_delivers_every_contact_in_fewer_calls(self):
+        report = (
+            FlowsBatchingBenchmark(
+                FlowsBatchingConfig(
+                    contacts=7, distinct_payloads=2, max_urns=3, flows_latency_ms=0
+                )
+            )
+            .run()
+            .as_dict()
+        )
+
+        unbatched, batched = report["modes"]["unbatched"], report["modes"]["batched"]
+        self.assertEqual(unbatched["flows_calls"], 7)
+        self.assertEqual(unbatched["contacts"], 7)
+        # 4 + 3 contacts per payload, at most 3 URNs per call: 2 + 1 calls.
+        self.assertEqual(batched["flows_calls"], 3)
+        self.assertEqual(batched["contacts"], 7)
+        self.assertIn("speedup", report)
@@ -0,0 +1,84 @@
+from io import StringIO
+from unittest.mock import patch
+from uuid import uuid4
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from retail.agents.domains.agent_integration.models import IntegratedAgent
+from retail.agents.domains.agent_management.models import Agent, PreApprovedTemplate
+from retail.clients.exceptions import CustomAPIException
+from retail.projects.models import Project
+
+
+class WarmMetaLibraryTemplatesCommandTest(TestCase):
+    def setUp(self):
+        self.project = Project.objects.create(uuid=uuid4(), name="Store")
+        self.agent = Agent.objects.create(
+            name="Order Status", lambda_arn="arn:aws:lambda:fake", project=self.project
+        )
+        for name in ("weni_order_invoiced", "weni_order_shipped"):
+            for _ in range(2):
+                PreApprovedTemplate.objects.create(
+                    agent=self.agent,
+                    name=name,
+                    display_name=name,
+                    start_condition="",
+                )
+        IntegratedAgent.objects.create(
+            agent=self.agent,
+            project=self.project,
+            channel_uuid=uuid4(),
+            config={"initial_template_language": "es_MX"},
+        )
+
+        patcher = patch(
+            "retail.agents.management.commands.warm_meta_library_templates.MetaService"
+        )
+        self.meta_service = patcher.start().return_value
+        self.addCleanup(patcher.stop)
+
+    def _call(self, *args):
+        stdout, stderr = StringIO(), StringIO()
+        call_command("warm_meta_library_templates", *args, stdout=stdout, stderr=stderr)
+        return stdout.getvalue(), stderr.getvalue()
+
+    def _refreshed(self):
+        return sorted(
+            call.args for call in self.meta_service.refresh_library_template.mock_calls
+        )
+
+    def test_warms_every_template_name_in_every_language_in_use(self):
+        self.meta_service.refresh_library_template.side_effect = (
+            lambda name, language: (None if language == "es_MX" else {"name": name})
+        )
+
+        stdout, _ = self._call()
+
+        self.assertEqual(
+            self._refreshed(),
+            [
+                ("weni_order_invoiced", "es_MX"),
+                ("weni_order_invoiced", "pt_BR"),
+                ("weni_order_shipped", "es_MX"),
+                ("weni_order_shipped", "pt_BR"),
+            ],
+        )
+        self.assertIn("2 found, 2 missing, 0 failed", stdout)
+
+    def test_explicit_languages_and_failures(self):
+        def refresh(name, language):
+            if name == "weni_order_shipped":
+                raise CustomAPIException(detail="rate limited", status_code=429)
+            return {"name": name}
+
+        self.meta_service.refresh_library_template.side_effect = refresh
+
+        stdout, stderr = self._call("--language", "en_US", "--workers", "1")
+
+        self.assertEqual(
+            self._refreshed(),
+            [("weni_order_invoiced", "en_US"), ("weni_order_shipped", "en_US")],
+        )
+        self.assertIn("1 found, 0 missing, 1 failed", stdout)
+        self.assertIn("weni_order_shipped (en_US)", stderr)
@@ -0,0 +1,65 @@
+"""Smoke tests for the agent webhook pipeline benchmark harness.
+
+The harness is run for a handful of executions against the test
+database, with the buffer wired to the in-memory Redis fake, to make
+sure the pipeline it drives still completes end to end and the report
+keeps the shape the comparison tooling reads.
+"""
+
+from unittest.mock import patch
+
+from django.test import TestCase, override_settings
+
+from retail.agents.benchmarks.webhook_pipeline import (
+    AgentWebhookPipelineBenchmark,
+    BenchmarkConfig,
+    percentile,
+)
+from retail.agents.domains.agent_execution.models import AgentExecution
+from retail.agents.domains.agent_execution.tests._fakes import FakeRedisConnection
+
+
+@override_settings(
+    CACHES={
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        }
+    }
+)
+class AgentWebhookPipelineBenchmarkTests(TestCase):
+    def setUp(self):
+        self.fake_redis = FakeRedisConnection()
+        patcher = patch(
+            "retail.agents.domains.agent_execution.services.buffer."
+            "get_redis_connection",
+            return_value=self.fake_redis,
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_runs_pipeline_end_to_end_and_reports_per_stage_costs(self):
+        benchmark = AgentWebhookPipelineBenchmark(
+            BenchmarkConfig(executions=4, warmup=1, flush_every=2)
+        )
+
+        report = benchmark.run().as_dict()
+
+        self.assertEqual(report["executions"], 4)
+        self.assertEqual(report["flushed"], 4)
+        self.assertEqual(report["latency_ms"]["view"]["count"], 4)
+        self.assertEqual(report["latency_ms"]["task"]["count"], 4)
+        self.assertEqual(
+            set(report["per_execution_by_stage"]), {"view", "task", "flush"}
+        )
+        self.assertGreater(report["per_execution"]["db_queries"], 0)
+        self.assertEqual(report["outcomes"], {"success": 4})
+        self.assertEqual(report["stand_in_calls"]["lambda_invocations"], 5)
+        self.assertEqual(report["stand_in_calls"]["flows_broadcasts"], 5)
+        self.assertEqual(AgentExecution.objects.count(), 5)
+
+    def test_percentile_uses_nearest_rank(self):
+        values = [float(v) for v in range(1, 101)]
+
+        self.assertEqual(percentile(values, 50), 50.0)
+        self.assertEqual(percentile(values, 99), 99.0)
+        self.assertEqual(percentile([], 99), 0.0)
@@ -747,6 +747,25 @@ class AgentWebhookUseCaseLoggingTest(TestCase):
         )
         self.exec_logger.log_execution_error.assert_not_called()
 
+    def test_execute_leaves_batched_send_to_the_flush(self):
+        parsed = {"template": "order_update", "contact_urn": "whatsapp:123"}
+        self.mock_lambda_handler.invoke.return_value = {"Payload": MagicMock()}
+        self.mock_lambda_handler.parse_response.return_value = parsed
+        self.mock_lambda_handler.validate_response.return_value = True
+        self.mock_broadcast_handler.can_send_to_contact.return_value = True
+        self.mock_broadcast_handler.build_message.return_value = {"msg": "ok"}
+        self.mock_broadcast_handler.send_message.return_value = _dispatch_result(
+            response={"status": "pending", "batched": True},
+            broadcast_message_uuid=uuid4(),
+        )
+        self.mock_broadcast_handler.get_current_template.return_value = None
+
+        result = self.usecase.execute(self.mock_agent, self._build_request_data())
+
+        self.assertEqual(result, parsed)
+        self.exec_logger.log_broadcast_sent.assert_not_called()
+        self.exec_logger.log_execution_error.assert_not_called()
+
     def test_execute_logs_broadcast_sent_when_dispatch_persistence_failed(self):
         # ``Broadcast.send_message`` is defensive on the BroadcastMessage
         # persistence path: when ``RecordBroadcastSentUseCase`` fails the
@@ -6,8 +6,9 @@ from typing import Any, Dict
 from unittest.mock import MagicMock
 from uuid import uuid4
 
+from django.db import connection
 from django.test import TestCase
-from django.test.utils import override_settings
+from django.test.utils import CaptureQueriesContext, override_settings
 
 from retail.agents.domains.agent_integration.exceptions import (
     DirectSendTemplateUnavailableError,
@@ -248,6 +249,48 @@ class AssignDirectSendHappyPathTest(AssignDirectSendBaseTest):
         self.assertIn("template_persisted", joined)
         self.assertIn(f"project_uuid={self.project.uuid}", joined)
 
+    def test_query_count_does_not_grow_with_pre_approveds(self):
+        def provision(pre_approveds):
+            integrated_agent = IntegratedAgent.objects.create(
+                agent=pre_approveds[0].agent,
+                project=self.project,
+                channel_uuid=uuid4(),
+                config={"direct_send": True, "initial_template_language": "pt_BR"},
+            )
+            with CaptureQueriesContext(connection) as queries:
+                self.use_case._create_direct_send_library_templates(
+                    integrated_agent, pre_approveds, self.project.uuid, uuid4()
+                )
+            return integrated_agent, len(queries)
+
+        _, queries_for_one = provision([self.template_a])
+
+        bulk_agent = Agent.objects.create(
+            name="Bulk", lambda_arn="arn:aws:lambda:bulk", project=self.project
+        )
+        pre_approveds = [
+            PreApprovedTemplate.objects.create(
+                agent=bulk_agent,
+                slug=f"weni-bulk-{index}",
+                name=f"weni_bulk_{index}",
+                display_name=f"Bulk {index}",
+                is_valid=True,
+                metadata={"category": "UTILITY", "language": "pt_BR"},
+                start_condition="bulk",
+            )
+            for index in range(10)
+        ]
+        integrated_agent, queries_for_many = provision(pre_approveds)
+
+        self.assertEqual(queries_for_many, queries_for_one)
+        templates = Template.objects.filter(integrated_agent=integrated_agent)
+        self.assertEqual(templates.count(), 10)
+        self.assertFalse(templates.filter(current_version__isnull=True).exists())
+        integrated_agent.refresh_from_db()
+        self.assertEqual(
+            integrated_agent.ignore_templates, [t.slug for t in pre_approveds]
+        )
+
     def test_does_not_call_legacy_template_creation_paths(self):
         self._execute()
 
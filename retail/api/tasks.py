@@ -2,91 +2,41 @@ import logging
 
 from celery import shared_task
 
-from retail.features.models import IntegratedFeature
-from retail.services.integrations.service import IntegrationsService
-from retail.clients.integrations.client import IntegrationsClient
+from retail.api.usecases.sweep_templates_synchronization import (
+    SweepTemplatesSynchronizationUseCase,
+)
 
 
 logger = logging.getLogger(__name__)
 
 
-@shared_task
-def check_templates_synchronization(integrated_feature_uuid: str):
+@shared_task(name="task_sweep_templates_synchronization")
+def task_sweep_templates_synchronization() -> dict:
     """
-    Task to check if templates are synchronized with Meta.
+    Periodic check of every IntegratedFeature whose templates are still
+    pending with Meta (one Integrations call per app).
+
+    Errors are swallowed so the beat schedule keeps trying without raising.
     """
     try:
-        logger.info(
-            f"Starting template synchronization check for integrated feature {integrated_feature_uuid}"
-        )
-        integrated_feature = IntegratedFeature.objects.get(uuid=integrated_feature_uuid)
-        integrations_service = IntegrationsService(IntegrationsClient())
-
-        # Get app_uuid from config
-        wpp_cloud_app_uuid = integrated_feature.config.get("wpp_cloud_app_uuid")
-
-        if not wpp_cloud_app_uuid:
-            logger.warning(
-                f"Wpp cloud app uuid not found for integrated feature {integrated_feature_uuid}"
-            )
-            return
-
-        # Collect all template names from config
-        logger.info(
-            f"Collecting template names for integrated feature {integrated_feature_uuid}"
-        )
-        order_status_templates = integrated_feature.config.get(
-            "order_status_templates", {}
-        ).values()
-        abandoned_cart_template = integrated_feature.config.get(
-            "abandoned_cart_template"
-        )
-
-        if abandoned_cart_template:
-            order_status_templates = list(order_status_templates) + [
-                abandoned_cart_template
-            ]
+        return SweepTemplatesSynchronizationUseCase().execute()
+    except Exception:
+        logger.exception("Error sweeping template synchronization")
+        return {"apps": 0, "checked": 0, "updated": 0}
 
-        # Get template synchronization status
-        logger.info(
-            f"Getting synchronization status for templates of integrated feature {integrated_feature_uuid}"
-        )
-        sync_status = integrations_service.get_synchronized_templates(
-            app_uuid=wpp_cloud_app_uuid, template_list=order_status_templates
-        )
 
-        # Update synchronization status in config
-        logger.info(
-            f"Updating synchronization status to {sync_status} for integrated feature {integrated_feature_uuid}"
-        )
-        integrated_feature.config["templates_synchronization_status"] = sync_status
-        integrated_feature.save()
-
-        # Reattempt sync if status is "pending"
-        if sync_status == "pending":
-            logger.info(
-                f"Templates still pending, scheduling retry for integrated feature {integrated_feature_uuid}"
-            )
-            check_templates_synchronization.apply_async(
-                args=[integrated_feature_uuid],
-                countdown=300,  # Reattempt in 5 minutes
-                task_id=f"template_sync_retry_{integrated_feature_uuid}",
-            )
-            logger.info(
-                f"Retry task for {integrated_feature_uuid} scheduled with task_id: "
-                f"template_sync_retry_{integrated_feature_uuid}"
-            )
-
-        elif sync_status == "rejected":
-            logger.warning(
-                f"Templates were rejected for {integrated_feature_uuid}. No further attempts."
-            )
+@shared_task
+def check_templates_synchronization(integrated_feature_uuid: str):
+    """
+    Deprecated: checks a single IntegratedFeature once.
 
-    except IntegratedFeature.DoesNotExist:
-        logger.error(f"Integrated feature {integrated_feature_uuid} not found")
-        raise
-    except Exception as e:
-        logger.error(
-            f"Error checking template synchronization for {integrated_feature_uuid}: {str(e)}"
-        )
-        raise
+    Kept registered so retries queued before the beat sweeper existed
+    drain; it no longer reschedules itself, the sweeper keeps checking
+    features that are still pending.
+    """
+    logger.info(
+        f"Starting template synchronization check for integrated feature {integrated_feature_uuid}"
+    )
+    SweepTemplatesSynchronizationUseCase().execute(
+        feature_uuids=[integrated_feature_uuid]
+    )
@@ -1,7 +1,6 @@
 import logging
 from urllib.parse import urlparse
 
-from retail.api.tasks import check_templates_synchronization
 from retail.clients.exceptions import CustomAPIException
 from retail.features.models import Feature, IntegratedFeature
 from retail.services.integrations.service import IntegrationsService
@@ -90,12 +89,11 @@ class InstallActions:
             template = self.integrations_service.create_abandoned_cart_template(
                 app_uuid=wpp_cloud_app_uuid, project_uuid=project_uuid, domain=domain
             )
-            # Save the template name in the integrated feature config
+            # Save the template name in the integrated feature config. The
+            # "pending" status makes task_sweep_templates_synchronization
+            # check it with Meta on its next run.
             integrated_feature.config["abandoned_cart_template"] = template
             integrated_feature.save(update_fields=["config"])
-
-            # Start the task to check template synchronization
-            self._check_templates_synchronization(integrated_feature)
         except CustomAPIException as e:
             print(f"Error creating template: {str(e)}")
             raise
@@ -151,26 +149,6 @@ class InstallActions:
             print(f"Error on process order status templates: {str(e)}")
             raise
 
-    def _check_templates_synchronization(self, integrated_feature: IntegratedFeature):
-        """
-        Creates a task to check template synchronization status with Meta.
-
-        Args:
-            integrated_feature (IntegratedFeature): The integrated feature instance to update.
-        """
-        try:
-            logger.info(
-                f"Schedule template synchronization for integrated feature {integrated_feature.uuid}"
-            )
-            # Call the task to check template synchronization
-            check_templates_synchronization.apply_async(
-                args=[str(integrated_feature.uuid)], countdown=60  # 1 minute
-            )
-
-        except Exception as e:
-            print(f"Error scheduling template synchronization check: {str(e)}")
-            raise
-
     def _register_code_action(
         self, integrated_feature: IntegratedFeature, project_uuid: str
     ):
@@ -0,0 +1,108 @@
+import logging
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional
+
+from django.db.models.fields.json import KeyTextTransform
+
+from retail.clients.integrations.client import IntegrationsClient
+from retail.features.models import IntegratedFeature
+from retail.services.integrations.service import IntegrationsService
+from retail.webhooks.templates.usecases.template_status_update import (
+    collect_tracked_templates,
+    save_templates_synchronization_statuses,
+)
+
+
+logger = logging.getLogger(__name__)
+
+
+class SweepTemplatesSynchronizationUseCase:
+    """
+    Re-checks every IntegratedFeature whose templates are still
+    ``pending`` with Meta.
+
+    Replaces the per-feature ``check_templates_synchronization`` retry
+    chains: pending features are grouped by ``wpp_cloud_app_uuid``, each
+    app's templates are fetched once from Integrations and the statuses
+    that changed are written in a single UPDATE. Features without an app
+    yet are left for a later sweep.
+    """
+
+    def __init__(self, integrations_service: Optional[IntegrationsService] = None):
+        self.integrations_service = integrations_service or IntegrationsService(
+            IntegrationsClient()
+        )
+
+    def execute(self, feature_uuids: Optional[Iterable[str]] = None) -> Dict[str, int]:
+        features_by_app = self._pending_features_by_app(feature_uuids)
+
+        updated_features = []
+        for app_uuid, integrated_features in features_by_app.items():
+            try:
+                templates = self.integrations_service.list_synchronized_templates(
+                    app_uuid
+                )
+            except Exception as e:
+                logger.error(
+                    f"Error fetching templates of app {app_uuid} for "
+                    f"synchronization check: {str(e)}"
+                )
+                continue
+
+            for integrated_feature in integrated_features:
+                tracked_templates = collect_tracked_templates(integrated_feature.config)
+                if not tracked_templates:
+                    # Template names are not saved yet (creation failed or
+                    # the install is still running): nothing to check.
+                    continue
+                status = self.integrations_service.get_templates_synchronization_status(
+                    templates, tracked_templates
+                )
+                if status == "pending":
+                    continue
+                if status == "rejected":
+                    logger.warning(
+                        f"Templates were rejected for {integrated_feature.uuid}. "
+                        f"No further attempts."
+                    )
+                updated_features.append(
+                    {"uuid": str(integrated_feature.uuid), "status": status}
+                )
+
+        save_templates_synchronization_statuses(updated_features)
+
+        checked = sum(len(features) for features in features_by_app.values())
+        if checked:
+            logger.info(
+                f"Template synchronization sweep: apps={len(features_by_app)} "
+                f"checked={checked} updated={len(updated_features)}"
+            )
+        return {
+            "apps": len(features_by_app),
+            "checked": checked,
+            "updated": len(updated_features),
+        }
+
+    @staticmethod
+    def _pending_features_by_app(
+        feature_uuids: Optional[Iterable[str]],
+    ) -> Dict[str, List[IntegratedFeature]]:
+        queryset = (
+            IntegratedFeature.objects.alias(
+                templates_status=KeyTextTransform(
+                    "templates_synchronization_status", "config"
+                ),
+                wpp_cloud_app_uuid=KeyTextTransform("wpp_cloud_app_uuid", "config"),
+            )
+            .filter(templates_status="pending", wpp_cloud_app_uuid__isnull=False)
+            .only("uuid", "config")
+        )
+        if feature_uuids is not None:
+            queryset = queryset.filter(uuid__in=list(feature_uuids))
+
+        features_by_app = defaultdict(list)
+        for integrated_feature in queryset:
+            app_uuid = integrated_feature.config.get("wpp_cloud_app_uuid")
+            if app_uuid:
+                features_by_app[app_uuid].append(integrated_feature)
+        return features_by_app
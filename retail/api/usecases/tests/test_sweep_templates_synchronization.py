@@ -0,0 +1,162 @@
+from unittest.mock import MagicMock, patch
+from uuid import uuid4
+
+from django.contrib.auth.models import User
+from django.test import TestCase
+
+from retail.api.usecases.sweep_templates_synchronization import (
+    SweepTemplatesSynchronizationUseCase,
+)
+from retail.features.models import Feature, IntegratedFeature
+from retail.projects.models import Project
+from retail.services.integrations.service import IntegrationsService
+
+
+APPROVED = [{"status": "APPROVED"}]
+
+
+class SweepTemplatesSynchronizationUseCaseTest(TestCase):
+    def setUp(self):
+        self.project = Project.objects.create(name="Store", uuid=uuid4())
+        self.user = User.objects.create(username="template-sweep")
+        self.feature = Feature.objects.create(name="Order Status")
+        self.client = MagicMock()
+        self.usecase = SweepTemplatesSynchronizationUseCase(
+            integrations_service=IntegrationsService(client=self.client)
+        )
+
+    def _create_feature(self, app_uuid, status="pending", template="order_invoiced"):
+        config = {
+            "order_status_templates": {"invoiced": template},
+            "templates_synchronization_status": status,
+            "flow_channel_uuid": "channel",
+        }
+        if app_uuid:
+            config["wpp_cloud_app_uuid"] = app_uuid
+        return IntegratedFeature.objects.create(
+            feature=self.feature, project=self.project, user=self.user, config=config
+        )
+
+    def test_http_calls_grow_with_apps_not_features(self):
+        apps = [str(uuid4()) for _ in range(3)]
+        for app_uuid in apps:
+            for _ in range(5):
+                self._create_feature(app_uuid)
+        self.client.get_synchronized_templates.return_value = {
+            "order_invoiced": APPROVED
+        }
+
+        with self.assertNumQueries(2):
+            result = self.usecase.execute()
+
+        self.assertEqual(self.client.get_synchronized_templates.call_count, len(apps))
+        self.assertEqual(
+            sorted(
+                call.args[0]
+                for call in self.client.get_synchronized_templates.call_args_list
+            ),
+            sorted(apps),
+        )
+        self.assertEqual(result, {"apps": 3, "checked": 15, "updated": 15})
+        self.assertFalse(
+            IntegratedFeature.objects.filter(
+                config__templates_synchronization_status="pending"
+            ).exists()
+        )
+
+    def test_features_of_one_app_get_their_own_status(self):
+        app_uuid = str(uuid4())
+        approved = self._create_feature(app_uuid, template="order_invoiced")
+        rejected = self._create_feature(app_uuid, template="order_canceled")
+        waiting = self._create_feature(app_uuid, template="order_shipped")
+        self.client.get_synchronized_templates.return_value = {
+            "order_invoiced": APPROVED,
+            "order_canceled": [{"status": "REJECTED"}],
+            "order_shipped": [{"status": "PENDING"}],
+        }
+
+        result = self.usecase.execute()
+
+        self.assertEqual(result["updated"], 2)
+        statuses = {
+            feature.pk: feature.config["templates_synchronization_status"]
+            for feature in IntegratedFeature.objects.all()
+        }
+        self.assertEqual(statuses[approved.pk], "synchronized")
+        self.assertEqual(statuses[rejected.pk], "rejected")
+        self.assertEqual(statuses[waiting.pk], "pending")
+        approved.refresh_from_db()
+        self.assertEqual(approved.config["flow_channel_uuid"], "channel")
+
+    def test_skips_settled_features_and_features_without_app(self):
+        self._create_feature(str(uuid4()), status="synchronized")
+        self._create_feature(None)
+
+        result = self.usecase.execute()
+
+        self.client.get_synchronized_templates.assert_not_called()
+        self.assertEqual(result, {"apps": 0, "checked": 0, "updated": 0})
+
+    def test_features_without_tracked_templates_stay_pending(self):
+        app_uuid = str(uuid4())
+        tracked = self._create_feature(app_uuid)
+        untracked = self._create_feature(app_uuid)
+        untracked.config["order_status_templates"] = {}
+        untracked.save(update_fields=["config"])
+        self.client.get_synchronized_templates.return_value = {
+            "order_invoiced": APPROVED
+        }
+
+        result = self.usecase.execute()
+
+        self.assertEqual(result["updated"], 1)
+        tracked.refresh_from_db()
+        untracked.refresh_from_db()
+        self.assertEqual(
+            tracked.config["templates_synchronization_status"], "synchronized"
+        )
+        self.assertEqual(
+            untracked.config["templates_synchronization_status"], "pending"
+        )
+
+    def test_failing_app_does_not_block_the_others(self):
+        failing_app, healthy_app = str(uuid4()), str(uuid4())
+        failing = self._create_feature(failing_app)
+        healthy = self._create_feature(healthy_app)
+
+        def get_synchronized_templates(app_uuid):
+            if app_uuid == failing_app:
+                raise RuntimeError("integrations down")
+            return {"order_invoiced": APPROVED}
+
+        self.client.get_synchronized_templates.side_effect = get_synchronized_templates
+
+        result = self.usecase.execute()
+
+        self.assertEqual(result["updated"], 1)
+        failing.refresh_from_db()
+        healthy.refresh_from_db()
+        self.assertEqual(failing.config["templates_synchronization_status"], "pending")
+        self.assertEqual(
+            healthy.config["templates_synchronization_status"], "synchronized"
+        )
+
+    def test_deprecated_task_checks_only_its_feature_and_does_not_reschedule(self):
+        from retail.api.tasks import check_templates_synchronization
+
+        target = self._create_feature(str(uuid4()))
+        other = self._create_feature(str(uuid4()))
+
+        with patch(
+            "retail.api.usecases.sweep_templates_synchronization.IntegrationsClient",
+            return_value=self.client,
+        ), patch.object(check_templates_synchronization, "apply_async") as mock_async:
+            self.client.get_synchronized_templates.return_value = {}
+            check_templates_synchronization(str(target.uuid))
+
+        self.client.get_synchronized_templates.assert_called_once_with(
+            target.config["wpp_cloud_app_uuid"]
+        )
+        mock_async.assert_not_called()
+        other.refresh_from_db()
+        self.assertEqual(other.config["templates_synchronization_status"], "pending")
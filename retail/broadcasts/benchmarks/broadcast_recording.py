@@ -0,0 +1,213 @@
+"""Throughput benchmark for recording BroadcastMessage rows.
+
+Records the same direct dispatches through ``RecordBroadcastSentUseCase``
+once per mode:
+
+- ``per_row``: the write-behind buffer is disabled, so every dispatch
+  inserts its own row, which is what every dispatch paid before the
+  buffer existed.
+- ``buffered``: rows are appended to the ``BroadcastMessageBuffer`` and
+  written by ``FlushBufferedBroadcastMessagesUseCase`` in batches of
+  ``batch_size``. A flush the buffer schedules is run in-process right
+  after the dispatch that filled the batch, as an idle worker would,
+  and the remainder is flushed at the end.
+
+``per_dispatch_ms`` is what the dispatching request pays; the wall
+time includes the flushes, so ``rows_per_second`` compares the total
+cost of getting every row into Postgres. Queries are counted with a
+``connection.execute_wrapper``. Must run against a disposable database
+and, for ``buffered``, a Redis the harness may write to.
+"""
+
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, Iterator, List, Optional
+from uuid import uuid4
+
+from django.db import connection
+from django.test import override_settings
+
+from retail.agents.benchmarks.webhook_pipeline import summarize_latencies
+from retail.agents.domains.agent_integration.models import IntegratedAgent
+from retail.agents.domains.agent_management.models import Agent
+from retail.broadcasts.models import BroadcastMessage
+from retail.broadcasts.services.broadcast_message_buffer import (
+    BroadcastMessageBuffer,
+)
+from retail.broadcasts.usecases.flush_broadcast_messages import (
+    FlushBufferedBroadcastMessagesUseCase,
+)
+from retail.broadcasts.usecases.record_broadcast_sent import (
+    BroadcastDispatchContext,
+    RecordBroadcastSentDTO,
+    RecordBroadcastSentUseCase,
+)
+from retail.projects.models import Project
+
+
+@dataclass
+class BroadcastRecordingConfig:
+    """Knobs for a single benchmark run."""
+
+    dispatches: int = 1000
+    batch_size: int = 200
+
+
+@dataclass
+class ModeResult:
+    dispatch_latencies_ms: List[float] = field(default_factory=list)
+    flush_latencies_ms: List[float] = field(default_factory=list)
+    wall_seconds: float = 0.0
+    rows_written: int = 0
+    queries: int = 0
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "per_dispatch_ms": summarize_latencies(self.dispatch_latencies_ms),
+            "per_flush_ms": summarize_latencies(self.flush_latencies_ms),
+            "wall_seconds": round(self.wall_seconds, 4),
+            "rows_written": self.rows_written,
+            "rows_per_second": (
+                round(self.rows_written / self.wall_seconds, 2)
+                if self.wall_seconds
+                else 0.0
+            ),
+            "queries": self.queries,
+        }
+
+
+@dataclass
+class BroadcastRecordingReport:
+    config: BroadcastRecordingConfig
+    modes: Dict[str, ModeResult] = field(default_factory=dict)
+
+    def as_dict(self) -> Dict[str, Any]:
+        modes = {name: result.as_dict() for name, result in self.modes.items()}
+        report = {
+            "benchmark": "broadcast_recording",
+            "config": asdict(self.config),
+            "modes": modes,
+        }
+        if "per_row" in modes and "buffered" in modes:
+            per_row = modes["per_row"]["rows_per_second"]
+            buffered = modes["buffered"]["rows_per_second"]
+            report["speedup"] = round(buffered / per_row, 1) if per_row else None
+        return report
+
+
+class BroadcastRecordingBenchmark:
+    """Runs the ``per_row`` and ``buffered`` modes and reports both."""
+
+    def __init__(
+        self,
+        config: Optional[BroadcastRecordingConfig] = None,
+        redis_client=None,
+    ):
+        self.config = config or BroadcastRecordingConfig()
+        self.redis_client = redis_client
+        self._flush_requested = False
+
+    def seed(self) -> IntegratedAgent:
+        project = Project.objects.create(
+            uuid=uuid4(), name="Benchmark Store", vtex_account="benchmarkstore"
+        )
+        agent = Agent.objects.create(name="Benchmark Agent", project=project)
+        return IntegratedAgent.objects.create(
+            agent=agent, project=project, channel_uuid=uuid4()
+        )
+
+    def dtos(self, integrated_agent: IntegratedAgent) -> List[RecordBroadcastSentDTO]:
+        base_id = int(time.time() * 1000) * 10000
+        return [
+            RecordBroadcastSentDTO(
+                broadcast_id=base_id + index,
+                integrated_agent=integrated_agent,
+                template=None,
+                contact_urn=f"whatsapp:55119{index:08d}",
+                channel_uuid=str(integrated_agent.channel_uuid),
+                flows_template_uuid=None,
+                flows_response={"id": base_id + index, "status": "queued"},
+                dispatch_context=BroadcastDispatchContext(
+                    order_form_id=f"benchmark-order-form-{index}"
+                ),
+            )
+            for index in range(self.config.dispatches)
+        ]
+
+    def run(self) -> BroadcastRecordingReport:
+        report = BroadcastRecordingReport(config=self.config)
+        integrated_agent = self.seed()
+
+        with override_settings(BROADCAST_MESSAGE_BUFFER_WINDOW_SECONDS=0):
+            report.modes["per_row"] = self._run_mode(
+                integrated_agent, RecordBroadcastSentUseCase(), flush=None
+            )
+
+        message_buffer = BroadcastMessageBuffer(
+            redis_client=self.redis_client, schedule_flush=self._request_flush
+        )
+        with override_settings(
+            BROADCAST_MESSAGE_BUFFER_WINDOW_SECONDS=1,
+            BROADCAST_MESSAGE_BUFFER_MAX_ROWS=max(1, self.config.batch_size),
+        ):
+            report.modes["buffered"] = self._run_mode(
+                integrated_agent,
+                RecordBroadcastSentUseCase(message_buffer=message_buffer),
+                flush=FlushBufferedBroadcastMessagesUseCase(message_buffer),
+            )
+        return report
+
+    def _request_flush(self, countdown: int) -> None:
+        if countdown == 0:
+            self._flush_requested = True
+
+    def _run_mode(
+        self,
+        integrated_agent: IntegratedAgent,
+        record_use_case: RecordBroadcastSentUseCase,
+        flush: Optional[FlushBufferedBroadcastMessagesUseCase],
+    ) -> ModeResult:
+        result = ModeResult()
+        dtos = self.dtos(integrated_agent)
+        rows_before = BroadcastMessage.objects.count()
+        self._flush_requested = False
+
+        with self._count_queries(result):
+            started = time.perf_counter()
+            for dto in dtos:
+                dispatch_started = time.perf_counter()
+                record_use_case.execute(dto)
+                result.dispatch_latencies_ms.append(
+                    (time.perf_counter() - dispatch_started) * 1000.0
+                )
+                if flush is not None and self._flush_requested:
+                    self._run_flush(flush, result)
+            while flush is not None and self._run_flush(flush, result):
+                pass
+            result.wall_seconds = time.perf_counter() - started
+
+        result.rows_written = BroadcastMessage.objects.count() - rows_before
+        return result
+
+    def _run_flush(
+        self, flush: FlushBufferedBroadcastMessagesUseCase, result: ModeResult
+    ) -> int:
+        self._flush_requested = False
+        flush_started = time.perf_counter()
+        flushed = flush.execute()
+        if flushed:
+            result.flush_latencies_ms.append(
+                (time.perf_counter() - flush_started) * 1000.0
+            )
+        return flushed
+
+    @staticmethod
+    @contextmanager
+    def _count_queries(result: ModeResult) -> Iterator[None]:
+        def count(execute, sql, params, many, context):
+            result.queries += 1
+            return execute(sql, params, many, context)
+
+        with connection.execute_wrapper(count):
+            yield
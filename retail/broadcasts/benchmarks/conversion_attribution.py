@@ -0,0 +1,252 @@
+"""Latency benchmark for the last-touch conversion attribution lookup.
+
+Seeds ``rows`` BroadcastMessage rows spread over ``agents`` integrated
+agents of one project with a single ``INSERT ... SELECT generate_series``,
+then resolves the same ``lookups`` ``(order_id, order_form_id)`` pairs
+once per mode:
+
+- ``or_filter``: the single query ``MarkBroadcastConvertedUseCase`` ran
+  before the rewrite, ``order_id OR order_form_id`` sorted by
+  ``created_at``, with the partial last-touch indexes dropped (inside a
+  transaction that is rolled back) so it is planned as it was then;
+- ``union_all``: ``MarkBroadcastConvertedUseCase._last_touch_queryset``,
+  one ``LIMIT 1`` branch per identifier over the partial indexes.
+
+Half the rows carry an ``order_id`` and half an ``order_form_id``, each
+identifier shared by ``dispatches_per_identifier`` rows across every
+agent, and one row in ten is FAILED. Both modes must pick the same
+broadcast (``mismatches`` counts the lookups where they did not) and
+the report carries the ``EXPLAIN`` of the first lookup of each mode.
+``per_lookup_ms`` is measured around the ORM call, so it includes
+building and compiling the query; ``per_query_ms`` runs the already
+compiled SQL on a cursor and isolates what the database spends. Must
+run against a disposable database.
+"""
+
+import random
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+from uuid import uuid4
+
+from django.db import connection, transaction
+from django.db.models import Q
+
+from retail.agents.benchmarks.webhook_pipeline import summarize_latencies
+from retail.agents.domains.agent_integration.models import IntegratedAgent
+from retail.agents.domains.agent_management.models import Agent
+from retail.broadcasts.models import (
+    CONVERSION_INELIGIBLE_STATUSES,
+    BroadcastMessage,
+    BroadcastStatus,
+)
+from retail.broadcasts.usecases.mark_broadcast_converted import (
+    MarkBroadcastConvertedUseCase,
+)
+from retail.projects.models import Project
+
+
+LAST_TOUCH_INDEXES = ("broadcasts_agent_order_touch", "broadcasts_agent_form_touch")
+
+
+@dataclass
+class ConversionAttributionConfig:
+    """Knobs for a single benchmark run."""
+
+    rows: int = 2_000_000
+    agents: int = 20
+    lookups: int = 500
+    dispatches_per_identifier: int = 8
+    seed: int = 7
+
+
+@dataclass
+class ModeResult:
+    latencies_ms: List[float] = field(default_factory=list)
+    query_latencies_ms: List[float] = field(default_factory=list)
+    matched: int = 0
+    plan: str = ""
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "per_lookup_ms": summarize_latencies(self.latencies_ms),
+            "per_query_ms": summarize_latencies(self.query_latencies_ms),
+            "matched": self.matched,
+            "plan": self.plan,
+        }
+
+
+@dataclass
+class ConversionAttributionReport:
+    config: ConversionAttributionConfig
+    seed_seconds: float = 0.0
+    mismatches: int = 0
+    modes: Dict[str, ModeResult] = field(default_factory=dict)
+
+    def as_dict(self) -> Dict[str, Any]:
+        modes = {name: result.as_dict() for name, result in self.modes.items()}
+        report = {
+            "benchmark": "conversion_attribution",
+            "config": asdict(self.config),
+            "seed_seconds": round(self.seed_seconds, 2),
+            "mismatches": self.mismatches,
+            "modes": modes,
+        }
+        if "or_filter" in modes and "union_all" in modes:
+            for key, metric in (
+                ("speedup", "per_lookup_ms"),
+                ("query_speedup", "per_query_ms"),
+            ):
+                before = modes["or_filter"][metric]["p50"]
+                after = modes["union_all"][metric]["p50"]
+                report[key] = round(before / after, 1) if after else None
+        return report
+
+
+class ConversionAttributionBenchmark:
+    """Seeds the table once and times both lookups against it."""
+
+    def __init__(self, config: Optional[ConversionAttributionConfig] = None):
+        self.config = config or ConversionAttributionConfig()
+        self.random = random.Random(self.config.seed)
+
+    @property
+    def orders(self) -> int:
+        return max(1, self.config.rows // max(1, self.config.dispatches_per_identifier))
+
+    def seed(self) -> Tuple[Project, IntegratedAgent]:
+        project = Project.objects.create(
+            uuid=uuid4(), name="Benchmark Store", vtex_account="benchmarkstore"
+        )
+        integrated_agents = [
+            IntegratedAgent.objects.create(
+                agent=Agent.objects.create(name=f"Agent {index}", project=project),
+                project=project,
+                channel_uuid=uuid4(),
+            )
+            for index in range(max(1, self.config.agents))
+        ]
+        agent_ids = [integrated_agent.pk for integrated_agent in integrated_agents]
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"""
+                INSERT INTO {BroadcastMessage._meta.db_table} (
+                    uuid, project_id, integrated_agent_id, template_name,
+                    template_version, contact_urn, status, previous_status,
+                    error_message, last_payload, order_id, order_form_id,
+                    created_at, updated_at
+                )
+                SELECT
+                    md5(g::text || random()::text)::uuid,
+                    %(project_id)s,
+                    (%(agent_ids)s::bigint[])[(g / 7) %% %(agents)s + 1],
+                    'payment_recovery',
+                    '',
+                    'whatsapp:' || g,
+                    CASE WHEN g %% 10 = 0 THEN %(failed)s ELSE %(delivered)s END,
+                    '',
+                    '',
+                    '{{}}'::jsonb,
+                    CASE WHEN g %% 2 = 0 THEN 'order-' || (g %% %(orders)s) END,
+                    CASE WHEN g %% 2 = 1 THEN 'of-' || (g %% %(orders)s) END,
+                    now() - g * interval '1 second',
+                    now()
+                FROM generate_series(1, %(rows)s) AS g
+                """,
+                {
+                    "project_id": project.pk,
+                    "agent_ids": agent_ids,
+                    "agents": len(agent_ids),
+                    "failed": BroadcastStatus.FAILED,
+                    "delivered": BroadcastStatus.DELIVERED,
+                    "orders": self.orders,
+                    "rows": self.config.rows,
+                },
+            )
+            cursor.execute(f"ANALYZE {BroadcastMessage._meta.db_table}")
+        return project, integrated_agents[0]
+
+    def lookup_keys(self) -> List[Tuple[str, str]]:
+        keys = []
+        for _ in range(self.config.lookups):
+            order = self.random.randrange(self.orders)
+            keys.append((f"order-{order}", f"of-{self.random.randrange(self.orders)}"))
+        return keys
+
+    def run(self) -> ConversionAttributionReport:
+        report = ConversionAttributionReport(config=self.config)
+        started = time.perf_counter()
+        project, integrated_agent = self.seed()
+        report.seed_seconds = time.perf_counter() - started
+
+        keys = self.lookup_keys()
+        with transaction.atomic():
+            with connection.cursor() as cursor:
+                for index_name in LAST_TOUCH_INDEXES:
+                    cursor.execute(f'DROP INDEX "{index_name}"')
+            before = self._run_mode(
+                self._or_filter_queryset, project, integrated_agent, keys
+            )
+            transaction.set_rollback(True)
+        after = self._run_mode(
+            MarkBroadcastConvertedUseCase._last_touch_queryset,
+            project,
+            integrated_agent,
+            keys,
+        )
+
+        report.modes["or_filter"], before_picks = before
+        report.modes["union_all"], after_picks = after
+        report.mismatches = sum(
+            picked_before != picked_after
+            for picked_before, picked_after in zip(before_picks, after_picks)
+        )
+        return report
+
+    @staticmethod
+    def _run_mode(
+        build,
+        project: Project,
+        integrated_agent: IntegratedAgent,
+        keys: List[Tuple[str, str]],
+    ) -> Tuple[ModeResult, List[Optional[int]]]:
+        result = ModeResult()
+        picks: List[Optional[int]] = []
+        for order_id, order_form_id in keys:
+            queryset = build(project, integrated_agent, order_id, order_form_id)
+            if not result.plan:
+                result.plan = queryset.explain()
+            lookup_started = time.perf_counter()
+            broadcast = queryset.first()
+            result.latencies_ms.append((time.perf_counter() - lookup_started) * 1000.0)
+            result.matched += broadcast is not None
+            picks.append(broadcast.pk if broadcast else None)
+
+            sql, params = queryset[:1].query.sql_with_params()
+            with connection.cursor() as cursor:
+                query_started = time.perf_counter()
+                cursor.execute(sql, params)
+                cursor.fetchall()
+                result.query_latencies_ms.append(
+                    (time.perf_counter() - query_started) * 1000.0
+                )
+        return result, picks
+
+    @staticmethod
+    def _or_filter_queryset(
+        project: Project,
+        integrated_agent: IntegratedAgent,
+        order_id: str,
+        order_form_id: Optional[str],
+    ):
+        match_filter = Q(order_id=order_id)
+        if order_form_id:
+            match_filter |= Q(order_form_id=order_form_id)
+        return (
+            BroadcastMessage.objects.select_related("integrated_agent")
+            .filter(project=project, integrated_agent=integrated_agent)
+            .filter(match_filter)
+            .exclude(status__in=CONVERSION_INELIGIBLE_STATUSES)
+            .order_by("-created_at")
+        )
@@ -0,0 +1,87 @@
+"""Load recent broadcasts into the broadcast membership filter.
+
+Usage::
+
+    python manage.py backfill_broadcast_membership [--batch-size 5000]
+
+Adds the ``broadcast_id`` and ``external_message_id`` of every
+``BroadcastMessage`` created within ``BROADCAST_MEMBERSHIP_RETENTION_DAYS``
+to the daily bucket of its ``created_at``. Run it after enabling
+``BROADCAST_MEMBERSHIP_FILTER_ENABLED`` and before setting
+``BROADCAST_MEMBERSHIP_FILTER_ENFORCED``; running it again is harmless.
+"""
+
+from datetime import timedelta
+from typing import List
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db.models import Q
+from django.utils import timezone
+
+from retail.broadcasts.models import BroadcastMessage
+from retail.broadcasts.services.broadcast_membership import (
+    get_broadcast_membership_filter,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Add the broadcast and message ids recorded within the retention "
+        "window to the broadcast membership filter."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=5000,
+            help="Rows read and added to Redis per round trip.",
+        )
+
+    def handle(self, *args, **options):
+        membership_filter = get_broadcast_membership_filter()
+        if not membership_filter.enabled:
+            raise CommandError("BROADCAST_MEMBERSHIP_FILTER_ENABLED is not set.")
+
+        since = timezone.now() - timedelta(days=membership_filter.retention_days)
+        rows = (
+            BroadcastMessage.objects.filter(created_at__gte=since)
+            .filter(
+                Q(broadcast_id__isnull=False) | Q(external_message_id__isnull=False)
+            )
+            .order_by("created_at")
+            .values_list("broadcast_id", "external_message_id", "created_at")
+        )
+
+        batch_size = max(1, options["batch_size"])
+        added = 0
+        failed = 0
+        day = None
+        members: List[str] = []
+        for broadcast_id, message_id, created_at in rows.iterator(
+            chunk_size=batch_size
+        ):
+            created_day = created_at.date()
+            if members and (created_day != day or len(members) >= batch_size):
+                added, failed = self._add(
+                    membership_filter, members, day, added, failed
+                )
+                members = []
+            day = created_day
+            if broadcast_id is not None:
+                members.append(f"broadcast:{broadcast_id}")
+            if message_id:
+                members.append(f"message:{message_id}")
+        if members:
+            added, failed = self._add(membership_filter, members, day, added, failed)
+
+        self.stdout.write(
+            f"Added {added} member(s) from the last "
+            f"{membership_filter.retention_days} day(s); {failed} failed."
+        )
+
+    @staticmethod
+    def _add(membership_filter, members, day, added, failed):
+        if membership_filter.add(members, day=day):
+            return added + len(members), failed
+        return added, failed + len(members)
@@ -0,0 +1,65 @@
+"""Compare per-row and write-behind BroadcastMessage recording throughput.
+
+Usage::
+
+    python manage.py benchmark_broadcast_recording --dispatches 5000 \\
+        --batch-size 500 --output recording.json
+
+The run happens inside a throwaway test database (created and dropped
+by this command) against the Redis configured in ``REDIS_URL``; see
+``retail.broadcasts.benchmarks.broadcast_recording`` for what is
+measured.
+"""
+
+import json
+
+from django.core.management.base import BaseCommand
+
+from retail.agents.benchmarks.database import benchmark_database
+from retail.broadcasts.benchmarks.broadcast_recording import (
+    BroadcastRecordingBenchmark,
+    BroadcastRecordingConfig,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark BroadcastMessage rows per second with and without the "
+        "write-behind buffer and emit a JSON report."
+    )
+
+    def add_arguments(self, parser):
+        defaults = BroadcastRecordingConfig()
+        parser.add_argument("--dispatches", type=int, default=defaults.dispatches)
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=defaults.batch_size,
+            help="Rows written by one flush of the buffered mode.",
+        )
+        parser.add_argument(
+            "--output",
+            help="Write the JSON report to this path instead of stdout.",
+        )
+        parser.add_argument(
+            "--keepdb",
+            action="store_true",
+            help="Reuse the benchmark database between runs.",
+        )
+
+    def handle(self, *args, **options):
+        config = BroadcastRecordingConfig(
+            dispatches=options["dispatches"],
+            batch_size=options["batch_size"],
+        )
+
+        with benchmark_database(keepdb=options["keepdb"]):
+            report = BroadcastRecordingBenchmark(config).run().as_dict()
+
+        rendered = json.dumps(report, indent=2, sort_keys=True)
+        if options["output"]:
+            with open(options["output"], "w") as fp:
+                fp.write(rendered + "\n")
+            self.stdout.write(f"Benchmark report written to {options['output']}")
+        else:
+            self.stdout.write(rendered)
@@ -0,0 +1,74 @@
+"""Compare the OR-filter and UNION ALL last-touch attribution lookups.
+
+Usage::
+
+    python manage.py benchmark_conversion_attribution --rows 2000000 \\
+        --lookups 500 --output attribution.json
+
+The run happens inside a throwaway test database (created and dropped
+by this command); see
+``retail.broadcasts.benchmarks.conversion_attribution`` for what is
+seeded and measured.
+"""
+
+import json
+
+from django.core.management.base import BaseCommand
+
+from retail.agents.benchmarks.database import benchmark_database
+from retail.broadcasts.benchmarks.conversion_attribution import (
+    ConversionAttributionBenchmark,
+    ConversionAttributionConfig,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark the last-touch conversion attribution lookup on a seeded "
+        "BroadcastMessage table and emit a JSON report."
+    )
+
+    def add_arguments(self, parser):
+        defaults = ConversionAttributionConfig()
+        parser.add_argument("--rows", type=int, default=defaults.rows)
+        parser.add_argument(
+            "--agents",
+            type=int,
+            default=defaults.agents,
+            help="Integrated agents the seeded rows are spread over.",
+        )
+        parser.add_argument("--lookups", type=int, default=defaults.lookups)
+        parser.add_argument(
+            "--dispatches-per-identifier",
+            type=int,
+            default=defaults.dispatches_per_identifier,
+            help="Rows sharing each order_id / order_form_id.",
+        )
+        parser.add_argument(
+            "--output",
+            help="Write the JSON report to this path instead of stdout.",
+        )
+        parser.add_argument(
+            "--keepdb",
+            action="store_true",
+            help="Reuse the benchmark database between runs.",
+        )
+
+    def handle(self, *args, **options):
+        config = ConversionAttributionConfig(
+            rows=options["rows"],
+            agents=options["agents"],
+            lookups=options["lookups"],
+            dispatches_per_identifier=options["dispatches_per_identifier"],
+        )
+
+        with benchmark_database(keepdb=options["keepdb"]):
+            report = ConversionAttributionBenchmark(config).run().as_dict()
+
+        rendered = json.dumps(report, indent=2, sort_keys=True)
+        if options["output"]:
+            with open(options["output"], "w") as fp:
+                fp.write(rendered + "\n")
+            self.stdout.write(f"Benchmark report written to {options['output']}")
+        else:
+            self.stdout.write(rendered)
@@ -0,0 +1,70 @@
+# A batched Flows dispatch shares one broadcast_id across every contact
+# it carried, so broadcast_id is now unique per contact_urn only.
+#
+# The new partial unique index is built concurrently before the old one
+# is dropped, so deploys neither block writes on the large
+# BroadcastMessage table nor leave it without a uniqueness guarantee.
+# Every (broadcast_id) pair the old index allowed is also unique on
+# (broadcast_id, contact_urn), so the build cannot fail on existing rows.
+# atomic=False is required: CREATE/DROP INDEX CONCURRENTLY cannot run
+# inside a transaction.
+#
+# An interrupted build leaves an INVALID index behind; the migration is
+# then not recorded and is safe to rerun, as any index left by a
+# previous attempt is dropped first.
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ("broadcasts", "0006_integratedagent_integer_fk"),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            "DROP INDEX CONCURRENTLY IF EXISTS "
+            "broadcasts_broadcast_id_contact_urn_unique;",
+            migrations.RunSQL.noop,
+        ),
+        migrations.SeparateDatabaseAndState(
+            database_operations=[
+                migrations.RunSQL(
+                    "CREATE UNIQUE INDEX CONCURRENTLY "
+                    "broadcasts_broadcast_id_contact_urn_unique "
+                    "ON broadcasts_broadcastmessage (broadcast_id, contact_urn) "
+                    "WHERE broadcast_id IS NOT NULL;",
+                    "DROP INDEX CONCURRENTLY IF EXISTS "
+                    "broadcasts_broadcast_id_contact_urn_unique;",
+                ),
+            ],
+            state_operations=[
+                migrations.AddConstraint(
+                    model_name="broadcastmessage",
+                    constraint=models.UniqueConstraint(
+                        condition=models.Q(("broadcast_id__isnull", False)),
+                        fields=("broadcast_id", "contact_urn"),
+                        name="broadcasts_broadcast_id_contact_urn_unique",
+                    ),
+                ),
+            ],
+        ),
+        migrations.SeparateDatabaseAndState(
+            database_operations=[
+                migrations.RunSQL(
+                    "DROP INDEX CONCURRENTLY IF EXISTS broadcasts_broadcast_id_unique;",
+                    "CREATE UNIQUE INDEX CONCURRENTLY broadcasts_broadcast_id_unique "
+                    "ON broadcasts_broadcastmessage (broadcast_id) "
+                    "WHERE broadcast_id IS NOT NULL;",
+                ),
+            ],
+            state_operations=[
+                migrations.RemoveConstraint(
+                    model_name="broadcastmessage",
+                    name="broadcasts_broadcast_id_unique",
+                ),
+            ],
+        ),
+    ]
@@ -0,0 +1,41 @@
+# Partial indexes for the last-touch conversion lookup
+# (MarkBroadcastConvertedUseCase), one per identifier, built
+# concurrently so production deploys do not block writes on the large
+# BroadcastMessage table.
+#
+# atomic=False is required: CREATE INDEX CONCURRENTLY cannot run inside
+# a transaction.
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ("broadcasts", "0007_broadcast_id_contact_urn_unique"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="broadcastmessage",
+            index=models.Index(
+                condition=models.Q(
+                    ("status__in", ("errored", "failed", "unknown")), _negated=True
+                ),
+                fields=["integrated_agent", "order_id", "-created_at"],
+                name="broadcasts_agent_order_touch",
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="broadcastmessage",
+            index=models.Index(
+                condition=models.Q(
+                    ("status__in", ("errored", "failed", "unknown")), _negated=True
+                ),
+                fields=["integrated_agent", "order_form_id", "-created_at"],
+                name="broadcasts_agent_form_touch",
+            ),
+        ),
+    ]
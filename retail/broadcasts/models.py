@@ -57,6 +57,16 @@ SUCCESSFUL_SEND_STATUSES = frozenset(
     }
 )
 
+# Statuses that disqualify a broadcast from being credited as the
+# attribution source of a conversion. ERRORED/FAILED never reached the
+# recipient, and UNKNOWN means we could not interpret what happened on
+# the courier side, so attributing a sale to it would be misleading.
+CONVERSION_INELIGIBLE_STATUSES = (
+    BroadcastStatus.ERRORED,
+    BroadcastStatus.FAILED,
+    BroadcastStatus.UNKNOWN,
+)
+
 
 class BroadcastMessage(models.Model):
     """Persistent log of every WhatsApp broadcast issued.
@@ -154,12 +164,26 @@ class BroadcastMessage(models.Model):
             models.Index(fields=["project", "status"]),
             models.Index(fields=["project", "order_form_id"]),
             models.Index(fields=["project", "order_id"]),
+            # Last-touch conversion lookups: one LIMIT 1 scan per
+            # identifier over the rows still eligible for attribution.
+            models.Index(
+                fields=["integrated_agent", "order_id", "-created_at"],
+                condition=~models.Q(status__in=CONVERSION_INELIGIBLE_STATUSES),
+                name="broadcasts_agent_order_touch",
+            ),
+            models.Index(
+                fields=["integrated_agent", "order_form_id", "-created_at"],
+                condition=~models.Q(status__in=CONVERSION_INELIGIBLE_STATUSES),
+                name="broadcasts_agent_form_touch",
+            ),
         ]
         constraints = [
+            # A batched Flows dispatch returns one broadcast id for every
+            # contact it carried, so the id is only unique per contact.
             models.UniqueConstraint(
-                fields=["broadcast_id"],
+                fields=["broadcast_id", "contact_urn"],
                 condition=models.Q(broadcast_id__isnull=False),
-                name="broadcasts_broadcast_id_unique",
+                name="broadcasts_broadcast_id_contact_urn_unique",
             ),
             models.UniqueConstraint(
                 fields=["external_message_id"],
@@ -0,0 +1,199 @@
+"""Membership pre-filter for courier events of our broadcasts.
+
+Every outbound WAC event on the shared courier exchange reaches
+``HandleStatusUpdateUseCase``, including the status events of messages
+this service never sent, and each one costs a locked Postgres lookup.
+``BroadcastMembershipFilter`` keeps a Bloom filter of what we did send
+so most foreign events are dropped before the database is touched:
+
+- ``broadcast:{broadcast_id}`` is added when a dispatch is recorded and
+  admits the template-send event that links the Meta message id;
+- ``message:{message_id}`` is added once that link is made and admits
+  the template-status events that follow.
+
+Members go into one Redis bitmap per UTC day,
+``{prefix}:{YYYYMMDD}``, sized for ``BROADCAST_MEMBERSHIP_FILTER_CAPACITY``
+members at ``FALSE_POSITIVE_RATE``. A lookup checks the buckets of the
+last ``BROADCAST_MEMBERSHIP_RETENTION_DAYS`` days in one pipeline and
+each bucket expires once it falls out of that window.
+
+``BROADCAST_MEMBERSHIP_FILTER_ENABLED`` records members and counts what
+the filter would do; events are only dropped with
+``BROADCAST_MEMBERSHIP_FILTER_ENFORCED`` as well, once the
+``backfill_broadcast_membership`` command has loaded the broadcasts
+recorded before the filter was enabled. Outcomes are emitted as the
+StatsD counter ``broadcast.membership.events``, tagged ``routing`` and
+``result`` (``filtered``, ``passed``, ``false_positive``, ``missed`` or
+``unavailable``); nothing is exposed when StatsD is disabled. If Redis
+is unreachable every event is admitted until ``_redis_gate`` lets Redis
+be tried again.
+"""
+
+import functools
+import hashlib
+import logging
+import math
+from datetime import date, timedelta
+from typing import Iterable, List, Optional
+
+from django.conf import settings
+from django.utils import timezone
+from django_redis import get_redis_connection
+
+from retail.observability.backoff import BackoffGate
+from retail.observability.statsd import get_statsd_client
+
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "broadcast_membership"
+DEFAULT_RETENTION_DAYS = 7
+DEFAULT_CAPACITY = 1_000_000
+FALSE_POSITIVE_RATE = 0.01
+# Redis strings, and so bitmaps, are capped at 512MB.
+MAX_FILTER_BITS = 2**32
+
+
+def filter_size(capacity: int, false_positive_rate: float) -> tuple[int, int]:
+    """Return ``(bits, hashes)`` of a Bloom filter for ``capacity`` members."""
+    capacity = max(1, capacity)
+    bits = math.ceil(-capacity * math.log(false_positive_rate) / math.log(2) ** 2)
+    bits = min(bits, MAX_FILTER_BITS)
+    hashes = max(1, round(bits / capacity * math.log(2)))
+    return bits, hashes
+
+
+def count_outcome(routing: str, result: str) -> None:
+    """Count a courier event by pre-filter outcome (filtered, passed,
+    false_positive, missed, unavailable)."""
+    statsd = get_statsd_client()
+    if statsd.enabled:
+        statsd.send(
+            [
+                (
+                    "broadcast.membership.events",
+                    1,
+                    "c",
+                    {"routing": routing, "result": result},
+                )
+            ]
+        )
+
+
+class BroadcastMembershipFilter:
+    """Time-bucketed Bloom filter of broadcast ids and Meta message ids."""
+
+    def __init__(self, redis_client=None):
+        self._redis_client = redis_client
+        self._redis_gate = BackoffGate(
+            logger, "[BROADCAST_MEMBERSHIP] Redis unavailable, admitting every event"
+        )
+
+    @property
+    def enabled(self) -> bool:
+        return bool(getattr(settings, "BROADCAST_MEMBERSHIP_FILTER_ENABLED", False))
+
+    @property
+    def enforced(self) -> bool:
+        return self.enabled and bool(
+            getattr(settings, "BROADCAST_MEMBERSHIP_FILTER_ENFORCED", False)
+        )
+
+    @property
+    def retention_days(self) -> int:
+        value = getattr(
+            settings, "BROADCAST_MEMBERSHIP_RETENTION_DAYS", DEFAULT_RETENTION_DAYS
+        )
+        return max(1, int(value))
+
+    @property
+    def capacity(self) -> int:
+        return int(
+            getattr(settings, "BROADCAST_MEMBERSHIP_FILTER_CAPACITY", DEFAULT_CAPACITY)
+        )
+
+    @property
+    def redis(self):
+        if self._redis_client is None:
+            self._redis_client = get_redis_connection("default")
+        return self._redis_client
+
+    def bucket_key(self, day: date) -> str:
+        return f"{KEY_PREFIX}:{day:%Y%m%d}"
+
+    def add_broadcast(self, broadcast_id: int, day: Optional[date] = None) -> bool:
+        return self.add([f"broadcast:{broadcast_id}"], day=day)
+
+    def add_message(self, message_id: str, day: Optional[date] = None) -> bool:
+        return self.add([f"message:{message_id}"], day=day)
+
+    def might_have_broadcast(self, broadcast_id: int) -> Optional[bool]:
+        return self.might_contain(f"broadcast:{broadcast_id}")
+
+    def might_have_message(self, message_id: str) -> Optional[bool]:
+        return self.might_contain(f"message:{message_id}")
+
+    def add(self, members: Iterable[str], day: Optional[date] = None) -> bool:
+        """Add ``members`` to the bucket of ``day`` (today by default).
+
+        Returns ``False`` without raising when Redis is unavailable.
+        """
+        members = list(members)
+        if not members or not self._redis_gate.available:
+            return False
+
+        key = self.bucket_key(day or timezone.now().date())
+        try:
+            pipe = self.redis.pipeline(transaction=False)
+            for member in members:
+                for offset in self._offsets(member):
+                    pipe.setbit(key, offset, 1)
+            pipe.expire(key, (self.retention_days + 1) * 86400)
+            pipe.execute()
+        except Exception as exc:
+            self._redis_gate.trip(exc)
+            return False
+        return True
+
+    def might_contain(self, member: str) -> Optional[bool]:
+        """``False`` only when ``member`` was certainly not added.
+
+        ``None`` means Redis could not be asked; callers admit the event.
+        """
+        if not self._redis_gate.available:
+            return None
+
+        offsets = self._offsets(member)
+        keys = self._bucket_keys()
+        try:
+            pipe = self.redis.pipeline(transaction=False)
+            for key in keys:
+                for offset in offsets:
+                    pipe.getbit(key, offset)
+            bits = pipe.execute()
+        except Exception as exc:
+            self._redis_gate.trip(exc)
+            return None
+
+        width = len(offsets)
+        return any(all(bits[start:][:width]) for start in range(0, len(bits), width))
+
+    def _bucket_keys(self) -> List[str]:
+        today = timezone.now().date()
+        return [
+            self.bucket_key(today - timedelta(days=offset))
+            for offset in range(self.retention_days + 1)
+        ]
+
+    def _offsets(self, member: str) -> List[int]:
+        bits, hashes = filter_size(self.capacity, FALSE_POSITIVE_RATE)
+        digest = hashlib.blake2b(member.encode("utf-8"), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "big")
+        second = int.from_bytes(digest[8:], "big") | 1
+        return [(first + index * second) % bits for index in range(hashes)]
+
+
+@functools.lru_cache(maxsize=None)
+def get_broadcast_membership_filter() -> BroadcastMembershipFilter:
+    """Process-wide filter, so one Redis outage is backed off everywhere."""
+    return BroadcastMembershipFilter()
@@ -0,0 +1,293 @@
+"""Write-behind buffer for ``BroadcastMessage`` rows.
+
+``RecordBroadcastSentUseCase`` inserts one row per dispatch. When
+``BROADCAST_MESSAGE_BUFFER_WINDOW_SECONDS`` is positive the rows of
+non-pending dispatches are appended to Redis instead and written with a
+single ``bulk_create`` by ``task_flush_broadcast_messages``:
+
+- ``{prefix}:rows`` is the list of serialized rows, oldest first;
+- ``{prefix}:scheduled`` is set by the first append of a window, which
+  is the only one that schedules the flush. It is cleared once a flush
+  has removed the rows it wrote, so appends made while a batch is in
+  flight never schedule a second flush for it;
+- ``{prefix}:flushing`` is the lock held by the single running flush;
+- ``{prefix}:failures`` counts consecutive failed flushes; it sets the
+  backoff before the next attempt and is cleared by a successful one;
+- ``{prefix}:row:{uuid}`` marks a row as buffered until a flush has
+  taken it, so readers can tell a row still on its way to Postgres from
+  one that will never get there;
+- ``{prefix}:pending:{broadcast_id}`` counts the buffered rows carrying
+  that ``broadcast_id``;
+- ``{prefix}:parked:{broadcast_id}`` lists the courier events that
+  arrived for a buffered ``broadcast_id`` before its row was written;
+- ``{prefix}:message:{message_id}`` maps a parked Meta message id to
+  its ``broadcast_id`` so later status-only events are parked as well.
+
+A window reaching ``BROADCAST_MESSAGE_BUFFER_MAX_ROWS`` rows is flushed
+straight away; whatever a flush leaves behind is flushed again
+immediately. Every key expires after ``KEY_TTL_SECONDS``.
+
+``append`` returns ``False`` whenever the row could not be buffered
+(Redis or the broker unavailable) and callers then insert it directly.
+"""
+
+import json
+import logging
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set
+from uuid import UUID, uuid4
+
+from django.conf import settings
+from django_redis import get_redis_connection
+
+from retail.broadcasts.models import BroadcastMessage
+
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "broadcast_message_buffer"
+DEFAULT_MAX_ROWS = 500
+KEY_TTL_SECONDS = 3600
+FLUSH_LOCK_SECONDS = 60
+FLUSH_RETRY_SECONDS = 5
+FLUSH_RETRY_MAX_SECONDS = 300
+
+# Filled in by the database (``id``) or by ``bulk_create`` itself
+# (``created_at`` / ``updated_at``).
+_UNBUFFERED_FIELDS = frozenset({"id", "created_at", "updated_at"})
+
+
+def _schedule_flush_task(countdown: int) -> None:
+    from retail.broadcasts.tasks import task_flush_broadcast_messages
+
+    task_flush_broadcast_messages.apply_async(countdown=countdown)
+
+
+def serialize_row(message: BroadcastMessage) -> str:
+    """Return the JSON form of an unsaved ``message`` as stored in Redis."""
+    values = {
+        field.attname: getattr(message, field.attname)
+        for field in BroadcastMessage._meta.concrete_fields
+        if field.attname not in _UNBUFFERED_FIELDS
+    }
+    return json.dumps(values, default=str)
+
+
+def deserialize_row(raw: bytes) -> BroadcastMessage:
+    return BroadcastMessage(**json.loads(raw))
+
+
+class BroadcastMessageBuffer:
+    """Buffers rows in Redis and hands them to the flush in batches."""
+
+    def __init__(
+        self,
+        redis_client=None,
+        schedule_flush: Optional[Callable[[int], None]] = None,
+    ):
+        self._redis_client = redis_client
+        self.schedule_flush = schedule_flush or _schedule_flush_task
+        self._flush_token: Optional[str] = None
+
+    @property
+    def window_seconds(self) -> int:
+        return int(getattr(settings, "BROADCAST_MESSAGE_BUFFER_WINDOW_SECONDS", 0))
+
+    @property
+    def max_rows(self) -> int:
+        value = getattr(settings, "BROADCAST_MESSAGE_BUFFER_MAX_ROWS", DEFAULT_MAX_ROWS)
+        return max(1, int(value))
+
+    @property
+    def enabled(self) -> bool:
+        return self.window_seconds > 0
+
+    @property
+    def redis(self):
+        if self._redis_client is None:
+            self._redis_client = get_redis_connection("default")
+        return self._redis_client
+
+    @staticmethod
+    def _key(*parts: Any) -> str:
+        return ":".join([KEY_PREFIX, *(str(part) for part in parts)])
+
+    def append(self, message: BroadcastMessage) -> bool:
+        """Buffer the unsaved ``message``; ``False`` means insert it directly."""
+        row = serialize_row(message)
+        broadcast_id = message.broadcast_id
+
+        try:
+            pipe = self.redis.pipeline()
+            pipe.rpush(self._key("rows"), row)
+            pipe.expire(self._key("rows"), KEY_TTL_SECONDS)
+            pipe.set(self._key("scheduled"), "1", ex=KEY_TTL_SECONDS, nx=True)
+            pipe.set(self._key("row", message.uuid), "1", ex=KEY_TTL_SECONDS)
+            if broadcast_id is not None:
+                pipe.incr(self._key("pending", broadcast_id))
+                pipe.expire(self._key("pending", broadcast_id), KEY_TTL_SECONDS)
+            size, _, first_of_window = pipe.execute()[:3]
+        except Exception as exc:
+            logger.warning(
+                f"[BROADCAST_BUFFER] Could not buffer broadcast {message.uuid}, "
+                f"inserting it directly: {exc}"
+            )
+            return False
+
+        countdown = None
+        if size == self.max_rows:
+            countdown = 0
+        elif first_of_window:
+            countdown = self.window_seconds
+
+        if countdown is not None:
+            try:
+                self.schedule_flush(countdown)
+            except Exception as exc:
+                logger.warning(
+                    f"[BROADCAST_BUFFER] Could not schedule flush, inserting "
+                    f"broadcast {message.uuid} directly: {exc}"
+                )
+                self._withdraw(row, message.uuid, broadcast_id, bool(first_of_window))
+                return False
+
+        return True
+
+    def _withdraw(
+        self,
+        row: str,
+        row_uuid: UUID,
+        broadcast_id: Optional[int],
+        release_schedule: bool,
+    ) -> None:
+        try:
+            self.redis.lrem(self._key("rows"), 1, row)
+            self.redis.delete(self._key("row", row_uuid))
+            if broadcast_id is not None:
+                self.release([broadcast_id])
+            if release_schedule:
+                self.redis.delete(self._key("scheduled"))
+        except Exception as exc:
+            logger.error(
+                f"[BROADCAST_BUFFER] Could not withdraw row from "
+                f"{self._key('rows')}; it may be inserted twice: {exc}"
+            )
+
+    def acquire_flush_lock(self) -> bool:
+        token = uuid4().hex
+        acquired = bool(
+            self.redis.set(self._key("flushing"), token, ex=FLUSH_LOCK_SECONDS, nx=True)
+        )
+        self._flush_token = token if acquired else None
+        return acquired
+
+    def release_flush_lock(self) -> None:
+        """Release the lock unless it expired and another flush took it."""
+        token, self._flush_token = self._flush_token, None
+        if token is None:
+            return
+        if self.redis.get(self._key("flushing")) in (token, token.encode()):
+            self.redis.delete(self._key("flushing"))
+
+    def read_rows(self) -> List[bytes]:
+        """Return up to ``max_rows`` of the oldest rows without removing them.
+
+        Rows stay in Redis until ``remove_rows`` confirms they were
+        written, so a flush that dies halfway loses nothing.
+        """
+        return self.redis.lrange(self._key("rows"), 0, self.max_rows - 1)
+
+    def remove_rows(self, raw_rows: List[bytes], row_uuids: Iterable[UUID]) -> None:
+        """Drop ``raw_rows`` from the buffer once they are written.
+
+        Rows are removed by value rather than by position: if the flush
+        lock expired and a second flush already took the same rows, a
+        positional trim would discard rows neither of them has read.
+        Also ends the window and the failure streak of the flush.
+        """
+        pipe = self.redis.pipeline()
+        for raw in raw_rows:
+            pipe.lrem(self._key("rows"), 1, raw)
+        for row_uuid in row_uuids:
+            pipe.delete(self._key("row", row_uuid))
+        pipe.delete(self._key("scheduled"), self._key("failures"))
+        pipe.execute()
+
+    def still_buffered(self, row_uuids: Iterable[UUID]) -> Set[UUID]:
+        """Return the subset of ``row_uuids`` no flush has taken yet."""
+        row_uuids = list(row_uuids)
+        if not row_uuids:
+            return set()
+        marks = self.redis.mget(*(self._key("row", u) for u in row_uuids))
+        return {u for u, mark in zip(row_uuids, marks) if mark is not None}
+
+    def reschedule_if_remaining(self, countdown: int = 0) -> bool:
+        """Schedule another flush when rows are still buffered.
+
+        Called after the flush lock is released: a flush scheduled while
+        the lock was held found it taken and did nothing.
+        """
+        if not self.redis.llen(self._key("rows")):
+            return False
+        self.redis.set(self._key("scheduled"), "1", ex=KEY_TTL_SECONDS)
+        self.schedule_flush(countdown)
+        return True
+
+    def retry_countdown(self) -> int:
+        """Record a failed flush and return the backoff before the next one.
+
+        Doubles from ``FLUSH_RETRY_SECONDS`` with every consecutive
+        failure, up to ``FLUSH_RETRY_MAX_SECONDS``.
+        """
+        pipe = self.redis.pipeline()
+        pipe.incr(self._key("failures"))
+        pipe.expire(self._key("failures"), KEY_TTL_SECONDS)
+        failures = pipe.execute()[0]
+        return min(FLUSH_RETRY_MAX_SECONDS, FLUSH_RETRY_SECONDS * 2 ** (failures - 1))
+
+    def release(self, broadcast_ids: List[int]) -> None:
+        """Mark one buffered row of each of ``broadcast_ids`` as written."""
+        for broadcast_id in broadcast_ids:
+            key = self._key("pending", broadcast_id)
+            if self.redis.incr(key, -1) <= 0:
+                self.redis.delete(key)
+
+    def broadcast_id_for(self, message_id: str) -> Optional[int]:
+        """Return the ``broadcast_id`` a parked send event linked to ``message_id``."""
+        mapped = self.redis.get(self._key("message", message_id))
+        return int(mapped) if mapped is not None else None
+
+    def park(self, kind: str, event: Dict[str, Any], broadcast_id: int) -> bool:
+        """Keep a courier event until the row of ``broadcast_id`` is written.
+
+        ``kind`` names the ``HandleStatusUpdateUseCase`` entry point the
+        event is replayed through. The event is pushed in the same
+        transaction that reads the pending counter; if no row of
+        ``broadcast_id`` is buffered the push is undone and ``False`` is
+        returned so the caller looks the row up again. When a flush took
+        the event before it could be undone it is already being
+        replayed, which counts as parked.
+        """
+        parked_key = self._key("parked", broadcast_id)
+        entry = json.dumps({"kind": kind, "event": event, "token": uuid4().hex})
+        message_id = event.get("message_id")
+
+        pipe = self.redis.pipeline(transaction=True)
+        pipe.get(self._key("pending", broadcast_id))
+        pipe.rpush(parked_key, entry)
+        pipe.expire(parked_key, KEY_TTL_SECONDS)
+        if message_id:
+            pipe.set(self._key("message", message_id), broadcast_id, ex=KEY_TTL_SECONDS)
+        pending = pipe.execute()[0]
+
+        if pending is not None and int(pending) > 0:
+            return True
+        return not self.redis.lrem(parked_key, 1, entry)
+
+    def take_parked(self, broadcast_id: int) -> List[Dict[str, Any]]:
+        """Pop every event parked for ``broadcast_id``, oldest first."""
+        parked_key = self._key("parked", broadcast_id)
+        pipe = self.redis.pipeline()
+        pipe.lrange(parked_key, 0, -1)
+        pipe.delete(parked_key)
+        raw_entries, _ = pipe.execute()
+        return [json.loads(raw) for raw in raw_entries]
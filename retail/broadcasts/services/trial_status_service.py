@@ -1,6 +1,7 @@
 import logging
+import time
 
-from typing import Optional
+from typing import Callable, Optional
 
 from django.core.cache import cache
 
@@ -14,9 +15,31 @@ logger = logging.getLogger(__name__)
 # Kept short and intentional: we only want to coalesce repeated lookups
 # inside the same broadcast burst (status events arrive in clusters per
 # project), not delay invalidation that already happens server-side on
-# plan changes.
+# plan changes. Past this soft expiry the value is still served while
+# a single worker refreshes it in the background.
 TRIAL_STATUS_CACHE_TTL_SECONDS = 30
 
+# Hard expiry: after this the cached value is dropped and the next
+# lookup calls Connect synchronously. Matches Connect's own cache, so a
+# value served while a refresh is in flight (or while Connect is down)
+# is never older than what Connect itself may answer with.
+TRIAL_STATUS_CACHE_HARD_TTL_SECONDS = 15 * 60
+
+# Refresh lock lifetime. A refresh that fails leaves the lock to expire
+# on its own, which spaces retries against a degraded Connect.
+TRIAL_STATUS_REFRESH_LOCK_SECONDS = 10
+
+# How long a cold lookup waits for another worker's in-flight refresh
+# before failing open.
+TRIAL_STATUS_COLD_WAIT_SECONDS = 1.0
+TRIAL_STATUS_COLD_POLL_SECONDS = 0.05
+
+
+def _schedule_refresh_task(project_uuid: str) -> None:
+    from retail.broadcasts.tasks import task_refresh_trial_status
+
+    task_refresh_trial_status.delay(project_uuid)
+
 
 class TrialStatusService:
     """Resolves whether a project is in an active trial.
@@ -29,11 +52,19 @@ class TrialStatusService:
     and is the documented single source of truth for trial-feature
     gating.
 
-    A short local cache layer is added on top to avoid hitting the
-    Connect HTTP service on every broadcast status event of the same
-    project within the same minute. The TTL is intentionally smaller
-    than Connect's so we still benefit from server-side invalidation
-    triggered by plan changes.
+    A local cache layer is added on top to avoid hitting the Connect
+    HTTP service on every broadcast status event of the same project.
+    Each entry carries a soft expiry (``cache_ttl_seconds``) and a hard
+    one (``hard_ttl_seconds``, the cache timeout):
+
+    - fresh: served as is;
+    - stale (past the soft expiry): served as is, and the first worker
+      to take the project's refresh lock enqueues
+      ``task_refresh_trial_status``, so a burst of events arriving as
+      the entry turns stale costs one Connect call, off the status
+      handler's path;
+    - missing (cold or past the hard expiry): the lock holder calls
+      Connect inline; the other workers wait briefly for its answer.
 
     Failure mode: ``fail-open``. If Connect is unreachable or returns
     an unexpected payload, ``is_trial_active`` returns ``False`` so the
@@ -41,15 +72,19 @@ class TrialStatusService:
     lookup must not block paying customers; the worst case is that a
     trial project temporarily exceeds its cap, which can be reconciled
     later. The opposite (blocking paid customers) has direct revenue
-    impact.
+    impact. A failed background refresh keeps serving the stale value
+    until the hard expiry.
     """
 
     CACHE_KEY_TEMPLATE = "broadcasts:trial_status:{project_uuid}"
+    LOCK_KEY_TEMPLATE = "broadcasts:trial_status:{project_uuid}:refresh"
 
     def __init__(
         self,
         connect_service: Optional[ConnectServiceInterface] = None,
         cache_ttl_seconds: Optional[int] = None,
+        hard_ttl_seconds: Optional[int] = None,
+        schedule_refresh: Optional[Callable[[str], None]] = None,
     ):
         self.connect_service = connect_service or ConnectService()
         self.cache_ttl_seconds = (
@@ -57,13 +92,41 @@ class TrialStatusService:
             if cache_ttl_seconds is not None
             else TRIAL_STATUS_CACHE_TTL_SECONDS
         )
+        self.hard_ttl_seconds = max(
+            self.cache_ttl_seconds,
+            (
+                hard_ttl_seconds
+                if hard_ttl_seconds is not None
+                else TRIAL_STATUS_CACHE_HARD_TTL_SECONDS
+            ),
+        )
+        self.schedule_refresh = schedule_refresh or _schedule_refresh_task
 
     def is_trial_active(self, project_uuid: str) -> bool:
         """Return True only when the project is confirmed to be in trial."""
-        cached_value = cache.get(self._cache_key(project_uuid))
-        if cached_value is not None:
-            return bool(cached_value)
-
+        entry = self._read_entry(project_uuid)
+        if entry is not None:
+            if time.time() >= entry["fresh_until"] and self._acquire_lock(project_uuid):
+                self._schedule_background_refresh(project_uuid)
+            return entry["value"]
+
+        if self._acquire_lock(project_uuid):
+            is_trial_active = self.refresh(project_uuid)
+            if is_trial_active is None:
+                # Nothing to serve meanwhile: let the next lookup retry.
+                cache.delete(self._lock_key(project_uuid))
+            return bool(is_trial_active)
+
+        return self._wait_for_refresh(project_uuid)
+
+    def refresh(self, project_uuid: str) -> Optional[bool]:
+        """Fetch the status from Connect and store it with new expiries.
+
+        Expected to run while holding the project's refresh lock; the
+        lock is released once the new value is stored. Returns ``None``
+        when Connect could not be reached: nothing is stored and the lock
+        is left to expire, spacing out the next attempt.
+        """
         try:
             payload = self.connect_service.get_project_plan_status(
                 project_uuid=project_uuid
@@ -75,15 +138,63 @@ class TrialStatusService:
                 f"assuming non-trial. project_uuid={project_uuid} "
                 f"status_code={getattr(exc, 'status_code', None)} error={exc}"
             )
-            return False
+            return None
 
         is_trial_active = bool((payload or {}).get("is_trial_active", False))
         cache.set(
             self._cache_key(project_uuid),
-            is_trial_active,
-            timeout=self.cache_ttl_seconds,
+            {
+                "value": is_trial_active,
+                "fresh_until": time.time() + self.cache_ttl_seconds,
+            },
+            timeout=self.hard_ttl_seconds,
         )
+        cache.delete(self._lock_key(project_uuid))
         return is_trial_active
 
+    def _read_entry(self, project_uuid: str) -> Optional[dict]:
+        entry = cache.get(self._cache_key(project_uuid))
+        # Entries written before the soft expiry existed were bare bools.
+        if not isinstance(entry, dict):
+            return None
+        return entry
+
+    def _acquire_lock(self, project_uuid: str) -> bool:
+        return cache.add(
+            self._lock_key(project_uuid),
+            1,
+            timeout=TRIAL_STATUS_REFRESH_LOCK_SECONDS,
+        )
+
+    def _schedule_background_refresh(self, project_uuid: str) -> None:
+        try:
+            self.schedule_refresh(project_uuid)
+        except Exception:
+            # The stale value is still served; let the next lookup retry.
+            cache.delete(self._lock_key(project_uuid))
+            logger.exception(
+                f"Could not schedule trial status refresh for "
+                f"project_uuid={project_uuid}"
+            )
+
+    def _wait_for_refresh(self, project_uuid: str) -> bool:
+        deadline = time.monotonic() + TRIAL_STATUS_COLD_WAIT_SECONDS
+        while time.monotonic() < deadline:
+            time.sleep(TRIAL_STATUS_COLD_POLL_SECONDS)
+            entry = self._read_entry(project_uuid)
+            if entry is not None:
+                return entry["value"]
+            if cache.get(self._lock_key(project_uuid)) is None:
+                break
+        logger.warning(
+            "Trial status not resolved by the refreshing worker; "
+            "assuming non-trial. "
+            f"project_uuid={project_uuid}"
+        )
+        return False
+
     def _cache_key(self, project_uuid: str) -> str:
         return self.CACHE_KEY_TEMPLATE.format(project_uuid=project_uuid)
+
+    def _lock_key(self, project_uuid: str) -> str:
+        return self.LOCK_KEY_TEMPLATE.format(project_uuid=project_uuid)
@@ -0,0 +1,44 @@
+import logging
+
+from celery import shared_task
+
+from retail.broadcasts.services.trial_status_service import TrialStatusService
+from retail.broadcasts.usecases.flush_broadcast_messages import (
+    FlushBufferedBroadcastMessagesUseCase,
+)
+
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task(name="task_flush_broadcast_messages")
+def task_flush_broadcast_messages() -> int:
+    """Write one batch of buffered BroadcastMessage rows.
+
+    Scheduled by ``BroadcastMessageBuffer.append`` when a buffer window
+    opens or fills up. Returns the number of rows written, or 0 on
+    failure; the rows then stay buffered and the use case has already
+    scheduled a retry with backoff.
+    """
+    try:
+        return FlushBufferedBroadcastMessagesUseCase().execute()
+    except Exception:
+        logger.exception(
+            "[BROADCAST_BUFFER] Error flushing buffered broadcast messages"
+        )
+        return 0
+
+
+@shared_task(name="task_refresh_trial_status")
+def task_refresh_trial_status(project_uuid: str) -> None:
+    """Refresh a stale cached trial status from Connect.
+
+    Enqueued by ``TrialStatusService`` by the one worker that took the
+    project's refresh lock; the others keep serving the stale value.
+    """
+    try:
+        TrialStatusService().refresh(project_uuid)
+    except Exception:
+        logger.exception(
+            f"Error refreshing trial status for project_uuid={project_uuid}"
+        )
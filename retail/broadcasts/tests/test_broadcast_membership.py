@@ -0,0 +1,227 @@
+from datetime import timedelta
+from unittest.mock import MagicMock, patch
+from uuid import uuid4
+
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from retail.agents.domains.agent_execution.tests._fakes import FakeRedisConnection
+from retail.agents.domains.agent_integration.models import IntegratedAgent
+from retail.agents.domains.agent_management.models import Agent
+from retail.broadcasts.models import BroadcastMessage, BroadcastStatus
+from retail.broadcasts.services.broadcast_membership import (
+    BroadcastMembershipFilter,
+    filter_size,
+)
+from retail.broadcasts.usecases.handle_status_update import (
+    BroadcastStatusEvent,
+    HandleStatusUpdateUseCase,
+)
+from retail.broadcasts.usecases.record_broadcast_sent import (
+    RecordBroadcastSentDTO,
+    RecordBroadcastSentUseCase,
+)
+from retail.projects.models import Project
+
+
+class BrokenRedis:
+    def pipeline(self, *args, **kwargs):
+        raise ConnectionError("redis down")
+
+
+@override_settings(
+    BROADCAST_MEMBERSHIP_FILTER_ENABLED=True,
+    BROADCAST_MEMBERSHIP_FILTER_CAPACITY=1000,
+    BROADCAST_MEMBERSHIP_RETENTION_DAYS=2,
+)
+class BroadcastMembershipFilterTest(TestCase):
+    def setUp(self):
+        self.redis = FakeRedisConnection()
+        self.membership_filter = BroadcastMembershipFilter(redis_client=self.redis)
+
+    def test_filter_size_targets_the_false_positive_rate(self):
+        bits, hashes = filter_size(1_000_000, 0.01)
+
+        self.assertEqual(bits, 9_585_059)
+        self.assertEqual(hashes, 7)
+
+    def test_added_members_are_found_and_others_are_not(self):
+        self.membership_filter.add_broadcast(42)
+        self.membership_filter.add_message("wamid.1")
+
+        self.assertTrue(self.membership_filter.might_have_broadcast(42))
+        self.assertTrue(self.membership_filter.might_have_message("wamid.1"))
+        self.assertFalse(self.membership_filter.might_have_broadcast(43))
+        self.assertFalse(self.membership_filter.might_have_message("wamid.2"))
+
+    def test_members_stay_visible_for_the_retention_window(self):
+        today = timezone.now().date()
+        self.membership_filter.add_broadcast(1, day=today - timedelta(days=2))
+        self.membership_filter.add_broadcast(2, day=today - timedelta(days=3))
+
+        self.assertTrue(self.membership_filter.might_have_broadcast(1))
+        self.assertFalse(self.membership_filter.might_have_broadcast(2))
+
+    def test_buckets_expire_after_the_retention_window(self):
+        self.membership_filter.add_broadcast(42)
+
+        key = self.membership_filter.bucket_key(timezone.now().date())
+        self.assertEqual(self.redis.expirations[key], 3 * 86400)
+
+    def test_unreachable_redis_admits_and_backs_off(self):
+        membership_filter = BroadcastMembershipFilter(redis_client=BrokenRedis())
+
+        self.assertFalse(membership_filter.add_broadcast(42))
+        self.assertIsNone(membership_filter.might_have_broadcast(42))
+
+        with patch.object(BrokenRedis, "pipeline") as pipeline:
+            self.assertIsNone(membership_filter.might_have_broadcast(42))
+        pipeline.assert_not_called()
+
+    def test_backfill_adds_recent_rows_to_their_day(self):
+        project = Project.objects.create(name="Backfill", uuid=uuid4())
+        recent = BroadcastMessage.objects.create(
+            broadcast_id=7, external_message_id="wamid.7", project=project
+        )
+        old = BroadcastMessage.objects.create(broadcast_id=8, project=project)
+        BroadcastMessage.objects.filter(pk=old.pk).update(
+            created_at=timezone.now() - timedelta(days=5)
+        )
+
+        with patch(
+            "retail.broadcasts.management.commands.backfill_broadcast_membership."
+            "get_broadcast_membership_filter",
+            return_value=self.membership_filter,
+        ):
+            call_command("backfill_broadcast_membership", stdout=MagicMock())
+
+        self.assertTrue(
+            self.membership_filter.might_have_broadcast(recent.broadcast_id)
+        )
+        self.assertTrue(self.membership_filter.might_have_message("wamid.7"))
+        self.assertFalse(self.membership_filter.might_have_broadcast(old.broadcast_id))
+
+
+@override_settings(
+    BROADCAST_MEMBERSHIP_FILTER_ENABLED=True,
+    BROADCAST_MEMBERSHIP_FILTER_CAPACITY=1000,
+)
+class StatusEventMembershipTest(TestCase):
+    def setUp(self):
+        self.project = Project.objects.create(name="Project A", uuid=uuid4())
+        agent = Agent.objects.create(name="Agent A", project=self.project)
+        self.integrated_agent = IntegratedAgent.objects.create(
+            agent=agent, project=self.project
+        )
+        self.redis = FakeRedisConnection()
+        self.membership_filter = BroadcastMembershipFilter(redis_client=self.redis)
+        self.record = RecordBroadcastSentUseCase(
+            membership_filter=self.membership_filter
+        )
+        limit_guard = MagicMock()
+        limit_guard.should_block.return_value = False
+        self.status = HandleStatusUpdateUseCase(
+            limit_guard=limit_guard, membership_filter=self.membership_filter
+        )
+        patcher = patch(
+            "retail.broadcasts.services.broadcast_membership.get_statsd_client"
+        )
+        self.statsd = patcher.start().return_value
+        self.statsd.enabled = True
+        self.addCleanup(patcher.stop)
+
+    def _record(self, broadcast_id):
+        return self.record.execute(
+            RecordBroadcastSentDTO(
+                broadcast_id=broadcast_id,
+                integrated_agent=self.integrated_agent,
+                template=None,
+                contact_urn="whatsapp:5584999990000",
+                channel_uuid=None,
+                flows_template_uuid=None,
+                flows_response={"status": "queued"},
+            )
+        )
+
+    def _events(self, routing, result):
+        return sum(
+            value
+            for call in self.statsd.send.call_args_list
+            for name, value, _, tags in call.args[0]
+            if name == "broadcast.membership.events"
+            and tags == {"routing": routing, "result": result}
+        )
+
+    def test_recorded_broadcast_passes_and_its_status_events_follow(self):
+        message = self._record(501)
+        passed = self._events("send", "passed")
+        status_passed = self._events("status", "passed")
+
+        self.status.link_send_event(
+            BroadcastStatusEvent("wamid.501", 501, BroadcastStatus.SENT, {})
+        )
+        self.status.apply_status_event(
+            BroadcastStatusEvent("wamid.501", None, BroadcastStatus.DELIVERED, {})
+        )
+
+        message.refresh_from_db()
+        self.assertEqual(message.status, BroadcastStatus.DELIVERED)
+        self.assertEqual(self._events("send", "passed"), passed + 1)
+        self.assertEqual(self._events("status", "passed"), status_passed + 1)
+
+    @override_settings(BROADCAST_MEMBERSHIP_FILTER_ENFORCED=True)
+    def test_enforced_filter_drops_foreign_events_without_queries(self):
+        filtered = self._events("status", "filtered")
+
+        with self.assertNumQueries(0):
+            self.status.link_send_event(
+                BroadcastStatusEvent("wamid.x", 999, BroadcastStatus.SENT, {})
+            )
+            self.status.apply_status_event(
+                BroadcastStatusEvent("wamid.y", None, BroadcastStatus.SENT, {})
+            )
+
+        self.assertEqual(self._events("status", "filtered"), filtered + 1)
+
+    def test_shadow_mode_counts_rows_the_filter_does_not_know(self):
+        message = BroadcastMessage.objects.create(
+            broadcast_id=777,
+            project=self.project,
+            integrated_agent=self.integrated_agent,
+            status=BroadcastStatus.QUEUED,
+        )
+        missed = self._events("send", "missed")
+        filtered = self._events("send", "filtered")
+
+        self.status.link_send_event(
+            BroadcastStatusEvent("wamid.777", 777, BroadcastStatus.SENT, {})
+        )
+        self.status.link_send_event(
+            BroadcastStatusEvent("wamid.x", 999, BroadcastStatus.SENT, {})
+        )
+
+        message.refresh_from_db()
+        self.assertEqual(message.external_message_id, "wamid.777")
+        self.assertEqual(self._events("send", "missed"), missed + 1)
+        self.assertEqual(self._events("send", "filtered"), filtered + 1)
+        self.assertTrue(self.membership_filter.might_have_message("wamid.777"))
+
+    def test_admitted_event_without_row_counts_as_false_positive(self):
+        self.membership_filter.add_message("wamid.gone")
+        false_positives = self._events("status", "false_positive")
+
+        self.status.apply_status_event(
+            BroadcastStatusEvent("wamid.gone", None, BroadcastStatus.SENT, {})
+        )
+
+        self.assertEqual(self._events("status", "false_positive"), false_positives + 1)
+
+    @override_settings(BROADCAST_MEMBERSHIP_FILTER_ENABLED=False)
+    def test_disabled_filter_never_touches_redis(self):
+        self._record(601)
+        self.status.link_send_event(
+            BroadcastStatusEvent("wamid.601", 601, BroadcastStatus.SENT, {})
+        )
+
+        self.assertEqual(self.redis.bitmaps, {})
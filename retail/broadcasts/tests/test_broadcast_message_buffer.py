@@ -0,0 +1,304 @@
+from unittest.mock import MagicMock, patch
+from uuid import uuid4
+
+from django.test import TestCase, override_settings
+
+from retail.agents.domains.agent_execution.tests._fakes import FakeRedisConnection
+from retail.agents.domains.agent_integration.models import IntegratedAgent
+from retail.agents.domains.agent_management.models import Agent
+from retail.broadcasts.models import BroadcastMessage, BroadcastStatus
+from retail.broadcasts.services.broadcast_message_buffer import (
+    BroadcastMessageBuffer,
+    deserialize_row,
+)
+from retail.broadcasts.usecases.flush_broadcast_messages import (
+    FlushBufferedBroadcastMessagesUseCase,
+)
+from retail.broadcasts.usecases.handle_status_update import (
+    BroadcastStatusEvent,
+    HandleStatusUpdateUseCase,
+)
+from retail.broadcasts.usecases.record_broadcast_sent import (
+    BroadcastDispatchContext,
+    RecordBroadcastSentDTO,
+    RecordBroadcastSentUseCase,
+)
+from retail.projects.models import Project
+
+
+class BrokenRedis:
+    def pipeline(self, *args, **kwargs):
+        raise ConnectionError("redis down")
+
+
+@override_settings(
+    BROADCAST_MESSAGE_BUFFER_WINDOW_SECONDS=2, BROADCAST_MESSAGE_BUFFER_MAX_ROWS=3
+)
+class BroadcastMessageBufferTest(TestCase):
+    def setUp(self):
+        self.project = Project.objects.create(
+            uuid=uuid4(), name="Buffer Project", vtex_account="buffer-store"
+        )
+        agent = Agent.objects.create(name="Campaign Agent", project=self.project)
+        self.integrated_agent = IntegratedAgent.objects.create(
+            agent=agent, project=self.project, channel_uuid=uuid4()
+        )
+        self.redis = FakeRedisConnection()
+        self.scheduled = []
+        self.buffer = BroadcastMessageBuffer(
+            redis_client=self.redis, schedule_flush=self.scheduled.append
+        )
+        self.record = RecordBroadcastSentUseCase(message_buffer=self.buffer)
+        self.limit_guard = MagicMock()
+        self.limit_guard.should_block.return_value = False
+        self.status = HandleStatusUpdateUseCase(
+            limit_guard=self.limit_guard, message_buffer=self.buffer
+        )
+        self.flush = FlushBufferedBroadcastMessagesUseCase(
+            message_buffer=self.buffer, status_use_case=self.status
+        )
+
+    def _record(self, broadcast_id, **overrides):
+        defaults = dict(
+            broadcast_id=broadcast_id,
+            integrated_agent=self.integrated_agent,
+            template=None,
+            contact_urn=f"whatsapp:55119{broadcast_id or 0:08d}",
+            channel_uuid=str(self.integrated_agent.channel_uuid),
+            flows_template_uuid=None,
+            flows_response={"id": broadcast_id, "status": "queued"},
+            dispatch_context=BroadcastDispatchContext(order_form_id="of-1"),
+        )
+        defaults.update(overrides)
+        return self.record.execute(RecordBroadcastSentDTO(**defaults))
+
+    def _event(self, message_id, status, broadcast_id=None):
+        return BroadcastStatusEvent(
+            message_id=message_id,
+            broadcast_id=broadcast_id,
+            status=status,
+            payload={"message_id": message_id, "status": status},
+        )
+
+    def test_rows_are_buffered_until_the_flush_writes_them_in_one_insert(self):
+        recorded = [self._record(broadcast_id) for broadcast_id in (101, 102)]
+
+        self.assertFalse(BroadcastMessage.objects.exists())
+        self.assertEqual(self.scheduled, [2])
+
+        with self.assertNumQueries(4):
+            flushed = self.flush.execute()
+
+        self.assertEqual(flushed, 2)
+        rows = {row.uuid: row for row in BroadcastMessage.objects.all()}
+        self.assertEqual(set(rows), {message.uuid for message in recorded})
+        row = rows[recorded[0].uuid]
+        self.assertEqual(row.broadcast_id, 101)
+        self.assertEqual(row.status, BroadcastStatus.QUEUED)
+        self.assertEqual(row.project_id, self.project.pk)
+        self.assertEqual(row.integrated_agent_id, self.integrated_agent.pk)
+        self.assertEqual(row.order_form_id, "of-1")
+        self.assertEqual(
+            row.last_payload, {"flows_response": {"id": 101, "status": "queued"}}
+        )
+        self.assertIsNotNone(row.created_at)
+        self.assertEqual(self.flush.execute(), 0)
+
+    def test_full_window_is_flushed_without_waiting(self):
+        for broadcast_id in (101, 102, 103):
+            self._record(broadcast_id)
+
+        self.assertEqual(self.scheduled, [2, 0])
+
+    def test_leftover_rows_schedule_another_flush(self):
+        for broadcast_id in (101, 102, 103, 104):
+            self._record(broadcast_id)
+        self.scheduled.clear()
+
+        self.assertEqual(self.flush.execute(), 3)
+
+        self.assertEqual(self.scheduled, [0])
+        self.assertEqual(self.flush.execute(), 1)
+        self.assertEqual(BroadcastMessage.objects.count(), 4)
+
+    def test_reflushing_a_written_batch_does_not_duplicate_rows(self):
+        self._record(101)
+        raw_rows = self.redis.lrange("broadcast_message_buffer:rows", 0, -1)
+        self.flush.execute()
+
+        self.redis.rpush("broadcast_message_buffer:rows", *raw_rows)
+        self.flush.execute()
+
+        self.assertEqual(BroadcastMessage.objects.count(), 1)
+
+    def test_duplicate_dispatch_is_dropped_without_blocking_the_batch(self):
+        kept = self._record(101)
+        duplicate = self._record(101, contact_urn=kept.contact_urn)
+        other = self._record(102)
+
+        with self.assertLogs(
+            "retail.broadcasts.usecases.flush_broadcast_messages", "WARNING"
+        ):
+            self.assertEqual(self.flush.execute(), 3)
+
+        self.assertEqual(
+            set(BroadcastMessage.objects.values_list("uuid", flat=True)),
+            {kept.uuid, other.uuid},
+        )
+        self.assertEqual(self.redis.llen("broadcast_message_buffer:rows"), 0)
+        self.assertEqual(self.buffer.still_buffered([duplicate.uuid]), set())
+
+    def test_rows_stay_marked_as_buffered_until_flushed(self):
+        message = self._record(101)
+
+        self.assertEqual(self.buffer.still_buffered([message.uuid]), {message.uuid})
+        self.flush.execute()
+        self.assertEqual(self.buffer.still_buffered([message.uuid]), set())
+
+    def test_flush_that_outlived_its_lock_keeps_rows_it_did_not_read(self):
+        self._record(101)
+        self._record(102)
+        raw_rows = self.buffer.read_rows()
+        row_uuids = [deserialize_row(raw).uuid for raw in raw_rows]
+
+        # A second flush took the same rows after the lock expired...
+        self.buffer.remove_rows(raw_rows, row_uuids)
+        late = self._record(103)
+        # ...and the first one finishes after it.
+        self.buffer.remove_rows(raw_rows, row_uuids)
+
+        remaining = self.redis.lrange("broadcast_message_buffer:rows", 0, -1)
+        self.assertEqual(
+            [deserialize_row(raw).uuid for raw in remaining], [str(late.uuid)]
+        )
+
+    def test_expired_lock_is_not_released_by_its_former_holder(self):
+        self.assertTrue(self.buffer.acquire_flush_lock())
+        self.redis.delete("broadcast_message_buffer:flushing")
+        other = BroadcastMessageBuffer(redis_client=self.redis)
+        self.assertTrue(other.acquire_flush_lock())
+
+        self.buffer.release_flush_lock()
+
+        self.assertFalse(self.buffer.acquire_flush_lock())
+        other.release_flush_lock()
+        self.assertTrue(self.buffer.acquire_flush_lock())
+
+    def test_failed_flush_keeps_the_rows_and_retries_with_backoff(self):
+        message = self._record(101)
+        self.scheduled.clear()
+
+        with patch.object(
+            BroadcastMessage.objects,
+            "bulk_create",
+            side_effect=RuntimeError("db down"),
+        ):
+            for _ in range(2):
+                with self.assertRaises(RuntimeError):
+                    self.flush.execute()
+
+        self.assertEqual(self.scheduled, [5, 10])
+        self.assertEqual(self.redis.llen("broadcast_message_buffer:rows"), 1)
+        self.assertIsNotNone(self.redis.get("broadcast_message_buffer:scheduled"))
+        self.assertEqual(self.buffer.still_buffered([message.uuid]), {message.uuid})
+
+        self.assertEqual(self.flush.execute(), 1)
+        self.assertTrue(BroadcastMessage.objects.filter(uuid=message.uuid).exists())
+        self.assertIsNone(self.redis.get("broadcast_message_buffer:failures"))
+        self.assertIsNone(self.redis.get("broadcast_message_buffer:scheduled"))
+
+    def test_append_during_a_flush_does_not_schedule_another_one(self):
+        self._record(101)
+        self.scheduled.clear()
+        self.buffer.read_rows()
+
+        self._record(102)
+
+        self.assertEqual(self.scheduled, [])
+
+    def test_held_lock_skips_the_flush(self):
+        self._record(101)
+        self.buffer.acquire_flush_lock()
+
+        self.assertEqual(self.flush.execute(), 0)
+        self.assertFalse(BroadcastMessage.objects.exists())
+
+    def test_pending_rows_are_inserted_right_away(self):
+        message = self._record(None, pending=True, flows_response={})
+
+        self.assertTrue(BroadcastMessage.objects.filter(uuid=message.uuid).exists())
+        self.assertEqual(self.redis.llen("broadcast_message_buffer:rows"), 0)
+
+    def test_redis_down_inserts_the_row_directly(self):
+        self.buffer._redis_client = BrokenRedis()
+
+        message = self._record(101)
+
+        self.assertTrue(BroadcastMessage.objects.filter(uuid=message.uuid).exists())
+
+    def test_failed_schedule_withdraws_the_row_and_inserts_it_directly(self):
+        self.buffer.schedule_flush = MagicMock(side_effect=ConnectionError("down"))
+
+        message = self._record(101)
+
+        self.assertTrue(BroadcastMessage.objects.filter(uuid=message.uuid).exists())
+        self.assertEqual(self.redis.llen("broadcast_message_buffer:rows"), 0)
+        self.assertIsNone(self.redis.get("broadcast_message_buffer:pending:101"))
+
+    def test_courier_events_for_a_buffered_row_are_replayed_after_the_flush(self):
+        message = self._record(101)
+
+        self.status.link_send_event(
+            self._event("wamid-1", BroadcastStatus.SENT, broadcast_id=101)
+        )
+        self.status.apply_status_event(
+            self._event("wamid-1", BroadcastStatus.DELIVERED)
+        )
+        self.status.apply_status_event(self._event("wamid-1", BroadcastStatus.READ))
+        self.assertFalse(BroadcastMessage.objects.exists())
+
+        self.flush.execute()
+
+        row = BroadcastMessage.objects.get(uuid=message.uuid)
+        self.assertEqual(row.external_message_id, "wamid-1")
+        self.assertEqual(row.status, BroadcastStatus.READ)
+        self.assertEqual(row.previous_status, BroadcastStatus.DELIVERED)
+        self.integrated_agent.refresh_from_db()
+        self.assertEqual(self.integrated_agent.broadcasts_delivered, 1)
+        self.assertEqual(self.integrated_agent.first_successful_sent_at, row.created_at)
+        self.assertEqual(self.buffer.take_parked(101), [])
+
+        self.status.apply_status_event(self._event("wamid-1", BroadcastStatus.FAILED))
+        row.refresh_from_db()
+        self.assertEqual(row.status, BroadcastStatus.FAILED)
+
+    def test_events_of_unbuffered_broadcasts_are_not_parked(self):
+        self.status.link_send_event(
+            self._event("wamid-9", BroadcastStatus.SENT, broadcast_id=999)
+        )
+        self.status.apply_status_event(
+            self._event("wamid-8", BroadcastStatus.DELIVERED)
+        )
+
+        self.assertEqual(self.buffer.take_parked(999), [])
+        self.assertIsNone(self.buffer.broadcast_id_for("wamid-8"))
+
+    def test_event_parked_after_the_row_was_written_is_applied_directly(self):
+        self._record(101)
+        self.flush.execute()
+
+        parked = self.buffer.park(
+            "link",
+            {"message_id": "wamid-1", "broadcast_id": 101, "status": None},
+            101,
+        )
+
+        self.assertFalse(parked)
+        self.assertEqual(self.buffer.take_parked(101), [])
+
+    @override_settings(BROADCAST_MESSAGE_BUFFER_WINDOW_SECONDS=0)
+    def test_disabled_buffer_inserts_every_row(self):
+        message = self._record(101)
+
+        self.assertTrue(BroadcastMessage.objects.filter(uuid=message.uuid).exists())
+        self.assertEqual(self.scheduled, [])
@@ -0,0 +1,29 @@
+"""Smoke test for the BroadcastMessage recording benchmark harness."""
+
+from django.test import TestCase
+
+from retail.agents.domains.agent_execution.tests._fakes import FakeRedisConnection
+from retail.broadcasts.benchmarks.broadcast_recording import (
+    BroadcastRecordingBenchmark,
+    BroadcastRecordingConfig,
+)
+
+
+class BroadcastRecordingBenchmarkTests(TestCase):
+    def test_buffered_mode_writes_every_row_in_fewer_queries(self):
+        report = (
+            BroadcastRecordingBenchmark(
+                BroadcastRecordingConfig(dispatches=25, batch_size=10),
+                redis_client=FakeRedisConnection(),
+            )
+            .run()
+            .as_dict()
+        )
+
+        per_row, buffered = report["modes"]["per_row"], report["modes"]["buffered"]
+        self.assertEqual(per_row["rows_written"], 25)
+        self.assertEqual(buffered["rows_written"], 25)
+        # 10 + 10 + 5 rows, one flush each.
+        self.assertEqual(buffered["per_flush_ms"]["count"], 3)
+        self.assertLess(buffered["queries"], per_row["queries"])
+        self.assertIn("speedup", report)
@@ -0,0 +1,32 @@
+"""Smoke test for the conversion attribution benchmark harness."""
+
+from django.test import TestCase
+
+from retail.broadcasts.benchmarks.conversion_attribution import (
+    ConversionAttributionBenchmark,
+    ConversionAttributionConfig,
+)
+
+
+class ConversionAttributionBenchmarkTests(TestCase):
+    def test_both_lookups_pick_the_same_broadcast(self):
+        report = (
+            ConversionAttributionBenchmark(
+                ConversionAttributionConfig(rows=4000, agents=4, lookups=40)
+            )
+            .run()
+            .as_dict()
+        )
+
+        or_filter, union_all = (
+            report["modes"]["or_filter"],
+            report["modes"]["union_all"],
+        )
+        self.assertEqual(report["mismatches"], 0)
+        self.assertEqual(union_all["per_lookup_ms"]["count"], 40)
+        self.assertEqual(or_filter["per_query_ms"]["count"], 40)
+        self.assertGreater(union_all["matched"], 0)
+        self.assertEqual(union_all["matched"], or_filter["matched"])
+        self.assertIn("broadcasts_agent_order_touch", union_all["plan"])
+        self.assertNotIn("broadcasts_agent_order_touch", or_filter["plan"])
+        self.assertIn("query_speedup", report)
@@ -421,6 +421,71 @@ class HandleStatusUpdateUseCaseTest(TestCase):
         self.integrated_agent.refresh_from_db()
         self.assertIsNone(self.integrated_agent.first_successful_sent_at)
 
+    def test_batched_broadcast_links_the_row_of_the_event_contact(self):
+        self.message.contact_urn = "whatsapp:5511999990001"
+        self.message.save(update_fields=["contact_urn"])
+        sibling = BroadcastMessage.objects.create(
+            broadcast_id=self.broadcast_id,
+            project=self.project,
+            integrated_agent=self.integrated_agent,
+            contact_urn="whatsapp:5511999990002",
+            status=BroadcastStatus.QUEUED,
+        )
+
+        self._dispatch(
+            self._event(
+                message_id="msg-sibling",
+                payload={
+                    "message_id": "msg-sibling",
+                    "contact_urn": "whatsapp:5511999990002",
+                },
+            )
+        )
+
+        sibling.refresh_from_db()
+        self.message.refresh_from_db()
+        self.assertEqual(sibling.external_message_id, "msg-sibling")
+        self.assertIsNone(self.message.external_message_id)
+
+    def test_batched_broadcast_does_not_link_a_sibling_of_an_unknown_contact(self):
+        self.message.contact_urn = "whatsapp:5511999990001"
+        self.message.save(update_fields=["contact_urn"])
+        sibling = BroadcastMessage.objects.create(
+            broadcast_id=self.broadcast_id,
+            project=self.project,
+            integrated_agent=self.integrated_agent,
+            contact_urn="whatsapp:5511999990002",
+            status=BroadcastStatus.QUEUED,
+        )
+
+        for payload in (
+            {"message_id": "msg-other", "contact_urn": "whatsapp:5511999990003"},
+            {"message_id": "msg-other"},
+        ):
+            self._dispatch(self._event(message_id="msg-other", payload=payload))
+
+        sibling.refresh_from_db()
+        self.message.refresh_from_db()
+        self.assertIsNone(sibling.external_message_id)
+        self.assertIsNone(self.message.external_message_id)
+
+    def test_single_dispatch_of_another_contact_is_not_linked(self):
+        self.message.contact_urn = "whatsapp:5511999990001"
+        self.message.save(update_fields=["contact_urn"])
+
+        self._dispatch(
+            self._event(
+                message_id="msg-other",
+                payload={
+                    "message_id": "msg-other",
+                    "contact_urn": "whatsapp:5511999990002",
+                },
+            )
+        )
+
+        self.message.refresh_from_db()
+        self.assertIsNone(self.message.external_message_id)
+
 
 class HandleStatusUpdateIdempotencyTest(TestCase):
     """Guards that the consumer does not double-count deliveries on replay."""
@@ -4,6 +4,7 @@ from unittest.mock import MagicMock, patch
 from uuid import uuid4
 
 from django.core.cache import cache
+from django.db import connection
 from django.test import TestCase, override_settings
 from django.utils import timezone
 
@@ -236,6 +237,31 @@ class MarkBroadcastConvertedUseCaseTest(TestCase):
         self.assertEqual(conversion.broadcast, recent)
         self.assertEqual(conversion.integrated_agent, self.integrated_agent)
 
+    def test_picks_most_recent_broadcast_across_both_identifiers(self):
+        now = timezone.now()
+        self._create_broadcast(
+            order_id="order-301", created_at=now - timedelta(hours=1)
+        )
+        recent = self._create_broadcast(
+            order_form_id="of-cart-9", created_at=now - timedelta(minutes=1)
+        )
+        self._create_broadcast(
+            order_form_id="of-cart-9",
+            status=BroadcastStatus.FAILED,
+            created_at=now,
+        )
+
+        with self.assertNumQueries(1):
+            selected = self.use_case._last_touch_queryset(
+                project=self.project,
+                integrated_agent=self.integrated_agent,
+                order_id="order-301",
+                order_form_id="of-cart-9",
+            ).first()
+            self.assertEqual(selected.integrated_agent, self.integrated_agent)
+
+        self.assertEqual(selected, recent)
+
     def test_skips_when_only_failed_broadcasts_exist(self):
         """An invoiced order whose only related broadcasts failed must
         not yield a conversion record — the table tracks broadcast-driven
@@ -523,6 +549,22 @@ class MarkBroadcastConvertedUseCaseTest(TestCase):
 
         self.assertFalse(BroadcastConversion.objects.exists())
 
+    def test_last_touch_lookup_uses_the_partial_indexes(self):
+        queryset = self.use_case._last_touch_queryset(
+            project=self.project,
+            integrated_agent=self.integrated_agent,
+            order_id="order-1",
+            order_form_id="of-1",
+        )
+        with connection.cursor() as cursor:
+            cursor.execute("SET LOCAL enable_seqscan = off")
+            plan = queryset.explain()
+
+        self.assertIn("broadcasts_agent_order_touch", plan)
+        self.assertIn("broadcasts_agent_form_touch", plan)
+        # Each branch is already ordered by its index: no sort step.
+        self.assertNotIn("->  Sort", plan)
+
 
 @override_settings(
     CACHES={
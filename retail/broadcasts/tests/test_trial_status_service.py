@@ -1,4 +1,7 @@
-from unittest.mock import MagicMock
+import threading
+import time
+
+from unittest.mock import MagicMock, patch
 
 from uuid import uuid4
 
@@ -6,6 +9,7 @@ from django.core.cache import cache
 from django.test import TestCase, override_settings
 
 from retail.broadcasts.services.trial_status_service import TrialStatusService
+from retail.broadcasts.tasks import task_refresh_trial_status
 from retail.clients.exceptions import CustomAPIException
 
 
@@ -118,3 +122,165 @@ class TrialStatusServiceTest(TestCase):
         }
 
         self.assertFalse(self.service.is_trial_active(self.project_uuid))
+
+
+@override_settings(
+    CACHES={
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "trial-status-service-swr-test",
+        }
+    }
+)
+class TrialStatusServiceStaleWhileRevalidateTest(TestCase):
+    WORKERS = 8
+
+    def setUp(self):
+        cache.clear()
+        self.connect_service = MagicMock()
+        self.connect_service.get_project_plan_status.return_value = {
+            "is_trial_active": True
+        }
+        self.scheduled = []
+        self.service = TrialStatusService(
+            connect_service=self.connect_service,
+            cache_ttl_seconds=30,
+            hard_ttl_seconds=900,
+            schedule_refresh=self.scheduled.append,
+        )
+        self.project_uuid = str(uuid4())
+        self.now = time.time()
+        clock = patch(
+            "retail.broadcasts.services.trial_status_service.time.time",
+            side_effect=lambda: self.now,
+        )
+        clock.start()
+        self.addCleanup(clock.stop)
+
+    def tearDown(self):
+        cache.clear()
+
+    def _burst(self, project_uuids):
+        """Runs one lookup per worker per project, all released at once."""
+        lookups = [
+            project_uuid for project_uuid in project_uuids for _ in range(self.WORKERS)
+        ]
+        barrier = threading.Barrier(len(lookups))
+        results = [None] * len(lookups)
+
+        def lookup(index, project_uuid):
+            barrier.wait()
+            results[index] = self.service.is_trial_active(project_uuid)
+
+        threads = [
+            threading.Thread(target=lookup, args=(index, project_uuid))
+            for index, project_uuid in enumerate(lookups)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return results
+
+    def _run_scheduled_refreshes(self):
+        while self.scheduled:
+            self.service.refresh(self.scheduled.pop(0))
+
+    def test_serves_stale_value_and_schedules_a_single_refresh(self):
+        self.service.is_trial_active(self.project_uuid)
+        self.connect_service.get_project_plan_status.return_value = {
+            "is_trial_active": False
+        }
+        self.now += 31
+
+        results = self._burst([self.project_uuid])
+
+        self.assertEqual(results, [True] * self.WORKERS)
+        self.assertEqual(self.scheduled, [self.project_uuid])
+        self.connect_service.get_project_plan_status.assert_called_once()
+
+        self._run_scheduled_refreshes()
+
+        self.assertFalse(self.service.is_trial_active(self.project_uuid))
+        self.assertEqual(self.connect_service.get_project_plan_status.call_count, 2)
+
+    def test_one_connect_call_per_project_per_refresh_window(self):
+        def slow_plan_status(project_uuid):
+            # Keeps the first caller inside Connect while the rest arrive.
+            time.sleep(0.1)
+            return {"is_trial_active": True}
+
+        self.connect_service.get_project_plan_status.side_effect = slow_plan_status
+        projects = [str(uuid4()) for _ in range(3)]
+
+        cold = self._burst(projects)
+        self.now += 31
+        stale = self._burst(projects)
+        self._run_scheduled_refreshes()
+        fresh = self._burst(projects)
+
+        self.assertEqual(cold + stale + fresh, [True] * self.WORKERS * 9)
+        calls = [
+            call.kwargs["project_uuid"]
+            for call in self.connect_service.get_project_plan_status.call_args_list
+        ]
+        self.assertEqual(sorted(calls), sorted(projects * 2))
+
+    def test_hard_expired_entry_is_fetched_synchronously(self):
+        self.service.is_trial_active(self.project_uuid)
+        self.connect_service.get_project_plan_status.return_value = {
+            "is_trial_active": False
+        }
+        cache.delete(self.service._cache_key(self.project_uuid))
+
+        self.assertFalse(self.service.is_trial_active(self.project_uuid))
+        self.assertEqual(self.scheduled, [])
+
+    def test_failed_refresh_keeps_serving_stale_value(self):
+        self.service.is_trial_active(self.project_uuid)
+        self.connect_service.get_project_plan_status.side_effect = CustomAPIException(
+            detail="connect down", status_code=503
+        )
+        self.now += 31
+
+        self.assertTrue(self.service.is_trial_active(self.project_uuid))
+        self._run_scheduled_refreshes()
+        self.assertTrue(self.service.is_trial_active(self.project_uuid))
+        # The lock left by the failed refresh spaces out the next attempt.
+        self.assertEqual(self.scheduled, [])
+        self.assertEqual(self.connect_service.get_project_plan_status.call_count, 2)
+
+    def test_failed_schedule_releases_the_lock(self):
+        self.service.is_trial_active(self.project_uuid)
+        self.service.schedule_refresh = MagicMock(side_effect=RuntimeError("broker"))
+        self.now += 31
+
+        self.assertTrue(self.service.is_trial_active(self.project_uuid))
+        self.assertTrue(self.service.is_trial_active(self.project_uuid))
+        self.assertEqual(self.service.schedule_refresh.call_count, 2)
+
+    def test_cold_lookup_fails_open_when_connect_raises_for_every_caller(self):
+        def failing_plan_status(project_uuid):
+            time.sleep(0.1)
+            raise CustomAPIException(detail="connect down", status_code=503)
+
+        self.connect_service.get_project_plan_status.side_effect = failing_plan_status
+
+        results = self._burst([self.project_uuid])
+
+        self.assertEqual(results, [False] * self.WORKERS)
+        self.connect_service.get_project_plan_status.assert_called_once()
+
+    def test_ignores_legacy_bool_entries(self):
+        cache.set(self.service._cache_key(self.project_uuid), False)
+
+        self.assertTrue(self.service.is_trial_active(self.project_uuid))
+
+    def test_refresh_task_swallows_errors(self):
+        with patch(
+            "retail.broadcasts.tasks.TrialStatusService.refresh",
+            side_effect=RuntimeError("boom"),
+        ) as mock_refresh:
+            task_refresh_trial_status(self.project_uuid)
+
+        mock_refresh.assert_called_once_with(self.project_uuid)
@@ -0,0 +1,99 @@
+import logging
+
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+
+from django.utils import timezone
+
+from retail.broadcasts.models import BroadcastMessage, BroadcastStatus
+from retail.broadcasts.services.broadcast_membership import (
+    BroadcastMembershipFilter,
+    get_broadcast_membership_filter,
+)
+from retail.broadcasts.services.flows_status_mapper import FlowsStatusMapper
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class CompleteBatchedBroadcastDTO:
+    """Outcome of one multi-URN Flows call for its PENDING rows.
+
+    ``error_message`` is populated only when the Flows call raised; the
+    rows are then recorded as FAILED whatever the response says.
+    """
+
+    broadcast_message_uuids: List[UUID]
+    broadcast_id: Optional[int]
+    flows_template_uuid: Optional[str]
+    flows_response: Dict[str, Any]
+    error_message: str = ""
+
+
+class CompleteBatchedBroadcastUseCase:
+    """Moves the PENDING rows of a batched dispatch to their Flows status.
+
+    Rows are created PENDING by ``RecordBroadcastSentUseCase`` when a
+    send is parked for batching. A single UPDATE gives all of them the
+    shared ``broadcast_id`` and the status Flows reported, following the
+    same rules as an individual dispatch: an error or a missing
+    ``broadcast_id`` is FAILED, otherwise the status is mapped through
+    ``FlowsStatusMapper``. Rows that already left PENDING are untouched,
+    so replaying a flush is harmless.
+    """
+
+    def __init__(self, membership_filter: Optional[BroadcastMembershipFilter] = None):
+        self.membership_filter = membership_filter or get_broadcast_membership_filter()
+
+    def execute(self, dto: CompleteBatchedBroadcastDTO) -> int:
+        status, error_message = self._resolve_status_and_error(dto)
+        if (
+            dto.broadcast_id is not None
+            and not dto.error_message
+            and self.membership_filter.enabled
+        ):
+            self.membership_filter.add_broadcast(dto.broadcast_id)
+
+        updated = BroadcastMessage.objects.filter(
+            uuid__in=dto.broadcast_message_uuids,
+            status=BroadcastStatus.PENDING,
+        ).update(
+            broadcast_id=dto.broadcast_id if not dto.error_message else None,
+            flows_template_uuid=dto.flows_template_uuid,
+            status=status,
+            error_message=error_message,
+            last_payload={"flows_response": dto.flows_response},
+            updated_at=timezone.now(),
+        )
+
+        logger.info(
+            f"[BROADCAST_TRACKING] batch_recorded: "
+            f"status={status} broadcast_id={dto.broadcast_id} "
+            f"rows={updated}/{len(dto.broadcast_message_uuids)}"
+        )
+        return updated
+
+    @staticmethod
+    def _resolve_status_and_error(
+        dto: CompleteBatchedBroadcastDTO,
+    ) -> tuple[BroadcastStatus, str]:
+        if dto.error_message:
+            return BroadcastStatus.FAILED, dto.error_message
+
+        if dto.broadcast_id is None:
+            logger.error(
+                f"[BROADCAST_TRACKING] batch_dispatch_failed: missing broadcast_id "
+                f"response={dto.flows_response}"
+            )
+            return BroadcastStatus.FAILED, "Flows response missing broadcast_id"
+
+        response = dto.flows_response or {}
+        mapped = FlowsStatusMapper.map(response.get("status")) or BroadcastStatus.QUEUED
+        if mapped != BroadcastStatus.FAILED:
+            return mapped, ""
+
+        for key in ("error", "message", "detail"):
+            if response.get(key):
+                return mapped, str(response[key])
+        return mapped, "Flows reported status=failed without error detail"
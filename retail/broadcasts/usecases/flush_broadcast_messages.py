@@ -0,0 +1,140 @@
+import logging
+
+from typing import List, Optional
+from uuid import UUID
+
+from django.db import transaction
+
+from retail.broadcasts.models import BroadcastMessage
+from retail.broadcasts.services.broadcast_message_buffer import (
+    BroadcastMessageBuffer,
+    deserialize_row,
+)
+from retail.broadcasts.usecases.handle_status_update import HandleStatusUpdateUseCase
+
+logger = logging.getLogger(__name__)
+
+
+class FlushBufferedBroadcastMessagesUseCase:
+    """Writes one batch of buffered BroadcastMessage rows.
+
+    The rows go out in a single ``bulk_create``. Rows whose ``uuid``
+    already exists are skipped, so a batch re-read after a flush died
+    before removing it is not written twice. A row repeating the
+    ``(broadcast_id, contact_urn)`` of another row is dropped with a
+    warning before the insert; executions pointing at it lose the link
+    when they are flushed (see ``FlushExecutionsUseCase``). Either way
+    the rows leave the buffer, so one bad row cannot block the rest.
+    ``created_at`` is the flush time, at most one buffer window after
+    the dispatch.
+
+    Once the rows are committed, the courier events parked for their
+    ``broadcast_id`` are replayed; the pending counters are released
+    between two replay passes so an event parked while the first pass
+    ran is not left behind.
+    """
+
+    def __init__(
+        self,
+        message_buffer: Optional[BroadcastMessageBuffer] = None,
+        status_use_case: Optional[HandleStatusUpdateUseCase] = None,
+    ):
+        self.message_buffer = message_buffer or BroadcastMessageBuffer()
+        self._status_use_case = status_use_case
+
+    @property
+    def status_use_case(self) -> HandleStatusUpdateUseCase:
+        if self._status_use_case is None:
+            self._status_use_case = HandleStatusUpdateUseCase(
+                message_buffer=self.message_buffer
+            )
+        return self._status_use_case
+
+    def execute(self) -> int:
+        """Flush up to ``BROADCAST_MESSAGE_BUFFER_MAX_ROWS`` rows.
+
+        Returns the number of rows taken from the buffer; ``0`` when it
+        was empty or another flush holds the lock. When writing the
+        batch fails the rows stay buffered, another flush is scheduled
+        after a backoff and the error is raised again.
+        """
+        if not self.message_buffer.acquire_flush_lock():
+            return 0
+        written = False
+        try:
+            raw_rows = self.message_buffer.read_rows()
+            rows = [deserialize_row(raw) for raw in raw_rows]
+            if rows:
+                with transaction.atomic():
+                    BroadcastMessage.objects.bulk_create(
+                        self._without_duplicate_dispatches(rows),
+                        ignore_conflicts=True,
+                    )
+                self._replay_parked_events(
+                    [row.broadcast_id for row in rows if row.broadcast_id is not None]
+                )
+            self.message_buffer.remove_rows(raw_rows, [row.uuid for row in rows])
+            written = True
+        finally:
+            self.message_buffer.release_flush_lock()
+            self._schedule_next_flush(written)
+
+        if raw_rows:
+            logger.info(
+                f"[BROADCAST_BUFFER] flushed {len(raw_rows)} broadcast message(s)"
+            )
+        return len(raw_rows)
+
+    def _schedule_next_flush(self, written: bool) -> None:
+        """Flush what is left right away, or retry a failed batch later.
+
+        Nothing else would flush a failed batch once appends stop, so
+        its rows would otherwise sit in Redis until they expire.
+        """
+        try:
+            countdown = 0 if written else self.message_buffer.retry_countdown()
+            self.message_buffer.reschedule_if_remaining(countdown)
+        except Exception:
+            logger.exception("[BROADCAST_BUFFER] Could not schedule the next flush")
+
+    @staticmethod
+    def _without_duplicate_dispatches(
+        rows: List[BroadcastMessage],
+    ) -> List[BroadcastMessage]:
+        """Leave out rows whose ``(broadcast_id, contact_urn)`` is taken.
+
+        ``ignore_conflicts`` would skip them as well, but silently and
+        for any constraint; here only the ``uuid`` conflict of a re-read
+        batch is left to it.
+        """
+        broadcast_ids = {row.broadcast_id for row in rows if row.broadcast_id}
+        taken = {
+            (broadcast_id, contact_urn): row_uuid
+            for row_uuid, broadcast_id, contact_urn in BroadcastMessage.objects.filter(
+                broadcast_id__in=broadcast_ids
+            ).values_list("uuid", "broadcast_id", "contact_urn")
+        }
+        kept = []
+        for row in rows:
+            if row.broadcast_id is None:
+                kept.append(row)
+                continue
+            dispatch = (row.broadcast_id, row.contact_urn)
+            existing = taken.setdefault(dispatch, UUID(str(row.uuid)))
+            if existing != UUID(str(row.uuid)):
+                logger.warning(
+                    f"[BROADCAST_BUFFER] duplicate_dispatch: "
+                    f"broadcast_id={row.broadcast_id} contact_urn={row.contact_urn} "
+                    f"kept={existing} dropped={row.uuid}"
+                )
+                continue
+            kept.append(row)
+        return kept
+
+    def _replay_parked_events(self, broadcast_ids: List[int]) -> None:
+        distinct_ids = list(dict.fromkeys(broadcast_ids))
+        for broadcast_id in distinct_ids:
+            self.status_use_case.replay_parked(broadcast_id)
+        self.message_buffer.release(broadcast_ids)
+        for broadcast_id in distinct_ids:
+            self.status_use_case.replay_parked(broadcast_id)
@@ -1,6 +1,6 @@
 import logging
 
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 from typing import Any, Dict, Optional
 
 from django.db import transaction
@@ -14,6 +14,14 @@ from retail.broadcasts.models import (
     ProjectBroadcastCounter,
     SUCCESSFUL_SEND_STATUSES,
 )
+from retail.broadcasts.services.broadcast_membership import (
+    BroadcastMembershipFilter,
+    count_outcome,
+    get_broadcast_membership_filter,
+)
+from retail.broadcasts.services.broadcast_message_buffer import (
+    BroadcastMessageBuffer,
+)
 from retail.broadcasts.usecases.project_limit_guard import ProjectLimitGuard
 
 logger = logging.getLogger(__name__)
@@ -70,10 +78,26 @@ class HandleStatusUpdateUseCase:
     on ProjectBroadcastCounter.total_delivered (outbound broadcast counter,
     not the conversation counter), checking the broadcast limit afterwards
     through ProjectLimitGuard.
+
+    With the write-behind ``BroadcastMessageBuffer`` enabled, an event
+    whose row is still buffered is parked in Redis and replayed through
+    ``replay_parked`` once the flush has written the row.
+
+    With the ``BroadcastMembershipFilter`` enabled, events whose
+    ``broadcast_id`` (send) or ``message_id`` (status) we never recorded
+    are counted and, once the filter is enforced, dropped before any
+    row is locked.
     """
 
-    def __init__(self, limit_guard: Optional[ProjectLimitGuard] = None):
+    def __init__(
+        self,
+        limit_guard: Optional[ProjectLimitGuard] = None,
+        message_buffer: Optional[BroadcastMessageBuffer] = None,
+        membership_filter: Optional[BroadcastMembershipFilter] = None,
+    ):
         self.limit_guard = limit_guard or ProjectLimitGuard()
+        self.message_buffer = message_buffer or BroadcastMessageBuffer()
+        self.membership_filter = membership_filter or get_broadcast_membership_filter()
 
     def link_send_event(self, event: BroadcastStatusEvent) -> None:
         """Public entry point for the template-send routing key.
@@ -95,7 +119,23 @@ class HandleStatusUpdateUseCase:
                 f"broadcast_id={event.broadcast_id} payload={event.payload}"
             )
             return
-        self._link_message_to_broadcast(event)
+
+        admitted = self._admit(
+            "send", self.membership_filter.might_have_broadcast, event.broadcast_id
+        )
+        if admitted is False and self.membership_filter.enforced:
+            return
+        if admitted and self.membership_filter.enabled:
+            # Recorded before the row is linked so a status event racing
+            # the link is not filtered out.
+            self.membership_filter.add_message(event.message_id)
+
+        matched = self._link_message_to_broadcast(event) or self._park_unmatched(
+            "link", event, event.broadcast_id
+        )
+        self._count_membership("send", admitted, matched)
+        if matched and not admitted and self.membership_filter.enabled:
+            self.membership_filter.add_message(event.message_id)
 
     def apply_status_event(self, event: BroadcastStatusEvent) -> None:
         """Public entry point for the template-status routing key.
@@ -106,9 +146,112 @@ class HandleStatusUpdateUseCase:
         """
         if not event.message_id:
             return
-        self._update_status_by_message_id(event)
 
-    def _link_message_to_broadcast(self, event: BroadcastStatusEvent) -> None:
+        admitted = self._admit(
+            "status", self.membership_filter.might_have_message, event.message_id
+        )
+        if admitted is False and self.membership_filter.enforced:
+            return
+
+        matched = self._update_status_by_message_id(event) or self._park_unmatched(
+            "status", event
+        )
+        self._count_membership("status", admitted, matched)
+
+    def replay_parked(self, broadcast_id: int) -> int:
+        """Apply the events parked for ``broadcast_id``, oldest first.
+
+        An event whose row is still buffered is parked again. Returns
+        the number of events taken from the buffer.
+        """
+        entries = self.message_buffer.take_parked(broadcast_id)
+        for entry in entries:
+            event = BroadcastStatusEvent(**entry["event"])
+            try:
+                if entry["kind"] == "link":
+                    self.link_send_event(event)
+                else:
+                    self.apply_status_event(event)
+            except Exception:
+                logger.exception(
+                    f"[BROADCAST_TRACKING] parked_event_replay_failed: "
+                    f"broadcast_id={broadcast_id} message_id={event.message_id} "
+                    f"status={event.status}"
+                )
+        return len(entries)
+
+    def _admit(self, routing: str, might_contain, member) -> Optional[bool]:
+        """Ask the membership filter whether ``member`` may be one of ours.
+
+        ``True`` when the filter is disabled; ``None`` when Redis could
+        not be asked, in which case the event is processed as usual.
+        """
+        if not self.membership_filter.enabled:
+            return True
+        admitted = might_contain(member)
+        if admitted is False and self.membership_filter.enforced:
+            count_outcome(routing, "filtered")
+        return admitted
+
+    def _count_membership(
+        self, routing: str, admitted: Optional[bool], matched: bool
+    ) -> None:
+        """Count what the filter did for an event that reached the database.
+
+        Without enforcement a rejected event is still looked up, which
+        tells a correct rejection (``filtered``) from a member the
+        filter does not know (``missed``, e.g. before the backfill).
+        """
+        if not self.membership_filter.enabled:
+            return
+        if admitted is None:
+            result = "unavailable"
+        elif admitted:
+            result = "passed" if matched else "false_positive"
+        else:
+            result = "missed" if matched else "filtered"
+        count_outcome(routing, result)
+
+    def _park_unmatched(
+        self,
+        kind: str,
+        event: BroadcastStatusEvent,
+        broadcast_id: Optional[int] = None,
+    ) -> bool:
+        """Park an event that matched no row in case the row is buffered.
+
+        A status-only event is parked when the send event of its message
+        id was. If the row was written in the meantime, whatever is
+        parked for it is replayed first and the lookup is retried once.
+        Returns ``True`` when the event was parked or matched on retry.
+        """
+        if not self.message_buffer.enabled:
+            return False
+        try:
+            if broadcast_id is None:
+                broadcast_id = self.message_buffer.broadcast_id_for(event.message_id)
+                if broadcast_id is None:
+                    return False
+            if self.message_buffer.park(kind, asdict(event), broadcast_id):
+                logger.info(
+                    f"[BROADCAST_TRACKING] event_parked: "
+                    f"broadcast_id={broadcast_id} message_id={event.message_id} "
+                    f"status={event.status}"
+                )
+                return True
+            self.replay_parked(broadcast_id)
+        except Exception:
+            logger.exception(
+                f"[BROADCAST_TRACKING] event_park_failed: "
+                f"broadcast_id={broadcast_id} message_id={event.message_id}"
+            )
+            return False
+
+        if kind == "link":
+            return self._link_message_to_broadcast(event)
+        return self._update_status_by_message_id(event)
+
+    def _link_message_to_broadcast(self, event: BroadcastStatusEvent) -> bool:
         """Attach the Meta message_id to our dispatch row.
 
         select_for_update acquires a row lock at the SELECT so that a
@@ -116,14 +259,27 @@ class HandleStatusUpdateUseCase:
         ahead and transition the status before the linkage is committed.
         The actual DB write happens on .save() inside the atomic block;
         the lock is released on commit.
+
+        A batched dispatch shares one ``broadcast_id`` across all of its
+        contacts, so the row is matched on ``(broadcast_id, contact_urn)``
+        when the courier reports the URN. The id alone is only trusted
+        when it names a single row (see ``_lock_single_dispatch``).
+        Returns ``False`` when no row matched.
         """
         broadcast_id = event.broadcast_id
+        contact_urn = (event.payload or {}).get("contact_urn")
 
         with transaction.atomic():
-            message = self._lock_broadcast_message(broadcast_id=broadcast_id)
+            message = None
+            if contact_urn:
+                message = self._lock_broadcast_message(
+                    broadcast_id=broadcast_id, contact_urn=contact_urn
+                )
+            if message is None:
+                message = self._lock_single_dispatch(broadcast_id, contact_urn)
 
             if message is None:
-                return
+                return False
 
             if (
                 message.external_message_id
@@ -153,8 +309,9 @@ class HandleStatusUpdateUseCase:
 
             if event.status:
                 self._apply_status_transition(message, event)
+        return True
 
-    def _update_status_by_message_id(self, event: BroadcastStatusEvent) -> None:
+    def _update_status_by_message_id(self, event: BroadcastStatusEvent) -> bool:
         """Status-only events look up the row by message_id (Meta's ID).
 
         The courier drops broadcast_id after the first create event so
@@ -163,6 +320,7 @@ class HandleStatusUpdateUseCase:
         select_for_update acquires the lock at the SELECT. The DB write
         happens in _apply_status_transition via .save(), still inside the
         same atomic block, before the lock is released on commit.
+        Returns ``False`` when no row matched.
         """
         message_id = event.message_id
 
@@ -170,7 +328,7 @@ class HandleStatusUpdateUseCase:
             message = self._lock_broadcast_message(external_message_id=message_id)
 
             if message is None:
-                return
+                return False
 
             logger.info(
                 f"[BROADCAST_TRACKING] status_received: "
@@ -179,6 +337,7 @@ class HandleStatusUpdateUseCase:
             )
 
             self._apply_status_transition(message, event)
+        return True
 
     @staticmethod
     def _lock_broadcast_message(**lookup) -> Optional[BroadcastMessage]:
@@ -196,6 +355,36 @@ class HandleStatusUpdateUseCase:
             .first()
         )
 
+    @staticmethod
+    def _lock_single_dispatch(
+        broadcast_id: int, contact_urn: Optional[str]
+    ) -> Optional[BroadcastMessage]:
+        """Lock the row of ``broadcast_id`` when it is the only one.
+
+        Without a URN match, the id alone is safe for an individual
+        dispatch (one row) but not for a batched one, where it would
+        pick an arbitrary sibling contact. A row recorded with a
+        different URN than the event's belongs to another contact and
+        is never linked.
+        """
+        rows = list(
+            BroadcastMessage.objects.select_for_update(of=("self",))
+            .select_related("integrated_agent")
+            .filter(broadcast_id=broadcast_id)[:2]
+        )
+        if len(rows) > 1:
+            logger.warning(
+                f"[BROADCAST_TRACKING] ambiguous_broadcast_id: "
+                f"broadcast_id={broadcast_id} contact_urn={contact_urn}"
+            )
+            return None
+        if not rows:
+            return None
+        message = rows[0]
+        if contact_urn and message.contact_urn and message.contact_urn != contact_urn:
+            return None
+        return message
+
     def _apply_status_transition(
         self, message: BroadcastMessage, event: BroadcastStatusEvent
     ) -> None:
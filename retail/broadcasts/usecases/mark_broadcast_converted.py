@@ -8,8 +8,6 @@ from typing import Optional
 
 from django.conf import settings
 from django.core.cache import cache
-from django.db.models import Q
-
 from retail.agents.domains.agent_integration.models import IntegratedAgent
 from retail.agents.shared.cache import (
     AgentRole,
@@ -17,9 +15,9 @@ from retail.agents.shared.cache import (
     IntegratedAgentCacheHandlerRedis,
 )
 from retail.broadcasts.models import (
+    CONVERSION_INELIGIBLE_STATUSES,
     BroadcastConversion,
     BroadcastMessage,
-    BroadcastStatus,
 )
 from retail.projects.models import Project
 from retail.services.vtex_io.service import VtexIOService
@@ -27,16 +25,6 @@ from retail.services.vtex_io.service import VtexIOService
 logger = logging.getLogger(__name__)
 
 
-# Statuses that disqualify a broadcast from being credited as the
-# attribution source of a conversion. ERRORED/FAILED never reached the
-# recipient, and UNKNOWN means we could not interpret what happened on
-# the courier side, so attributing a sale to it would be misleading.
-_BROADCAST_STATUSES_INELIGIBLE_FOR_CONVERSION = (
-    BroadcastStatus.ERRORED,
-    BroadcastStatus.FAILED,
-    BroadcastStatus.UNKNOWN,
-)
-
 _VTEX_DATETIME_FRACTION = re.compile(r"(\.\d{6})\d+(?=[Z+-]|$)")
 
 
@@ -285,25 +273,45 @@ class MarkBroadcastConvertedUseCase:
         if payment_recovery_agent is None:
             return None
 
-        match_filter = Q(order_id=order_id)
-        if order_form_id:
-            match_filter |= Q(order_form_id=order_form_id)
+        return self._last_touch_queryset(
+            project=project,
+            integrated_agent=payment_recovery_agent,
+            order_id=order_id,
+            order_form_id=order_form_id,
+        ).first()
+
+    @staticmethod
+    def _last_touch_queryset(
+        project: Project,
+        integrated_agent: IntegratedAgent,
+        order_id: str,
+        order_form_id: Optional[str],
+    ):
+        """Newest eligible broadcast of each identifier, newest first.
 
+        An ``order_id OR order_form_id`` predicate sorted by
+        ``created_at`` cannot be served by a single index scan, so each
+        identifier is its own ``LIMIT 1`` branch over the partial
+        ``(integrated_agent, <identifier>, created_at DESC)`` index and
+        the branches are combined with ``UNION ALL``.
+        """
         # Passing the object (instead of `integrated_agent_id=...uuid`)
         # keeps this query PK-agnostic: when IntegratedAgent migrates
         # from UUID PK to integer PK (see TODO on the model), the ORM
         # transparently resolves the new PK from the same object.
-        return (
+        eligible = (
             BroadcastMessage.objects.select_related("integrated_agent")
-            .filter(
-                project=project,
-                integrated_agent=payment_recovery_agent,
-            )
-            .filter(match_filter)
-            .exclude(status__in=_BROADCAST_STATUSES_INELIGIBLE_FOR_CONVERSION)
-            .order_by("-created_at")
-            .first()
+            .filter(project=project, integrated_agent=integrated_agent)
+            .exclude(status__in=CONVERSION_INELIGIBLE_STATUSES)
         )
+        by_order_id = eligible.filter(order_id=order_id).order_by("-created_at")[:1]
+        if not order_form_id:
+            return by_order_id
+
+        by_order_form_id = eligible.filter(order_form_id=order_form_id).order_by(
+            "-created_at"
+        )[:1]
+        return by_order_id.union(by_order_form_id, all=True).order_by("-created_at")
 
     def _get_payment_recovery_integrated_agent(
         self, project: Project
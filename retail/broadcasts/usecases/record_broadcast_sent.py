@@ -5,6 +5,13 @@ from typing import Any, Dict, Optional
 
 from retail.agents.domains.agent_integration.models import IntegratedAgent
 from retail.broadcasts.models import BroadcastMessage, BroadcastStatus
+from retail.broadcasts.services.broadcast_membership import (
+    BroadcastMembershipFilter,
+    get_broadcast_membership_filter,
+)
+from retail.broadcasts.services.broadcast_message_buffer import (
+    BroadcastMessageBuffer,
+)
 from retail.broadcasts.services.flows_status_mapper import FlowsStatusMapper
 from retail.templates.models import Template
 
@@ -42,6 +49,10 @@ class RecordBroadcastSentDTO:
     ``dispatch_context`` carries the commercial origin (order_form_id /
     order_id) so the row can later be matched against an ``invoiced``
     event for conversion attribution.
+
+    ``pending`` records a send parked for a batched Flows dispatch: the
+    row is stored as PENDING without a ``broadcast_id`` and completed by
+    ``CompleteBatchedBroadcastUseCase`` once the batch goes out.
     """
 
     broadcast_id: Optional[int]
@@ -53,6 +64,7 @@ class RecordBroadcastSentDTO:
     flows_response: Dict[str, Any]
     error_message: str = ""
     dispatch_context: Optional[BroadcastDispatchContext] = None
+    pending: bool = False
 
 
 class RecordBroadcastSentUseCase:
@@ -69,8 +81,25 @@ class RecordBroadcastSentUseCase:
         link this row to a courier event later, so the dispatch is
         useless even if the HTTP call succeeded).
       - Flows response status was explicitly ``"failed"``.
+
+    With the write-behind ``BroadcastMessageBuffer`` enabled, rows of
+    non-pending dispatches are buffered in Redis and the returned
+    instance is unsaved; only its ``uuid`` is final until the flush
+    writes it. PENDING rows are always inserted right away because the
+    batched dispatch updates them by ``uuid``.
+
+    The ``broadcast_id`` is added to the ``BroadcastMembershipFilter``
+    (when enabled) so its courier events pass the status pre-filter.
     """
 
+    def __init__(
+        self,
+        message_buffer: Optional[BroadcastMessageBuffer] = None,
+        membership_filter: Optional[BroadcastMembershipFilter] = None,
+    ):
+        self.message_buffer = message_buffer or BroadcastMessageBuffer()
+        self.membership_filter = membership_filter or get_broadcast_membership_filter()
+
     def execute(self, dto: RecordBroadcastSentDTO) -> Optional[BroadcastMessage]:
         integrated_agent = dto.integrated_agent
         project = integrated_agent.project
@@ -88,7 +117,7 @@ class RecordBroadcastSentUseCase:
 
         order_form_id, order_id = self._resolve_dispatch_context(dto.dispatch_context)
 
-        broadcast_message = BroadcastMessage.objects.create(
+        broadcast_message = BroadcastMessage(
             broadcast_id=dto.broadcast_id,
             project=project,
             integrated_agent=integrated_agent,
@@ -103,10 +132,15 @@ class RecordBroadcastSentUseCase:
             order_form_id=order_form_id,
             order_id=order_id,
         )
+        if dto.broadcast_id is not None and self.membership_filter.enabled:
+            self.membership_filter.add_broadcast(dto.broadcast_id)
+        buffered = self._buffer(broadcast_message, pending=dto.pending)
+        if not buffered:
+            broadcast_message.save(force_insert=True)
 
         logger.info(
             f"[BROADCAST_TRACKING] recorded: "
-            f"broadcast_uuid={broadcast_message.uuid} "
+            f"broadcast_uuid={broadcast_message.uuid} buffered={buffered} "
             f"status={status} broadcast_id={dto.broadcast_id} "
             f"project_uuid={project_uuid} vtex_account={vtex_account} "
             f"agent_uuid={integrated_agent.uuid} template={template_name} "
@@ -116,6 +150,11 @@ class RecordBroadcastSentUseCase:
 
         return broadcast_message
 
+    def _buffer(self, broadcast_message: BroadcastMessage, pending: bool) -> bool:
+        if pending or not self.message_buffer.enabled:
+            return False
+        return self.message_buffer.append(broadcast_message)
+
     @staticmethod
     def _resolve_dispatch_context(
         dispatch_context: Optional[BroadcastDispatchContext],
@@ -141,13 +180,17 @@ class RecordBroadcastSentUseCase:
 
         Order of precedence:
           1. Caller-supplied ``error_message`` → FAILED.
-          2. Missing broadcast_id in the Flows response → FAILED with a
+          2. Send parked for batching → PENDING (no Flows response yet).
+          3. Missing broadcast_id in the Flows response → FAILED with a
              synthetic reason (we cannot link this row to courier events later).
-          3. Otherwise, mirror the Flows response status via FlowsStatusMapper.
+          4. Otherwise, mirror the Flows response status via FlowsStatusMapper.
         """
         if dto.error_message:
             return BroadcastStatus.FAILED, dto.error_message
 
+        if dto.pending:
+            return BroadcastStatus.PENDING, ""
+
         if dto.broadcast_id is None:
             self._log_missing_broadcast_id(
                 dto=dto,
@@ -29,5 +29,21 @@ def _reset_execution_context(*_args, **_kwargs) -> None:
     clear_execution_context()
 
 
+def _start_task_metrics(*args, **kwargs) -> None:
+    from retail.observability.task_metrics import on_task_prerun
+
+    on_task_prerun(*args, **kwargs)
+
+
+def _finish_task_metrics(*args, **kwargs) -> None:
+    from retail.observability.task_metrics import on_task_postrun
+
+    on_task_postrun(*args, **kwargs)
+
+
 task_prerun.connect(_reset_execution_context)
+task_prerun.connect(_start_task_metrics)
+# Metrics close before the execution context is cleared so the usage
+# can be attached to the execution the task opened.
+task_postrun.connect(_finish_task_metrics)
 task_postrun.connect(_reset_execution_context)
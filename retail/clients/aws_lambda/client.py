@@ -1,4 +1,5 @@
 import json
+import time
 
 import boto3
 
@@ -8,6 +9,7 @@ from django.conf import settings
 from django.utils import timezone
 
 from retail.interfaces.clients.aws_lambda.client import AwsLambdaClientInterface
+from retail.observability.task_metrics import record_lambda_invoke
 
 
 class AwsLambdaClient(AwsLambdaClientInterface):
@@ -53,9 +55,13 @@ class AwsLambdaClient(AwsLambdaClientInterface):
         )
 
     def invoke(self, function_name: str, payload: dict) -> Dict[str, Any]:
-        return self.boto3_client.invoke(
-            FunctionName=function_name,
-            InvocationType="RequestResponse",
-            Payload=json.dumps(payload),
-            LogType="Tail",
-        )
+        started = time.perf_counter()
+        try:
+            return self.boto3_client.invoke(
+                FunctionName=function_name,
+                InvocationType="RequestResponse",
+                Payload=json.dumps(payload),
+                LogType="Tail",
+            )
+        finally:
+            record_lambda_invoke((time.perf_counter() - started) * 1000.0)
@@ -1,10 +1,11 @@
 import boto3
 
+import io
 import mimetypes
 
 import logging
 
-from typing import BinaryIO, Optional
+from typing import BinaryIO, Dict, List, Optional
 
 from botocore.exceptions import ClientError
 from django.conf import settings
@@ -14,6 +15,109 @@ from retail.interfaces.clients.aws_s3.client import S3ClientInterface
 
 logger = logging.getLogger(__name__)
 
+# S3 rejects multipart parts smaller than 5 MiB (except the last one).
+MULTIPART_MIN_PART_BYTES = 5 * 1024 * 1024
+
+
+class S3MultipartUpload(io.RawIOBase):
+    """Writable stream that uploads to S3 as a multipart upload.
+
+    Written bytes are buffered until ``part_size`` is reached and then
+    sent with ``upload_part``, so at most one part is held in memory no
+    matter how much is written. ``close`` uploads the remainder and
+    completes the upload; ``abort`` discards every uploaded part. Used as
+    a context manager, an exception inside the block aborts the upload
+    so a truncated object is never published.
+    """
+
+    def __init__(
+        self,
+        s3,
+        bucket_name: str,
+        key: str,
+        part_size: int = MULTIPART_MIN_PART_BYTES,
+        extra_args: Optional[Dict[str, str]] = None,
+    ):
+        super().__init__()
+        self.s3 = s3
+        self.bucket_name = bucket_name
+        self.key = key
+        self.part_size = part_size
+        self.parts: List[Dict[str, object]] = []
+        self._buffer = bytearray()
+        response = s3.create_multipart_upload(
+            Bucket=bucket_name, Key=key, **(extra_args or {})
+        )
+        self.upload_id = response["UploadId"]
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        if self.closed:
+            raise ValueError("write to a closed multipart upload")
+        part_size = self.part_size
+        self._buffer += data
+        while len(self._buffer) >= part_size:
+            # Copy the part out through a view so it is duplicated once.
+            with memoryview(self._buffer) as view:
+                part = bytes(view[:part_size])
+            self._upload_part(part)
+            del part, self._buffer[:part_size]
+        return len(data)
+
+    def close(self) -> None:
+        if self.closed:
+            return
+        try:
+            if self._buffer or not self.parts:
+                self._upload_part(bytes(self._buffer))
+                self._buffer = bytearray()
+            self.s3.complete_multipart_upload(
+                Bucket=self.bucket_name,
+                Key=self.key,
+                UploadId=self.upload_id,
+                MultipartUpload={"Parts": self.parts},
+            )
+        except Exception:
+            self.abort()
+            raise
+        super().close()
+        logger.debug(f"Completed multipart upload to S3: {self.key}")
+
+    def abort(self) -> None:
+        if self.closed:
+            return
+        self._buffer = bytearray()
+        super().close()
+        self.s3.abort_multipart_upload(
+            Bucket=self.bucket_name, Key=self.key, UploadId=self.upload_id
+        )
+        logger.warning(f"Aborted multipart upload to S3: {self.key}")
+
+    def __del__(self) -> None:
+        # ``IOBase`` closes on garbage collection, which here would
+        # publish whatever was written so far; an upload that was never
+        # closed is left for the bucket's lifecycle rule to expire.
+        pass
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if exc_type is not None:
+            self.abort()
+        else:
+            self.close()
+
+    def _upload_part(self, body: bytes) -> None:
+        part_number = len(self.parts) + 1
+        response = self.s3.upload_part(
+            Bucket=self.bucket_name,
+            Key=self.key,
+            UploadId=self.upload_id,
+            PartNumber=part_number,
+            Body=body,
+        )
+        self.parts.append({"ETag": response["ETag"], "PartNumber": part_number})
+
 
 class S3Client(S3ClientInterface):
     def __init__(self, bucket_name: Optional[str] = None):
@@ -66,6 +170,25 @@ class S3Client(S3ClientInterface):
         logger.debug(f"Streamed content to S3: {key}")
         return key
 
+    def open_multipart_upload(
+        self,
+        key: str,
+        content_type: str = "application/octet-stream",
+        content_encoding: Optional[str] = None,
+        part_size: int = MULTIPART_MIN_PART_BYTES,
+    ) -> S3MultipartUpload:
+        """Starts a multipart upload and returns a writable stream for it.
+
+        Unlike ``upload_fileobj``, the caller pushes bytes as it produces
+        them, so the payload never has to exist as a readable file.
+        """
+        extra_args = {"ContentType": content_type}
+        if content_encoding:
+            extra_args["ContentEncoding"] = content_encoding
+        return S3MultipartUpload(
+            self.s3, self.bucket_name, key, part_size=part_size, extra_args=extra_args
+        )
+
     def generate_presigned_url(self, key: str, expiration: int = 3600) -> str:
         """Generates a presigned URL for accessing a private S3 object."""
         return self.s3.generate_presigned_url(
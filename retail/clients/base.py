@@ -1,18 +1,26 @@
 import requests
 import logging
+import time
 
 from urllib.parse import urlparse
 from typing import Any, Dict, List, Optional
 
 from django.conf import settings
 
+from retail.clients.circuit_breaker import CallPermit, get_circuit_breaker
 from retail.clients.exceptions import CustomAPIException
+from retail.observability.http_metrics import observe_http_request
 from retail.observability.sentry import sentry_error_scope
+from retail.observability.task_metrics import record_http_call
 
 logger = logging.getLogger(__name__)
 
 
 class RequestClient:
+    # Fallback request timeout (seconds) when neither the caller nor
+    # ``settings.HTTP_CLIENT_TIMEOUTS`` sets one for this client class.
+    default_timeout = 60
+
     def make_request(
         self,
         url: str,
@@ -22,7 +30,7 @@ class RequestClient:
         params=None,
         files=None,
         json=None,
-        timeout=60,
+        timeout=None,
         sentry_tags: Optional[Dict[str, Any]] = None,
         sentry_fingerprint_prefix: Optional[List[str]] = None,
     ):
@@ -30,6 +38,13 @@ class RequestClient:
             raise ValueError(
                 "Cannot use both 'data' and 'json' arguments simultaneously."
             )
+        if timeout is None:
+            timeout = self._default_timeout()
+        # Raises CircuitOpenError when the host is shedding load.
+        permit = get_circuit_breaker().before_call(
+            urlparse(url).hostname or "", timeout=timeout
+        )
+        started = time.perf_counter()
         try:
             response = requests.request(
                 method=method,
@@ -42,6 +57,7 @@ class RequestClient:
                 files=files,
             )
         except Exception as e:
+            self._record_outcome(url, method, started, permit, response=None)
             self._log_request_exception(
                 exception=e,
                 url=url,
@@ -59,6 +75,8 @@ class RequestClient:
                 status_code=getattr(e.response, "status_code", None),
             ) from e
 
+        self._record_outcome(url, method, started, permit, response=response)
+
         if response.status_code >= 400:
             self._generate_log(
                 response,
@@ -87,6 +105,26 @@ class RequestClient:
 
         return response
 
+    def _default_timeout(self):
+        timeouts = getattr(settings, "HTTP_CLIENT_TIMEOUTS", None) or {}
+        return timeouts.get(type(self).__name__, self.default_timeout)
+
+    def _record_outcome(self, url, method, started, permit: CallPermit, response=None):
+        elapsed = time.perf_counter() - started
+        get_circuit_breaker().record(
+            permit,
+            response.status_code if response is not None else None,
+            elapsed,
+        )
+        record_http_call(
+            urlparse(url).hostname or "unknown",
+            elapsed * 1000.0,
+            failed=response is None or response.status_code >= 400,
+        )
+        observe_http_request(
+            type(self).__name__, method, url, elapsed, response=response
+        )
+
     def _generate_log(
         self,
         response,
@@ -0,0 +1,286 @@
+"""Per-host circuit breaker for outbound HTTP calls.
+
+When VTEX IO or Flows degrade, every ``RequestClient.make_request``
+would otherwise wait out its full timeout and the Celery workers on
+the order/cart queues pile up behind a dead upstream. The breaker
+tracks calls per host and, once enough of them fail, rejects new calls
+immediately with ``CircuitOpenError`` until the host has had time to
+recover.
+
+State is shared across every web and Celery process through Redis:
+
+- ``cb:{host}:{window}:calls`` / ``:bad`` — fixed-window counters
+  (``CIRCUIT_BREAKER_WINDOW_SECONDS``). A call is *bad* when it raised,
+  answered 5xx/429, or took longer than
+  ``CIRCUIT_BREAKER_SLOW_CALL_SECONDS``.
+- ``cb:{host}:open`` — set for ``CIRCUIT_BREAKER_OPEN_SECONDS`` when
+  the window reaches ``CIRCUIT_BREAKER_MIN_CALLS`` calls with a bad
+  ratio of at least ``CIRCUIT_BREAKER_FAILURE_RATE``. While present,
+  calls are rejected.
+- ``cb:{host}:half_open`` — outlives ``open``. Once ``open`` expires,
+  a single caller wins ``cb:{host}:probe`` (``SET NX``) and its call
+  decides: success closes the circuit, failure opens it again. Other
+  callers are rejected while the probe is in flight; the probe key
+  lives at least as long as the probing call's timeout so a slow probe
+  cannot let a second one through.
+
+The pre-call check is a single ``MGET`` and recording an outcome is a
+single pipeline. The last observed state is memoised in-process for
+``CIRCUIT_BREAKER_STATE_CACHE_SECONDS`` so an open circuit rejects
+without touching Redis at all. If Redis itself is unreachable the
+breaker fails open (calls go through) and a ``BackoffGate`` keeps it
+from trying Redis again for a while.
+"""
+
+import functools
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+from django.conf import settings
+from django_redis import get_redis_connection
+from redis.exceptions import RedisError
+
+from retail.clients.exceptions import CustomAPIException
+from retail.observability.backoff import BackoffGate
+from retail.observability.http_metrics import template_host
+from retail.observability.statsd import get_statsd_client
+
+
+logger = logging.getLogger(__name__)
+
+
+def _count(name: str, host: str) -> None:
+    """Count a breaker event (``rejections`` or ``opened``) for ``host``."""
+    statsd = get_statsd_client()
+    if statsd.enabled:
+        statsd.send(
+            [(f"http.client.circuit_{name}", 1, "c", {"host": template_host(host)})]
+        )
+
+
+class CircuitOpenError(CustomAPIException):
+    """Raised instead of calling a host whose circuit is open."""
+
+    status_code = 503
+
+    def __init__(self, host: str):
+        self.host = host
+        super().__init__(
+            detail=f"Circuit open for {host}; upstream is degraded",
+            status_code=503,
+        )
+
+
+@dataclass(frozen=True)
+class CallPermit:
+    """Handed out by ``before_call``; pass it back to ``record``."""
+
+    host: str
+    probe: bool = False
+    tracked: bool = True
+
+
+_UNTRACKED = CallPermit(host="", tracked=False)
+
+_CLOSED = "closed"
+_OPEN = "open"
+
+
+class CircuitBreaker:
+    """Redis-backed, per-host circuit breaker."""
+
+    KEY_PREFIX = "cb"
+
+    DEFAULT_WINDOW_SECONDS = 30
+    DEFAULT_MIN_CALLS = 20
+    DEFAULT_FAILURE_RATE = 0.5
+    DEFAULT_SLOW_CALL_SECONDS = 10.0
+    DEFAULT_OPEN_SECONDS = 30
+    DEFAULT_STATE_CACHE_SECONDS = 1.0
+
+    def __init__(self, redis_client=None):
+        self._redis_client = redis_client
+        self._lock = threading.Lock()
+        # host -> (state, memo expiry on the monotonic clock)
+        self._local_state: Dict[str, Tuple[str, float]] = {}
+        self._redis_gate = BackoffGate(
+            logger, "[CIRCUIT_BREAKER] Redis unavailable, failing open"
+        )
+
+    @property
+    def enabled(self) -> bool:
+        return getattr(settings, "CIRCUIT_BREAKER_ENABLED", True)
+
+    def _setting(self, name: str, default):
+        return getattr(settings, f"CIRCUIT_BREAKER_{name}", default)
+
+    def _redis(self):
+        if self._redis_client is None:
+            self._redis_client = get_redis_connection("default")
+        return self._redis_client
+
+    def _key(self, host: str, suffix: str) -> str:
+        return f"{self.KEY_PREFIX}:{host}:{suffix}"
+
+    def _window_keys(self, host: str) -> Tuple[str, str]:
+        window_seconds = self._setting("WINDOW_SECONDS", self.DEFAULT_WINDOW_SECONDS)
+        window = int(time.time() // window_seconds)
+        return (
+            self._key(host, f"{window}:calls"),
+            self._key(host, f"{window}:bad"),
+        )
+
+    def _remember(self, host: str, state: str) -> None:
+        ttl = self._setting("STATE_CACHE_SECONDS", self.DEFAULT_STATE_CACHE_SECONDS)
+        with self._lock:
+            self._local_state[host] = (state, time.monotonic() + ttl)
+
+    def _remembered(self, host: str) -> Optional[str]:
+        with self._lock:
+            entry = self._local_state.get(host)
+        if entry is None or entry[1] <= time.monotonic():
+            return None
+        return entry[0]
+
+    def _reject(self, host: str) -> None:
+        _count("rejections", host)
+        raise CircuitOpenError(host)
+
+    def _probe_ttl_ms(self, timeout) -> int:
+        probe_seconds = self._setting("OPEN_SECONDS", self.DEFAULT_OPEN_SECONDS)
+        # ``requests`` also takes a (connect, read) pair.
+        if isinstance(timeout, (tuple, list)):
+            timeout = sum(t for t in timeout if t is not None)
+        if timeout:
+            probe_seconds = max(probe_seconds, timeout)
+        return int(probe_seconds * 1000)
+
+    def before_call(self, host: str, timeout=None) -> CallPermit:
+        """Return a permit for calling ``host`` or raise ``CircuitOpenError``.
+
+        ``timeout`` is the call's request timeout; a half-open probe
+        holds the probe slot for at least that long.
+        """
+        if not host or not self.enabled or not self._redis_gate.available:
+            return _UNTRACKED
+
+        remembered = self._remembered(host)
+        if remembered == _OPEN:
+            self._reject(host)
+        if remembered == _CLOSED:
+            return CallPermit(host=host)
+
+        try:
+            redis_client = self._redis()
+            is_open, is_half_open = redis_client.mget(
+                self._key(host, "open"), self._key(host, "half_open")
+            )
+            if is_open:
+                self._remember(host, _OPEN)
+                self._reject(host)
+            if not is_half_open:
+                self._remember(host, _CLOSED)
+                return CallPermit(host=host)
+
+            probe_ttl_ms = self._probe_ttl_ms(timeout)
+            if redis_client.set(self._key(host, "probe"), 1, nx=True, px=probe_ttl_ms):
+                return CallPermit(host=host, probe=True)
+        except RedisError as exc:
+            self._redis_gate.trip(exc)
+            return _UNTRACKED
+
+        self._reject(host)
+
+    def is_bad_outcome(
+        self, status_code: Optional[int], elapsed_seconds: float
+    ) -> bool:
+        if status_code is None or status_code >= 500 or status_code == 429:
+            return True
+        slow_call_seconds = self._setting(
+            "SLOW_CALL_SECONDS", self.DEFAULT_SLOW_CALL_SECONDS
+        )
+        return elapsed_seconds >= slow_call_seconds
+
+    def record(
+        self,
+        permit: CallPermit,
+        status_code: Optional[int],
+        elapsed_seconds: float,
+    ) -> None:
+        """Record the outcome of a permitted call.
+
+        ``status_code`` is ``None`` when the call raised before a
+        response came back.
+        """
+        if not permit.tracked:
+            return
+
+        bad = self.is_bad_outcome(status_code, elapsed_seconds)
+        try:
+            if permit.probe:
+                if bad:
+                    self._open(permit.host, reason="half-open probe failed")
+                else:
+                    self._close(permit.host)
+                return
+
+            calls_key, bad_key = self._window_keys(permit.host)
+            window_seconds = self._setting(
+                "WINDOW_SECONDS", self.DEFAULT_WINDOW_SECONDS
+            )
+            pipe = self._redis().pipeline(transaction=False)
+            pipe.incr(calls_key, 1)
+            pipe.incr(bad_key, 1 if bad else 0)
+            pipe.expire(calls_key, window_seconds * 2)
+            pipe.expire(bad_key, window_seconds * 2)
+            calls, bad_calls, _, _ = pipe.execute()
+        except RedisError as exc:
+            self._redis_gate.trip(exc)
+            return
+
+        if not bad:
+            return
+        min_calls = self._setting("MIN_CALLS", self.DEFAULT_MIN_CALLS)
+        failure_rate = self._setting("FAILURE_RATE", self.DEFAULT_FAILURE_RATE)
+        if calls >= min_calls and bad_calls / calls >= failure_rate:
+            try:
+                self._open(
+                    permit.host,
+                    reason=f"{bad_calls}/{calls} bad calls in the current window",
+                )
+            except RedisError as exc:
+                self._redis_gate.trip(exc)
+
+    def _open(self, host: str, reason: str) -> None:
+        open_seconds = self._setting("OPEN_SECONDS", self.DEFAULT_OPEN_SECONDS)
+        open_ms = int(open_seconds * 1000)
+        calls_key, bad_key = self._window_keys(host)
+
+        pipe = self._redis().pipeline(transaction=False)
+        pipe.set(self._key(host, "open"), 1, px=open_ms)
+        # Long enough that the first call after ``open`` expires finds
+        # it and probes instead of going straight back to closed.
+        pipe.set(self._key(host, "half_open"), 1, px=open_ms * 10)
+        pipe.delete(self._key(host, "probe"), calls_key, bad_key)
+        pipe.execute()
+
+        self._remember(host, _OPEN)
+        _count("opened", host)
+        logger.warning(
+            f"[CIRCUIT_BREAKER] Circuit opened for {host} for {open_seconds}s: "
+            f"{reason}"
+        )
+
+    def _close(self, host: str) -> None:
+        self._redis().delete(self._key(host, "half_open"), self._key(host, "probe"))
+        self._remember(host, _CLOSED)
+        logger.info(f"[CIRCUIT_BREAKER] Circuit closed for {host}: probe succeeded")
+
+
+@functools.lru_cache(maxsize=None)
+def get_circuit_breaker() -> CircuitBreaker:
+    """Process-wide breaker so the local state memo is shared by clients."""
+    return CircuitBreaker()
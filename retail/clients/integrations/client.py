@@ -1,6 +1,9 @@
 """Client for connection with Integrations"""
 
+import contextvars
 import logging
+import math
+from concurrent.futures import ThreadPoolExecutor
 
 from django.conf import settings
 
@@ -11,6 +14,10 @@ from retail.interfaces.clients.integrations.interface import IntegrationsClientI
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_TEMPLATES_PAGE_SIZE = 100
+DEFAULT_TEMPLATES_FETCH_WORKERS = 4
+MAX_TEMPLATE_PAGES = 100  # Safety limit to prevent runaway pagination
+
 
 class IntegrationsClient(RequestClient, IntegrationsClientInterface):
     def __init__(self):
@@ -186,59 +193,99 @@ class IntegrationsClient(RequestClient, IntegrationsClientInterface):
     ) -> List[Dict]:
         """
         Fetch templates from user with optional filtering by template names.
-        Uses simple sequential pagination instead of multi-threading.
-        """
 
-        def fetch_single_page(
-            app_uuid: str,
-            page: int,
-            page_size: int = 15,
-            template_names: Optional[List[str]] = None,
-        ) -> Dict:
-            url = f"{self.base_url}/api/v1/apps/{app_uuid}/templates/"
+        The first page tells how many templates there are; the remaining
+        pages are then fetched concurrently, at most
+        ``INTEGRATIONS_TEMPLATES_FETCH_WORKERS`` at a time, and returned in
+        page order. A response without ``count`` falls back to following
+        ``next`` one page at a time.
+        """
+        url = f"{self.base_url}/api/v1/apps/{app_uuid}/templates/"
+        page_size = max(
+            1,
+            getattr(
+                settings,
+                "INTEGRATIONS_TEMPLATES_PAGE_SIZE",
+                DEFAULT_TEMPLATES_PAGE_SIZE,
+            ),
+        )
+        max_workers = max(
+            1,
+            getattr(
+                settings,
+                "INTEGRATIONS_TEMPLATES_FETCH_WORKERS",
+                DEFAULT_TEMPLATES_FETCH_WORKERS,
+            ),
+        )
+        # Resolved once: every ``headers`` access requests a new module token.
+        headers = {
+            **self.authentication_instance.headers,
+            "Project-Uuid": project_uuid,
+        }
 
-            # Build query parameters
+        def fetch_single_page(page: int) -> Dict:
             params = {"page": page, "page_size": page_size}
-
-            # Add template names filtering if provided
             if template_names:
                 params["names"] = template_names
-
-            headers = {
-                **self.authentication_instance.headers,
-                "Project-Uuid": project_uuid,
-            }
-
-            response = self.make_request(
+            return self.make_request(
                 url, method="GET", headers=headers, params=params
             ).json()
 
-            return response
+        first_page = fetch_single_page(1)
+        all_templates = list(first_page.get("results", []))
+        if not first_page.get("next") or not all_templates:
+            return all_templates
 
-        page_size = 15
-        all_templates = []
-        page = 1
-        max_pages = 100  # Safety limit to prevent infinite loops
-
-        while page <= max_pages:
-            response = fetch_single_page(app_uuid, page, page_size, template_names)
-            results = response.get("results", [])
-            all_templates.extend(results)
-
-            # If no more pages or no results, break
-            if not response.get("next") or not results:
-                break
-
-            page += 1
+        count = first_page.get("count")
+        if not isinstance(count, int):
+            return all_templates + self._fetch_next_pages_serially(
+                fetch_single_page, first_page=2
+            )
 
-        # Log warning if we hit the safety limit
-        if page > max_pages:
+        # The server may cap ``page_size``; a full first page tells the real one.
+        total_pages = math.ceil(count / len(all_templates))
+        if total_pages > MAX_TEMPLATE_PAGES:
             logger.warning(
-                f"Reached maximum page limit ({max_pages}) for templates fetch. Some templates may be missing."
+                f"Reached maximum page limit ({MAX_TEMPLATE_PAGES}) for templates "
+                f"fetch. Some templates may be missing."
             )
+            total_pages = MAX_TEMPLATE_PAGES
+
+        remaining_pages = range(2, total_pages + 1)
+        if not remaining_pages:
+            return all_templates
+
+        workers = min(max_workers, len(remaining_pages))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            # Each page runs in a copy of this context so the task's HTTP
+            # accounting (``record_http_call``) sees the pooled calls.
+            futures = [
+                executor.submit(contextvars.copy_context().run, fetch_single_page, page)
+                for page in remaining_pages
+            ]
+            for future in futures:
+                all_templates.extend(future.result().get("results", []))
 
         return all_templates
 
+    @staticmethod
+    def _fetch_next_pages_serially(fetch_single_page, first_page: int) -> List[Dict]:
+        templates = []
+        page = first_page
+        while page <= MAX_TEMPLATE_PAGES:
+            response = fetch_single_page(page)
+            results = response.get("results", [])
+            templates.extend(results)
+            if not response.get("next") or not results:
+                return templates
+            page += 1
+
+        logger.warning(
+            f"Reached maximum page limit ({MAX_TEMPLATE_PAGES}) for templates "
+            f"fetch. Some templates may be missing."
+        )
+        return templates
+
     def create_channel_app(self, apptype: str, project_uuid: str, config: Dict) -> Dict:
         """
         Creates a channel app of the given apptype for the project.
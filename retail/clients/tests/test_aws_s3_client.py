@@ -172,3 +172,79 @@ class TestS3ClientUploadFileobj(_S3ClientBotoMixin, SimpleTestCase):
 
         with self.assertRaises(ClientError):
             self.client.upload_fileobj(BytesIO(b"x"), "exports/fail.csv")
+
+
+class TestS3ClientMultipartUpload(_S3ClientBotoMixin, SimpleTestCase):
+    def setUp(self):
+        super().setUp()
+        self.mock_s3.create_multipart_upload.return_value = {"UploadId": "up-1"}
+        self.mock_s3.upload_part.side_effect = lambda **kwargs: {
+            "ETag": f'"etag-{kwargs["PartNumber"]}"'
+        }
+
+    def _uploaded_bodies(self):
+        return [call.kwargs["Body"] for call in self.mock_s3.upload_part.call_args_list]
+
+    def test_open_sets_content_type_and_encoding(self):
+        self.client.open_multipart_upload(
+            "exports/out.csv", content_type="text/csv", content_encoding="gzip"
+        )
+
+        self.mock_s3.create_multipart_upload.assert_called_once_with(
+            Bucket="my-bucket",
+            Key="exports/out.csv",
+            ContentType="text/csv",
+            ContentEncoding="gzip",
+        )
+
+    def test_parts_are_uploaded_as_they_fill_and_completed_on_close(self):
+        with self.client.open_multipart_upload("exports/out.csv", part_size=4) as up:
+            up.write(b"abc")
+            self.mock_s3.upload_part.assert_not_called()
+            up.write(b"defghij")
+            self.assertEqual(self._uploaded_bodies(), [b"abcd", b"efgh"])
+
+        self.assertEqual(self._uploaded_bodies(), [b"abcd", b"efgh", b"ij"])
+        self.mock_s3.complete_multipart_upload.assert_called_once_with(
+            Bucket="my-bucket",
+            Key="exports/out.csv",
+            UploadId="up-1",
+            MultipartUpload={
+                "Parts": [
+                    {"ETag": '"etag-1"', "PartNumber": 1},
+                    {"ETag": '"etag-2"', "PartNumber": 2},
+                    {"ETag": '"etag-3"', "PartNumber": 3},
+                ]
+            },
+        )
+        self.mock_s3.abort_multipart_upload.assert_not_called()
+
+    def test_empty_upload_still_sends_one_part(self):
+        self.client.open_multipart_upload("exports/empty.csv").close()
+
+        self.assertEqual(self._uploaded_bodies(), [b""])
+        self.mock_s3.complete_multipart_upload.assert_called_once()
+
+    def test_exception_inside_block_aborts_instead_of_completing(self):
+        with self.assertRaises(RuntimeError):
+            with self.client.open_multipart_upload("exports/out.csv") as upload:
+                upload.write(b"partial")
+                raise RuntimeError("boom")
+
+        self.mock_s3.complete_multipart_upload.assert_not_called()
+        self.mock_s3.abort_multipart_upload.assert_called_once_with(
+            Bucket="my-bucket", Key="exports/out.csv", UploadId="up-1"
+        )
+
+    def test_failed_completion_aborts_and_propagates(self):
+        self.mock_s3.complete_multipart_upload.side_effect = ClientError(
+            error_response={"Error": {"Code": "InternalError"}},
+            operation_name="CompleteMultipartUpload",
+        )
+        upload = self.client.open_multipart_upload("exports/out.csv")
+
+        with self.assertRaises(ClientError):
+            upload.close()
+
+        self.mock_s3.abort_multipart_upload.assert_called_once()
+        self.assertTrue(upload.closed)
@@ -0,0 +1,200 @@
+from unittest.mock import MagicMock, patch
+
+from django.test import TestCase, override_settings
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from retail.agents.domains.agent_execution.tests._fakes import FakeRedisConnection
+from retail.clients.base import RequestClient
+from retail.clients.circuit_breaker import CircuitBreaker, CircuitOpenError
+from retail.clients.exceptions import CustomAPIException
+
+
+HOST = "store.vtexcommercestable.com.br"
+
+
+@override_settings(
+    CIRCUIT_BREAKER_ENABLED=True,
+    CIRCUIT_BREAKER_MIN_CALLS=4,
+    CIRCUIT_BREAKER_FAILURE_RATE=0.5,
+    CIRCUIT_BREAKER_SLOW_CALL_SECONDS=5,
+    CIRCUIT_BREAKER_OPEN_SECONDS=30,
+    CIRCUIT_BREAKER_STATE_CACHE_SECONDS=0,
+)
+class CircuitBreakerTest(TestCase):
+    def setUp(self):
+        self.redis = FakeRedisConnection()
+        self.breaker = CircuitBreaker(redis_client=self.redis)
+
+    def _call(self, status_code, elapsed=0.1):
+        permit = self.breaker.before_call(HOST)
+        self.breaker.record(permit, status_code, elapsed)
+        return permit
+
+    def _expire_open_key(self):
+        self.redis.delete(f"cb:{HOST}:open")
+
+    def test_stays_closed_below_min_calls(self):
+        for _ in range(3):
+            self._call(None)
+
+        self.assertTrue(self.breaker.before_call(HOST).tracked)
+
+    def test_opens_when_failure_rate_is_reached_and_fails_fast(self):
+        self._call(200)
+        self._call(200)
+        self._call(503)
+        with self.assertLogs("retail.clients.circuit_breaker", "WARNING"):
+            self._call(None)
+
+        with self.assertRaises(CircuitOpenError) as ctx:
+            self.breaker.before_call(HOST)
+        self.assertEqual(ctx.exception.status_code, 503)
+
+    def test_slow_calls_and_429_count_as_bad(self):
+        self.assertTrue(self.breaker.is_bad_outcome(200, 6.0))
+        self.assertTrue(self.breaker.is_bad_outcome(429, 0.1))
+        self.assertFalse(self.breaker.is_bad_outcome(404, 0.1))
+
+    def test_client_errors_do_not_open_the_circuit(self):
+        for _ in range(6):
+            self._call(404)
+
+        self.assertTrue(self.breaker.before_call(HOST).tracked)
+
+    def test_other_hosts_are_unaffected(self):
+        for _ in range(4):
+            self._call(500)
+
+        self.assertTrue(self.breaker.before_call("flows.weni.ai").tracked)
+
+    def test_half_open_lets_a_single_probe_through(self):
+        for _ in range(4):
+            self._call(500)
+        self._expire_open_key()
+
+        probe = self.breaker.before_call(HOST)
+
+        self.assertTrue(probe.probe)
+        with self.assertRaises(CircuitOpenError):
+            self.breaker.before_call(HOST)
+
+    def _probe_ttls_ms(self):
+        return [
+            kwargs["px"]
+            for command, args, kwargs in self.redis.command_log
+            if command == "set" and args[0] == f"cb:{HOST}:probe"
+        ]
+
+    def test_probe_slot_outlives_a_slow_probe(self):
+        for _ in range(4):
+            self._call(500)
+        self._expire_open_key()
+
+        self.breaker.before_call(HOST, timeout=60)
+
+        self.assertEqual(self._probe_ttls_ms(), [60_000])
+
+    def test_probe_slot_lasts_at_least_the_open_period(self):
+        for _ in range(4):
+            self._call(500)
+        self._expire_open_key()
+
+        self.breaker.before_call(HOST, timeout=(3, 10))
+
+        self.assertEqual(self._probe_ttls_ms(), [30_000])
+
+    def test_successful_probe_closes_the_circuit(self):
+        for _ in range(4):
+            self._call(500)
+        self._expire_open_key()
+
+        probe = self.breaker.before_call(HOST)
+        self.breaker.record(probe, 200, 0.1)
+
+        permit = self.breaker.before_call(HOST)
+        self.assertTrue(permit.tracked)
+        self.assertFalse(permit.probe)
+
+    def test_failed_probe_reopens_the_circuit(self):
+        for _ in range(4):
+            self._call(500)
+        self._expire_open_key()
+
+        probe = self.breaker.before_call(HOST)
+        with self.assertLogs("retail.clients.circuit_breaker", "WARNING"):
+            self.breaker.record(probe, None, 0.1)
+
+        with self.assertRaises(CircuitOpenError):
+            self.breaker.before_call(HOST)
+
+    @override_settings(CIRCUIT_BREAKER_STATE_CACHE_SECONDS=60)
+    def test_open_state_is_memoised_locally(self):
+        for _ in range(4):
+            self._call(500)
+        self.redis.command_log.clear()
+
+        for _ in range(3):
+            with self.assertRaises(CircuitOpenError):
+                self.breaker.before_call(HOST)
+
+        self.assertEqual(self.redis.command_log, [])
+
+    def test_fails_open_when_redis_is_down(self):
+        redis_client = MagicMock()
+        redis_client.mget.side_effect = RedisConnectionError("down")
+        breaker = CircuitBreaker(redis_client=redis_client)
+
+        with self.assertLogs("retail.clients.circuit_breaker", "WARNING"):
+            permit = breaker.before_call(HOST)
+
+        self.assertFalse(permit.tracked)
+        self.assertFalse(breaker.before_call(HOST).tracked)
+        redis_client.mget.assert_called_once()
+
+    @override_settings(CIRCUIT_BREAKER_ENABLED=False)
+    def test_disabled_breaker_never_touches_redis(self):
+        self.assertFalse(self.breaker.before_call(HOST).tracked)
+        self.assertEqual(self.redis.command_log, [])
+
+
+class _VtexIOClient(RequestClient):
+    pass
+
+
+@override_settings(CIRCUIT_BREAKER_STATE_CACHE_SECONDS=0)
+class RequestClientCircuitBreakerTest(TestCase):
+    def setUp(self):
+        self.breaker = CircuitBreaker(redis_client=FakeRedisConnection())
+        patcher = patch(
+            "retail.clients.base.get_circuit_breaker", return_value=self.breaker
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    @override_settings(CIRCUIT_BREAKER_MIN_CALLS=2)
+    @patch("retail.clients.base.requests.request")
+    def test_open_circuit_skips_the_request(self, mock_request):
+        mock_request.return_value = MagicMock(status_code=502, text="bad gateway")
+        url = f"https://{HOST}/api/oms/pvt/orders/1-01"
+
+        for _ in range(2):
+            with self.assertRaises(CustomAPIException):
+                _VtexIOClient().make_request(url, method="GET")
+        mock_request.reset_mock()
+
+        with self.assertRaises(CircuitOpenError):
+            _VtexIOClient().make_request(url, method="GET")
+
+        mock_request.assert_not_called()
+
+    @override_settings(HTTP_CLIENT_TIMEOUTS={"_VtexIOClient": 7})
+    @patch("retail.clients.base.requests.request")
+    def test_uses_per_client_timeout(self, mock_request):
+        mock_request.return_value = MagicMock(status_code=200, text="{}")
+
+        _VtexIOClient().make_request(f"https://{HOST}/x", method="GET")
+        RequestClient().make_request(f"https://{HOST}/x", method="GET")
+        _VtexIOClient().make_request(f"https://{HOST}/x", method="GET", timeout=3)
+
+        timeouts = [call.kwargs["timeout"] for call in mock_request.call_args_list]
+        self.assertEqual(timeouts, [7, 60, 3])
@@ -0,0 +1,151 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import MagicMock
+from urllib.parse import parse_qs, urlparse
+
+from django.test import SimpleTestCase, override_settings
+
+from retail.clients.integrations.client import IntegrationsClient
+from retail.observability import task_metrics
+from retail.observability.task_metrics import (
+    finish_task_accounting,
+    start_task_accounting,
+)
+
+
+class FakeTemplatesServer:
+    """Serves ``count`` templates over paginated GETs, ``delay`` per page."""
+
+    def __init__(self, count, delay=0.0, max_page_size=None, include_count=True):
+        self.count = count
+        self.delay = delay
+        self.max_page_size = max_page_size
+        self.include_count = include_count
+        self.pages_requested = []
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler_class())
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def base_url(self):
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+
+    def _page(self, page, page_size):
+        if self.max_page_size:
+            page_size = min(page_size, self.max_page_size)
+        start = (page - 1) * page_size
+        names = [
+            f"template_{i:04d}"
+            for i in range(start, min(start + page_size, self.count))
+        ]
+        body = {
+            "next": "more" if start + page_size < self.count else None,
+            "results": [{"name": name} for name in names],
+        }
+        if self.include_count:
+            body["count"] = self.count
+        return body
+
+    def _handler_class(self):
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                query = parse_qs(urlparse(self.path).query)
+                page = int(query["page"][0])
+                fake.pages_requested.append(page)
+                time.sleep(fake.delay)
+                encoded = json.dumps(
+                    fake._page(page, int(query["page_size"][0]))
+                ).encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(encoded)))
+                self.end_headers()
+                self.wfile.write(encoded)
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+
+@override_settings(CIRCUIT_BREAKER_ENABLED=False, INTEGRATIONS_TEMPLATES_PAGE_SIZE=10)
+class IntegrationsClientFetchTemplatesTest(SimpleTestCase):
+    def _fetch(self, server):
+        with override_settings(INTEGRATIONS_REST_ENDPOINT=server.base_url):
+            client = IntegrationsClient()
+        client.authentication_instance = MagicMock(
+            headers={"Authorization": "Bearer t"}
+        )
+        started = time.perf_counter()
+        templates = client.fetch_templates_from_user("app-uuid", "project-uuid")
+        return templates, time.perf_counter() - started
+
+    def _assert_all_in_order(self, templates, count):
+        self.assertEqual(
+            [template["name"] for template in templates],
+            [f"template_{i:04d}" for i in range(count)],
+        )
+
+    def test_remaining_pages_are_fetched_concurrently_in_order(self):
+        with FakeTemplatesServer(count=75, delay=0.1) as server:
+            with override_settings(INTEGRATIONS_TEMPLATES_FETCH_WORKERS=8):
+                templates, elapsed = self._fetch(server)
+
+        self._assert_all_in_order(templates, 75)
+        self.assertEqual(sorted(server.pages_requested), list(range(1, 9)))
+        # Page 1, then pages 2-8 in one round: about 2 delays, not 8.
+        self.assertLess(elapsed, 0.5)
+
+    def test_wall_time_follows_pool_width(self):
+        with FakeTemplatesServer(count=90, delay=0.1) as server:
+            with override_settings(INTEGRATIONS_TEMPLATES_FETCH_WORKERS=2):
+                templates, elapsed = self._fetch(server)
+
+        self._assert_all_in_order(templates, 90)
+        # Page 1, then 8 pages two at a time: at least 5 delays.
+        self.assertGreaterEqual(elapsed, 0.5)
+
+    def test_server_capped_page_size_is_respected(self):
+        with FakeTemplatesServer(count=23, max_page_size=5) as server:
+            templates, _ = self._fetch(server)
+
+        self._assert_all_in_order(templates, 23)
+        self.assertEqual(sorted(server.pages_requested), [1, 2, 3, 4, 5])
+
+    def test_falls_back_to_next_links_without_count(self):
+        with FakeTemplatesServer(count=25, include_count=False) as server:
+            templates, _ = self._fetch(server)
+
+        self._assert_all_in_order(templates, 25)
+        self.assertEqual(server.pages_requested, [1, 2, 3])
+
+    @override_settings(STATSD_HOST="", TASK_METRICS_ENABLED=True)
+    def test_pooled_pages_are_accounted_to_the_task(self):
+        self.addCleanup(task_metrics._current_usage.set, None)
+        with FakeTemplatesServer(count=75) as server:
+            with override_settings(INTEGRATIONS_TEMPLATES_FETCH_WORKERS=8):
+                start_task_accounting("task-1", "task")
+                self._fetch(server)
+                usage = finish_task_accounting("task-1")
+
+        self.assertEqual(usage.http["127.0.0.1"].calls, 8)
+
+    def test_single_page_makes_one_request(self):
+        with FakeTemplatesServer(count=4) as server:
+            templates, _ = self._fetch(server)
+
+        self._assert_all_in_order(templates, 4)
+        self.assertEqual(server.pages_requested, [1])
@@ -0,0 +1,206 @@
+"""Throughput and memory benchmark for contract acceptance PDF rendering.
+
+Renders the same acceptance documents once per mode, each mode in its
+own forked process so their memory high-water marks do not mix:
+
+- ``cold``: a new ``WeasyPrintContractPdfRenderer`` per document, which
+  is what the task did before the warm renderer existed (template load,
+  stylesheet parse and font configuration on every PDF).
+- ``warm``: one ``WarmWeasyPrintContractPdfRenderer`` for the whole run,
+  as a contract documents worker process holds it.
+
+Documents cycle through ``languages`` so the warm renderer has to cache
+one Order Form partial per language. The context is built by
+``ProcessContractAcceptanceDocumentUseCase`` from unsaved model
+instances; no database, Connect or S3 is touched. Peak RSS is the
+process' ``ru_maxrss`` after each render, so ``rss_growth_kb`` is how
+much the high-water mark moved over the run.
+"""
+
+import multiprocessing
+import resource
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, List, Optional, Type
+from uuid import uuid4
+
+from retail.agents.benchmarks.webhook_pipeline import summarize_latencies
+from retail.contracts.models import ContractAcceptance, ContractTemplate
+from retail.contracts.renderers import ContractPdfRendererInterface
+from retail.contracts.usecases.process_contract_acceptance_document import (
+    ProcessContractAcceptanceDocumentUseCase,
+)
+from retail.contracts.weasyprint_renderer import (
+    WarmWeasyPrintContractPdfRenderer,
+    WeasyPrintContractPdfRenderer,
+)
+from retail.projects.models import Project
+
+
+BENCHMARK_TEMPLATE_NAME = "contract/pdf/v1.html"
+
+
+@dataclass
+class PdfRenderingConfig:
+    """Knobs for a single benchmark run."""
+
+    documents: int = 50
+    languages: List[str] = field(default_factory=lambda: ["pt-br", "en", "es"])
+    template_name: str = BENCHMARK_TEMPLATE_NAME
+    # Fork one process per mode; disable to measure in the caller's
+    # process (RSS figures then include whatever ran before).
+    isolate_modes: bool = True
+
+
+@dataclass
+class ModeResult:
+    render_latencies_ms: List[float] = field(default_factory=list)
+    rss_after_render_kb: List[int] = field(default_factory=list)
+    wall_seconds: float = 0.0
+    pdf_bytes: int = 0
+
+    def as_dict(self) -> Dict[str, Any]:
+        count = len(self.render_latencies_ms)
+        rss = self.rss_after_render_kb
+        return {
+            "per_pdf_ms": summarize_latencies(self.render_latencies_ms),
+            "first_pdf_ms": (round(self.render_latencies_ms[0], 3) if count else 0.0),
+            "wall_seconds": round(self.wall_seconds, 4),
+            "pdfs_per_second": (
+                round(count / self.wall_seconds, 2) if self.wall_seconds else 0.0
+            ),
+            "peak_rss_kb": max(rss) if rss else 0,
+            "rss_growth_kb": rss[-1] - rss[0] if rss else 0,
+            "pdf_bytes": self.pdf_bytes,
+        }
+
+
+@dataclass
+class PdfRenderingReport:
+    config: PdfRenderingConfig
+    modes: Dict[str, ModeResult] = field(default_factory=dict)
+
+    def as_dict(self) -> Dict[str, Any]:
+        modes = {name: result.as_dict() for name, result in self.modes.items()}
+        report = {
+            "benchmark": "contract_pdf_rendering",
+            "config": asdict(self.config),
+            "modes": modes,
+        }
+        if "cold" in modes and "warm" in modes:
+            cold = modes["cold"]["pdfs_per_second"]
+            warm = modes["warm"]["pdfs_per_second"]
+            report["speedup"] = round(warm / cold, 2) if cold else None
+        return report
+
+
+def _peak_rss_kb() -> int:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+@dataclass(frozen=True)
+class RenderMode:
+    renderer_class: Type[ContractPdfRendererInterface]
+    # Render every document with one instance instead of a new one each.
+    reuse_renderer: bool
+
+
+DEFAULT_MODES = {
+    "cold": RenderMode(WeasyPrintContractPdfRenderer, reuse_renderer=False),
+    "warm": RenderMode(WarmWeasyPrintContractPdfRenderer, reuse_renderer=True),
+}
+
+
+class PdfRenderingBenchmark:
+    """Runs the ``cold`` and ``warm`` modes and reports both."""
+
+    def __init__(
+        self,
+        config: Optional[PdfRenderingConfig] = None,
+        modes: Optional[Dict[str, RenderMode]] = None,
+    ):
+        self.config = config or PdfRenderingConfig()
+        self.modes = modes or DEFAULT_MODES
+
+    def contexts(self) -> List[Dict[str, Any]]:
+        template = ContractTemplate(
+            version="benchmark", template_name=self.config.template_name
+        )
+        languages = self.config.languages or [""]
+        contexts = []
+        for index in range(self.config.documents):
+            language = languages[index % len(languages)]
+            acceptance = ContractAcceptance(
+                user_id=uuid4(),
+                email_at_acceptance=f"buyer{index}@example.com",
+                company_name=f"Benchmark Store {index}",
+                user_name="Benchmark User",
+                project=Project(name="Benchmark", language=language),
+                vtex_account=f"benchmark{index}",
+                accepted_at_local_offset="-03:00",
+                contract_template=template,
+                contract_version="benchmark",
+                contract_document_key=f"contratos/benchmark/{index}.pdf",
+                plan_snapshot={"plan": "Growth"},
+                ip_address="127.0.0.1",
+                user_agent="benchmark",
+                session_id="benchmark",
+                acceptance_method="checkbox",
+                checkbox_label_text="I accept the terms.",
+            )
+            contexts.append(
+                ProcessContractAcceptanceDocumentUseCase._build_context(
+                    acceptance, language
+                )
+            )
+        return contexts
+
+    def run(self) -> PdfRenderingReport:
+        report = PdfRenderingReport(config=self.config)
+        for name in self.modes:
+            if self.config.isolate_modes:
+                report.modes[name] = self._run_isolated(name)
+            else:
+                report.modes[name] = self._run_mode(name)
+        return report
+
+    def _run_isolated(self, name: str) -> ModeResult:
+        context = multiprocessing.get_context("fork")
+        parent_end, child_end = context.Pipe(duplex=False)
+        process = context.Process(
+            target=self._run_in_child, args=(name, child_end), daemon=True
+        )
+        process.start()
+        child_end.close()
+        outcome = parent_end.recv()
+        process.join()
+        if isinstance(outcome, BaseException):
+            raise outcome
+        return ModeResult(**outcome)
+
+    def _run_in_child(self, name: str, conn) -> None:
+        try:
+            conn.send(asdict(self._run_mode(name)))
+        except BaseException as exc:
+            conn.send(exc)
+        finally:
+            conn.close()
+
+    def _run_mode(self, name: str) -> ModeResult:
+        mode = self.modes[name]
+        shared_renderer = mode.renderer_class() if mode.reuse_renderer else None
+        contexts = self.contexts()
+        result = ModeResult()
+
+        started = time.perf_counter()
+        for context in contexts:
+            render_started = time.perf_counter()
+            renderer = shared_renderer or mode.renderer_class()
+            pdf = renderer.render(self.config.template_name, context)
+            result.render_latencies_ms.append(
+                (time.perf_counter() - render_started) * 1000.0
+            )
+            result.rss_after_render_kb.append(_peak_rss_kb())
+            result.pdf_bytes += len(pdf)
+        result.wall_seconds = time.perf_counter() - started
+        return result
@@ -0,0 +1,59 @@
+"""Compare cold and warm contract PDF rendering throughput and memory.
+
+Usage::
+
+    python manage.py benchmark_contract_pdf --documents 200 \\
+        --languages pt-br en es --output contract_pdf.json
+
+Needs WeasyPrint's system libraries (Pango); no database, Connect or S3
+is touched. See ``retail.contracts.benchmarks.pdf_rendering`` for what
+is measured.
+"""
+
+import json
+
+from django.core.management.base import BaseCommand
+
+from retail.contracts.benchmarks.pdf_rendering import (
+    PdfRenderingBenchmark,
+    PdfRenderingConfig,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark contract PDFs per second and peak RSS with a fresh renderer "
+        "per document versus a warm per-process renderer and emit a JSON report."
+    )
+
+    def add_arguments(self, parser):
+        defaults = PdfRenderingConfig()
+        parser.add_argument("--documents", type=int, default=defaults.documents)
+        parser.add_argument("--languages", nargs="+", default=defaults.languages)
+        parser.add_argument("--template-name", default=defaults.template_name)
+        parser.add_argument(
+            "--no-isolation",
+            action="store_true",
+            help="Run both modes in this process instead of one fork per mode.",
+        )
+        parser.add_argument(
+            "--output",
+            help="Write the JSON report to this path instead of stdout.",
+        )
+
+    def handle(self, *args, **options):
+        config = PdfRenderingConfig(
+            documents=options["documents"],
+            languages=options["languages"],
+            template_name=options["template_name"],
+            isolate_modes=not options["no_isolation"],
+        )
+        report = PdfRenderingBenchmark(config).run().as_dict()
+        rendered = json.dumps(report, indent=2, sort_keys=True)
+
+        if options["output"]:
+            with open(options["output"], "w") as fp:
+                fp.write(rendered + "\n")
+            self.stdout.write(f"Benchmark report written to {options['output']}")
+        else:
+            self.stdout.write(rendered)
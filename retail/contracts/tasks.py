@@ -7,7 +7,7 @@ from retail.contracts.translations import format_acceptance_datetime
 from retail.contracts.usecases.process_contract_acceptance_document import (
     ProcessContractAcceptanceDocumentUseCase,
 )
-from retail.contracts.weasyprint_renderer import WeasyPrintContractPdfRenderer
+from retail.contracts.weasyprint_renderer import get_contract_pdf_renderer
 from retail.services.notification.contract_acceptance_service import (
     ContractAcceptanceNotificationService,
 )
@@ -23,6 +23,9 @@ def task_process_contract_acceptance_document(acceptance_uuid: str) -> None:
     exists, so a missing row is logged and any downstream failure inside
     the use case must not corrupt the audit trail. Reprocessing is a
     matter of re-running this task with the same UUID.
+
+    Routed to ``CONTRACT_PDF_CELERY_QUEUE``, which can point at its own
+    bounded worker pool; each worker process keeps a warm renderer.
     """
     try:
         acceptance = ContractAcceptance.objects.select_related(
@@ -33,7 +36,7 @@ def task_process_contract_acceptance_document(acceptance_uuid: str) -> None:
         return
 
     use_case = ProcessContractAcceptanceDocumentUseCase(
-        pdf_renderer=WeasyPrintContractPdfRenderer(),
+        pdf_renderer=get_contract_pdf_renderer(),
     )
     use_case.execute(acceptance)
 
@@ -0,0 +1,149 @@
+from unittest.mock import patch
+
+from django.test import SimpleTestCase
+
+from retail.contracts import weasyprint_renderer
+from retail.contracts.benchmarks.pdf_rendering import (
+    PdfRenderingBenchmark,
+    PdfRenderingConfig,
+    RenderMode,
+)
+from retail.contracts.translations import get_order_form_partial
+from retail.contracts.weasyprint_renderer import (
+    WarmWeasyPrintContractPdfRenderer,
+    WeasyPrintContractPdfRenderer,
+    get_contract_pdf_renderer,
+    stylesheet_name,
+)
+
+TEMPLATE_NAME = "contract/pdf/v1.html"
+
+
+def _context(language):
+    return {
+        "labels": {},
+        "lang_code": language,
+        "order_form_partial": get_order_form_partial(language),
+        "company_name": f"Store {language}",
+    }
+
+
+@patch.object(weasyprint_renderer, "FontConfiguration")
+@patch.object(weasyprint_renderer, "CSS")
+@patch.object(weasyprint_renderer, "HTML")
+class WeasyPrintContractPdfRendererTests(SimpleTestCase):
+    def test_stylesheet_sits_next_to_the_template(self, *_mocks):
+        self.assertEqual(stylesheet_name(TEMPLATE_NAME), "contract/pdf/v1.css")
+
+    def test_cold_renderer_rebuilds_fonts_and_stylesheet_per_pdf(
+        self, mock_html, mock_css, mock_font_config
+    ):
+        mock_html.return_value.write_pdf.return_value = b"%PDF"
+
+        for _ in range(2):
+            pdf = WeasyPrintContractPdfRenderer().render(TEMPLATE_NAME, _context("en"))
+
+        self.assertEqual(pdf, b"%PDF")
+        self.assertEqual(mock_font_config.call_count, 2)
+        self.assertEqual(mock_css.call_count, 2)
+        self.assertIn("@page", mock_css.call_args.kwargs["string"])
+
+    def test_warm_renderer_compiles_fonts_and_stylesheet_once(
+        self, mock_html, mock_css, mock_font_config
+    ):
+        renderer = WarmWeasyPrintContractPdfRenderer()
+
+        for language in ("en", "es", "en"):
+            renderer.render(TEMPLATE_NAME, _context(language))
+
+        mock_font_config.assert_called_once_with()
+        mock_css.assert_called_once_with(
+            string=weasyprint_renderer._stylesheet_source(TEMPLATE_NAME),
+            font_config=mock_font_config.return_value,
+        )
+        mock_html.return_value.write_pdf.assert_called_with(
+            stylesheets=[mock_css.return_value],
+            font_config=mock_font_config.return_value,
+        )
+        self.assertEqual(
+            set(renderer._templates),
+            {
+                TEMPLATE_NAME,
+                get_order_form_partial("en"),
+                get_order_form_partial("es"),
+            },
+        )
+
+    def test_warm_renderer_renders_each_language_partial(
+        self, mock_html, mock_css, mock_font_config
+    ):
+        renderer = WarmWeasyPrintContractPdfRenderer()
+
+        renderer.render(TEMPLATE_NAME, _context("en"))
+        renderer.render(TEMPLATE_NAME, _context("pt-br"))
+
+        english, portuguese = [
+            call.kwargs["string"] for call in mock_html.call_args_list
+        ]
+        self.assertIn("Store en", english)
+        self.assertIn("Store pt-br", portuguese)
+        self.assertNotEqual(english, portuguese)
+
+    def test_template_without_stylesheet_renders_without_one(
+        self, mock_html, mock_css, _mock_font_config
+    ):
+        partial_name = get_order_form_partial("en")
+
+        WeasyPrintContractPdfRenderer().render(partial_name, _context("en"))
+        WarmWeasyPrintContractPdfRenderer().render(partial_name, _context("en"))
+
+        mock_css.assert_not_called()
+        for call in mock_html.return_value.write_pdf.call_args_list:
+            self.assertEqual(call.kwargs["stylesheets"], [])
+
+    def test_worker_processes_share_one_warm_renderer(self, *_mocks):
+        with patch.object(weasyprint_renderer, "_warm_renderer", None):
+            self.assertIs(get_contract_pdf_renderer(), get_contract_pdf_renderer())
+
+
+class FakePdfRenderer:
+    instances = 0
+
+    def __init__(self):
+        type(self).instances += 1
+
+    def render(self, template_name, context):
+        return f"%PDF {context['company_name']}".encode()
+
+
+class PdfRenderingBenchmarkTests(SimpleTestCase):
+    def test_reports_throughput_and_rss_for_each_mode(self):
+        report = (
+            PdfRenderingBenchmark(
+                PdfRenderingConfig(documents=4, languages=["pt-br", "es"]),
+                modes={
+                    "cold": RenderMode(FakePdfRenderer, reuse_renderer=False),
+                    "warm": RenderMode(FakePdfRenderer, reuse_renderer=True),
+                },
+            )
+            .run()
+            .as_dict()
+        )
+
+        for name in ("cold", "warm"):
+            mode = report["modes"][name]
+            self.assertEqual(mode["per_pdf_ms"]["count"], 4)
+            self.assertGreater(mode["pdf_bytes"], 0)
+            self.assertGreater(mode["peak_rss_kb"], 0)
+        self.assertIn("speedup", report)
+
+    def test_warm_mode_reuses_one_renderer(self):
+        FakePdfRenderer.instances = 0
+        benchmark = PdfRenderingBenchmark(
+            PdfRenderingConfig(documents=3, isolate_modes=False),
+            modes={"warm": RenderMode(FakePdfRenderer, reuse_renderer=True)},
+        )
+
+        benchmark.run()
+
+        self.assertEqual(FakePdfRenderer.instances, 1)
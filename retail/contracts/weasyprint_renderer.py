@@ -1,14 +1,111 @@
-"""WeasyPrint-backed contract PDF renderer."""
+"""WeasyPrint-backed contract PDF renderers.
 
-from django.template.loader import render_to_string
-from weasyprint import HTML
+A contract template ``<name>.html`` may ship a stylesheet next to it as
+``<name>.css``; it is handed to WeasyPrint as a compiled ``CSS`` object
+together with the ``FontConfiguration`` that resolves its fonts.
+Templates without one render with their inline styles only.
+
+``WeasyPrintContractPdfRenderer`` loads the template, parses the
+stylesheet and builds a ``FontConfiguration`` on every render.
+``WarmWeasyPrintContractPdfRenderer`` keeps all three for the lifetime
+of the process, which is what the contract documents worker uses (see
+``get_contract_pdf_renderer``). WeasyPrint objects are not thread-safe,
+so a warm renderer must only be used by one thread at a time; Celery's
+prefork pool gives each worker process its own.
+"""
+
+import os
+from typing import Dict, List, Optional
+
+from django.template import TemplateDoesNotExist
+from django.template.loader import get_template, render_to_string
+from weasyprint import CSS, HTML
+from weasyprint.text.fonts import FontConfiguration
 
 from retail.contracts.renderers import ContractPdfRendererInterface
 
 
-class WeasyPrintContractPdfRenderer(ContractPdfRendererInterface):  # pragma: no cover
+def stylesheet_name(template_name: str) -> str:
+    """Return the stylesheet template shipped alongside ``template_name``."""
+    return f"{os.path.splitext(template_name)[0]}.css"
+
+
+def _stylesheet_source(template_name: str) -> Optional[str]:
+    try:
+        return get_template(stylesheet_name(template_name)).template.source
+    except TemplateDoesNotExist:
+        return None
+
+
+class WeasyPrintContractPdfRenderer(ContractPdfRendererInterface):
     """Render the contract HTML template to PDF bytes via WeasyPrint."""
 
     def render(self, template_name: str, context: dict) -> bytes:
+        font_config = FontConfiguration()
+        source = _stylesheet_source(template_name)
+        stylesheets = (
+            [CSS(string=source, font_config=font_config)] if source is not None else []
+        )
         html = render_to_string(template_name, context)
-        return HTML(string=html).write_pdf()
+        return HTML(string=html).write_pdf(
+            stylesheets=stylesheets, font_config=font_config
+        )
+
+
+class WarmWeasyPrintContractPdfRenderer(ContractPdfRendererInterface):
+    """Reuse fonts, compiled stylesheets and templates across renders.
+
+    The Order Form partial is language dependent and included by name
+    (``order_form_partial``); it is swapped for its cached template so
+    each language's partial is also loaded once per process.
+    """
+
+    PARTIAL_CONTEXT_KEY = "order_form_partial"
+
+    def __init__(self):
+        self._font_config: Optional[FontConfiguration] = None
+        self._stylesheets: Dict[str, List[CSS]] = {}
+        self._templates: Dict[str, object] = {}
+
+    @property
+    def font_config(self) -> FontConfiguration:
+        if self._font_config is None:
+            self._font_config = FontConfiguration()
+        return self._font_config
+
+    def stylesheets(self, template_name: str) -> List[CSS]:
+        if template_name not in self._stylesheets:
+            source = _stylesheet_source(template_name)
+            self._stylesheets[template_name] = (
+                [CSS(string=source, font_config=self.font_config)]
+                if source is not None
+                else []
+            )
+        return self._stylesheets[template_name]
+
+    def template(self, template_name: str):
+        if template_name not in self._templates:
+            self._templates[template_name] = get_template(template_name)
+        return self._templates[template_name]
+
+    def render(self, template_name: str, context: dict) -> bytes:
+        partial_name = context.get(self.PARTIAL_CONTEXT_KEY)
+        if isinstance(partial_name, str):
+            context = {**context, self.PARTIAL_CONTEXT_KEY: self.template(partial_name)}
+
+        html = self.template(template_name).render(context)
+        return HTML(string=html).write_pdf(
+            stylesheets=self.stylesheets(template_name),
+            font_config=self.font_config,
+        )
+
+
+_warm_renderer: Optional[WarmWeasyPrintContractPdfRenderer] = None
+
+
+def get_contract_pdf_renderer() -> WarmWeasyPrintContractPdfRenderer:
+    """Per-process warm renderer, built on first use by each worker."""
+    global _warm_renderer
+    if _warm_renderer is None:
+        _warm_renderer = WarmWeasyPrintContractPdfRenderer()
+    return _warm_renderer
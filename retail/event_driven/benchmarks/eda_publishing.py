@@ -0,0 +1,378 @@
+"""Publish throughput benchmark for EDA messages.
+
+Publishes the same ``integrated-feature.topic`` bodies to a stub AMQP
+broker over real sockets, once per mode:
+
+- ``per_message``: a new ``weni.eda`` ``EDAPublisher`` per message,
+  which is what ``IntegratedFeatureEDA`` did before the pool (one new
+  channel per message on the shared class-level connection, no
+  confirms).
+- ``pooled``: ``EDAPublisherPool.publish`` per message; the channel is
+  reused and every message waits for its own broker confirm.
+- ``pooled_batched``: ``EDAPublisherPool.publish_batch`` in batches of
+  ``batch_size``, one confirm wait per batch.
+
+``StubAMQPBroker`` speaks just enough AMQP 0-9-1 for py-amqp publishers
+(connection handshake, channel open/close, ``confirm.select``,
+``basic.publish`` with content frames, ``basic.ack``) and sleeps
+``broker_latency_ms`` before every reply to stand in for the network
+round trip to RabbitMQ. Like RabbitMQ, it confirms every publish read
+so far with one ``multiple`` ack once the client has nothing more in
+flight. Messages are counted, not routed.
+"""
+
+import select
+import socket
+import socketserver
+import struct
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+from amqp import spec
+from amqp.serialization import dumps, loads
+from weni.eda.connection import EDAConnection
+from weni.eda.connection_params import ConnectionParams, ParamsFactory
+from weni.eda.eda_publisher import EDAPublisher
+
+from retail.agents.benchmarks.webhook_pipeline import summarize_latencies
+from retail.event_driven.publisher_pool import EDAMessage, EDAPublisherPool
+
+
+BENCHMARK_EXCHANGE = "integrated-feature.topic"
+FRAME_METHOD, FRAME_HEADER, FRAME_BODY, FRAME_HEARTBEAT = 1, 2, 3, 8
+FRAME_END = b"\xce"
+PROTOCOL_HEADER = b"AMQP\x00\x00\x09\x01"
+
+
+@dataclass
+class EDAPublishingConfig:
+    """Knobs for a single benchmark run."""
+
+    messages: int = 300
+    batch_size: int = 50
+    broker_latency_ms: float = 1.0
+
+
+class StubAMQPBroker:
+    """Local AMQP 0-9-1 endpoint that acknowledges every publish."""
+
+    def __init__(self, latency_ms: float = 0.0, nack_exchanges=()):
+        self.latency_ms = latency_ms
+        self.nack_exchanges = set(nack_exchanges)
+        self.connections_opened = 0
+        self.channels_opened = 0
+        self.messages_received = 0
+        self.bodies: List[bytes] = []
+        self._lock = threading.Lock()
+        self._server = socketserver.ThreadingTCPServer(
+            ("127.0.0.1", 0), self._handler_class()
+        )
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def address(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"{host}:{port}"
+
+    def params_factory(self) -> type:
+        address = self.address
+
+        class StubParamsFactory(ParamsFactory):
+            @classmethod
+            def get_params(cls) -> ConnectionParams:
+                return ConnectionParams(host=address, userid="guest", password="guest")
+
+        return StubParamsFactory
+
+    def __enter__(self) -> "StubAMQPBroker":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+
+    def _count(self, attribute: str) -> None:
+        with self._lock:
+            setattr(self, attribute, getattr(self, attribute) + 1)
+
+    def _handler_class(self):
+        broker = self
+
+        class Handler(socketserver.BaseRequestHandler):
+            def setup(self):
+                self.request.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                self.confirming = set()
+                self.delivery_tags: Dict[int, int] = {}
+                self.publishing: Dict[int, Dict[str, Any]] = {}
+                self.unacked: Dict[int, int] = {}
+
+            def handle(self):
+                if self._read(len(PROTOCOL_HEADER)) != PROTOCOL_HEADER:
+                    return
+                broker._count("connections_opened")
+                self._reply(
+                    0,
+                    spec.Connection.Start,
+                    "ooFSS",
+                    (0, 9, {}, "PLAIN AMQPLAIN", "en_US"),
+                )
+                while True:
+                    frame = self._read_frame()
+                    if frame is None:
+                        return
+                    if not self._on_frame(*frame):
+                        return
+
+            def _on_frame(self, frame_type, channel, payload) -> bool:
+                if frame_type == FRAME_HEARTBEAT:
+                    return True
+                if frame_type == FRAME_HEADER:
+                    (body_size,) = struct.unpack_from(">Q", payload, 4)
+                    self.publishing[channel]["remaining"] = body_size
+                    if body_size == 0:
+                        self._published(channel)
+                    return True
+                if frame_type == FRAME_BODY:
+                    publishing = self.publishing[channel]
+                    publishing["body"] += payload
+                    publishing["remaining"] -= len(payload)
+                    if publishing["remaining"] <= 0:
+                        self._published(channel)
+                    return True
+
+                method = struct.unpack_from(">HH", payload, 0)
+                if method == spec.Connection.StartOk:
+                    self._reply(0, spec.Connection.Tune, "BlB", (2047, 131072, 0))
+                elif method == spec.Connection.Open:
+                    self._reply(0, spec.Connection.OpenOk, "s", ("",))
+                elif method == spec.Channel.Open:
+                    broker._count("channels_opened")
+                    self.delivery_tags[channel] = 0
+                    self._reply(channel, spec.Channel.OpenOk, "s", ("",))
+                elif method == spec.Confirm.Select:
+                    self.confirming.add(channel)
+                    self._reply(channel, spec.Confirm.SelectOk, "", ())
+                elif method == spec.Basic.Publish:
+                    (_, exchange, _), _ = loads("Bss", payload, 4)
+                    self.publishing[channel] = {
+                        "exchange": exchange,
+                        "body": b"",
+                        "remaining": None,
+                    }
+                elif method == spec.Channel.Close:
+                    self.confirming.discard(channel)
+                    self._reply(channel, spec.Channel.CloseOk, "", ())
+                elif method == spec.Connection.Close:
+                    self._reply(0, spec.Connection.CloseOk, "", ())
+                    return False
+                return True
+
+            def _published(self, channel):
+                publishing = self.publishing.pop(channel)
+                with broker._lock:
+                    broker.messages_received += 1
+                    broker.bodies.append(publishing["body"])
+                if channel not in self.confirming:
+                    return
+                self.delivery_tags[channel] += 1
+                if publishing["exchange"] in broker.nack_exchanges:
+                    self._reply(
+                        channel,
+                        spec.Basic.Nack,
+                        "Lb",
+                        (self.delivery_tags[channel], False),
+                    )
+                    return
+                # Like RabbitMQ, confirm everything read so far in one
+                # ``multiple`` ack once the client has nothing more queued.
+                self.unacked[channel] = self.delivery_tags[channel]
+                if not select.select([self.request], [], [], 0)[0]:
+                    self._flush_acks()
+
+            def _flush_acks(self):
+                for channel, delivery_tag in self.unacked.items():
+                    self._reply(channel, spec.Basic.Ack, "Lb", (delivery_tag, True))
+                self.unacked.clear()
+
+            def _reply(self, channel, method, argsig, args):
+                if broker.latency_ms:
+                    time.sleep(broker.latency_ms / 1000.0)
+                body = struct.pack(">HH", *method) + dumps(argsig, args)
+                frame = struct.pack(">BHI", FRAME_METHOD, channel, len(body))
+                self.request.sendall(frame + body + FRAME_END)
+
+            def _read_frame(self):
+                header = self._read(7)
+                if header is None:
+                    return None
+                frame_type, channel, size = struct.unpack(">BHI", header)
+                payload = self._read(size + 1)
+                if payload is None:
+                    return None
+                return frame_type, channel, payload[:-1]
+
+            def _read(self, size):
+                data = b""
+                while len(data) < size:
+                    try:
+                        chunk = self.request.recv(size - len(data))
+                    except OSError:
+                        return None
+                    if not chunk:
+                        return None
+                    data += chunk
+                return data
+
+        return Handler
+
+
+@dataclass
+class ModeResult:
+    call_latencies_ms: List[float] = field(default_factory=list)
+    wall_seconds: float = 0.0
+    messages: int = 0
+    connections_opened: int = 0
+    channels_opened: int = 0
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "per_call_ms": summarize_latencies(self.call_latencies_ms),
+            "wall_seconds": round(self.wall_seconds, 4),
+            "messages": self.messages,
+            "messages_per_second": (
+                round(self.messages / self.wall_seconds, 2)
+                if self.wall_seconds
+                else 0.0
+            ),
+            "connections_opened": self.connections_opened,
+            "channels_opened": self.channels_opened,
+        }
+
+
+@dataclass
+class EDAPublishingReport:
+    config: EDAPublishingConfig
+    modes: Dict[str, ModeResult] = field(default_factory=dict)
+
+    def as_dict(self) -> Dict[str, Any]:
+        modes = {name: result.as_dict() for name, result in self.modes.items()}
+        report = {
+            "benchmark": "eda_publishing",
+            "config": asdict(self.config),
+            "modes": modes,
+        }
+        baseline = modes.get("per_message", {}).get("messages_per_second")
+        if baseline:
+            report["speedup"] = {
+                name: round(mode["messages_per_second"] / baseline, 1)
+                for name, mode in modes.items()
+                if name != "per_message"
+            }
+        return report
+
+
+class EDAPublishingBenchmark:
+    """Runs the three publishing modes against one stub broker."""
+
+    def __init__(self, config: Optional[EDAPublishingConfig] = None):
+        self.config = config or EDAPublishingConfig()
+
+    def messages(self) -> List[EDAMessage]:
+        return [
+            EDAMessage(
+                body={
+                    "project_uuid": f"benchmark-project-{index}",
+                    "feature_uuid": "benchmark-feature",
+                    "action": [],
+                },
+                exchange=BENCHMARK_EXCHANGE,
+            )
+            for index in range(self.config.messages)
+        ]
+
+    def run(self) -> EDAPublishingReport:
+        report = EDAPublishingReport(config=self.config)
+        messages = self.messages()
+        with StubAMQPBroker(latency_ms=self.config.broker_latency_ms) as broker:
+            params_factory = broker.params_factory()
+            try:
+                report.modes["per_message"] = self._run_mode(
+                    broker, self._per_message_calls(messages, params_factory)
+                )
+            finally:
+                if EDAConnection.connection is not None:
+                    EDAConnection.connection.collect()
+                EDAConnection.connection = None
+
+            pool = EDAPublisherPool(params_factory, size=1)
+            try:
+                report.modes["pooled"] = self._run_mode(
+                    broker,
+                    [self._publish_one(pool, message) for message in messages],
+                )
+                report.modes["pooled_batched"] = self._run_mode(
+                    broker, self._batched_calls(pool, messages)
+                )
+            finally:
+                pool.close()
+        return report
+
+    @staticmethod
+    def _per_message_calls(messages, params_factory) -> List[Callable[[], int]]:
+        def call(message: EDAMessage) -> Callable[[], int]:
+            def publish() -> int:
+                EDAPublisher(params_factory).send_message(
+                    body=message.body, exchange=message.exchange
+                )
+                return 1
+
+            return publish
+
+        EDAConnection.connection = None
+        return [call(message) for message in messages]
+
+    @staticmethod
+    def _publish_one(pool: EDAPublisherPool, message: EDAMessage):
+        def publish() -> int:
+            pool.publish(message.body, message.exchange)
+            return 1
+
+        return publish
+
+    def _batched_calls(self, pool: EDAPublisherPool, messages):
+        size = max(1, self.config.batch_size)
+        batches = [messages[start:][:size] for start in range(0, len(messages), size)]
+        return [lambda batch=batch: pool.publish_batch(batch) for batch in batches]
+
+    @staticmethod
+    def _run_mode(broker: StubAMQPBroker, calls: List[Callable[[], int]]) -> ModeResult:
+        result = ModeResult()
+        received_before = broker.messages_received
+        connections_before = broker.connections_opened
+        channels_before = broker.channels_opened
+
+        published = 0
+        started = time.perf_counter()
+        for call in calls:
+            call_started = time.perf_counter()
+            published += call()
+            result.call_latencies_ms.append(
+                (time.perf_counter() - call_started) * 1000.0
+            )
+        result.wall_seconds = time.perf_counter() - started
+
+        # Unconfirmed publishes may still be in flight; wait for them.
+        expected = received_before + published
+        deadline = time.monotonic() + 5
+        while broker.messages_received < expected and time.monotonic() < deadline:
+            time.sleep(0.001)
+
+        result.messages = broker.messages_received - received_before
+        result.connections_opened = broker.connections_opened - connections_before
+        result.channels_opened = broker.channels_opened - channels_before
+        return result
@@ -0,0 +1,232 @@
+"""Per-process pool of long-lived EDA publishers.
+
+``weni.eda``'s ``EDAPublisher`` reuses one class-level AMQP connection
+but opens a new channel for every message and never closes it, and its
+messages are fire-and-forget. ``EDAPublisherPool`` keeps up to
+``EDA_PUBLISHER_POOL_SIZE`` publishers per process, each one its own
+connection with a single channel in publisher-confirm mode:
+
+- ``publish_batch`` writes every message of the batch and then waits
+  once for the broker to confirm them all (a nack raises
+  ``MessageNacked``); ``publish`` is a batch of one.
+- Connections are opened lazily on first use. A publisher whose
+  connection fails is discarded and the unconfirmed part of the batch
+  is retried once on a fresh connection, so delivery is at least once.
+- A publisher is used by one thread at a time; threads beyond the pool
+  size wait for a free one. The pool is rebuilt after a fork so a
+  connection is never shared between processes.
+"""
+
+import json
+import logging
+import os
+import queue
+import threading
+from dataclasses import dataclass
+from typing import Iterable, List, Optional, Sequence
+
+import amqp
+from amqp.exceptions import MessageNacked
+from django.conf import settings
+from weni.eda.connection_params import ParamsFactory
+from weni.eda.django.connection_params import ConnectionParamsFactory
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_POOL_SIZE = 2
+DEFAULT_CONFIRM_TIMEOUT_SECONDS = 10
+
+
+@dataclass(frozen=True)
+class EDAMessage:
+    body: dict
+    exchange: str
+    routing_key: str = ""
+
+
+class _PooledPublisher:
+    """One AMQP connection and its confirm-mode channel."""
+
+    def __init__(self, connection: amqp.Connection):
+        self.connection = connection
+        self.channel = connection.channel()
+        self.channel.confirm_select()
+        self._published_tag = 0
+        self._confirmed_tag = 0
+        self._nacked = False
+        self.channel.events["basic_ack"].add(self._on_ack)
+        self.channel.events["basic_nack"].add(self._on_nack)
+
+    def _on_ack(self, delivery_tag: int, multiple: bool) -> None:
+        self._confirmed_tag = max(self._confirmed_tag, delivery_tag)
+
+    def _on_nack(self, delivery_tag: int, multiple: bool) -> None:
+        self._nacked = True
+        self._confirmed_tag = max(self._confirmed_tag, delivery_tag)
+
+    @property
+    def usable(self) -> bool:
+        return bool(self.connection.connected and self.channel.is_open)
+
+    def publish(
+        self,
+        messages: Sequence[EDAMessage],
+        confirm_timeout: float,
+        on_confirmed=None,
+    ) -> None:
+        """Publish ``messages`` and block until the broker confirms them.
+
+        ``on_confirmed`` is told how many leading messages of the batch
+        were confirmed before a failure, so a retry can skip them.
+        """
+        first_tag = self._published_tag + 1
+        self._nacked = False
+        try:
+            for message in messages:
+                self.channel.basic_publish(
+                    amqp.Message(json.dumps(message.body).encode()),
+                    exchange=message.exchange,
+                    routing_key=message.routing_key,
+                )
+                self._published_tag += 1
+            while self._confirmed_tag < self._published_tag:
+                self.connection.drain_events(timeout=confirm_timeout)
+        finally:
+            if on_confirmed is not None:
+                on_confirmed(max(0, self._confirmed_tag - first_tag + 1))
+        if self._nacked:
+            raise MessageNacked("Broker rejected at least one message of the batch")
+
+    def close(self) -> None:
+        try:
+            self.connection.close()
+        except Exception:
+            self.connection.collect()
+
+
+class EDAPublisherPool:
+    def __init__(
+        self,
+        connection_params_factory: ParamsFactory = ConnectionParamsFactory,
+        size: Optional[int] = None,
+        confirm_timeout: Optional[float] = None,
+    ):
+        self.connection_params_factory = connection_params_factory
+        self.size = max(
+            1,
+            size or getattr(settings, "EDA_PUBLISHER_POOL_SIZE", DEFAULT_POOL_SIZE),
+        )
+        self.confirm_timeout = confirm_timeout or getattr(
+            settings,
+            "EDA_PUBLISHER_CONFIRM_TIMEOUT_SECONDS",
+            DEFAULT_CONFIRM_TIMEOUT_SECONDS,
+        )
+        self._idle: "queue.LifoQueue[_PooledPublisher]" = queue.LifoQueue()
+        self._created = 0
+        self._lock = threading.Lock()
+
+    def publish(self, body: dict, exchange: str, routing_key: str = "") -> None:
+        self.publish_batch([EDAMessage(body, exchange, routing_key)])
+
+    def publish_batch(self, messages: Iterable[EDAMessage]) -> int:
+        """Publish ``messages`` with a single confirm wait; returns the count."""
+        pending: List[EDAMessage] = list(messages)
+        if not pending:
+            return 0
+
+        total = len(pending)
+        for attempt in range(2):
+            publisher = self._acquire()
+            confirmed = 0
+
+            def record(count: int) -> None:
+                nonlocal confirmed
+                confirmed = count
+
+            try:
+                publisher.publish(pending, self.confirm_timeout, on_confirmed=record)
+            except MessageNacked:
+                self._release(publisher)
+                raise
+            except Exception as exc:
+                self._discard(publisher)
+                pending = pending[confirmed:]
+                if attempt:
+                    raise
+                logger.warning(
+                    f"[EDA_PUBLISHER] Publish failed, reconnecting and retrying "
+                    f"{len(pending)} unconfirmed message(s): {exc}"
+                )
+                continue
+            self._release(publisher)
+            return total
+
+    def close(self) -> None:
+        """Close every idle publisher (e.g. on worker shutdown)."""
+        while True:
+            try:
+                publisher = self._idle.get_nowait()
+            except queue.Empty:
+                return
+            self._discard(publisher)
+
+    def _acquire(self) -> _PooledPublisher:
+        while True:
+            try:
+                publisher = self._idle.get_nowait()
+            except queue.Empty:
+                with self._lock:
+                    can_create = self._created < self.size
+                    if can_create:
+                        self._created += 1
+                if can_create:
+                    try:
+                        return self._connect()
+                    except Exception:
+                        with self._lock:
+                            self._created -= 1
+                        raise
+                publisher = self._idle.get()
+
+            if publisher.usable:
+                return publisher
+            self._discard(publisher)
+
+    def _release(self, publisher: _PooledPublisher) -> None:
+        self._idle.put(publisher)
+
+    def _discard(self, publisher: _PooledPublisher) -> None:
+        with self._lock:
+            self._created -= 1
+        publisher.close()
+
+    def _connect(self) -> _PooledPublisher:
+        params = self.connection_params_factory.get_params().value
+        host = params.pop("host")
+        port = params.pop("port", None)
+        if port and ":" not in host:
+            # py-amqp ignores a ``port`` keyword; it only reads host:port.
+            host = f"{host}:{port}"
+        connection = amqp.Connection(host=host, **params)
+        connection.connect()
+        try:
+            return _PooledPublisher(connection)
+        except Exception:
+            connection.collect()
+            raise
+
+
+_pool: Optional[EDAPublisherPool] = None
+_pool_pid: Optional[int] = None
+_pool_lock = threading.Lock()
+
+
+def get_eda_publisher_pool() -> EDAPublisherPool:
+    """Process-wide pool, rebuilt in a forked child before first use."""
+    global _pool, _pool_pid
+    with _pool_lock:
+        if _pool is None or _pool_pid != os.getpid():
+            _pool = EDAPublisherPool()
+            _pool_pid = os.getpid()
+        return _pool
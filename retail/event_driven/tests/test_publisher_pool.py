@@ -0,0 +1,113 @@
+import json
+import socket
+from unittest.mock import patch
+
+from amqp.exceptions import MessageNacked
+from django.test import SimpleTestCase
+
+from retail.event_driven import publisher_pool
+from retail.event_driven.benchmarks.eda_publishing import (
+    EDAPublishingBenchmark,
+    EDAPublishingConfig,
+    StubAMQPBroker,
+)
+from retail.event_driven.publisher_pool import (
+    EDAMessage,
+    EDAPublisherPool,
+    get_eda_publisher_pool,
+)
+from retail.features.integrated_feature_eda import IntegratedFeatureEDA
+
+
+class EDAPublisherPoolTests(SimpleTestCase):
+    def setUp(self):
+        self.broker = StubAMQPBroker().__enter__()
+        self.addCleanup(self.broker.__exit__)
+        self.pool = EDAPublisherPool(self.broker.params_factory(), size=2)
+        self.addCleanup(self.pool.close)
+
+    def _received(self):
+        return [json.loads(body) for body in self.broker.bodies]
+
+    def test_publishes_reuse_one_connection_and_channel(self):
+        for index in range(5):
+            self.pool.publish({"index": index}, "integrated-feature.topic")
+
+        self.assertEqual(self._received(), [{"index": i} for i in range(5)])
+        self.assertEqual(self.broker.connections_opened, 1)
+        self.assertEqual(self.broker.channels_opened, 1)
+
+    def test_batch_is_confirmed_as_a_whole(self):
+        sent = self.pool.publish_batch(
+            EDAMessage({"index": index}, "integrated-feature.topic")
+            for index in range(20)
+        )
+
+        self.assertEqual(sent, 20)
+        self.assertEqual(self.broker.messages_received, 20)
+
+    def test_nack_raises_and_keeps_the_publisher(self):
+        self.broker.nack_exchanges.add("rejecting.topic")
+
+        with self.assertRaises(MessageNacked):
+            self.pool.publish({"index": 0}, "rejecting.topic")
+        self.pool.publish({"index": 1}, "integrated-feature.topic")
+
+        self.assertEqual(self.broker.connections_opened, 1)
+
+    def test_reconnects_and_retries_after_a_dropped_connection(self):
+        self.pool.publish({"index": 0}, "integrated-feature.topic")
+        publisher = self.pool._idle.queue[-1]
+        publisher.connection.transport.sock.shutdown(socket.SHUT_RDWR)
+
+        with self.assertLogs("retail.event_driven.publisher_pool", "WARNING"):
+            self.pool.publish({"index": 1}, "integrated-feature.topic")
+
+        self.assertEqual(self.broker.connections_opened, 2)
+        self.assertEqual(self._received(), [{"index": 0}, {"index": 1}])
+
+    def test_connection_failure_propagates(self):
+        self.broker.__exit__()
+        pool = EDAPublisherPool(self.broker.params_factory(), size=1)
+
+        with self.assertRaises(OSError):
+            pool.publish({"index": 0}, "integrated-feature.topic")
+        self.assertEqual(pool._created, 0)
+
+
+class GetEDAPublisherPoolTests(SimpleTestCase):
+    def test_pool_is_shared_per_process_and_rebuilt_after_fork(self):
+        with patch.object(publisher_pool, "_pool", None):
+            pool = get_eda_publisher_pool()
+            self.assertIs(get_eda_publisher_pool(), pool)
+
+            with patch.object(publisher_pool.os, "getpid", return_value=-1):
+                self.assertIsNot(get_eda_publisher_pool(), pool)
+
+    @patch("retail.features.integrated_feature_eda.get_eda_publisher_pool")
+    def test_integrated_feature_eda_publishes_through_the_pool(self, mock_get_pool):
+        IntegratedFeatureEDA().publisher(
+            body={"a": 1}, exchange="removed-feature.topic"
+        )
+
+        mock_get_pool.return_value.publish.assert_called_once_with(
+            body={"a": 1}, exchange="removed-feature.topic"
+        )
+
+
+class EDAPublishingBenchmarkTests(SimpleTestCase):
+    def test_every_mode_delivers_every_message(self):
+        report = (
+            EDAPublishingBenchmark(
+                EDAPublishingConfig(messages=12, batch_size=5, broker_latency_ms=0)
+            )
+            .run()
+            .as_dict()
+        )
+
+        modes = report["modes"]
+        self.assertEqual({mode["messages"] for mode in modes.values()}, {12})
+        self.assertEqual(modes["per_message"]["channels_opened"], 12)
+        self.assertEqual(modes["pooled"]["channels_opened"], 1)
+        self.assertEqual(modes["pooled_batched"]["per_call_ms"]["count"], 3)
+        self.assertIn("pooled_batched", report["speedup"])
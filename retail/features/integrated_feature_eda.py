@@ -1,9 +1,7 @@
-from weni.eda.eda_publisher import EDAPublisher
-from weni.eda.django.connection_params import ConnectionParamsFactory
+from retail.event_driven.publisher_pool import get_eda_publisher_pool
 
 
 class IntegratedFeatureEDA:
 
     def publisher(self, body: dict, exchange: str):
-        publisher = EDAPublisher(ConnectionParamsFactory)
-        publisher.send_message(exchange=exchange, body=body)
+        get_eda_publisher_pool().publish(body=body, exchange=exchange)
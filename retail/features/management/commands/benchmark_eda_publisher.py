@@ -0,0 +1,58 @@
+"""Compare per-message and pooled EDA publish throughput.
+
+Usage::
+
+    python manage.py benchmark_eda_publisher --messages 2000 \\
+        --batch-size 100 --broker-latency-ms 1 --output eda.json
+
+A stub AMQP broker is started on localhost; no RabbitMQ is touched.
+See ``retail.event_driven.benchmarks.eda_publishing`` for what is
+measured.
+"""
+
+import json
+
+from django.core.management.base import BaseCommand
+
+from retail.event_driven.benchmarks.eda_publishing import (
+    EDAPublishingBenchmark,
+    EDAPublishingConfig,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark EDA messages per second with a publisher per message versus "
+        "the pooled confirm-mode publisher and emit a JSON report."
+    )
+
+    def add_arguments(self, parser):
+        defaults = EDAPublishingConfig()
+        parser.add_argument("--messages", type=int, default=defaults.messages)
+        parser.add_argument("--batch-size", type=int, default=defaults.batch_size)
+        parser.add_argument(
+            "--broker-latency-ms",
+            type=float,
+            default=defaults.broker_latency_ms,
+            help="Time the stub broker waits before each reply.",
+        )
+        parser.add_argument(
+            "--output",
+            help="Write the JSON report to this path instead of stdout.",
+        )
+
+    def handle(self, *args, **options):
+        config = EDAPublishingConfig(
+            messages=options["messages"],
+            batch_size=options["batch_size"],
+            broker_latency_ms=options["broker_latency_ms"],
+        )
+        report = EDAPublishingBenchmark(config).run().as_dict()
+        rendered = json.dumps(report, indent=2, sort_keys=True)
+
+        if options["output"]:
+            with open(options["output"], "w") as fp:
+                fp.write(rendered + "\n")
+            self.stdout.write(f"Benchmark report written to {options['output']}")
+        else:
+            self.stdout.write(rendered)
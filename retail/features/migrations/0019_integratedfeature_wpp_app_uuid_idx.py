@@ -0,0 +1,29 @@
+# Concurrent expression index on config->>'wpp_cloud_app_uuid' so
+# production deploys do not block writes on the IntegratedFeature table.
+#
+# atomic=False is required: CREATE INDEX CONCURRENTLY cannot run inside
+# a transaction.
+
+import django.db.models.fields.json
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ("features", "0018_feature_code"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="integratedfeature",
+            index=models.Index(
+                django.db.models.fields.json.KeyTextTransform(
+                    "wpp_cloud_app_uuid", "config"
+                ),
+                name="intfeature_wpp_app_uuid_idx",
+            ),
+        ),
+    ]
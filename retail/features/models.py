@@ -1,6 +1,7 @@
 import uuid
 
 from django.db import models
+from django.db.models.fields.json import KeyTextTransform
 from django.contrib.auth.models import User
 from django.conf import settings
 
@@ -149,6 +150,17 @@ class IntegratedFeature(models.Model):
     created_by_vtex = models.BooleanField(default=False)
     config = models.JSONField(default=dict)
 
+    class Meta:
+        indexes = [
+            # Expression index used by the template status webhook
+            # (``TemplateStatusUpdateUseCase``), which looks features up
+            # by ``config->>'wpp_cloud_app_uuid'``.
+            models.Index(
+                KeyTextTransform("wpp_cloud_app_uuid", "config"),
+                name="intfeature_wpp_app_uuid_idx",
+            ),
+        ]
+
     # def save(self, *args) -> None:
     # self.feature = self.feature_version.feature
     # return super().save(*args)
@@ -32,6 +32,28 @@ class S3ServiceInterface(Protocol):
         """
         pass
 
+    def open_multipart_upload(
+        self,
+        key: str,
+        content_type: str = "application/octet-stream",
+        content_encoding: Optional[str] = None,
+    ) -> BinaryIO:
+        """Starts a multipart upload and returns a writable binary stream.
+
+        Bytes written to the stream are uploaded in parts as they fill,
+        so only one part is held in memory. Closing the stream completes
+        the upload; leaving its ``with`` block with an exception aborts it.
+
+        Args:
+            key: The S3 object key.
+            content_type: The MIME type of the content.
+            content_encoding: Optional ``Content-Encoding`` (e.g. ``gzip``).
+
+        Returns:
+            The writable stream for the upload.
+        """
+        pass
+
     def generate_presigned_url(self, key: str, expiration: int = 3600) -> str:
         """Generates a presigned URL for accessing a private S3 object."""
         pass
@@ -12,6 +12,11 @@ class MetaServiceInterface(Protocol):
     ) -> Optional[Dict[str, Any]]:
         ...
 
+    def refresh_library_template(
+        self, template_name: str, language: str
+    ) -> Optional[Dict[str, Any]]:
+        ...
+
     def create_flow(
         self,
         waba_id: str,
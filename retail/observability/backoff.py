@@ -0,0 +1,44 @@
+"""Outage backoff for optional backends (Redis, the Django cache).
+
+Callers that can work without a backend (a cache, a pre-filter, the
+circuit breaker state) should not pay a connection timeout on every
+call while it is down. A ``BackoffGate`` is tripped by the first
+failure and keeps the backend skipped for ``retry_seconds``; the next
+call after that tries it again. Only the first failure of an outage is
+logged, on the caller's logger.
+"""
+
+import logging
+import time
+
+
+DEFAULT_RETRY_SECONDS = 30
+
+
+class BackoffGate:
+    """Skips a backend for ``retry_seconds`` after it failed."""
+
+    def __init__(
+        self,
+        logger: logging.Logger,
+        message: str,
+        retry_seconds: float = DEFAULT_RETRY_SECONDS,
+    ):
+        self.logger = logger
+        self.message = message
+        self.retry_seconds = retry_seconds
+        self._down_until = 0.0
+
+    @property
+    def available(self) -> bool:
+        return time.monotonic() >= self._down_until
+
+    def trip(self, exc: Exception) -> None:
+        """Skip the backend for ``retry_seconds`` from now."""
+        already_down = not self.available
+        self._down_until = time.monotonic() + self.retry_seconds
+        if not already_down:
+            self.logger.warning(f"{self.message} for {self.retry_seconds}s: {exc}")
+
+    def reset(self) -> None:
+        self._down_until = 0.0
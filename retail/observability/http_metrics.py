@@ -0,0 +1,136 @@
+"""Outbound HTTP metrics for ``RequestClient``.
+
+Every ``RequestClient.make_request`` call is sent to StatsD (see
+``retail.observability.statsd``) tagged with ``client``, ``method``,
+``host``, ``route`` and ``status`` (``"error"`` when no response came
+back):
+
+- ``http.client.duration_ms`` timer;
+- ``http.client.requests`` counter;
+- ``http.client.request_bytes`` and ``http.client.response_bytes``
+  histograms.
+
+StatsD aggregates across every gunicorn worker and Celery process, the
+same sink the per-task metrics use, so there is no per-process registry
+to scrape.
+
+Cardinality is kept bounded by templating both parts of the URL:
+dynamic path segments (UUIDs, numeric and VTEX order ids, hashes and
+other long tokens) become placeholders, and the per-store label of
+multi-tenant hosts (``HTTP_METRICS_TENANT_HOST_SUFFIXES``, e.g.
+``{account}.vtexcommercestable.com.br``) is collapsed. The query
+string is never part of the route.
+"""
+
+import logging
+import re
+from typing import Optional
+from urllib.parse import urlparse
+
+from django.conf import settings
+
+from retail.observability.statsd import get_statsd_client
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TENANT_HOST_SUFFIXES = (
+    "vtexcommercestable.com.br",
+    "vtexpayments.com.br",
+    "myvtex.com",
+)
+MAX_ROUTE_SEGMENTS = 8
+
+_UUID_SEGMENT = re.compile(
+    r"^[0-9a-f]{8}-?[0-9a-f]{4}-?[0-9a-f]{4}-?[0-9a-f]{4}-?[0-9a-f]{12}$",
+    re.IGNORECASE,
+)
+_NUMERIC_SEGMENT = re.compile(r"^\d+(?:-\d+)*$")
+_HEX_SEGMENT = re.compile(r"^[0-9a-f]{16,}$", re.IGNORECASE)
+_TOKEN_MIN_LENGTH = 16
+
+
+def template_segment(segment: str) -> str:
+    if _UUID_SEGMENT.match(segment):
+        return "{uuid}"
+    if _NUMERIC_SEGMENT.match(segment):
+        return "{id}"
+    if _HEX_SEGMENT.match(segment):
+        return "{hash}"
+    if len(segment) >= _TOKEN_MIN_LENGTH and any(char.isdigit() for char in segment):
+        return "{token}"
+    return segment
+
+
+def template_route(path: str) -> str:
+    """Collapse the dynamic segments of ``path`` into placeholders.
+
+    ``/api/oms/pvt/orders/1234567890-01`` → ``/api/oms/pvt/orders/{id}``.
+    Paths deeper than ``MAX_ROUTE_SEGMENTS`` are truncated with ``/...``.
+    """
+    segments = [segment for segment in path.split("/") if segment]
+    if not segments:
+        return "/"
+    templated = [template_segment(segment) for segment in segments]
+    route = "/" + "/".join(templated[:MAX_ROUTE_SEGMENTS])
+    if len(templated) > MAX_ROUTE_SEGMENTS:
+        route += "/..."
+    return route
+
+
+def template_host(host: str) -> str:
+    """Replace the tenant label of multi-tenant hosts with ``{account}``."""
+    suffixes = getattr(
+        settings, "HTTP_METRICS_TENANT_HOST_SUFFIXES", DEFAULT_TENANT_HOST_SUFFIXES
+    )
+    for suffix in suffixes:
+        if host.endswith(f".{suffix}"):
+            return f"{{account}}.{suffix}"
+    return host
+
+
+def _body_size(body) -> Optional[int]:
+    if body is None:
+        return 0
+    if isinstance(body, (bytes, bytearray, str)):
+        return len(body)
+    # Streamed/generator bodies have no cheap size.
+    return None
+
+
+def observe_http_request(
+    client: str,
+    method: str,
+    url: str,
+    elapsed_seconds: float,
+    response=None,
+) -> None:
+    """Record one outbound request. ``response`` is ``None`` on failure.
+
+    Never raises: instrumentation must not break the request path.
+    """
+    try:
+        statsd = get_statsd_client()
+        if not statsd.enabled:
+            return
+        parsed = urlparse(url)
+        tags = {
+            "client": client,
+            "method": method.upper(),
+            "host": template_host(parsed.hostname or "unknown"),
+            "route": template_route(parsed.path),
+            "status": str(response.status_code) if response is not None else "error",
+        }
+        metrics = [
+            ("http.client.duration_ms", elapsed_seconds * 1000.0, "ms", tags),
+            ("http.client.requests", 1, "c", tags),
+        ]
+        if response is not None:
+            request_size = _body_size(getattr(response.request, "body", None))
+            if request_size is not None:
+                metrics.append(("http.client.request_bytes", request_size, "h", tags))
+            response_size = len(response.content or b"")
+            metrics.append(("http.client.response_bytes", response_size, "h", tags))
+        statsd.send(metrics)
+    except Exception:
+        logger.debug("[HTTP_METRICS] Failed to record request metrics", exc_info=True)
@@ -0,0 +1,91 @@
+"""Fire-and-forget StatsD emitter.
+
+Lines use the DogStatsD tag extension (``name:value|type|#k:v``) so a
+``statsd_exporter`` sidecar can map them straight onto labelled
+Prometheus series. Everything is sent over UDP in a single datagram
+per call and send errors are swallowed: metrics must never fail or
+slow down the code they observe.
+"""
+
+import logging
+import socket
+from typing import Iterable, Mapping, Optional, Tuple
+
+from django.conf import settings
+
+
+logger = logging.getLogger(__name__)
+
+# (name, value, type, tags)
+StatsdMetric = Tuple[str, float, str, Mapping[str, str]]
+
+_MAX_DATAGRAM_BYTES = 1432
+
+
+def _sanitize_tag(value: str) -> str:
+    return str(value).replace(",", "_").replace("|", "_").replace("#", "_")
+
+
+def format_metric(prefix: str, metric: StatsdMetric) -> str:
+    name, value, metric_type, tags = metric
+    full_name = f"{prefix}.{name}" if prefix else name
+    line = f"{full_name}:{value:g}|{metric_type}"
+    if tags:
+        rendered = ",".join(f"{key}:{_sanitize_tag(val)}" for key, val in tags.items())
+        line = f"{line}|#{rendered}"
+    return line
+
+
+class StatsdClient:
+    """Minimal UDP StatsD client configured from ``STATSD_*`` settings."""
+
+    def __init__(
+        self,
+        host: Optional[str] = None,
+        port: Optional[int] = None,
+        prefix: Optional[str] = None,
+    ):
+        self.host = host if host is not None else getattr(settings, "STATSD_HOST", "")
+        self.port = port or getattr(settings, "STATSD_PORT", 8125)
+        self.prefix = (
+            prefix if prefix is not None else getattr(settings, "STATSD_PREFIX", "")
+        )
+        self._socket: Optional[socket.socket] = None
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.host)
+
+    def send(self, metrics: Iterable[StatsdMetric]) -> None:
+        """Send ``metrics``, packing as many lines per datagram as fit."""
+        if not self.enabled:
+            return
+
+        packet = ""
+        for metric in metrics:
+            line = format_metric(self.prefix, metric)
+            if packet and len(packet) + len(line) + 1 > _MAX_DATAGRAM_BYTES:
+                self._sendto(packet)
+                packet = ""
+            packet = f"{packet}\n{line}" if packet else line
+        if packet:
+            self._sendto(packet)
+
+    def _sendto(self, packet: str) -> None:
+        try:
+            if self._socket is None:
+                self._socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            self._socket.sendto(packet.encode("utf-8"), (self.host, self.port))
+        except OSError as exc:
+            logger.debug(f"[STATSD] Failed to send metrics: {exc}")
+
+
+_shared_client: Optional[StatsdClient] = None
+
+
+def get_statsd_client() -> StatsdClient:
+    """Process-wide client, created on first use from settings."""
+    global _shared_client
+    if _shared_client is None:
+        _shared_client = StatsdClient()
+    return _shared_client
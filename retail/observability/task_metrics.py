@@ -0,0 +1,282 @@
+"""Per-task resource accounting for Celery tasks.
+
+``task_prerun`` opens a ``TaskResourceUsage`` for the running task
+and ``task_postrun`` closes it. In between, cheap hooks add to the
+open usage:
+
+- DB queries and time, via a ``connection.execute_wrappers`` hook;
+- Redis commands, via a wrapper around redis-py ``execute_command``
+  (plain and pipelined);
+- outbound HTTP calls and latency per host, reported by
+  ``RequestClient.make_request`` through ``record_http_call``;
+- Lambda invocations and latency, reported by ``AwsLambdaClient``
+  through ``record_lambda_invoke``.
+
+Every hook is a no-op when no task is being accounted, so web
+requests and management commands pay nothing beyond a contextvar
+lookup.
+
+On close the usage is sent to StatsD (``STATSD_HOST``), logged with a
+full breakdown when the task ran longer than
+``TASK_METRICS_SLOW_TASK_MS`` and, with
+``TASK_METRICS_ATTACH_TO_EXECUTION``, appended as a ``task_resources``
+trace to the AgentExecution the task opened. That is what tells a
+slow ``task_abandoned_cart_update`` spending its time in VTEX IO apart
+from one waiting on Postgres or the Lambda.
+"""
+
+import logging
+import threading
+import time
+from contextvars import ContextVar, Token
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from django.conf import settings
+from django.db import connection
+
+from retail.observability.statsd import StatsdMetric, get_statsd_client
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class HostUsage:
+    """Outbound HTTP activity against a single host."""
+
+    calls: int = 0
+    errors: int = 0
+    time_ms: float = 0.0
+
+
+@dataclass
+class TaskResourceUsage:
+    """Resources consumed by a single task run."""
+
+    task_name: str
+    wall_ms: float = 0.0
+    db_queries: int = 0
+    db_time_ms: float = 0.0
+    redis_commands: int = 0
+    http: Dict[str, HostUsage] = field(default_factory=dict)
+    lambda_invocations: int = 0
+    lambda_time_ms: float = 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "task_name": self.task_name,
+            "wall_ms": round(self.wall_ms, 3),
+            "db_queries": self.db_queries,
+            "db_time_ms": round(self.db_time_ms, 3),
+            "redis_commands": self.redis_commands,
+            "http": {
+                host: {
+                    "calls": usage.calls,
+                    "errors": usage.errors,
+                    "time_ms": round(usage.time_ms, 3),
+                }
+                for host, usage in self.http.items()
+            },
+            "lambda_invocations": self.lambda_invocations,
+            "lambda_time_ms": round(self.lambda_time_ms, 3),
+        }
+
+    def to_statsd_metrics(self) -> List[StatsdMetric]:
+        tags = {"task": self.task_name}
+        metrics: List[StatsdMetric] = [
+            ("task.duration_ms", self.wall_ms, "ms", tags),
+            ("task.db.queries", self.db_queries, "c", tags),
+            ("task.db.time_ms", self.db_time_ms, "ms", tags),
+            ("task.redis.commands", self.redis_commands, "c", tags),
+        ]
+        for host, usage in self.http.items():
+            host_tags = {**tags, "host": host}
+            metrics.append(("task.http.calls", usage.calls, "c", host_tags))
+            metrics.append(("task.http.errors", usage.errors, "c", host_tags))
+            metrics.append(("task.http.time_ms", usage.time_ms, "ms", host_tags))
+        if self.lambda_invocations:
+            metrics.append(
+                ("task.lambda.invocations", self.lambda_invocations, "c", tags)
+            )
+            metrics.append(("task.lambda.time_ms", self.lambda_time_ms, "ms", tags))
+        return metrics
+
+
+_current_usage: ContextVar[Optional[TaskResourceUsage]] = ContextVar(
+    "current_task_resource_usage", default=None
+)
+
+# task_id -> (contextvar token, usage, perf_counter at start). Keyed by
+# task id so eagerly-applied tasks nested inside another task restore
+# the outer usage when they finish.
+_open_tasks: Dict[str, Tuple[Token, TaskResourceUsage, float]] = {}
+
+
+# Thread pools run their work in a copy of the submitting context, so
+# several threads can report HTTP calls into the same usage at once.
+_http_lock = threading.Lock()
+
+
+def get_current_usage() -> Optional[TaskResourceUsage]:
+    """Usage of the task currently being accounted, if any."""
+    return _current_usage.get()
+
+
+def record_http_call(host: str, elapsed_ms: float, failed: bool = False) -> None:
+    """Add one outbound HTTP call to the current task's usage."""
+    usage = _current_usage.get()
+    if usage is None:
+        return
+    with _http_lock:
+        host_usage = usage.http.setdefault(host or "unknown", HostUsage())
+        host_usage.calls += 1
+        host_usage.time_ms += elapsed_ms
+        if failed:
+            host_usage.errors += 1
+
+
+def record_lambda_invoke(elapsed_ms: float) -> None:
+    """Add one Lambda invocation to the current task's usage."""
+    usage = _current_usage.get()
+    if usage is None:
+        return
+    usage.lambda_invocations += 1
+    usage.lambda_time_ms += elapsed_ms
+
+
+def _count_db_query(execute, sql, params, many, context):
+    usage = _current_usage.get()
+    if usage is None:
+        return execute(sql, params, many, context)
+    started = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        usage.db_queries += 1
+        usage.db_time_ms += (time.perf_counter() - started) * 1000.0
+
+
+def _install_db_instrumentation() -> None:
+    # ``execute_wrappers`` lives on the per-thread connection wrapper
+    # and survives reconnects, so this only appends once per thread.
+    if _count_db_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(_count_db_query)
+
+
+def _install_redis_instrumentation() -> None:
+    from redis.client import Pipeline, Redis
+
+    # Checked on the class itself rather than with a module flag so
+    # the wrapper is put back if something else swapped the method.
+    for cls in (Redis, Pipeline):
+        original = cls.__dict__["execute_command"]
+        if getattr(original, "_counts_task_redis_commands", False):
+            continue
+        cls.execute_command = _counting_execute_command(original)
+
+
+def _counting_execute_command(original):
+    def execute_command(self, *args, **kwargs):
+        usage = _current_usage.get()
+        if usage is not None:
+            usage.redis_commands += 1
+        return original(self, *args, **kwargs)
+
+    execute_command.__wrapped__ = original
+    execute_command._counts_task_redis_commands = True
+    return execute_command
+
+
+def start_task_accounting(task_id: str, task_name: str) -> None:
+    """Open a usage record for ``task_id`` and make it current."""
+    if not getattr(settings, "TASK_METRICS_ENABLED", True):
+        return
+    _install_db_instrumentation()
+    _install_redis_instrumentation()
+    usage = TaskResourceUsage(task_name=task_name)
+    token = _current_usage.set(usage)
+    _open_tasks[task_id] = (token, usage, time.perf_counter())
+
+
+def finish_task_accounting(task_id: str) -> Optional[TaskResourceUsage]:
+    """Close the usage record for ``task_id`` and report it."""
+    entry = _open_tasks.pop(task_id, None)
+    if entry is None:
+        return None
+    token, usage, started = entry
+    usage.wall_ms = (time.perf_counter() - started) * 1000.0
+    try:
+        _current_usage.reset(token)
+    except ValueError:
+        # Token created in another context (should not happen with
+        # Celery's synchronous signals); just drop the current usage.
+        _current_usage.set(None)
+
+    _report(usage)
+    return usage
+
+
+def _report(usage: TaskResourceUsage) -> None:
+    try:
+        get_statsd_client().send(usage.to_statsd_metrics())
+    except Exception:
+        logger.exception("[TASK_METRICS] Failed to emit StatsD metrics")
+
+    slow_task_ms = getattr(settings, "TASK_METRICS_SLOW_TASK_MS", 5000)
+    if usage.wall_ms >= slow_task_ms:
+        logger.warning(
+            f"[TASK_METRICS] Slow task {usage.task_name} took "
+            f"{usage.wall_ms:.0f}ms: {usage.as_dict()}"
+        )
+
+    if getattr(settings, "TASK_METRICS_ATTACH_TO_EXECUTION", False):
+        _attach_to_execution(usage)
+
+
+def _attach_to_execution(usage: TaskResourceUsage) -> None:
+    from retail.agents.domains.agent_execution.context import (
+        get_current_execution_uuid,
+    )
+
+    execution_uuid = get_current_execution_uuid()
+    if execution_uuid is None:
+        return
+    if not getattr(settings, "AGENT_EXECUTION_LOGGING_ENABLED", True):
+        return
+
+    from retail.agents.domains.agent_execution.services.buffer import (
+        ExecutionBufferService,
+    )
+    from retail.agents.domains.agent_execution.types import ExecutionTraceType
+
+    ExecutionBufferService().add_trace(
+        execution_uuid,
+        ExecutionTraceType.TASK_RESOURCES.value,
+        usage.as_dict(),
+    )
+
+
+def on_task_prerun(task_id=None, task=None, **_kwargs) -> None:
+    """``task_prerun`` receiver."""
+    if task_id is None:
+        return
+    try:
+        start_task_accounting(task_id, getattr(task, "name", None) or "unknown")
+    except Exception:
+        logger.exception("[TASK_METRICS] Failed to start task accounting")
+
+
+def on_task_postrun(task_id=None, **_kwargs) -> None:
+    """``task_postrun`` receiver.
+
+    Must be connected before ``_reset_execution_context`` so the
+    execution UUID is still available for
+    ``TASK_METRICS_ATTACH_TO_EXECUTION``.
+    """
+    if task_id is None:
+        return
+    try:
+        finish_task_accounting(task_id)
+    except Exception:
+        logger.exception("[TASK_METRICS] Failed to finish task accounting")
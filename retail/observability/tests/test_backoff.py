@@ -0,0 +1,48 @@
+import logging
+from unittest.mock import patch
+
+from django.test import SimpleTestCase
+
+from retail.observability.backoff import BackoffGate
+
+
+logger = logging.getLogger("retail.observability.tests.backoff")
+
+
+class BackoffGateTest(SimpleTestCase):
+    def setUp(self):
+        self.gate = BackoffGate(logger, "[TEST] Backend unavailable", retry_seconds=30)
+
+    def test_is_available_until_tripped(self):
+        self.assertTrue(self.gate.available)
+
+    @patch("retail.observability.backoff.time.monotonic")
+    def test_skips_the_backend_for_retry_seconds(self, monotonic):
+        monotonic.return_value = 100.0
+        with self.assertLogs(logger, level="WARNING"):
+            self.gate.trip(ConnectionError("down"))
+        self.assertFalse(self.gate.available)
+
+        monotonic.return_value = 129.9
+        self.assertFalse(self.gate.available)
+
+        monotonic.return_value = 130.0
+        self.assertTrue(self.gate.available)
+
+    def test_logs_only_the_first_failure_of_an_outage(self):
+        with self.assertLogs(logger, level="WARNING") as logs:
+            self.gate.trip(ConnectionError("down"))
+            self.gate.trip(ConnectionError("still down"))
+
+        self.assertEqual(
+            logs.output,
+            [f"WARNING:{logger.name}:[TEST] Backend unavailable for 30s: down"],
+        )
+
+    def test_reset_reopens_the_gate(self):
+        with self.assertLogs(logger, level="WARNING"):
+            self.gate.trip(ConnectionError("down"))
+
+        self.gate.reset()
+
+        self.assertTrue(self.gate.available)
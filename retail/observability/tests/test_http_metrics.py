@@ -0,0 +1,122 @@
+from unittest.mock import MagicMock, patch
+
+import requests
+from django.test import TestCase
+
+from retail.clients.base import RequestClient
+from retail.clients.exceptions import CustomAPIException
+from retail.observability.http_metrics import template_host, template_route
+
+
+class RouteTemplatingTest(TestCase):
+    def test_collapses_dynamic_segments(self):
+        cases = {
+            "/api/oms/pvt/orders/1234567890-01": "/api/oms/pvt/orders/{id}",
+            "/api/v1/apps/8c1e6a1e-7f5a-4b1f-9a7d-2f7b5a6c9e10/templates/": (
+                "/api/v1/apps/{uuid}/templates"
+            ),
+            "/v18.0/102290129340398/message_templates": (
+                "/v18.0/{id}/message_templates"
+            ),
+            "/api/checkout/pub/orderForm/a1b2c3d4e5f6a7b8c9d0e1f2a3b4c5d6": (
+                "/api/checkout/pub/orderForm/{uuid}"
+            ),
+            "/code/65f1c2a9b3e4d5f6a7b8c9d0": "/code/{hash}",
+            "/files/report_2024_ab12cd34.pdf": "/files/{token}",
+            "": "/",
+        }
+        for path, expected in cases.items():
+            with self.subTest(path=path):
+                self.assertEqual(template_route(path), expected)
+
+    def test_truncates_deep_paths(self):
+        self.assertEqual(template_route("/a/b/c/d/e/f/g/h/i/j"), "/a/b/c/d/e/f/g/h/...")
+
+    def test_collapses_tenant_hosts(self):
+        self.assertEqual(
+            template_host("lojasrede.vtexcommercestable.com.br"),
+            "{account}.vtexcommercestable.com.br",
+        )
+        self.assertEqual(template_host("flows.weni.ai"), "flows.weni.ai")
+
+
+class _VtexClient(RequestClient):
+    pass
+
+
+class RequestClientHttpMetricsTest(TestCase):
+    tags = {
+        "client": "_VtexClient",
+        "method": "GET",
+        "host": "{account}.vtexcommercestable.com.br",
+        "route": "/api/oms/pvt/orders/{id}",
+    }
+
+    def setUp(self):
+        patcher = patch("retail.observability.http_metrics.get_statsd_client")
+        self.statsd = patcher.start().return_value
+        self.statsd.enabled = True
+        self.addCleanup(patcher.stop)
+
+    def _response(self, status_code=200, content=b'{"ok": true}'):
+        response = MagicMock(status_code=status_code, text=content.decode())
+        response.content = content
+        response.request.body = b'{"q": 1}'
+        return response
+
+    def _sent(self):
+        return {
+            name: (value, metric_type, tags)
+            for name, value, metric_type, tags in self.statsd.send.call_args.args[0]
+        }
+
+    @patch("retail.clients.base.requests.request")
+    def test_sends_latency_status_and_sizes(self, mock_request):
+        mock_request.return_value = self._response()
+
+        _VtexClient().make_request(
+            "https://store.vtexcommercestable.com.br/api/oms/pvt/orders/123-01?x=1",
+            method="GET",
+        )
+
+        sent = self._sent()
+        tags = {**self.tags, "status": "200"}
+        self.assertEqual(sent["http.client.duration_ms"][1:], ("ms", tags))
+        self.assertEqual(sent["http.client.requests"], (1, "c", tags))
+        self.assertEqual(sent["http.client.request_bytes"], (8, "h", tags))
+        self.assertEqual(sent["http.client.response_bytes"], (12, "h", tags))
+
+    @patch("retail.clients.base.requests.request")
+    def test_tags_http_errors_by_status(self, mock_request):
+        mock_request.return_value = self._response(status_code=429)
+
+        with self.assertRaises(CustomAPIException):
+            _VtexClient().make_request(
+                "https://store.vtexcommercestable.com.br/api/oms/pvt/orders/9-01",
+                method="GET",
+            )
+
+        self.assertEqual(self._sent()["http.client.requests"][2]["status"], "429")
+
+    @patch("retail.clients.base.requests.request")
+    def test_tags_transport_failures_as_errors(self, mock_request):
+        mock_request.side_effect = requests.Timeout("slow")
+
+        with self.assertRaises(CustomAPIException):
+            _VtexClient().make_request(
+                "https://store.vtexcommercestable.com.br/api/oms/pvt/orders/9-01",
+                method="GET",
+            )
+
+        sent = self._sent()
+        self.assertEqual(sent["http.client.requests"][2]["status"], "error")
+        self.assertNotIn("http.client.response_bytes", sent)
+
+    @patch("retail.clients.base.requests.request")
+    def test_sends_nothing_without_statsd(self, mock_request):
+        mock_request.return_value = self._response()
+        self.statsd.enabled = False
+
+        _VtexClient().make_request("https://flows.weni.ai/api/v2/x", method="POST")
+
+        self.statsd.send.assert_not_called()
@@ -0,0 +1,226 @@
+from unittest.mock import MagicMock, patch
+from uuid import uuid4
+
+import redis
+import requests
+from django.test import TestCase, override_settings
+
+from retail.agents.domains.agent_execution.context import (
+    clear_execution_context,
+    set_current_execution_uuid,
+)
+from retail.clients.base import RequestClient
+from retail.clients.exceptions import CustomAPIException
+from retail.observability import task_metrics
+from retail.observability.statsd import StatsdClient, format_metric
+from retail.observability.task_metrics import (
+    finish_task_accounting,
+    get_current_usage,
+    on_task_postrun,
+    on_task_prerun,
+    record_http_call,
+    record_lambda_invoke,
+    start_task_accounting,
+)
+from retail.projects.models import Project
+
+
+@override_settings(STATSD_HOST="", TASK_METRICS_ENABLED=True)
+class TaskResourceAccountingTest(TestCase):
+    def tearDown(self):
+        task_metrics._open_tasks.clear()
+        task_metrics._current_usage.set(None)
+        clear_execution_context()
+        super().tearDown()
+
+    def test_hooks_are_noops_outside_a_task(self):
+        record_http_call("api.vtex.com", 12.0)
+        record_lambda_invoke(30.0)
+
+        self.assertIsNone(get_current_usage())
+
+    def test_accounts_db_http_and_lambda_usage_for_the_task(self):
+        start_task_accounting("task-1", "task_abandoned_cart_update")
+
+        Project.objects.create(uuid=uuid4(), name="Store", vtex_account="store")
+        Project.objects.count()
+        record_http_call("store.vtexcommercestable.com.br", 120.0)
+        record_http_call("store.vtexcommercestable.com.br", 80.0, failed=True)
+        record_http_call("flows.weni.ai", 15.0)
+        record_lambda_invoke(250.0)
+
+        usage = finish_task_accounting("task-1")
+
+        self.assertEqual(usage.task_name, "task_abandoned_cart_update")
+        self.assertGreaterEqual(usage.db_queries, 2)
+        self.assertGreater(usage.db_time_ms, 0)
+        vtex = usage.http["store.vtexcommercestable.com.br"]
+        self.assertEqual((vtex.calls, vtex.errors, vtex.time_ms), (2, 1, 200.0))
+        self.assertEqual(usage.http["flows.weni.ai"].calls, 1)
+        self.assertEqual(usage.lambda_invocations, 1)
+        self.assertEqual(usage.lambda_time_ms, 250.0)
+        self.assertIsNone(get_current_usage())
+
+    def test_counts_redis_commands(self):
+        client = redis.Redis(host="127.0.0.1", port=1, socket_connect_timeout=0.1)
+        start_task_accounting("task-1", "task_flush_execution_logs")
+
+        with self.assertRaises(redis.ConnectionError):
+            client.get("key")
+        pipe = client.pipeline(transaction=False)
+        pipe.get("a")
+        pipe.get("b")
+
+        usage = finish_task_accounting("task-1")
+
+        self.assertEqual(usage.redis_commands, 3)
+
+    def test_nested_task_restores_outer_usage(self):
+        start_task_accounting("outer", "outer_task")
+        start_task_accounting("inner", "inner_task")
+        record_lambda_invoke(10.0)
+        finish_task_accounting("inner")
+        record_lambda_invoke(20.0)
+
+        outer = finish_task_accounting("outer")
+
+        self.assertEqual(outer.lambda_invocations, 1)
+        self.assertEqual(outer.lambda_time_ms, 20.0)
+
+    @override_settings(TASK_METRICS_ENABLED=False)
+    def test_disabled_accounting_records_nothing(self):
+        on_task_prerun(task_id="task-1", task=MagicMock(name="task"))
+
+        self.assertIsNone(get_current_usage())
+        self.assertIsNone(finish_task_accounting("task-1"))
+
+    @override_settings(TASK_METRICS_SLOW_TASK_MS=0)
+    def test_slow_task_logs_breakdown(self):
+        task = MagicMock()
+        task.name = "task_abandoned_cart_update"
+        on_task_prerun(task_id="task-1", task=task)
+
+        with self.assertLogs("retail.observability.task_metrics", "WARNING") as logs:
+            on_task_postrun(task_id="task-1", task=task)
+
+        self.assertIn("Slow task task_abandoned_cart_update", logs.output[0])
+
+    @override_settings(
+        TASK_METRICS_ATTACH_TO_EXECUTION=True, AGENT_EXECUTION_LOGGING_ENABLED=True
+    )
+    @patch(
+        "retail.agents.domains.agent_execution.services.buffer."
+        "ExecutionBufferService.add_trace"
+    )
+    def test_attaches_usage_to_open_execution(self, mock_add_trace):
+        execution_uuid = uuid4()
+        start_task_accounting("task-1", "task_agent_webhook")
+        set_current_execution_uuid(execution_uuid)
+
+        finish_task_accounting("task-1")
+
+        mock_add_trace.assert_called_once()
+        args = mock_add_trace.call_args.args
+        self.assertEqual(args[0], execution_uuid)
+        self.assertEqual(args[1], "task_resources")
+        self.assertEqual(args[2]["task_name"], "task_agent_webhook")
+
+    @override_settings(TASK_METRICS_ATTACH_TO_EXECUTION=False)
+    @patch(
+        "retail.agents.domains.agent_execution.services.buffer."
+        "ExecutionBufferService.add_trace"
+    )
+    def test_does_not_attach_when_disabled(self, mock_add_trace):
+        start_task_accounting("task-1", "task_agent_webhook")
+        set_current_execution_uuid(uuid4())
+
+        finish_task_accounting("task-1")
+
+        mock_add_trace.assert_not_called()
+
+    def test_emits_statsd_metrics(self):
+        client = MagicMock()
+        with patch(
+            "retail.observability.task_metrics.get_statsd_client", return_value=client
+        ):
+            start_task_accounting("task-1", "task_agent_webhook")
+            record_http_call("flows.weni.ai", 15.0)
+            finish_task_accounting("task-1")
+
+        names = [metric[0] for metric in client.send.call_args.args[0]]
+        self.assertIn("task.duration_ms", names)
+        self.assertIn("task.http.time_ms", names)
+        self.assertNotIn("task.lambda.invocations", names)
+
+    def test_receivers_are_connected_in_order(self):
+        from celery.signals import task_postrun, task_prerun
+
+        from retail.celery import (
+            _finish_task_metrics,
+            _reset_execution_context,
+            _start_task_metrics,
+        )
+
+        prerun_receivers = [r() for _, r in task_prerun.receivers]
+        postrun_receivers = [r() for _, r in task_postrun.receivers]
+
+        self.assertIn(_start_task_metrics, prerun_receivers)
+        self.assertLess(
+            postrun_receivers.index(_finish_task_metrics),
+            postrun_receivers.index(_reset_execution_context),
+        )
+
+
+class RequestClientHttpAccountingTest(TestCase):
+    def tearDown(self):
+        task_metrics._open_tasks.clear()
+        task_metrics._current_usage.set(None)
+        super().tearDown()
+
+    @patch("retail.clients.base.requests.request")
+    def test_make_request_records_call_per_host(self, mock_request):
+        mock_request.return_value = MagicMock(status_code=200, text="{}")
+        start_task_accounting("task-1", "task")
+
+        RequestClient().make_request("https://api.vtex.com/orders", method="GET")
+
+        usage = finish_task_accounting("task-1")
+        self.assertEqual(usage.http["api.vtex.com"].calls, 1)
+        self.assertEqual(usage.http["api.vtex.com"].errors, 0)
+
+    @patch("retail.clients.base.requests.request")
+    def test_make_request_records_failures(self, mock_request):
+        mock_request.side_effect = requests.ConnectionError("down")
+        start_task_accounting("task-1", "task")
+
+        with self.assertRaises(CustomAPIException):
+            RequestClient().make_request("https://api.vtex.com/orders", method="GET")
+
+        usage = finish_task_accounting("task-1")
+        self.assertEqual(usage.http["api.vtex.com"].errors, 1)
+
+
+class StatsdClientTest(TestCase):
+    def test_format_metric_with_tags(self):
+        line = format_metric(
+            "retail", ("task.duration_ms", 12.5, "ms", {"task": "a,b"})
+        )
+
+        self.assertEqual(line, "retail.task.duration_ms:12.5|ms|#task:a_b")
+
+    def test_disabled_without_host(self):
+        client = StatsdClient(host="")
+        with patch("retail.observability.statsd.socket.socket") as mock_socket:
+            client.send([("x", 1, "c", {})])
+
+        mock_socket.assert_not_called()
+
+    def test_packs_lines_into_one_datagram(self):
+        client = StatsdClient(host="127.0.0.1", port=8125, prefix="retail")
+        with patch("retail.observability.statsd.socket.socket") as mock_socket:
+            client.send([("a", 1, "c", {}), ("b", 2, "ms", {})])
+
+        sock = mock_socket.return_value
+        sock.sendto.assert_called_once_with(
+            b"retail.a:1|c\nretail.b:2|ms", ("127.0.0.1", 8125)
+        )
@@ -0,0 +1,48 @@
+# Generated by Django 5.2.16 on 2026-10-19 00:06
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("projects", "0015_projectonboarding_is_active_and_managers"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="CrawlContentChunk",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("reference", models.UUIDField()),
+                ("position", models.PositiveIntegerField()),
+                ("items", models.JSONField(default=list)),
+                ("created_on", models.DateTimeField(auto_now_add=True)),
+                (
+                    "onboarding",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="crawl_content_chunks",
+                        to="projects.projectonboarding",
+                    ),
+                ),
+            ],
+            options={
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("reference", "position"),
+                        name="projects_crawl_chunk_unique_position",
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 5.2.16 on 2026-10-19 00:14
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("projects", "0016_crawlcontentchunk"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="projectonboarding",
+            name="pending_crawl_requested_on",
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="projectonboarding",
+            name="pending_crawl_url",
+            field=models.CharField(blank=True, default="", max_length=2048),
+        ),
+        migrations.AddIndex(
+            model_name="projectonboarding",
+            index=models.Index(
+                condition=models.Q(("pending_crawl_requested_on__isnull", False)),
+                fields=["pending_crawl_requested_on"],
+                name="projects_onboarding_pending",
+            ),
+        ),
+    ]
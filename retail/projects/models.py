@@ -103,6 +103,11 @@ class ProjectOnboarding(models.Model):
         default=None,
     )
     config = models.JSONField(default=dict, blank=True)
+    # Crawl requested by start-setup that has not been handed to the
+    # pre-crawl pipeline yet (see ``usecases.pending_crawl``). Empty
+    # once the pipeline has been dispatched.
+    pending_crawl_url = models.CharField(max_length=2048, blank=True, default="")
+    pending_crawl_requested_on = models.DateTimeField(null=True, blank=True)
 
     objects = ActiveOnboardingManager()
     all_objects = models.Manager()
@@ -117,6 +122,13 @@ class ProjectOnboarding(models.Model):
                 name="projects_onboarding_unique_active_vtex_account",
             ),
         ]
+        indexes = [
+            models.Index(
+                fields=["pending_crawl_requested_on"],
+                condition=models.Q(pending_crawl_requested_on__isnull=False),
+                name="projects_onboarding_pending",
+            ),
+        ]
 
     def __str__(self) -> str:
         return (
@@ -126,6 +138,38 @@ class ProjectOnboarding(models.Model):
         )
 
 
+class CrawlContentChunk(models.Model):
+    """
+    A slice of a crawl result staged for the background Nexus upload.
+
+    The ``crawl.completed`` webhook stores the crawled pages here, one
+    row per Nexus upload batch, and hands only ``reference`` to
+    ``task_upload_nexus_contents`` so page bodies never travel through
+    the Celery broker. The rows are deleted once the upload task ends.
+    """
+
+    onboarding = models.ForeignKey(
+        ProjectOnboarding,
+        on_delete=models.CASCADE,
+        related_name="crawl_content_chunks",
+    )
+    reference = models.UUIDField()
+    position = models.PositiveIntegerField()
+    items = models.JSONField(default=list)
+    created_on = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["reference", "position"],
+                name="projects_crawl_chunk_unique_position",
+            ),
+        ]
+
+    def __str__(self) -> str:
+        return f"CrawlContentChunk [{self.reference}] #{self.position}"
+
+
 @receiver(pre_save, sender=ProjectOnboarding)
 def snapshot_previous_completed(sender, instance, **kwargs):
     """
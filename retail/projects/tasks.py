@@ -1,11 +1,14 @@
 import logging
+from typing import Optional
 
 from celery import shared_task
 from django.core.cache import cache
+from django.utils import timezone
 
 from retail.projects.models import ProjectOnboarding
 from retail.projects.usecases.mark_onboarding_failed import mark_onboarding_failed
 from retail.projects.usecases.onboarding_orchestrator import OnboardingOrchestrator
+from retail.projects.usecases.pending_crawl import ResumePendingCrawlsUseCase
 from retail.projects.usecases.pre_crawl_channel import PreCrawlChannelUseCase
 from retail.projects.usecases.save_background_failure import (
     SaveBackgroundFailureUseCase,
@@ -14,13 +17,15 @@ from retail.projects.usecases.content_base_progress_helpers import (
     STATUS_FAILED,
     persist_content_base_progress,
 )
+from retail.projects.usecases.crawl_contents_staging import (
+    StagedCrawlContents,
+    discard_crawl_contents,
+)
 from retail.projects.usecases.upload_nexus_contents import UploadNexusContentsUseCase
 from retail.services.vtex_io.service import VtexIOService
 
 logger = logging.getLogger(__name__)
 
-WAIT_CRAWL_RETRY_COUNTDOWN = 10  # seconds between retries
-WAIT_CRAWL_MAX_RETRIES = 60  # ~10 minutes of waiting
 TASK_LOCK_TIMEOUT = 1800  # 30 min safety timeout
 
 # Progress marker set right before invoking the channel use case so the
@@ -49,26 +54,28 @@ def release_task_lock(task_name: str, vtex_account: str) -> None:
     cache.delete(_lock_key(task_name, vtex_account))
 
 
-def _run_setup_channel_and_start_crawl(task, vtex_account: str, crawl_url: str) -> None:
+def _run_setup_channel_and_start_crawl(vtex_account: str, crawl_url: str) -> None:
     """
     Shared implementation for the pre-crawl + post-crawl pipeline.
 
     Both ``task_setup_channel_and_start_crawl`` (new name) and the
     legacy alias ``task_wait_and_start_crawl`` delegate here so the
-    same retry/cleanup logic runs regardless of how the task was
-    enqueued.
+    same cleanup logic runs regardless of how the task was enqueued.
 
     Pipeline order (single Celery task, sequential):
-      1. Wait until the project is linked (retries up to ~10 minutes).
-      2. Pre-crawl channel setup (WWC or WPP Cloud).
-      3. Run the NEXUS_CONFIG orchestrator inline (crawl kickoff +
+      1. Pre-crawl channel setup (WWC or WPP Cloud).
+      2. Run the NEXUS_CONFIG orchestrator inline (crawl kickoff +
          manager + payment + agents -- no content upload). The wizard
          completes here; the content upload happens in background later
          when the crawler webhook arrives.
 
+    The task is only dispatched once the project is linked (see
+    ``usecases.pending_crawl``). A message without a linked project --
+    a retry enqueued before the link stopped being polled -- records
+    the crawl as pending and returns, leaving the link event to
+    dispatch it again.
+
     Args:
-        task: The bound Celery task instance (provides ``retry`` /
-            ``MaxRetriesExceededError``).
         vtex_account: VTEX account identifier.
         crawl_url: Store URL to crawl after channel setup.
     """
@@ -83,16 +90,16 @@ def _run_setup_channel_and_start_crawl(task, vtex_account: str, crawl_url: str)
     if onboarding.project is None:
         logger.info(
             f"Project not linked yet for vtex_account={vtex_account}. "
-            f"Retrying in {WAIT_CRAWL_RETRY_COUNTDOWN}s..."
+            f"Waiting for the link event to resume the crawl."
         )
-        try:
-            raise task.retry(countdown=WAIT_CRAWL_RETRY_COUNTDOWN)
-        except task.MaxRetriesExceededError:
-            mark_onboarding_failed(
-                vtex_account,
-                "Project was never linked: max retries exceeded",
-            )
-            raise
+        onboarding.pending_crawl_url = crawl_url
+        onboarding.pending_crawl_requested_on = (
+            onboarding.pending_crawl_requested_on or timezone.now()
+        )
+        onboarding.save(
+            update_fields=["pending_crawl_url", "pending_crawl_requested_on"]
+        )
+        return
 
     logger.info(
         f"Project linked for vtex_account={vtex_account}. "
@@ -116,36 +123,28 @@ def _run_setup_channel_and_start_crawl(task, vtex_account: str, crawl_url: str)
     OnboardingOrchestrator().execute(vtex_account, crawl_url)
 
 
-@shared_task(
-    bind=True,
-    name="task_setup_channel_and_start_crawl",
-    max_retries=WAIT_CRAWL_MAX_RETRIES,
-)
-def task_setup_channel_and_start_crawl(self, vtex_account: str, crawl_url: str) -> None:
+@shared_task(name="task_setup_channel_and_start_crawl")
+def task_setup_channel_and_start_crawl(vtex_account: str, crawl_url: str) -> None:
     """
-    Pre-crawl + NEXUS_CONFIG orchestration: wait for project link, create
-    channel, then run the NEXUS_CONFIG orchestrator inline (crawl kickoff +
-    manager + payment + agents) so the wizard completes without waiting
-    for the crawl.
+    Pre-crawl + NEXUS_CONFIG orchestration: create channel, then run the
+    NEXUS_CONFIG orchestrator inline (crawl kickoff + manager + payment +
+    agents) so the wizard completes without waiting for the crawl.
 
     The Facebook ``auth_code`` from Embedded Signup is short-lived, so the
     channel must be created (and the code exchanged on the
     integrations-engine side) before the long-running crawl can expire it.
 
-    Retries while the project is not linked. Once linked, runs the channel
-    use case (resolves wwc or wpp-cloud) and the orchestrator. If channel
-    creation fails, the onboarding is marked failed and the orchestrator is
-    not invoked -- the user must redo Embedded Signup.
+    Dispatched once the project is linked, by start-setup or by the
+    link event. Runs the channel use case (resolves wwc or wpp-cloud) and
+    the orchestrator. If channel creation fails, the onboarding is marked
+    failed and the orchestrator is not invoked -- the user must redo
+    Embedded Signup.
     """
-    return _run_setup_channel_and_start_crawl(self, vtex_account, crawl_url)
+    return _run_setup_channel_and_start_crawl(vtex_account, crawl_url)
 
 
-@shared_task(
-    bind=True,
-    name="task_wait_and_start_crawl",
-    max_retries=WAIT_CRAWL_MAX_RETRIES,
-)
-def task_wait_and_start_crawl(self, vtex_account: str, crawl_url: str) -> None:
+@shared_task(name="task_wait_and_start_crawl")
+def task_wait_and_start_crawl(vtex_account: str, crawl_url: str) -> None:
     """
     Deprecated alias for ``task_setup_channel_and_start_crawl``.
 
@@ -153,7 +152,22 @@ def task_wait_and_start_crawl(self, vtex_account: str, crawl_url: str) -> None:
     retries queued before the rename keep executing the new pre-crawl
     pipeline. New dispatches use the renamed task directly.
     """
-    return _run_setup_channel_and_start_crawl(self, vtex_account, crawl_url)
+    return _run_setup_channel_and_start_crawl(vtex_account, crawl_url)
+
+
+@shared_task(name="task_resume_pending_crawls")
+def task_resume_pending_crawls() -> dict:
+    """
+    Periodic safety net around ``ResumePendingCrawlsUseCase``.
+
+    Returns ``{"resumed": int, "expired": int}``. Errors are swallowed
+    so the beat schedule keeps trying without raising.
+    """
+    try:
+        return ResumePendingCrawlsUseCase().execute().as_dict()
+    except Exception:
+        logger.exception("Error resuming pending onboarding crawls")
+        return {"resumed": 0, "expired": 0}
 
 
 @shared_task(name="task_activate_agentic_cx_script")
@@ -173,10 +187,20 @@ def task_activate_agentic_cx_script(vtex_account: str) -> None:
 UPLOAD_NEXUS_LOCK_NAME = "upload_nexus_contents"
 
 
-def _run_upload_nexus_contents(vtex_account: str, contents: list) -> None:
+def _run_upload_nexus_contents(
+    vtex_account: str,
+    contents: Optional[list] = None,
+    crawl_reference: Optional[str] = None,
+    total_items: int = 0,
+) -> None:
     """
     Shared implementation for the background Nexus content upload.
 
+    New dispatches pass ``crawl_reference`` / ``total_items`` of the
+    pages staged by ``stage_crawl_contents``; an inline ``contents``
+    list is still accepted for jobs enqueued before staging existed.
+    The staged chunks are discarded when the upload ends.
+
     Both ``task_upload_nexus_contents`` (new canonical name) and the
     deprecated alias ``task_configure_nexus`` delegate here so the same
     soft-failure + lock-release semantics run regardless of which task
@@ -189,8 +213,10 @@ def _run_upload_nexus_contents(vtex_account: str, contents: list) -> None:
     in ``config["background_error"]`` and does NOT flip
     ``onboarding.failed``.
     """
+    if crawl_reference is not None:
+        contents = StagedCrawlContents(crawl_reference, total_items)
     try:
-        UploadNexusContentsUseCase().execute(vtex_account, contents)
+        UploadNexusContentsUseCase().execute(vtex_account, contents or [])
     except Exception as exc:
         logger.exception(
             f"Background nexus upload failed for vtex_account={vtex_account}"
@@ -205,18 +231,28 @@ def _run_upload_nexus_contents(vtex_account: str, contents: list) -> None:
                 f"vtex_account={vtex_account}: onboarding not found"
             )
     finally:
+        if crawl_reference is not None:
+            discard_crawl_contents(crawl_reference)
         release_task_lock(UPLOAD_NEXUS_LOCK_NAME, vtex_account)
 
 
 @shared_task(name="task_upload_nexus_contents")
-def task_upload_nexus_contents(vtex_account: str, contents: list) -> None:
+def task_upload_nexus_contents(
+    vtex_account: str,
+    contents: Optional[list] = None,
+    crawl_reference: Optional[str] = None,
+    total_items: int = 0,
+) -> None:
     """
     Background-only: uploads crawled contents to Nexus.
 
     Dispatched by ``UpdateOnboardingProgressUseCase`` when the
-    ``crawl.completed`` webhook arrives.
+    ``crawl.completed`` webhook arrives, with the reference of the
+    staged crawl rather than the pages themselves.
     """
-    return _run_upload_nexus_contents(vtex_account, contents)
+    return _run_upload_nexus_contents(
+        vtex_account, contents, crawl_reference, total_items
+    )
 
 
 @shared_task(name="task_configure_nexus")
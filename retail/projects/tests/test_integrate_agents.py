@@ -1,8 +1,15 @@
+import threading
 from unittest.mock import MagicMock, patch
 from uuid import uuid4
 
-from django.test import TestCase
+from django.test import TestCase, override_settings
 
+from retail.observability import task_metrics
+from retail.observability.task_metrics import (
+    finish_task_accounting,
+    record_http_call,
+    start_task_accounting,
+)
 from retail.projects.models import Project, ProjectOnboarding
 from retail.projects.usecases.integrate_agents import (
     IntegrateAgentsUseCase,
@@ -91,6 +98,7 @@ class TestIntegrateAgentsUseCase(TestCase):
             StubPassiveAgent("uuid-2", "Agent B"),
         ],
     )
+    @override_settings(ONBOARDING_AGENT_INTEGRATION_WORKERS=1)
     def test_stops_on_first_failure(self, _mock_agents):
         self.mock_nexus_service.integrate_agent.side_effect = [None, {"ok": True}]
 
@@ -156,6 +164,100 @@ class TestIntegrateAgentsUseCase(TestCase):
 
         self.assertEqual(self.mock_nexus_service.integrate_agent.call_count, 2)
 
+    def test_integrates_nexus_only_agents_concurrently(self):
+        barrier = threading.Barrier(3, timeout=5)
+
+        class MeetingAgent(StubPassiveAgent):
+            def integrate(self, context, nexus_service):
+                barrier.wait()
+                return {"ok": True}
+
+        agents = [MeetingAgent(f"uuid-{i}", f"Agent {i}") for i in range(3)]
+        with patch(
+            "retail.projects.usecases.integrate_agents.get_channel_agents",
+            return_value=agents,
+        ):
+            self.usecase.execute("mystore")
+
+        self.onboarding.refresh_from_db()
+        self.assertEqual(self.onboarding.progress, AGENT_PROGRESS_END)
+
+    def test_database_agents_run_on_calling_thread(self):
+        threads = {}
+
+        class RecordingAgent(StubPassiveAgent):
+            def integrate(self, context, nexus_service):
+                threads[self.uuid] = threading.get_ident()
+                return {"ok": True}
+
+        database_agent = RecordingAgent("uuid-db", "Database Agent")
+        database_agent.uses_database = True
+        agents = [
+            RecordingAgent("uuid-1", "Agent A"),
+            RecordingAgent("uuid-2", "Agent B"),
+            database_agent,
+        ]
+        with patch(
+            "retail.projects.usecases.integrate_agents.get_channel_agents",
+            return_value=agents,
+        ):
+            self.usecase.execute("mystore")
+
+        self.assertEqual(threads["uuid-db"], threading.get_ident())
+        self.assertNotEqual(threads["uuid-1"], threading.get_ident())
+        self.assertNotEqual(threads["uuid-2"], threading.get_ident())
+
+    @override_settings(STATSD_HOST="", TASK_METRICS_ENABLED=True)
+    def test_pooled_agents_are_accounted_to_the_task(self):
+        class NexusAgent(StubPassiveAgent):
+            def integrate(self, context, nexus_service):
+                record_http_call("nexus.weni.ai", 10.0)
+                return {"ok": True}
+
+        agents = [NexusAgent(f"uuid-{i}", f"Agent {i}") for i in range(3)]
+        self.addCleanup(task_metrics._current_usage.set, None)
+        start_task_accounting("task-1", "task_integrate_agents")
+        with patch(
+            "retail.projects.usecases.integrate_agents.get_channel_agents",
+            return_value=agents,
+        ):
+            self.usecase.execute("mystore")
+        usage = finish_task_accounting("task-1")
+
+        self.assertEqual(usage.http["nexus.weni.ai"].calls, 3)
+
+    @patch(
+        "retail.projects.usecases.integrate_agents.get_channel_agents",
+        return_value=[
+            StubPassiveAgent("uuid-1", "Agent A"),
+            StubPassiveAgent("uuid-2", "Agent B"),
+            StubPassiveAgent("uuid-3", "Agent C"),
+        ],
+    )
+    def test_concurrent_failure_raises_without_completing_progress(self, _mock_agents):
+        self.mock_nexus_service.integrate_agent.side_effect = (
+            lambda _project_uuid, agent_uuid: (
+                None if agent_uuid == "uuid-2" else {"ok": True}
+            )
+        )
+
+        with self.assertRaises(AgentIntegrationError):
+            self.usecase.execute("mystore")
+
+        self.onboarding.refresh_from_db()
+        self.assertLess(self.onboarding.progress, AGENT_PROGRESS_END)
+
+    def test_progress_update_never_regresses(self):
+        ProjectOnboarding.objects.filter(pk=self.onboarding.pk).update(progress=95)
+
+        IntegrateAgentsUseCase._persist_progress(self.onboarding, 1, 4)
+        self.onboarding.refresh_from_db()
+        self.assertEqual(self.onboarding.progress, 95)
+
+        IntegrateAgentsUseCase._persist_progress(self.onboarding, 4, 4)
+        self.onboarding.refresh_from_db()
+        self.assertEqual(self.onboarding.progress, AGENT_PROGRESS_END)
+
     def test_propagates_flow_id_from_payment_config_to_agent_context(self):
         """When the wpp-cloud config has a published payment flow_id,
         IntegrateAgentsUseCase must hand it to each agent via
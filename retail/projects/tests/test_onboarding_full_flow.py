@@ -5,7 +5,7 @@ Simulates every step, from start-setup to agent integration,
 with all external services mocked.
 """
 
-from unittest.mock import MagicMock, patch
+from unittest.mock import ANY, MagicMock, patch
 from uuid import uuid4
 
 from django.test import TestCase
@@ -28,6 +28,7 @@ from retail.projects.usecases.onboarding_dto import (
     CrawlerWebhookDTO,
     StartSetupDTO,
 )
+from retail.projects.usecases.crawl_contents_staging import StagedCrawlContents
 from retail.projects.usecases.content_base_progress_helpers import (
     compute_overall_percent,
 )
@@ -57,7 +58,7 @@ class TestFullOnboardingFlow(TestCase):
 
     Main (inline) path -- single Celery task:
       1. Front-end calls start-setup (project not linked yet) -> PROJECT_CONFIG 0%
-      2. EDA links the project                                -> PROJECT_CONFIG 30%
+      2. EDA links the project, pre-crawl task dispatched     -> PROJECT_CONFIG 30%
       3. Pre-crawl channel setup runs                         -> PROJECT_CONFIG 100%
       4. Orchestrator: NEXUS_CONFIG starts                    -> NEXUS_CONFIG 0%
       5. Orchestrator: crawl kickoff                          -> NEXUS_CONFIG 40%
@@ -78,7 +79,7 @@ class TestFullOnboardingFlow(TestCase):
         self.crawl_url = "https://www.flowstore.com.br/"
         self.channel_app_uuid = str(uuid4())
 
-    @patch("retail.projects.usecases.start_setup.task_setup_channel_and_start_crawl")
+    @patch("retail.projects.tasks.task_setup_channel_and_start_crawl")
     def test_full_flow(self, mock_setup_task):
         # -- Step 1: Front-end starts setup, no project yet --
         dto = StartSetupDTO(
@@ -93,15 +94,16 @@ class TestFullOnboardingFlow(TestCase):
         self.assertEqual(onboarding.current_step, "PROJECT_CONFIG")
         self.assertEqual(onboarding.progress, 0)
         self.assertIn("wwc", onboarding.config["channels"])
-        mock_setup_task.delay.assert_called_once_with(self.vtex_account, self.crawl_url)
+        mock_setup_task.delay.assert_not_called()
 
-        # -- Step 2: EDA links the project (partial PROJECT_CONFIG progress) --
+        # -- Step 2: EDA links the project and dispatches the pending crawl --
         project = Project.objects.create(
             name="Flow Store",
             uuid=self.project_uuid,
             vtex_account=self.vtex_account,
         )
         LinkProjectToOnboardingUseCase.execute(project)
+        mock_setup_task.delay.assert_called_once_with(self.vtex_account, self.crawl_url)
 
         onboarding.refresh_from_db()
         self.assertEqual(onboarding.project, project)
@@ -132,7 +134,7 @@ class TestFullOnboardingFlow(TestCase):
         )
 
         # -- Step 4: Orchestrator marks NEXUS_CONFIG started --
-        OnboardingOrchestrator._mark_nexus_config_started(self.vtex_account)
+        OnboardingOrchestrator._mark_nexus_config_started(onboarding)
 
         onboarding.refresh_from_db()
         self.assertEqual(onboarding.current_step, "NEXUS_CONFIG")
@@ -150,7 +152,7 @@ class TestFullOnboardingFlow(TestCase):
         initiate_crawl_usecase.detect_storefront_usecase = MagicMock()
 
         initiate_crawl_usecase.execute(project, self.vtex_account, self.crawl_url)
-        OnboardingOrchestrator._mark_crawl_kickoff(self.vtex_account)
+        OnboardingOrchestrator._mark_crawl_kickoff(onboarding)
 
         onboarding.refresh_from_db()
         self.assertEqual(onboarding.current_step, "NEXUS_CONFIG")
@@ -250,8 +252,9 @@ class TestFullOnboardingFlow(TestCase):
         self.assertEqual(result.progress, 100)
         self.assertEqual(result.crawler_result, ProjectOnboarding.SUCCESS)
         mock_nexus_task.delay.assert_called_once_with(
-            self.vtex_account, crawled_contents
+            self.vtex_account, crawl_reference=ANY, total_items=2
         )
+        crawl_reference = mock_nexus_task.delay.call_args.kwargs["crawl_reference"]
         onboarding.refresh_from_db()
         self.assertEqual(GetContentBaseProgressUseCase().execute(self.vtex_account), 33)
 
@@ -280,7 +283,10 @@ class TestFullOnboardingFlow(TestCase):
         background_usecase.nexus_service = background_nexus
 
         with patch("retail.projects.usecases.upload_nexus_contents.time.sleep"):
-            background_usecase.execute(self.vtex_account, crawled_contents)
+            background_usecase.execute(
+                self.vtex_account,
+                StagedCrawlContents(crawl_reference, total_items=2),
+            )
 
         onboarding.refresh_from_db()
         self.assertEqual(onboarding.current_step, "NEXUS_CONFIG")
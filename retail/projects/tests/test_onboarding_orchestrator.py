@@ -1,7 +1,9 @@
 from unittest.mock import MagicMock, patch
 from uuid import uuid4
 
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 
 from retail.projects.models import Project, ProjectOnboarding
 from retail.projects.usecases.onboarding_orchestrator import (
@@ -82,6 +84,24 @@ class TestOnboardingOrchestrator(TestCase):
         self.assertEqual(progress_at_agent_time["step"], "NEXUS_CONFIG")
         self.assertEqual(progress_at_agent_time["progress"], CRAWL_KICKOFF_PROGRESS)
 
+    @patch("retail.projects.usecases.onboarding_orchestrator.InitiateCrawlUseCase")
+    @patch("retail.projects.usecases.onboarding_orchestrator.IntegrateAgentsUseCase")
+    @patch(
+        "retail.projects.usecases.onboarding_orchestrator.ConfigureAgentBuilderUseCase"
+    )
+    def test_loads_onboarding_once(self, *_mocks):
+        """The progress and channel helpers reuse the row loaded up front."""
+        with CaptureQueriesContext(connection) as queries:
+            OnboardingOrchestrator().execute("mystore", CRAWL_URL)
+
+        onboarding_selects = [
+            query["sql"]
+            for query in queries.captured_queries
+            if query["sql"].startswith("SELECT")
+            and ProjectOnboarding._meta.db_table in query["sql"]
+        ]
+        self.assertEqual(len(onboarding_selects), 1)
+
     @patch("retail.projects.usecases.onboarding_orchestrator.mark_onboarding_failed")
     @patch("retail.projects.usecases.onboarding_orchestrator.InitiateCrawlUseCase")
     @patch("retail.projects.usecases.onboarding_orchestrator.IntegrateAgentsUseCase")
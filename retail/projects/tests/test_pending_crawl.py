@@ -0,0 +1,192 @@
+from datetime import timedelta
+from unittest.mock import MagicMock, patch
+from uuid import uuid4
+
+from celery.app.task import Task
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from retail.projects.models import Project, ProjectOnboarding
+from retail.projects.usecases.link_project_to_onboarding import (
+    LinkProjectToOnboardingUseCase,
+)
+from retail.projects.usecases.onboarding_dto import StartSetupDTO
+from retail.projects.usecases.pending_crawl import (
+    ResumePendingCrawlsUseCase,
+    dispatch_pending_crawl,
+    request_crawl,
+)
+from retail.projects.usecases.start_setup import StartSetupUseCase
+
+CRAWL_URL = "https://www.mystore.com.br/"
+
+
+@patch("retail.projects.tasks.task_setup_channel_and_start_crawl")
+class TestRequestCrawl(TestCase):
+    def setUp(self):
+        self.onboarding = ProjectOnboarding.objects.create(vtex_account="mystore")
+
+    def _link(self):
+        project = Project.objects.create(
+            name="Test", uuid=uuid4(), vtex_account="mystore"
+        )
+        ProjectOnboarding.objects.filter(pk=self.onboarding.pk).update(project=project)
+        return project
+
+    def test_records_request_without_dispatch_when_not_linked(self, mock_task):
+        self.assertFalse(request_crawl(self.onboarding, CRAWL_URL))
+
+        mock_task.delay.assert_not_called()
+        self.onboarding.refresh_from_db()
+        self.assertEqual(self.onboarding.pending_crawl_url, CRAWL_URL)
+        self.assertIsNotNone(self.onboarding.pending_crawl_requested_on)
+
+    def test_dispatches_when_linked_in_database(self, mock_task):
+        """A link committed after the onboarding was loaded still counts."""
+        self._link()
+
+        self.assertTrue(request_crawl(self.onboarding, CRAWL_URL))
+
+        mock_task.delay.assert_called_once_with("mystore", CRAWL_URL)
+        self.onboarding.refresh_from_db()
+        self.assertEqual(self.onboarding.pending_crawl_url, "")
+        self.assertIsNone(self.onboarding.pending_crawl_requested_on)
+
+    def test_pending_crawl_is_dispatched_once(self, mock_task):
+        request_crawl(self.onboarding, CRAWL_URL)
+        self._link()
+        stale_copy = ProjectOnboarding.objects.get(pk=self.onboarding.pk)
+
+        self.assertTrue(dispatch_pending_crawl(self.onboarding))
+        self.assertFalse(dispatch_pending_crawl(stale_copy))
+        self.assertFalse(dispatch_pending_crawl(self.onboarding))
+
+        mock_task.delay.assert_called_once_with("mystore", CRAWL_URL)
+
+    def test_link_event_dispatches_pending_crawl(self, mock_task):
+        request_crawl(self.onboarding, CRAWL_URL)
+        project = Project.objects.create(
+            name="Test", uuid=uuid4(), vtex_account="mystore"
+        )
+
+        LinkProjectToOnboardingUseCase.execute(project)
+
+        mock_task.delay.assert_called_once_with("mystore", CRAWL_URL)
+
+    def test_link_event_sees_crawl_requested_after_it_loaded(self, mock_task):
+        """Start-setup writing its request mid-link must not be missed."""
+        project = Project.objects.create(
+            name="Test", uuid=uuid4(), vtex_account="mystore"
+        )
+        original_save = ProjectOnboarding.save
+
+        def save_after_start_setup(instance, *args, **kwargs):
+            if "project" in kwargs.get("update_fields", ()):
+                request_crawl(ProjectOnboarding.objects.get(pk=instance.pk), CRAWL_URL)
+            return original_save(instance, *args, **kwargs)
+
+        with patch.object(ProjectOnboarding, "save", save_after_start_setup):
+            LinkProjectToOnboardingUseCase.execute(project)
+
+        mock_task.delay.assert_called_once_with("mystore", CRAWL_URL)
+
+    def test_link_event_without_pending_crawl_dispatches_nothing(self, mock_task):
+        project = Project.objects.create(
+            name="Test", uuid=uuid4(), vtex_account="mystore"
+        )
+
+        LinkProjectToOnboardingUseCase.execute(project)
+
+        mock_task.delay.assert_not_called()
+
+
+@override_settings(
+    PENDING_CRAWL_RESUME_AFTER_SECONDS=120, PENDING_CRAWL_LINK_TIMEOUT_SECONDS=600
+)
+@patch("retail.projects.tasks.task_setup_channel_and_start_crawl")
+class TestResumePendingCrawlsUseCase(TestCase):
+    def _onboarding(self, vtex_account, age_seconds, linked):
+        project = None
+        if linked:
+            project = Project.objects.create(
+                name=vtex_account, uuid=uuid4(), vtex_account=vtex_account
+            )
+        return ProjectOnboarding.objects.create(
+            vtex_account=vtex_account,
+            project=project,
+            pending_crawl_url=f"https://{vtex_account}.com/",
+            pending_crawl_requested_on=timezone.now() - timedelta(seconds=age_seconds),
+        )
+
+    def test_resumes_linked_requests_past_the_grace_period(self, mock_task):
+        self._onboarding("missed", age_seconds=300, linked=True)
+        self._onboarding("recent", age_seconds=10, linked=True)
+
+        result = ResumePendingCrawlsUseCase().execute()
+
+        self.assertEqual(result.as_dict(), {"resumed": 1, "expired": 0})
+        mock_task.delay.assert_called_once_with("missed", "https://missed.com/")
+
+    def test_fails_onboardings_never_linked(self, mock_task):
+        expired = self._onboarding("expired", age_seconds=900, linked=False)
+        waiting = self._onboarding("waiting", age_seconds=300, linked=False)
+
+        result = ResumePendingCrawlsUseCase().execute()
+
+        self.assertEqual(result.as_dict(), {"resumed": 0, "expired": 1})
+        mock_task.delay.assert_not_called()
+        expired.refresh_from_db()
+        self.assertTrue(expired.failed)
+        self.assertIn("never linked", expired.config["reason_failed"])
+        self.assertIsNone(expired.pending_crawl_requested_on)
+        waiting.refresh_from_db()
+        self.assertFalse(waiting.failed)
+        self.assertIsNotNone(waiting.pending_crawl_requested_on)
+
+    def test_task_swallows_errors(self, _mock_task):
+        from retail.projects.tasks import task_resume_pending_crawls
+
+        with patch(
+            "retail.projects.tasks.ResumePendingCrawlsUseCase.execute",
+            side_effect=RuntimeError("db down"),
+        ):
+            self.assertEqual(task_resume_pending_crawls(), {"resumed": 0, "expired": 0})
+
+
+class TestNormalOnboardingDoesNotPoll(TestCase):
+    @patch("retail.projects.tasks.OnboardingOrchestrator")
+    @patch("retail.projects.tasks.PreCrawlChannelUseCase")
+    def test_no_polling_tasks_are_enqueued(self, _mock_channel, _mock_orchestrator):
+        """
+        Start-setup before the project exists, then the link event: the
+        pipeline is enqueued exactly once, with no countdown, and running
+        it enqueues nothing else.
+        """
+        enqueued = []
+
+        def record(task, args=None, kwargs=None, **options):
+            enqueued.append((task.name, args, options))
+            return MagicMock()
+
+        with patch.object(Task, "apply_async", autospec=True, side_effect=record):
+            StartSetupUseCase().execute(
+                StartSetupDTO(
+                    vtex_account="mystore", crawl_url=CRAWL_URL, channel="wwc"
+                )
+            )
+            self.assertEqual(enqueued, [])
+
+            project = Project.objects.create(
+                name="Test", uuid=uuid4(), vtex_account="mystore"
+            )
+            LinkProjectToOnboardingUseCase.execute(project)
+            self.assertEqual(
+                enqueued,
+                [("task_setup_channel_and_start_crawl", ("mystore", CRAWL_URL), {})],
+            )
+
+            from retail.projects.tasks import task_setup_channel_and_start_crawl
+
+            task_setup_channel_and_start_crawl(*enqueued[0][1])
+
+        self.assertEqual(len(enqueued), 1)
@@ -16,11 +16,11 @@ class TestStartSetupUseCase(TestCase):
             channel="wwc",
         )
 
-    @patch("retail.projects.usecases.start_setup.task_setup_channel_and_start_crawl")
-    def test_creates_onboarding_and_schedules_setup_task_when_no_project(
+    @patch("retail.projects.tasks.task_setup_channel_and_start_crawl")
+    def test_creates_onboarding_and_records_pending_crawl_when_no_project(
         self, mock_task
     ):
-        """When no project exists, should schedule the pre-crawl setup task."""
+        """When no project exists, the crawl waits for the link event."""
         usecase = StartSetupUseCase()
 
         usecase.execute(self.dto)
@@ -29,16 +29,16 @@ class TestStartSetupUseCase(TestCase):
         self.assertIsNone(onboarding.project)
         self.assertEqual(onboarding.current_step, "PROJECT_CONFIG")
         self.assertEqual(onboarding.progress, 0)
-        mock_task.delay.assert_called_once_with(
-            "mystore", "https://www.mystore.com.br/"
-        )
+        self.assertEqual(onboarding.pending_crawl_url, "https://www.mystore.com.br/")
+        self.assertIsNotNone(onboarding.pending_crawl_requested_on)
+        mock_task.delay.assert_not_called()
 
-    @patch("retail.projects.usecases.start_setup.task_setup_channel_and_start_crawl")
+    @patch("retail.projects.tasks.task_setup_channel_and_start_crawl")
     def test_schedules_setup_task_when_project_already_linked(self, mock_task):
         """
         When a project is already linked at start-setup time, the task is
-        still dispatched (no inline crawl initiation). The task owns the
-        full pre-crawl pipeline regardless of link timing.
+        dispatched right away (no inline crawl initiation). The task owns
+        the full pre-crawl pipeline regardless of link timing.
         """
         Project.objects.create(name="Test", uuid=uuid4(), vtex_account="mystore")
 
@@ -52,8 +52,10 @@ class TestStartSetupUseCase(TestCase):
         mock_task.delay.assert_called_once_with(
             "mystore", "https://www.mystore.com.br/"
         )
+        self.assertEqual(onboarding.pending_crawl_url, "")
+        self.assertIsNone(onboarding.pending_crawl_requested_on)
 
-    @patch("retail.projects.usecases.start_setup.task_setup_channel_and_start_crawl")
+    @patch("retail.projects.tasks.task_setup_channel_and_start_crawl")
     @patch("retail.projects.tasks.task_activate_agentic_cx_script")
     def test_resets_existing_onboarding_on_retry(self, _mock_agentic, mock_task):
         """When an onboarding already exists, should reset transient fields."""
@@ -91,7 +93,7 @@ class TestStartSetupUseCase(TestCase):
         self.assertNotIn("background_error", onboarding.config)
         self.assertNotIn("content_base_progress", onboarding.config)
 
-    @patch("retail.projects.usecases.start_setup.task_setup_channel_and_start_crawl")
+    @patch("retail.projects.tasks.task_setup_channel_and_start_crawl")
     def test_reset_clears_previous_channel_app_uuid(self, _mock_task):
         """
         Re-running start-setup must clear previously persisted app_uuid /
@@ -185,9 +187,7 @@ class TestStartSetupUseCase(TestCase):
             config={"channels": {"wwc": {"app_uuid": "stale"}}},
         )
 
-        with patch(
-            "retail.projects.usecases.start_setup.task_setup_channel_and_start_crawl"
-        ):
+        with patch("retail.projects.tasks.task_setup_channel_and_start_crawl"):
             StartSetupUseCase().execute(self.dto)
 
         active_onboardings = ProjectOnboarding.objects.filter(vtex_account="mystore")
@@ -205,7 +205,7 @@ class TestStartSetupUseCase(TestCase):
         with self.assertRaises(Project.MultipleObjectsReturned):
             StartSetupUseCase._try_link_project(onboarding)
 
-    @patch("retail.projects.usecases.start_setup.task_setup_channel_and_start_crawl")
+    @patch("retail.projects.tasks.task_setup_channel_and_start_crawl")
     def test_stores_channel_data_in_config(self, mock_task):
         """When channel_data is provided, it should be stored in onboarding config."""
         dto = StartSetupDTO(
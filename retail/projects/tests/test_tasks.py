@@ -143,18 +143,23 @@ class TestTaskSetupChannelAndStartCrawl(TestCase):
         # We assert by verifying the call sequence works without errors.
         mock_channel.execute.assert_called_once()
 
-    def test_retries_when_project_not_linked(self):
+    @patch("retail.projects.tasks.PreCrawlChannelUseCase")
+    def test_records_pending_crawl_instead_of_retrying_when_not_linked(
+        self, mock_channel_cls
+    ):
+        """A pre-rename retry without a link waits for the link event."""
         ProjectOnboarding.objects.create(vtex_account="mystore")
 
-        from celery.exceptions import Retry
         from retail.projects.tasks import task_setup_channel_and_start_crawl
 
-        with patch.object(
-            task_setup_channel_and_start_crawl, "retry", side_effect=Retry()
-        ) as mock_retry:
-            with self.assertRaises(Retry):
-                task_setup_channel_and_start_crawl("mystore", "https://mystore.com.br/")
-            mock_retry.assert_called_once()
+        with patch.object(task_setup_channel_and_start_crawl, "retry") as mock_retry:
+            task_setup_channel_and_start_crawl("mystore", "https://mystore.com.br/")
+
+        mock_retry.assert_not_called()
+        mock_channel_cls.assert_not_called()
+        onboarding = ProjectOnboarding.objects.get(vtex_account="mystore")
+        self.assertEqual(onboarding.pending_crawl_url, "https://mystore.com.br/")
+        self.assertIsNotNone(onboarding.pending_crawl_requested_on)
 
     @patch("retail.projects.tasks.mark_onboarding_failed")
     def test_marks_failed_when_onboarding_record_missing(self, mock_mark_failed):
@@ -263,6 +268,39 @@ class TestTaskUploadNexusContents(TestCase):
         mock_upload.execute.assert_called_once_with("mystore", contents)
         mock_release.assert_called_once_with("upload_nexus_contents", "mystore")
 
+    @patch("retail.projects.tasks.UploadNexusContentsUseCase")
+    @patch("retail.projects.tasks.release_task_lock")
+    def test_reads_staged_contents_and_discards_them(
+        self, mock_release, mock_upload_cls
+    ):
+        from retail.projects.models import CrawlContentChunk
+        from retail.projects.tasks import task_upload_nexus_contents
+        from retail.projects.usecases.crawl_contents_staging import (
+            StagedCrawlContents,
+            stage_crawl_contents,
+        )
+
+        contents = [
+            {"link": f"https://a{i}.com", "title": f"Page {i}", "content": f"c{i}"}
+            for i in range(30)
+        ]
+        reference = stage_crawl_contents(self.onboarding, contents)
+        received = []
+        mock_upload_cls.return_value.execute.side_effect = (
+            lambda _account, staged: received.append((staged, list(staged)))
+        )
+
+        task_upload_nexus_contents(
+            "mystore", crawl_reference=reference, total_items=len(contents)
+        )
+
+        staged, items = received[0]
+        self.assertIsInstance(staged, StagedCrawlContents)
+        self.assertEqual(len(staged), 30)
+        self.assertEqual(items, contents)
+        self.assertFalse(CrawlContentChunk.objects.filter(reference=reference).exists())
+        mock_release.assert_called_once_with("upload_nexus_contents", "mystore")
+
     @patch("retail.projects.tasks.SaveBackgroundFailureUseCase")
     @patch("retail.projects.tasks.UploadNexusContentsUseCase")
     @patch("retail.projects.tasks.release_task_lock")
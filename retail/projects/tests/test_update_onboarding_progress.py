@@ -1,9 +1,10 @@
-from unittest.mock import MagicMock, patch
+from unittest.mock import ANY, MagicMock, patch
 from uuid import uuid4
 
 from django.test import TestCase
+from kombu.serialization import dumps
 
-from retail.projects.models import Project, ProjectOnboarding
+from retail.projects.models import CrawlContentChunk, Project, ProjectOnboarding
 from retail.projects.usecases.onboarding_dto import CrawlerWebhookDTO
 from retail.projects.usecases.update_onboarding_progress import (
     COMPLETED_EVENT,
@@ -104,7 +105,12 @@ class TestUpdateOnboardingProgressUseCase(TestCase):
         self.assertEqual(result.progress, 75)
         self.assertEqual(result.crawler_result, ProjectOnboarding.SUCCESS)
         mock_lock.assert_called_once_with("upload_nexus_contents", "mystore")
-        mock_task.delay.assert_called_once_with("mystore", contents)
+        mock_task.delay.assert_called_once_with(
+            "mystore", crawl_reference=ANY, total_items=1
+        )
+        reference = mock_task.delay.call_args.kwargs["crawl_reference"]
+        chunk = CrawlContentChunk.objects.get(reference=reference)
+        self.assertEqual(chunk.items, contents)
         self.onboarding.refresh_from_db()
         snapshot = self.onboarding.config["content_base_progress"]
         self.assertEqual(snapshot["crawl_percent"], 100)
@@ -112,6 +118,50 @@ class TestUpdateOnboardingProgressUseCase(TestCase):
         self.assertEqual(snapshot["status"], "uploading")
         self.assertEqual(snapshot["total_files"], 1)
 
+    @patch(
+        "retail.projects.usecases.update_onboarding_progress.task_upload_nexus_contents"
+    )
+    @patch(
+        "retail.projects.usecases.update_onboarding_progress.acquire_task_lock",
+        return_value=True,
+    )
+    def test_completed_task_message_size_does_not_grow_with_the_crawl(
+        self, _mock_lock, mock_task
+    ):
+        """Page bodies are staged in the database; the broker only ever
+        carries the reference and the item count."""
+        message_sizes = []
+        for pages in (1, 300):
+            contents = [
+                {
+                    "link": f"https://mystore.com.br/p/{index}",
+                    "title": f"Product {index}",
+                    "content": "x" * 20_000,
+                }
+                for index in range(pages)
+            ]
+            dto = CrawlerWebhookDTO(
+                task_id="task-1",
+                event=COMPLETED_EVENT,
+                timestamp="2026-01-01T00:00:00Z",
+                url="https://mystore.com.br/",
+                progress=100,
+                data={"contents": contents},
+            )
+            mock_task.reset_mock()
+
+            self.use_case.execute(self.onboarding_uuid, dto)
+
+            call = mock_task.delay.call_args
+            _, _, body = dumps([call.args, call.kwargs, {}], serializer="json")
+            message_sizes.append(len(body))
+
+        self.assertLess(max(message_sizes), 256)
+        # The only difference is the digits of total_items.
+        self.assertEqual(message_sizes[1] - message_sizes[0], len("300") - len("1"))
+        # Only the latest crawl stays staged, one chunk per Nexus batch.
+        self.assertEqual(CrawlContentChunk.objects.count(), 12)
+
     @patch(
         "retail.projects.usecases.update_onboarding_progress.task_upload_nexus_contents"
     )
@@ -133,6 +183,7 @@ class TestUpdateOnboardingProgressUseCase(TestCase):
 
         self.assertEqual(result.crawler_result, ProjectOnboarding.SUCCESS)
         mock_task.delay.assert_not_called()
+        self.assertFalse(CrawlContentChunk.objects.exists())
         self.onboarding.refresh_from_db()
         snapshot = self.onboarding.config["content_base_progress"]
         self.assertEqual(snapshot["status"], "complete")
@@ -262,11 +262,11 @@ class TestUploadNexusContentsUseCase(TestCase):
             self.mock_nexus_service.get_content_base_batch_progress.call_count, 2
         )
 
-    @patch("retail.projects.usecases.upload_nexus_contents.persist_content_base_progress")
+    @patch(
+        "retail.projects.usecases.upload_nexus_contents.persist_content_base_progress"
+    )
     @patch("retail.projects.usecases.upload_nexus_contents.time.sleep")
-    def test_persists_progress_during_batch_polling(
-        self, _mock_sleep, mock_persist
-    ):
+    def test_persists_progress_during_batch_polling(self, _mock_sleep, mock_persist):
         upload_uuid = str(uuid4())
         self.mock_nexus_service.upload_content_base_files_batch.return_value = (
             _batch_upload_response(upload_uuid)
@@ -292,7 +292,9 @@ class TestUploadNexusContentsUseCase(TestCase):
         ]
         self.assertEqual(upload_percents, [0, 50, 100])
 
-    @patch("retail.projects.usecases.upload_nexus_contents.persist_content_base_progress")
+    @patch(
+        "retail.projects.usecases.upload_nexus_contents.persist_content_base_progress"
+    )
     @patch("retail.projects.usecases.upload_nexus_contents.time.sleep")
     def test_multi_batch_persists_mid_batch_before_second_batch_starts(
         self, _mock_sleep, mock_persist
@@ -429,6 +431,39 @@ class TestUploadNexusContentsUseCase(TestCase):
         self.assertEqual(len(first_call_files), BATCH_MAX_FILES)
         self.assertEqual(len(second_call_files), 1)
 
+    @patch("retail.projects.usecases.upload_nexus_contents.time.sleep")
+    def test_uploads_staged_contents_in_batches(self, _mock_sleep):
+        from retail.projects.usecases.crawl_contents_staging import (
+            StagedCrawlContents,
+            stage_crawl_contents,
+        )
+
+        self.mock_nexus_service.upload_content_base_files_batch.side_effect = [
+            _batch_upload_response(*[str(uuid4()) for _ in range(BATCH_MAX_FILES)]),
+            _batch_upload_response(str(uuid4())),
+        ]
+        self.mock_nexus_service.get_content_base_batch_progress.return_value = (
+            _batch_progress_response()
+        )
+        contents = [
+            {"link": f"https://a{i}.com", "title": f"Page {i}", "content": f"c{i}"}
+            for i in range(BATCH_MAX_FILES + 1)
+        ]
+        reference = stage_crawl_contents(self.onboarding, contents)
+
+        self.usecase.execute(
+            "mystore", StagedCrawlContents(reference, total_items=len(contents))
+        )
+
+        calls = self.mock_nexus_service.upload_content_base_files_batch.call_args_list
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(len(calls[0][1]["files"]), BATCH_MAX_FILES)
+        second_batch_files = calls[1][1]["files"]
+        self.assertEqual(len(second_batch_files), 1)
+        filename, file_bytes, _ = second_batch_files[0]
+        self.assertEqual(file_bytes, b"c25")
+        self.assertEqual(filename, _sanitize_filename("Page 25", 25))
+
 
 class TestBuildFilesFromContents(TestCase):
     def test_builds_files_with_correct_structure(self):
@@ -0,0 +1,89 @@
+"""
+Crawl results staged in Postgres for the background Nexus upload.
+
+A completed crawl carries the full body of every crawled page. Passing
+that list as a Celery argument pushed multi-megabyte messages through
+the broker and kept the whole crawl in worker memory for the length of
+the upload. The webhook now stores the pages as ``CrawlContentChunk``
+rows of ``BATCH_MAX_FILES`` items (one Nexus upload batch each) and
+enqueues only the reference and the item count; the upload reads one
+chunk at a time through ``StagedCrawlContents``.
+
+Staging a new crawl replaces whatever an earlier crawl of the same
+onboarding left behind, and the upload task discards its chunks when
+it ends, successfully or not.
+"""
+
+import logging
+from typing import Iterator, List
+from uuid import UUID, uuid4
+
+from django.db import transaction
+
+from retail.projects.models import CrawlContentChunk, ProjectOnboarding
+from retail.projects.usecases.upload_nexus_contents import BATCH_MAX_FILES
+
+logger = logging.getLogger(__name__)
+
+
+def stage_crawl_contents(onboarding: ProjectOnboarding, contents: List[dict]) -> str:
+    """
+    Stores ``contents`` for ``onboarding`` and returns the reference the
+    upload task reads them back with.
+    """
+    reference = uuid4()
+    chunks = [
+        CrawlContentChunk(
+            onboarding=onboarding,
+            reference=reference,
+            position=position,
+            items=contents[start : start + BATCH_MAX_FILES],  # noqa: E203
+        )
+        for position, start in enumerate(range(0, len(contents), BATCH_MAX_FILES))
+    ]
+    with transaction.atomic():
+        CrawlContentChunk.objects.filter(onboarding=onboarding).delete()
+        CrawlContentChunk.objects.bulk_create(chunks)
+
+    logger.info(
+        f"Staged {len(contents)} crawled pages in {len(chunks)} chunk(s) for "
+        f"onboarding={onboarding.uuid} reference={reference}"
+    )
+    return str(reference)
+
+
+def discard_crawl_contents(reference: str) -> None:
+    CrawlContentChunk.objects.filter(reference=reference).delete()
+
+
+class StagedCrawlContents:
+    """
+    Lazy sequence of the pages staged under ``reference``.
+
+    ``len()`` is the item count recorded by the webhook, so progress can
+    be reported before anything is read. Iterating loads one chunk per
+    query instead of holding a cursor open across the Nexus polling.
+    """
+
+    def __init__(self, reference: str, total_items: int):
+        self.reference = UUID(str(reference))
+        self.total_items = total_items
+
+    def __len__(self) -> int:
+        return self.total_items
+
+    def __iter__(self) -> Iterator[dict]:
+        positions = list(
+            CrawlContentChunk.objects.filter(reference=self.reference)
+            .order_by("position")
+            .values_list("position", flat=True)
+        )
+        for position in positions:
+            items = (
+                CrawlContentChunk.objects.filter(
+                    reference=self.reference, position=position
+                )
+                .values_list("items", flat=True)
+                .first()
+            )
+            yield from items or []
@@ -1,5 +1,11 @@
+import contextvars
 import logging
-from typing import List, Set
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import List, Optional, Set
+
+from django.conf import settings
+from django.db.models import F, Value
+from django.db.models.functions import Greatest
 
 from retail.clients.nexus.client import NexusClient
 from retail.interfaces.clients.nexus.client import NexusClientInterface
@@ -21,6 +27,8 @@ logger = logging.getLogger(__name__)
 AGENT_PROGRESS_START = 75
 AGENT_PROGRESS_END = 100
 
+DEFAULT_AGENT_INTEGRATION_WORKERS = 4
+
 
 class AgentIntegrationError(Exception):
     """Raised when agent integration fails."""
@@ -37,6 +45,12 @@ class IntegrateAgentsUseCase:
     Agents already integrated in the project are detected via the
     Nexus app-teams list and skipped to avoid duplicates.
 
+    Agents are independent of each other: the ones that only call Nexus
+    run in a pool of ``ONBOARDING_AGENT_INTEGRATION_WORKERS`` threads
+    while the ones flagged ``uses_database`` run on the calling thread.
+    Progress follows the number of agents done and is persisted with
+    ``GREATEST`` so it never moves backwards.
+
     Progress: 75% -> 100%.
     """
 
@@ -89,39 +103,91 @@ class IntegrateAgentsUseCase:
         integrated_uuids: Set[str],
     ) -> None:
         total = len(agents)
-        progress_range = AGENT_PROGRESS_END - AGENT_PROGRESS_START
-
-        for index, agent in enumerate(agents):
+        pending = []
+        for agent in agents:
             if agent.uuid in integrated_uuids:
                 logger.info(
                     f"Agent {agent.name} ({agent.uuid}) already integrated "
                     f"for project={context.project_uuid}, skipping."
                 )
-                onboarding.progress = AGENT_PROGRESS_START + int(
-                    ((index + 1) / total) * progress_range
-                )
-                onboarding.save(update_fields=["progress"])
-                continue
-
-            result = agent.integrate(context, self.nexus_service)
+            else:
+                pending.append(agent)
+
+        done = total - len(pending)
+        if done:
+            self._persist_progress(onboarding, done, total)
+
+        pooled = [agent for agent in pending if not agent.uses_database]
+        workers = min(
+            getattr(
+                settings,
+                "ONBOARDING_AGENT_INTEGRATION_WORKERS",
+                DEFAULT_AGENT_INTEGRATION_WORKERS,
+            ),
+            len(pooled),
+        )
+        if workers < 2:
+            pooled = []
+        inline = [agent for agent in pending if agent not in pooled]
+
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+            # Each agent runs in a copy of this context so the task's HTTP
+            # accounting (``record_http_call``) sees the pooled Nexus calls.
+            futures = {
+                executor.submit(
+                    contextvars.copy_context().run,
+                    agent.integrate,
+                    context,
+                    self.nexus_service,
+                ): agent
+                for agent in pooled
+            }
+            try:
+                for agent in inline:
+                    result = agent.integrate(context, self.nexus_service)
+                    self._check_result(agent, context, result)
+                    done += 1
+                    self._persist_progress(onboarding, done, total)
+
+                for future in as_completed(futures):
+                    self._check_result(futures[future], context, future.result())
+                    done += 1
+                    self._persist_progress(onboarding, done, total)
+            except Exception:
+                executor.shutdown(wait=True, cancel_futures=True)
+                raise
 
-            if result is None:
-                raise AgentIntegrationError(
-                    f"Failed to integrate agent {agent.name} ({agent.uuid}) "
-                    f"for project={context.project_uuid}"
-                )
+        logger.info(
+            f"Agent integration completed for project={context.project_uuid}: "
+            f"{total} agents processed."
+        )
 
-            logger.info(
-                f"Agent {agent.name} ({agent.uuid}) integrated "
+    @staticmethod
+    def _check_result(
+        agent: OnboardingAgent, context: AgentContext, result: Optional[dict]
+    ) -> None:
+        if result is None:
+            raise AgentIntegrationError(
+                f"Failed to integrate agent {agent.name} ({agent.uuid}) "
                 f"for project={context.project_uuid}"
             )
 
-            onboarding.progress = AGENT_PROGRESS_START + int(
-                ((index + 1) / total) * progress_range
-            )
-            onboarding.save(update_fields=["progress"])
-
         logger.info(
-            f"Agent integration completed for project={context.project_uuid}: "
-            f"{total} agents processed."
+            f"Agent {agent.name} ({agent.uuid}) integrated "
+            f"for project={context.project_uuid}"
+        )
+
+    @staticmethod
+    def _persist_progress(onboarding: ProjectOnboarding, done: int, total: int) -> None:
+        """
+        Raises the stored progress to the value for ``done`` of ``total``
+        agents in a single UPDATE; a lower value never overwrites a
+        higher one.
+        """
+        progress = AGENT_PROGRESS_START + int(
+            (done / total) * (AGENT_PROGRESS_END - AGENT_PROGRESS_START)
+        )
+        ProjectOnboarding.objects.filter(pk=onboarding.pk).update(
+            progress=Greatest(F("progress"), Value(progress))
         )
+        onboarding.progress = max(onboarding.progress, progress)
@@ -1,6 +1,7 @@
 import logging
 
 from retail.projects.models import Project, ProjectOnboarding
+from retail.projects.usecases.pending_crawl import dispatch_pending_crawl
 
 logger = logging.getLogger(__name__)
 
@@ -17,7 +18,8 @@ class LinkProjectToOnboardingUseCase:
     Sets ``current_step = "PROJECT_CONFIG"`` and a partial progress
     (``PROJECT_LINKED_PROGRESS``) so the pre-crawl channel setup task
     can drive progress the rest of the way to 100% before the
-    NEXUS_CONFIG orchestrator runs.
+    NEXUS_CONFIG orchestrator runs, and dispatches that task if
+    start-setup left a crawl pending on the onboarding.
     """
 
     @staticmethod
@@ -65,3 +67,10 @@ class LinkProjectToOnboardingUseCase:
             f"(vtex_account={project.vtex_account}, "
             f"PROJECT_CONFIG={PROJECT_LINKED_PROGRESS}%)"
         )
+
+        # Start-setup may have recorded its crawl after the onboarding was
+        # loaded; re-read the request so a racing pair still dispatches.
+        onboarding.refresh_from_db(
+            fields=["pending_crawl_url", "pending_crawl_requested_on"]
+        )
+        dispatch_pending_crawl(onboarding)
@@ -36,6 +36,7 @@ class AbandonedCartAgent(ActiveAgent):
     """
 
     name = "Abandoned Cart"
+    uses_database = True
 
     def __init__(self):
         abandoned_cart_uuid = getattr(settings, "ABANDONED_CART_AGENT_UUID", "")
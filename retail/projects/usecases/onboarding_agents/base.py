@@ -36,6 +36,10 @@ class OnboardingAgent(ABC):
 
     uuid: str = ""
     name: str
+    # Agents that write through the Django ORM are integrated on the
+    # calling thread; the others only talk to Nexus and may run in the
+    # integration pool (see ``IntegrateAgentsUseCase``).
+    uses_database: bool = False
 
     def _validate_uuid(self) -> None:
         if not self.uuid:
@@ -56,7 +56,9 @@ class OnboardingOrchestrator:
     when the ``crawl.completed`` webhook arrives.
 
     Each step is sequential. If any step fails, progress freezes at the last
-    saved value and the error propagates.
+    saved value and the error propagates. The onboarding row is loaded once
+    and reused by the progress and channel helpers; the step use cases load
+    their own copy since they persist config this orchestrator never reads.
     """
 
     def execute(self, vtex_account: str, crawl_url: str) -> None:
@@ -74,14 +76,14 @@ class OnboardingOrchestrator:
                     f"Onboarding for vtex_account={vtex_account} has no project linked."
                 )
 
-            self._mark_nexus_config_started(vtex_account)
+            self._mark_nexus_config_started(onboarding)
 
             InitiateCrawlUseCase().execute(onboarding.project, vtex_account, crawl_url)
-            self._mark_crawl_kickoff(vtex_account)
+            self._mark_crawl_kickoff(onboarding)
 
             ConfigureAgentBuilderUseCase().execute(vtex_account)
 
-            channel_code = self._resolve_channel_code(vtex_account)
+            channel_code = self._resolve_channel_code(onboarding)
             if channel_code in CHANNELS_WITH_ONE_CLICK_PAYMENT:
                 ConfigureOneClickPaymentUseCase().execute(vtex_account)
 
@@ -93,31 +95,34 @@ class OnboardingOrchestrator:
         logger.info(f"NEXUS_CONFIG completed for vtex_account={vtex_account}")
 
     @staticmethod
-    def _mark_nexus_config_started(vtex_account: str) -> None:
+    def _mark_nexus_config_started(onboarding: ProjectOnboarding) -> None:
         """Transitions the onboarding into the NEXUS_CONFIG step."""
-        onboarding = ProjectOnboarding.objects.get(vtex_account=vtex_account)
         onboarding.current_step = "NEXUS_CONFIG"
         onboarding.progress = NEXUS_CONFIG_START_PROGRESS
-        onboarding.save(update_fields=["current_step", "progress"])
+        # update() rather than save(): ``completed`` is untouched, so the
+        # pre_save snapshot (one more SELECT of the row) is not needed.
+        ProjectOnboarding.objects.filter(pk=onboarding.pk).update(
+            current_step=onboarding.current_step, progress=onboarding.progress
+        )
 
     @staticmethod
-    def _mark_crawl_kickoff(vtex_account: str) -> None:
+    def _mark_crawl_kickoff(onboarding: ProjectOnboarding) -> None:
         """Records that the crawler was kicked off within NEXUS_CONFIG."""
-        onboarding = ProjectOnboarding.objects.get(vtex_account=vtex_account)
         onboarding.progress = CRAWL_KICKOFF_PROGRESS
-        onboarding.save(update_fields=["progress"])
+        ProjectOnboarding.objects.filter(pk=onboarding.pk).update(
+            progress=onboarding.progress
+        )
 
     @staticmethod
-    def _resolve_channel_code(vtex_account: str) -> str:
+    def _resolve_channel_code(onboarding: ProjectOnboarding) -> str:
         """Resolves the channel code from the onboarding config."""
-        onboarding = ProjectOnboarding.objects.get(vtex_account=vtex_account)
         channels = (onboarding.config or {}).get("channels", {})
         channel = next(iter(channels), None)
 
         if channel is None:
             raise ValueError(
                 f"No channel configured in onboarding "
-                f"for vtex_account={vtex_account}"
+                f"for vtex_account={onboarding.vtex_account}"
             )
 
         return channel
@@ -0,0 +1,155 @@
+"""
+Pending crawl requests for onboardings waiting on their project link.
+
+Start-setup used to enqueue ``task_setup_channel_and_start_crawl``
+right away and let it poll for the project link with
+``task.retry(countdown=10)`` up to 60 times, so every onboarding whose
+project was created asynchronously held a retry chain and a DB lookup
+every 10 seconds. The request is now recorded on the onboarding
+(``pending_crawl_url`` / ``pending_crawl_requested_on``) and the
+pipeline is dispatched once, by whichever side completes the pair:
+
+- ``request_crawl`` (start-setup) when the project is already linked;
+- ``LinkProjectToOnboardingUseCase`` when the link arrives later.
+
+Dispatching clears the request with a conditional UPDATE, so the two
+sides (and the sweeper) can race without enqueuing the pipeline twice.
+``ResumePendingCrawlsUseCase`` runs on a low-frequency beat schedule as
+the safety net: it dispatches linked requests a missed link event left
+behind and fails the ones whose project never showed up.
+"""
+
+import logging
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta
+from typing import Dict, Optional
+
+from django.conf import settings
+from django.utils import timezone
+
+from retail.projects.models import ProjectOnboarding
+from retail.projects.usecases.mark_onboarding_failed import mark_onboarding_failed
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_RESUME_AFTER_SECONDS = 120
+DEFAULT_LINK_TIMEOUT_SECONDS = 600
+
+
+def _dispatch_setup_task(vtex_account: str, crawl_url: str) -> None:
+    # Imported lazily: retail.projects.tasks imports this module.
+    from retail.projects.tasks import task_setup_channel_and_start_crawl
+
+    task_setup_channel_and_start_crawl.delay(vtex_account, crawl_url)
+
+
+def request_crawl(onboarding: ProjectOnboarding, crawl_url: str) -> bool:
+    """
+    Records ``crawl_url`` as the onboarding's pending crawl and
+    dispatches the pre-crawl pipeline if the project is already linked.
+
+    Returns True when the pipeline was dispatched; otherwise the link
+    event (or the sweeper) picks the request up later.
+    """
+    onboarding.pending_crawl_url = crawl_url
+    onboarding.pending_crawl_requested_on = timezone.now()
+    onboarding.save(update_fields=["pending_crawl_url", "pending_crawl_requested_on"])
+    return dispatch_pending_crawl(onboarding)
+
+
+def dispatch_pending_crawl(onboarding: ProjectOnboarding) -> bool:
+    """
+    Hands the onboarding's pending crawl to the pre-crawl pipeline.
+
+    The request is claimed with an UPDATE conditioned on the project
+    being linked in the database and on the request still being the
+    one loaded on ``onboarding``, so concurrent callers dispatch it at
+    most once. Returns True when this call dispatched it.
+    """
+    crawl_url = onboarding.pending_crawl_url
+    requested_on = onboarding.pending_crawl_requested_on
+    if requested_on is None:
+        return False
+
+    claimed = ProjectOnboarding.objects.filter(
+        pk=onboarding.pk,
+        project__isnull=False,
+        pending_crawl_url=crawl_url,
+        pending_crawl_requested_on=requested_on,
+    ).update(pending_crawl_url="", pending_crawl_requested_on=None)
+    if not claimed:
+        return False
+
+    onboarding.pending_crawl_url = ""
+    onboarding.pending_crawl_requested_on = None
+    _dispatch_setup_task(onboarding.vtex_account, crawl_url)
+
+    logger.info(
+        f"Dispatched pre-crawl setup for vtex_account={onboarding.vtex_account} "
+        f"(crawl_url={crawl_url}, waited "
+        f"{(timezone.now() - requested_on).total_seconds():.1f}s for the link)"
+    )
+    return True
+
+
+@dataclass
+class ResumePendingCrawlsResult:
+    resumed: int = 0
+    expired: int = 0
+
+    def as_dict(self) -> Dict[str, int]:
+        return asdict(self)
+
+
+class ResumePendingCrawlsUseCase:
+    """
+    Safety net for pending crawl requests nothing dispatched.
+
+    Requests older than ``PENDING_CRAWL_RESUME_AFTER_SECONDS`` whose
+    project is linked are dispatched (the link event was lost or raced
+    start-setup). Requests older than ``PENDING_CRAWL_LINK_TIMEOUT_SECONDS``
+    still without a project fail the onboarding, as the exhausted
+    retry chain used to.
+    """
+
+    def execute(self, now: Optional[datetime] = None) -> ResumePendingCrawlsResult:
+        now = now or timezone.now()
+        resume_after = getattr(
+            settings, "PENDING_CRAWL_RESUME_AFTER_SECONDS", DEFAULT_RESUME_AFTER_SECONDS
+        )
+        link_timeout = getattr(
+            settings, "PENDING_CRAWL_LINK_TIMEOUT_SECONDS", DEFAULT_LINK_TIMEOUT_SECONDS
+        )
+        result = ResumePendingCrawlsResult()
+
+        pending = ProjectOnboarding.objects.filter(
+            pending_crawl_requested_on__isnull=False
+        )
+        for onboarding in pending.filter(
+            project__isnull=False,
+            pending_crawl_requested_on__lte=now - timedelta(seconds=resume_after),
+        ):
+            result.resumed += dispatch_pending_crawl(onboarding)
+
+        for onboarding in pending.filter(
+            project__isnull=True,
+            pending_crawl_requested_on__lte=now - timedelta(seconds=link_timeout),
+        ):
+            expired = ProjectOnboarding.objects.filter(
+                pk=onboarding.pk,
+                project__isnull=True,
+                pending_crawl_requested_on=onboarding.pending_crawl_requested_on,
+            ).update(pending_crawl_url="", pending_crawl_requested_on=None)
+            if expired:
+                mark_onboarding_failed(
+                    onboarding.vtex_account,
+                    "Project was never linked: pending crawl timed out",
+                )
+                result.expired += 1
+
+        if result.resumed or result.expired:
+            logger.info(
+                f"Pending crawl sweep: resumed={result.resumed} "
+                f"expired={result.expired}"
+            )
+        return result
@@ -1,7 +1,6 @@
 import logging
 
 from retail.projects.models import Project, ProjectOnboarding
-from retail.projects.tasks import task_setup_channel_and_start_crawl
 from retail.projects.usecases.mark_onboarding_failed import mark_onboarding_failed
 from retail.projects.usecases.onboarding_agents.agent_mappings import SUPPORTED_CHANNELS
 from retail.projects.usecases.onboarding_access import (
@@ -9,6 +8,7 @@ from retail.projects.usecases.onboarding_access import (
     onboarding_linked_to_active_project_record,
 )
 from retail.projects.usecases.onboarding_dto import StartSetupDTO
+from retail.projects.usecases.pending_crawl import request_crawl
 
 logger = logging.getLogger(__name__)
 
@@ -18,15 +18,14 @@ class StartSetupUseCase:
     Initiates the setup process for a store.
 
     Creates/gets the onboarding record, stores channel configuration
-    (including channel_data for wpp-cloud), then schedules a single
-    background task that waits for the project link, creates the
-    channel, and starts the crawl.
-
-    The pre-crawl channel setup is dispatched unconditionally — even
-    when the project is already linked — so the task owns the channel
-    creation + crawl initiation pipeline end-to-end and the HTTP
-    response returns immediately while the (potentially slow) Meta
-    handshake runs asynchronously.
+    (including channel_data for wpp-cloud), then records the crawl as
+    pending on the onboarding (see ``usecases.pending_crawl``).
+
+    When the project is already linked the pre-crawl task is dispatched
+    right away; otherwise it is dispatched by the project link event.
+    Either way the task owns the channel creation + crawl initiation
+    pipeline end-to-end and the HTTP response returns immediately while
+    the (potentially slow) Meta handshake runs asynchronously.
     """
 
     def execute(self, dto: StartSetupDTO) -> None:
@@ -64,11 +63,11 @@ class StartSetupUseCase:
             mark_onboarding_failed(dto.vtex_account, str(exc))
             raise
 
-        task_setup_channel_and_start_crawl.delay(dto.vtex_account, dto.crawl_url)
+        dispatched = request_crawl(onboarding, dto.crawl_url)
 
         logger.info(
-            f"Scheduled pre-crawl setup task for vtex_account={dto.vtex_account} "
-            f"(project_linked={onboarding.project_id is not None}, "
+            f"Requested crawl for vtex_account={dto.vtex_account} "
+            f"(pre-crawl setup dispatched={dispatched}, "
             f"crawl_url={dto.crawl_url})"
         )
 
@@ -5,6 +5,7 @@ from retail.projects.models import ProjectOnboarding
 from retail.projects.tasks import (
     UPLOAD_NEXUS_LOCK_NAME,
     acquire_task_lock,
+    release_task_lock,
     task_upload_nexus_contents,
 )
 from retail.projects.usecases.content_base_progress_helpers import (
@@ -13,6 +14,7 @@ from retail.projects.usecases.content_base_progress_helpers import (
     mark_content_base_complete_with_no_files,
     persist_content_base_progress,
 )
+from retail.projects.usecases.crawl_contents_staging import stage_crawl_contents
 from retail.projects.usecases.onboarding_dto import CrawlerWebhookDTO
 from retail.projects.usecases.save_background_failure import (
     SaveBackgroundFailureUseCase,
@@ -76,6 +78,10 @@ class UpdateOnboardingProgressUseCase:
         Records the crawl as successful and dispatches the background
         Nexus content upload.
 
+        The crawled pages are staged in the database and the task only
+        receives their reference and count, so the broker message stays
+        the same size however large the crawl is.
+
         Does NOT touch ``onboarding.progress`` -- by the time this
         webhook arrives the main wizard may already be at
         ``NEXUS_CONFIG`` 100%, and pushing the bar back to 100 (or any
@@ -105,7 +111,16 @@ class UpdateOnboardingProgressUseCase:
         )
 
         if acquire_task_lock(UPLOAD_NEXUS_LOCK_NAME, vtex_account):
-            task_upload_nexus_contents.delay(vtex_account, contents)
+            try:
+                crawl_reference = stage_crawl_contents(onboarding, contents)
+                task_upload_nexus_contents.delay(
+                    vtex_account,
+                    crawl_reference=crawl_reference,
+                    total_items=total_files,
+                )
+            except Exception:
+                release_task_lock(UPLOAD_NEXUS_LOCK_NAME, vtex_account)
+                raise
         else:
             logger.warning(
                 f"Nexus upload task already running for vtex_account={vtex_account}, "
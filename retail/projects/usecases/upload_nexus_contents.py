@@ -1,9 +1,11 @@
 import logging
+import math
 import re
 import time
 import unicodedata
 
-from typing import List, Tuple
+from itertools import islice
+from typing import Collection, Iterator, List, Tuple
 
 from retail.clients.nexus.client import NexusClient
 from retail.interfaces.clients.nexus.client import NexusClientInterface
@@ -46,6 +48,9 @@ class UploadNexusContentsUseCase:
     Partial ingestion failures within a batch are logged but do not
     abort the upload when at least one file succeeds (best-effort).
 
+    ``contents`` may be a list or a ``StagedCrawlContents``; files are
+    built one batch at a time so a staged crawl is never fully loaded.
+
     Background path: does NOT touch ``onboarding.progress`` -- the main
     wizard is decoupled from the crawl outcome.
     """
@@ -56,11 +61,11 @@ class UploadNexusContentsUseCase:
     ):
         self.nexus_service = NexusService(nexus_client=nexus_client or NexusClient())
 
-    def execute(self, vtex_account: str, contents: list) -> None:
+    def execute(self, vtex_account: str, contents: Collection[dict]) -> None:
         """
         Args:
             vtex_account: The VTEX account identifier for the onboarding.
-            contents: List of dicts with 'link', 'title', and 'content' keys.
+            contents: Dicts with 'link', 'title', and 'content' keys.
 
         Raises:
             ProjectNotLinkedError: If the onboarding has no project linked.
@@ -78,7 +83,7 @@ class UploadNexusContentsUseCase:
         self,
         onboarding: ProjectOnboarding,
         project_uuid: str,
-        contents: list,
+        contents: Collection[dict],
     ) -> None:
         """
         Converts crawled content to .txt files and uploads them to Nexus
@@ -93,17 +98,18 @@ class UploadNexusContentsUseCase:
             )
             return
 
-        files = self._build_files_from_contents(contents)
-        total = len(files)
-        batches = _chunk_files(files, BATCH_MAX_FILES)
+        total = len(contents)
+        batch_count = math.ceil(total / BATCH_MAX_FILES)
         uploaded_file_uuids: List[str] = []
 
         logger.info(
             f"Uploading {total} content files to Nexus for project={project_uuid} "
-            f"in {len(batches)} batch(es)"
+            f"in {batch_count} batch(es)"
         )
 
-        for batch_index, batch in enumerate(batches):
+        for batch_index, batch in enumerate(
+            self._iter_file_batches(contents, BATCH_MAX_FILES)
+        ):
             response = self.nexus_service.upload_content_base_files_batch(
                 project_uuid=project_uuid,
                 files=batch,
@@ -132,7 +138,7 @@ class UploadNexusContentsUseCase:
             uploaded_file_uuids.extend(batch_file_uuids)
 
             logger.info(
-                f"Batch {batch_index + 1}/{len(batches)} uploaded for "
+                f"Batch {batch_index + 1}/{batch_count} uploaded for "
                 f"project={project_uuid}: file_uuids={batch_file_uuids}"
             )
 
@@ -235,9 +241,23 @@ class UploadNexusContentsUseCase:
         )
         return 0
 
+    @classmethod
+    def _iter_file_batches(
+        cls, contents: Collection[dict], batch_size: int
+    ) -> Iterator[List[Tuple[str, bytes, str]]]:
+        """Yields the files of ``contents`` ``batch_size`` at a time."""
+        items = iter(contents)
+        start = 0
+        while True:
+            batch = list(islice(items, batch_size))
+            if not batch:
+                return
+            yield cls._build_files_from_contents(batch, start=start)
+            start += len(batch)
+
     @staticmethod
     def _build_files_from_contents(
-        contents: list,
+        contents: list, start: int = 0
     ) -> List[Tuple[str, bytes, str]]:
         """
         Converts a list of crawled page contents into in-memory .txt files.
@@ -246,13 +266,15 @@ class UploadNexusContentsUseCase:
 
         Args:
             contents: List of dicts with 'link', 'title', and 'content' keys.
+            start: Position of the first item in the whole crawl, so
+                filenames stay unique across batches.
 
         Returns:
             List of tuples (filename, file_bytes, content_type).
         """
         files = []
 
-        for index, item in enumerate(contents):
+        for index, item in enumerate(contents, start=start):
             title = item.get("title") or f"page_{index}"
             content = item.get("content") or ""
 
@@ -264,12 +286,6 @@ class UploadNexusContentsUseCase:
         return files
 
 
-def _chunk_files(
-    files: List[Tuple[str, bytes, str]], chunk_size: int
-) -> List[List[Tuple[str, bytes, str]]]:
-    return [files[i : i + chunk_size] for i in range(0, len(files), chunk_size)]  # noqa: E203
-
-
 def _sanitize_filename(title: str, index: int) -> str:
     """
     Generates a safe filename from a page title.
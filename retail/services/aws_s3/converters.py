@@ -1,4 +1,5 @@
 import base64
+import hashlib
 import logging
 from uuid import uuid4
 from io import BytesIO
@@ -7,6 +8,11 @@ from typing import Protocol, Any, Optional, runtime_checkable
 import requests
 from django.core.files.uploadedfile import InMemoryUploadedFile, UploadedFile
 
+from retail.services.aws_s3.image_download_cache import (
+    ImageDownloadCache,
+    get_image_download_cache,
+)
+
 
 logger = logging.getLogger(__name__)
 
@@ -18,11 +24,20 @@ class ConverterInterface(Protocol):
 
 
 class ImageUrlToBase64Converter:
-    """Converts an image URL to a base64 Data URI string."""
+    """Converts an image URL to a base64 Data URI string.
+
+    Downloads go through ``ImageDownloadCache``: a URL converted before
+    is revalidated with a conditional GET and its cached encoding is
+    reused on ``304 Not Modified``.
+    """
 
     IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg", ".gif", ".webp", ".bmp")
     DEFAULT_CONTENT_TYPE = "image/png"
     REQUEST_TIMEOUT = 30
+    CHUNK_SIZE = 64 * 1024
+
+    def __init__(self, download_cache: Optional[ImageDownloadCache] = None):
+        self.download_cache = download_cache or get_image_download_cache()
 
     def is_image_url(self, url: str) -> bool:
         """Check if the string is an image URL."""
@@ -47,17 +62,41 @@ class ImageUrlToBase64Converter:
             return None
 
         try:
-            response = requests.get(image_url, timeout=self.REQUEST_TIMEOUT)
-            response.raise_for_status()
-
-            content_type = response.headers.get(
-                "Content-Type", self.DEFAULT_CONTENT_TYPE
+            cached = self.download_cache.lookup(image_url)
+            response = requests.get(
+                image_url,
+                timeout=self.REQUEST_TIMEOUT,
+                stream=True,
+                headers=cached.conditional_headers() if cached else {},
+            )
+            try:
+                if cached and response.status_code == 304:
+                    self.download_cache.touch(image_url, cached)
+                    return cached.data_uri
+
+                response.raise_for_status()
+
+                content_type = response.headers.get(
+                    "Content-Type", self.DEFAULT_CONTENT_TYPE
+                )
+                # Clean content-type (remove charset if present)
+                if ";" in content_type:
+                    content_type = content_type.split(";")[0].strip()
+
+                content, sha256 = self._read_body(response)
+            finally:
+                response.close()
+
+            image_base64 = base64.b64encode(content).decode("utf-8")
+            self.download_cache.store(
+                image_url,
+                etag=response.headers.get("ETag", ""),
+                last_modified=response.headers.get("Last-Modified", ""),
+                content_type=content_type,
+                sha256=sha256,
+                size=len(content),
+                base64_content=image_base64,
             )
-            # Clean content-type (remove charset if present)
-            if ";" in content_type:
-                content_type = content_type.split(";")[0].strip()
-
-            image_base64 = base64.b64encode(response.content).decode("utf-8")
             return f"data:{content_type};base64,{image_base64}"
 
         except requests.RequestException as e:
@@ -67,6 +106,15 @@ class ImageUrlToBase64Converter:
             logger.error(f"Failed to convert image URL to base64: {e}")
             return None
 
+    def _read_body(self, response) -> tuple[bytearray, str]:
+        """Read the streamed body into one buffer, hashing it on the way."""
+        content = bytearray()
+        digest = hashlib.sha256()
+        for chunk in response.iter_content(chunk_size=self.CHUNK_SIZE):
+            content.extend(chunk)
+            digest.update(chunk)
+        return content, digest.hexdigest()
+
 
 class Base64ToUploadedFileConverter(ConverterInterface):
     def convert(self, file: str) -> UploadedFile:
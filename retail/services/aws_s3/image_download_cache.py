@@ -0,0 +1,169 @@
+"""Content-addressed cache of downloaded template header images.
+
+``ImageUrlToBase64Converter`` turns a header image URL into a base64
+Data URI every time a template is created or updated, and the same URL
+is typically reused by every version of a template and across agents.
+``ImageDownloadCache`` keeps two kinds of entries in the Django cache
+(Redis in production, shared by web and Celery processes):
+
+- per URL, the validators the server sent (``ETag`` and/or
+  ``Last-Modified``), the content type and the SHA-256 of the bytes;
+- per SHA-256, the base64 encoding of the bytes, so URLs serving the
+  same image share one entry.
+
+A cached URL is revalidated with a conditional GET; a ``304`` reuses
+the encoded bytes without downloading them. Responses without
+validators are not cached (they could never be revalidated), nor are
+images larger than ``IMAGE_DOWNLOAD_CACHE_MAX_BYTES``. Entries live for
+``IMAGE_DOWNLOAD_CACHE_SECONDS``; 0 disables the cache. If the backend
+is unreachable the converter downloads as before and stops trying the
+backend until its ``BackoffGate`` reopens.
+"""
+
+import functools
+import hashlib
+import logging
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+
+from retail.observability.backoff import BackoffGate
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class CachedImage:
+    etag: str
+    last_modified: str
+    content_type: str
+    sha256: str
+    base64_content: str
+
+    @property
+    def data_uri(self) -> str:
+        return f"data:{self.content_type};base64,{self.base64_content}"
+
+    def conditional_headers(self) -> Dict[str, str]:
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ImageDownloadCache:
+    """URL → validators → content-addressed base64 image cache."""
+
+    URL_KEY_PREFIX = "image_download:url"
+    CONTENT_KEY_PREFIX = "image_download:content"
+    DEFAULT_CACHE_SECONDS = 86400
+    DEFAULT_MAX_BYTES = 5 * 1024 * 1024
+
+    def __init__(self, cache_backend=None):
+        self._cache_backend = cache_backend
+        self._cache_gate = BackoffGate(
+            logger, "[IMAGE_DOWNLOAD_CACHE] Cache unavailable, downloading without it"
+        )
+
+    @property
+    def backend(self):
+        return self._cache_backend or cache
+
+    @property
+    def cache_seconds(self) -> int:
+        return max(
+            0,
+            getattr(
+                settings, "IMAGE_DOWNLOAD_CACHE_SECONDS", self.DEFAULT_CACHE_SECONDS
+            ),
+        )
+
+    @property
+    def max_bytes(self) -> int:
+        return getattr(
+            settings, "IMAGE_DOWNLOAD_CACHE_MAX_BYTES", self.DEFAULT_MAX_BYTES
+        )
+
+    @property
+    def enabled(self) -> bool:
+        return self.cache_seconds > 0 and self._cache_gate.available
+
+    def url_key(self, url: str) -> str:
+        digest = hashlib.sha1(url.encode("utf-8")).hexdigest()
+        return f"{self.URL_KEY_PREFIX}:{digest}"
+
+    def content_key(self, sha256: str) -> str:
+        return f"{self.CONTENT_KEY_PREFIX}:{sha256}"
+
+    def lookup(self, url: str) -> Optional[CachedImage]:
+        """Return the cached image of ``url`` to revalidate, if any."""
+        if not self.enabled:
+            return None
+        try:
+            entry = self.backend.get(self.url_key(url))
+            if not entry:
+                return None
+            base64_content = self.backend.get(self.content_key(entry["sha256"]))
+        except Exception as exc:
+            self._cache_gate.trip(exc)
+            return None
+        if base64_content is None:
+            return None
+        return CachedImage(
+            etag=entry["etag"],
+            last_modified=entry["last_modified"],
+            content_type=entry["content_type"],
+            sha256=entry["sha256"],
+            base64_content=base64_content,
+        )
+
+    def store(
+        self,
+        url: str,
+        etag: str,
+        last_modified: str,
+        content_type: str,
+        sha256: str,
+        size: int,
+        base64_content: str,
+    ) -> bool:
+        """Cache a fresh download; returns whether it was stored."""
+        if not self.enabled or not (etag or last_modified) or size > self.max_bytes:
+            return False
+        ttl = self.cache_seconds
+        try:
+            self.backend.set(self.content_key(sha256), base64_content, timeout=ttl)
+            self.backend.set(
+                self.url_key(url),
+                {
+                    "etag": etag,
+                    "last_modified": last_modified,
+                    "content_type": content_type,
+                    "sha256": sha256,
+                },
+                timeout=ttl,
+            )
+        except Exception as exc:
+            self._cache_gate.trip(exc)
+            return False
+        return True
+
+    def touch(self, url: str, cached: CachedImage) -> None:
+        """Extend a revalidated entry by another ``cache_seconds``."""
+        ttl = self.cache_seconds
+        try:
+            self.backend.touch(self.content_key(cached.sha256), timeout=ttl)
+            self.backend.touch(self.url_key(url), timeout=ttl)
+        except Exception as exc:
+            self._cache_gate.trip(exc)
+
+
+@functools.lru_cache(maxsize=None)
+def get_image_download_cache() -> ImageDownloadCache:
+    """Process-wide instance so an outage is backed off once per process."""
+    return ImageDownloadCache()
@@ -0,0 +1,152 @@
+"""Shared cache of presigned GET URLs for long-lived S3 objects.
+
+Template header images are the same S3 object for every message of a
+campaign, yet ``Broadcast.build_broadcast_template_message`` used to
+build a fresh ``S3Service`` (and with it a boto3 client) and sign a new
+URL for every message. ``PresignedUrlCache`` signs each key once and
+keeps the URL in the Django cache (Redis in production, so every web
+and Celery process shares it) for ``S3_PRESIGNED_URL_CACHE_SECONDS``.
+
+URLs are signed for ``SIGNED_URL_SECONDS`` (the ``S3Service`` default)
+and cached for at most ``SIGNED_URL_SECONDS - MIN_REMAINING_SECONDS``,
+so a URL handed out right before its entry expires is still valid when
+Flows/WhatsApp fetches the media.
+
+Each process also memoises the entries it has read until the shared
+entry's deadline, so a 50k-message campaign does not cost a Redis round
+trip per message. If the cache backend is unreachable the URL is
+signed directly, nothing is memoised, and the backend is backed off
+through a ``BackoffGate``.
+"""
+
+import functools
+import hashlib
+import logging
+import threading
+import time
+from typing import Callable, Dict, Optional, Tuple
+
+from django.conf import settings
+from django.core.cache import cache
+
+from retail.interfaces.services.aws_s3 import S3ServiceInterface
+from retail.observability.backoff import BackoffGate
+
+
+logger = logging.getLogger(__name__)
+
+
+class PresignedUrlCache:
+    """Sign-once cache for presigned S3 GET URLs."""
+
+    KEY_PREFIX = "s3_presigned_url"
+    SIGNED_URL_SECONDS = 3600
+    MIN_REMAINING_SECONDS = 300
+    DEFAULT_CACHE_SECONDS = 3000
+    MAX_LOCAL_ENTRIES = 1024
+
+    def __init__(self, cache_backend=None):
+        self._cache_backend = cache_backend
+        self._lock = threading.Lock()
+        # cache key -> (url, wall-clock deadline shared with the cache entry)
+        self._local: Dict[str, Tuple[str, float]] = {}
+        self._cache_gate = BackoffGate(
+            logger, "[PRESIGNED_URL_CACHE] Cache unavailable, signing without it"
+        )
+
+    @property
+    def backend(self):
+        return self._cache_backend or cache
+
+    @property
+    def cache_seconds(self) -> int:
+        configured = getattr(
+            settings, "S3_PRESIGNED_URL_CACHE_SECONDS", self.DEFAULT_CACHE_SECONDS
+        )
+        return max(
+            0, min(configured, self.SIGNED_URL_SECONDS - self.MIN_REMAINING_SECONDS)
+        )
+
+    def cache_key(self, key: str) -> str:
+        bucket = getattr(settings, "AWS_STORAGE_BUCKET_NAME", "")
+        # S3 keys may hold spaces and non-ASCII, which cache backends reject.
+        digest = hashlib.sha1(f"{bucket}/{key}".encode("utf-8")).hexdigest()
+        return f"{self.KEY_PREFIX}:{digest}"
+
+    def get_url(
+        self, key: str, s3_service_factory: Callable[[], S3ServiceInterface]
+    ) -> str:
+        """Return a presigned URL for ``key``, signing it only on a miss.
+
+        ``s3_service_factory`` is only called on a miss so callers do not
+        pay for building a boto3 client when the URL is already cached.
+        """
+        ttl = self.cache_seconds
+        if ttl <= 0:
+            return s3_service_factory().generate_presigned_url(key)
+
+        cache_key = self.cache_key(key)
+        url = self._remembered(cache_key) or self._read_shared(cache_key)
+        if url:
+            return url
+
+        url = s3_service_factory().generate_presigned_url(key)
+        deadline = time.time() + ttl
+        if self._write_shared(cache_key, url, deadline, ttl):
+            self._remember(cache_key, url, deadline)
+        return url
+
+    def clear_local(self) -> None:
+        with self._lock:
+            self._local.clear()
+
+    def _remembered(self, cache_key: str) -> Optional[str]:
+        with self._lock:
+            entry = self._local.get(cache_key)
+        if entry is None or entry[1] <= time.time():
+            return None
+        return entry[0]
+
+    def _remember(self, cache_key: str, url: str, deadline: float) -> None:
+        with self._lock:
+            if len(self._local) >= self.MAX_LOCAL_ENTRIES:
+                now = time.time()
+                self._local = {
+                    k: entry for k, entry in self._local.items() if entry[1] > now
+                }
+                if len(self._local) >= self.MAX_LOCAL_ENTRIES:
+                    self._local.clear()
+            self._local[cache_key] = (url, deadline)
+
+    def _read_shared(self, cache_key: str) -> Optional[str]:
+        if not self._cache_gate.available:
+            return None
+        try:
+            entry = self.backend.get(cache_key)
+        except Exception as exc:
+            self._cache_gate.trip(exc)
+            return None
+        if not entry or entry["expires_at"] <= time.time():
+            return None
+        self._remember(cache_key, entry["url"], entry["expires_at"])
+        return entry["url"]
+
+    def _write_shared(
+        self, cache_key: str, url: str, deadline: float, ttl: int
+    ) -> bool:
+        if not self._cache_gate.available:
+            return False
+        try:
+            self.backend.set(
+                cache_key, {"url": url, "expires_at": deadline}, timeout=ttl
+            )
+        except Exception as exc:
+            self._cache_gate.trip(exc)
+            return False
+        return True
+
+
+@functools.lru_cache(maxsize=None)
+def get_presigned_url_cache() -> PresignedUrlCache:
+    """Process-wide instance so every caller shares the local URL memo."""
+    return PresignedUrlCache()
@@ -35,6 +35,15 @@ class S3Service(S3ServiceInterface):
         """Streams a binary file-like object to S3 (multipart-capable)."""
         return self.client.upload_fileobj(fileobj, key, content_type)
 
+    def open_multipart_upload(
+        self,
+        key: str,
+        content_type: str = "application/octet-stream",
+        content_encoding: Optional[str] = None,
+    ) -> BinaryIO:
+        """Starts a multipart upload and returns a writable stream for it."""
+        return self.client.open_multipart_upload(key, content_type, content_encoding)
+
     def generate_presigned_url(self, key: str, expiration: int = 3600) -> str:
         """Generates a presigned URL for accessing a private S3 object."""
         return self.client.generate_presigned_url(key, expiration)
@@ -227,7 +227,25 @@ class IntegrationsService:
                 - "rejected" → At least one template was rejected.
         """
         templates = self.client.get_synchronized_templates(app_uuid)
+        return self.get_templates_synchronization_status(templates, template_list)
 
+    def list_synchronized_templates(self, app_uuid: str) -> dict:
+        """
+        Returns every template of the app as ``{name: [translations]}``,
+        so the status of several template lists can be computed from a
+        single fetch with ``get_templates_synchronization_status``.
+        """
+        return self.client.get_synchronized_templates(app_uuid)
+
+    @staticmethod
+    def get_templates_synchronization_status(
+        templates: dict, template_list: list
+    ) -> str:
+        """
+        Determines the synchronization status of ``template_list`` from
+        the app ``templates`` (see ``get_synchronized_templates`` for the
+        possible values).
+        """
         # If no templates were synchronized yet, return "pending"
         if not templates:
             return "pending"
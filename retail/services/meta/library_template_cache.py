@@ -0,0 +1,133 @@
+"""Cross-project cache of Meta library template metadata.
+
+Meta's message template library is global: ``(template name, language)``
+resolves to the same payload for every WABA. Yet every project that
+assigns an agent with Direct Send used to fetch each of its templates
+from Meta again, and a project whose locale has no translation probed
+the missing locale before falling back to ``pt_BR``.
+
+``MetaLibraryTemplateCache`` keeps the exact-match payload in the Django
+cache (Redis in production, so every web and Celery process shares it)
+for ``META_LIBRARY_TEMPLATE_CACHE_SECONDS``. A translation Meta does not
+have is stored as a negative entry for
+``META_LIBRARY_TEMPLATE_MISSING_CACHE_SECONDS``. Failed fetches are
+never cached. If the cache backend is unreachable Meta is called
+directly, and a ``BackoffGate`` keeps the backend skipped for a while.
+
+The ``warm_meta_library_templates`` management command fills the cache
+for every template referenced by a ``PreApprovedTemplate``.
+"""
+
+import functools
+import logging
+from typing import Any, Callable, Dict, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+
+from retail.observability.backoff import BackoffGate
+
+
+logger = logging.getLogger(__name__)
+
+LibraryTemplate = Optional[Dict[str, Any]]
+
+
+class MetaLibraryTemplateCache:
+    """Shared ``(name, language) -> library template`` cache."""
+
+    KEY_PREFIX = "meta_library_template"
+    DEFAULT_CACHE_SECONDS = 86400
+    DEFAULT_MISSING_CACHE_SECONDS = 3600
+
+    def __init__(self, cache_backend=None):
+        self._cache_backend = cache_backend
+        self._cache_gate = BackoffGate(
+            logger, "[META_LIBRARY_CACHE] Cache unavailable, calling Meta without it"
+        )
+
+    @property
+    def backend(self):
+        return self._cache_backend or cache
+
+    @property
+    def cache_seconds(self) -> int:
+        return max(
+            0,
+            getattr(
+                settings,
+                "META_LIBRARY_TEMPLATE_CACHE_SECONDS",
+                self.DEFAULT_CACHE_SECONDS,
+            ),
+        )
+
+    @property
+    def missing_cache_seconds(self) -> int:
+        return max(
+            0,
+            getattr(
+                settings,
+                "META_LIBRARY_TEMPLATE_MISSING_CACHE_SECONDS",
+                self.DEFAULT_MISSING_CACHE_SECONDS,
+            ),
+        )
+
+    def cache_key(self, template_name: str, language: str) -> str:
+        return f"{self.KEY_PREFIX}:{language}:{template_name}"
+
+    def get_template(
+        self,
+        template_name: str,
+        language: str,
+        fetch: Callable[[], LibraryTemplate],
+    ) -> LibraryTemplate:
+        """Return the cached template, calling ``fetch`` only on a miss.
+
+        ``None`` means Meta has no such translation, whether it came from
+        ``fetch`` or from a negative entry. Exceptions raised by
+        ``fetch`` propagate and leave the cache untouched.
+        """
+        if self.cache_seconds <= 0 and self.missing_cache_seconds <= 0:
+            return fetch()
+
+        key = self.cache_key(template_name, language)
+        entry = self._read(key)
+        if entry is not None:
+            return entry["template"]
+
+        template = fetch()
+        self.store(template_name, language, template)
+        return template
+
+    def store(
+        self, template_name: str, language: str, template: LibraryTemplate
+    ) -> bool:
+        """Cache ``template`` (``None`` for a missing translation)."""
+        ttl = self.cache_seconds if template is not None else self.missing_cache_seconds
+        if ttl <= 0 or not self._cache_gate.available:
+            return False
+        try:
+            self.backend.set(
+                self.cache_key(template_name, language),
+                {"template": template},
+                timeout=ttl,
+            )
+        except Exception as exc:
+            self._cache_gate.trip(exc)
+            return False
+        return True
+
+    def _read(self, key: str) -> Optional[Dict[str, LibraryTemplate]]:
+        if not self._cache_gate.available:
+            return None
+        try:
+            return self.backend.get(key)
+        except Exception as exc:
+            self._cache_gate.trip(exc)
+            return None
+
+
+@functools.lru_cache(maxsize=None)
+def get_meta_library_template_cache() -> MetaLibraryTemplateCache:
+    """Process-wide instance shared by every library template fetch."""
+    return MetaLibraryTemplateCache()
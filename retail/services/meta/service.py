@@ -6,13 +6,22 @@ from retail.clients.exceptions import CustomAPIException
 from retail.interfaces.services.meta import MetaServiceInterface
 from retail.interfaces.clients.meta.client import MetaClientInterface
 from retail.clients.meta.client import MetaClient
+from retail.services.meta.library_template_cache import (
+    MetaLibraryTemplateCache,
+    get_meta_library_template_cache,
+)
 
 logger = logging.getLogger(__name__)
 
 
 class MetaService(MetaServiceInterface):
-    def __init__(self, client: Optional[MetaClientInterface] = None):
+    def __init__(
+        self,
+        client: Optional[MetaClientInterface] = None,
+        library_cache: Optional[MetaLibraryTemplateCache] = None,
+    ):
         self.client = client or MetaClient()
+        self.library_cache = library_cache or get_meta_library_template_cache()
 
     def get_pre_approved_template(
         self, template_name: str, language: str
@@ -30,10 +39,18 @@ class MetaService(MetaServiceInterface):
         (auth, rate limit, server errors) and malformed-JSON parsing
         errors collapse to ``None`` here so the use case sees a single
         deterministic return shape.
+
+        Results are shared across projects through ``library_cache``,
+        including translations Meta does not have; failures are not
+        cached.
         """
         try:
-            return self.client.fetch_library_template_by_name_and_language(
-                template_name, language
+            return self.library_cache.get_template(
+                template_name,
+                language,
+                lambda: self.client.fetch_library_template_by_name_and_language(
+                    template_name, language
+                ),
             )
         except CustomAPIException as exc:
             logger.error(
@@ -50,6 +67,21 @@ class MetaService(MetaServiceInterface):
             )
             return None
 
+    def refresh_library_template(
+        self, template_name: str, language: str
+    ) -> Optional[Dict[str, Any]]:
+        """Fetch the library template from Meta and overwrite its cache entry.
+
+        Unlike :meth:`fetch_library_template_by_name_and_language`, client
+        errors propagate so callers can tell a failure from a missing
+        translation.
+        """
+        template = self.client.fetch_library_template_by_name_and_language(
+            template_name, language
+        )
+        self.library_cache.store(template_name, language, template)
+        return template
+
     def create_flow(
         self,
         waba_id: str,
@@ -10,16 +10,24 @@ import logging
 
 from unittest.mock import MagicMock
 
+from django.core.cache.backends.locmem import LocMemCache
 from django.test import TestCase
 
 from retail.clients.exceptions import CustomAPIException
+from retail.services.meta.library_template_cache import MetaLibraryTemplateCache
 from retail.services.meta.service import MetaService
 
 
+def _library_cache() -> MetaLibraryTemplateCache:
+    backend = LocMemCache("meta-service-test", {})
+    backend.clear()
+    return MetaLibraryTemplateCache(cache_backend=backend)
+
+
 class FetchLibraryTemplateByNameAndLanguageServiceTest(TestCase):
     def setUp(self):
         self.client = MagicMock()
-        self.service = MetaService(client=self.client)
+        self.service = MetaService(client=self.client, library_cache=_library_cache())
 
     def test_returns_client_payload_on_success(self):
         payload = {"name": "weni_order_shipped", "language": "pt_BR", "body": "..."}
@@ -67,3 +75,79 @@ class FetchLibraryTemplateByNameAndLanguageServiceTest(TestCase):
         joined_logs = "\n".join(captured.output)
         self.assertIn("weni_order_shipped", joined_logs)
         self.assertIn("pt_BR", joined_logs)
+
+    def test_other_projects_reuse_the_cached_template(self):
+        payload = {"name": "weni_order_shipped", "language": "pt_BR", "body": "..."}
+        self.client.fetch_library_template_by_name_and_language.return_value = payload
+        other_project = MetaService(
+            client=self.client, library_cache=self.service.library_cache
+        )
+
+        self.service.fetch_library_template_by_name_and_language(
+            "weni_order_shipped", "pt_BR"
+        )
+        result = other_project.fetch_library_template_by_name_and_language(
+            "weni_order_shipped", "pt_BR"
+        )
+
+        self.assertEqual(result, payload)
+        self.client.fetch_library_template_by_name_and_language.assert_called_once()
+
+    def test_missing_translation_is_not_probed_again(self):
+        self.client.fetch_library_template_by_name_and_language.return_value = None
+
+        for _ in range(3):
+            result = self.service.fetch_library_template_by_name_and_language(
+                "weni_order_shipped", "es_MX"
+            )
+
+        self.assertIsNone(result)
+        self.client.fetch_library_template_by_name_and_language.assert_called_once()
+
+    def test_failures_are_not_cached(self):
+        payload = {"name": "weni_order_shipped", "language": "pt_BR"}
+        self.client.fetch_library_template_by_name_and_language.side_effect = [
+            CustomAPIException(detail="rate limited", status_code=429),
+            payload,
+        ]
+
+        with self.assertLogs("retail.services.meta.service", level=logging.ERROR):
+            first = self.service.fetch_library_template_by_name_and_language(
+                "weni_order_shipped", "pt_BR"
+            )
+        second = self.service.fetch_library_template_by_name_and_language(
+            "weni_order_shipped", "pt_BR"
+        )
+
+        self.assertIsNone(first)
+        self.assertEqual(second, payload)
+
+    def test_refresh_overwrites_the_cached_entry(self):
+        self.client.fetch_library_template_by_name_and_language.return_value = None
+        self.service.fetch_library_template_by_name_and_language(
+            "weni_order_shipped", "es_MX"
+        )
+        payload = {"name": "weni_order_shipped", "language": "es_MX"}
+        self.client.fetch_library_template_by_name_and_language.return_value = payload
+
+        self.assertEqual(
+            self.service.refresh_library_template("weni_order_shipped", "es_MX"),
+            payload,
+        )
+        self.assertEqual(
+            self.service.fetch_library_template_by_name_and_language(
+                "weni_order_shipped", "es_MX"
+            ),
+            payload,
+        )
+        self.assertEqual(
+            self.client.fetch_library_template_by_name_and_language.call_count, 2
+        )
+
+    def test_refresh_propagates_client_errors(self):
+        self.client.fetch_library_template_by_name_and_language.side_effect = (
+            CustomAPIException(detail="auth failure", status_code=403)
+        )
+
+        with self.assertRaises(CustomAPIException):
+            self.service.refresh_library_template("weni_order_shipped", "pt_BR")
@@ -1,6 +1,7 @@
 import base64
 from unittest.mock import patch, Mock
 
+from django.core.cache.backends.locmem import LocMemCache
 from django.test import TestCase
 from django.core.files.uploadedfile import InMemoryUploadedFile
 
@@ -9,6 +10,7 @@ from retail.services.aws_s3.converters import (
     ConverterInterface,
     ImageUrlToBase64Converter,
 )
+from retail.services.aws_s3.image_download_cache import ImageDownloadCache
 
 
 class TestBase64ToUploadedFileConverter(TestCase):
@@ -175,9 +177,22 @@ class TestBase64ToUploadedFileConverter(TestCase):
         self.assertEqual(result.tell(), len(test_data))
 
 
+def _image_response(content, headers=None, status_code=200):
+    response = Mock()
+    response.status_code = status_code
+    response.headers = headers if headers is not None else {"Content-Type": "image/png"}
+    response.iter_content.return_value = [content[:4], content[4:]]
+    response.raise_for_status = Mock()
+    return response
+
+
 class TestImageUrlToBase64Converter(TestCase):
     def setUp(self):
-        self.converter = ImageUrlToBase64Converter()
+        self.shared = LocMemCache("image-download-cache-test", {})
+        self.shared.clear()
+        self.converter = ImageUrlToBase64Converter(
+            download_cache=ImageDownloadCache(cache_backend=self.shared)
+        )
 
     # Tests for is_image_url method
     def test_is_image_url_with_png(self):
@@ -221,11 +236,9 @@ class TestImageUrlToBase64Converter(TestCase):
     @patch("retail.services.aws_s3.converters.requests.get")
     def test_convert_success(self, mock_get):
         """Successful conversion returns base64 Data URI."""
-        mock_response = Mock()
-        mock_response.content = b"fake image content"
-        mock_response.headers = {"Content-Type": "image/png"}
-        mock_response.raise_for_status = Mock()
-        mock_get.return_value = mock_response
+        mock_get.return_value = _image_response(
+            b"fake image content", {"Content-Type": "image/png"}
+        )
 
         url = "https://example.com/image.png"
         result = self.converter.convert(url)
@@ -239,11 +252,9 @@ class TestImageUrlToBase64Converter(TestCase):
     @patch("retail.services.aws_s3.converters.requests.get")
     def test_convert_with_content_type_charset(self, mock_get):
         """Content-Type with charset should be cleaned."""
-        mock_response = Mock()
-        mock_response.content = b"image data"
-        mock_response.headers = {"Content-Type": "image/jpeg; charset=utf-8"}
-        mock_response.raise_for_status = Mock()
-        mock_get.return_value = mock_response
+        mock_get.return_value = _image_response(
+            b"image data", {"Content-Type": "image/jpeg; charset=utf-8"}
+        )
 
         url = "https://example.com/image.jpg"
         result = self.converter.convert(url)
@@ -253,11 +264,7 @@ class TestImageUrlToBase64Converter(TestCase):
     @patch("retail.services.aws_s3.converters.requests.get")
     def test_convert_with_missing_content_type(self, mock_get):
         """Missing Content-Type should use default."""
-        mock_response = Mock()
-        mock_response.content = b"image data"
-        mock_response.headers = {}
-        mock_response.raise_for_status = Mock()
-        mock_get.return_value = mock_response
+        mock_get.return_value = _image_response(b"image data", {})
 
         url = "https://example.com/image.png"
         result = self.converter.convert(url)
@@ -299,13 +306,84 @@ class TestImageUrlToBase64Converter(TestCase):
     @patch("retail.services.aws_s3.converters.requests.get")
     def test_convert_uses_timeout(self, mock_get):
         """Request should use timeout."""
-        mock_response = Mock()
-        mock_response.content = b"image data"
-        mock_response.headers = {"Content-Type": "image/png"}
-        mock_response.raise_for_status = Mock()
-        mock_get.return_value = mock_response
+        mock_get.return_value = _image_response(
+            b"image data", {"Content-Type": "image/png"}
+        )
 
         url = "https://example.com/image.png"
         self.converter.convert(url)
 
-        mock_get.assert_called_once_with(url, timeout=30)
+        mock_get.assert_called_once_with(url, timeout=30, stream=True, headers={})
+
+    @patch("retail.services.aws_s3.converters.requests.get")
+    def test_unchanged_image_is_revalidated_instead_of_downloaded(self, mock_get):
+        url = "https://example.com/header.png"
+        mock_get.side_effect = [
+            _image_response(
+                b"header bytes",
+                {"Content-Type": "image/png", "ETag": '"v1"'},
+            ),
+            _image_response(b"", {}, status_code=304),
+        ]
+
+        first = self.converter.convert(url)
+        second = self.converter.convert(url)
+
+        self.assertEqual(first, second)
+        self.assertEqual(
+            mock_get.call_args.kwargs["headers"], {"If-None-Match": '"v1"'}
+        )
+        mock_get.return_value.iter_content.assert_not_called()
+
+    @patch("retail.services.aws_s3.converters.requests.get")
+    def test_changed_image_replaces_the_cached_encoding(self, mock_get):
+        url = "https://example.com/header.png"
+        last_modified = "Wed, 21 Oct 2026 07:28:00 GMT"
+        mock_get.side_effect = [
+            _image_response(
+                b"old bytes",
+                {"Content-Type": "image/png", "Last-Modified": last_modified},
+            ),
+            _image_response(b"new bytes", {"Content-Type": "image/png", "ETag": "v2"}),
+        ]
+
+        self.converter.convert(url)
+        result = self.converter.convert(url)
+
+        self.assertEqual(
+            mock_get.call_args.kwargs["headers"], {"If-Modified-Since": last_modified}
+        )
+        self.assertIn(base64.b64encode(b"new bytes").decode("utf-8"), result)
+
+    @patch("retail.services.aws_s3.converters.requests.get")
+    def test_urls_with_the_same_bytes_share_one_content_entry(self, mock_get):
+        mock_get.side_effect = lambda *args, **kwargs: _image_response(
+            b"same bytes", {"Content-Type": "image/png", "ETag": "same"}
+        )
+
+        self.converter.convert("https://example.com/a.png")
+        self.converter.convert("https://example.com/b.png")
+
+        content_keys = [
+            key for key in self.shared._cache if "image_download:content" in key
+        ]
+        self.assertEqual(len(content_keys), 1)
+
+    @patch("retail.services.aws_s3.converters.requests.get")
+    def test_images_without_validators_or_over_the_cap_are_not_cached(self, mock_get):
+        mock_get.side_effect = [
+            _image_response(b"no validators", {"Content-Type": "image/png"}),
+            _image_response(b"no validators", {"Content-Type": "image/png"}),
+        ]
+        self.converter.convert("https://example.com/plain.png")
+        self.converter.convert("https://example.com/plain.png")
+        self.assertEqual(mock_get.call_args.kwargs["headers"], {})
+
+        with self.settings(IMAGE_DOWNLOAD_CACHE_MAX_BYTES=4):
+            mock_get.side_effect = [
+                _image_response(b"too large", {"ETag": "big"}),
+                _image_response(b"too large", {"ETag": "big"}),
+            ]
+            self.converter.convert("https://example.com/big.png")
+            self.converter.convert("https://example.com/big.png")
+        self.assertEqual(mock_get.call_args.kwargs["headers"], {})
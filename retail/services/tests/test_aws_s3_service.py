@@ -345,3 +345,16 @@ class TestS3Service(TestCase):
             self.service.upload_fileobj(BytesIO(b"x"), "bad/key.csv")
 
         self.assertIn("stream failed", str(context.exception))
+
+    def test_open_multipart_upload_delegates_to_client(self):
+        upload = Mock()
+        self.mock_client.open_multipart_upload.return_value = upload
+
+        result = self.service.open_multipart_upload(
+            "exports/out.csv", content_type="text/csv", content_encoding="gzip"
+        )
+
+        self.mock_client.open_multipart_upload.assert_called_once_with(
+            "exports/out.csv", "text/csv", "gzip"
+        )
+        self.assertIs(result, upload)
@@ -0,0 +1,93 @@
+from unittest.mock import MagicMock
+
+from django.core.cache.backends.locmem import LocMemCache
+from django.test import TestCase, override_settings
+
+from retail.services.meta.library_template_cache import MetaLibraryTemplateCache
+
+
+def _local_cache(location: str) -> LocMemCache:
+    backend = LocMemCache(location, {})
+    backend.clear()
+    return backend
+
+
+class MetaLibraryTemplateCacheTest(TestCase):
+    def setUp(self):
+        self.shared = _local_cache("meta-library-template-cache-test")
+        self.cache = MetaLibraryTemplateCache(cache_backend=self.shared)
+        self.payload = {"name": "weni_order_shipped", "language": "pt_BR"}
+
+    def test_fetches_once_per_name_and_language(self):
+        fetch = MagicMock(return_value=self.payload)
+
+        for _ in range(5):
+            self.assertEqual(
+                self.cache.get_template("weni_order_shipped", "pt_BR", fetch),
+                self.payload,
+            )
+        self.cache.get_template("weni_order_shipped", "es_MX", fetch)
+
+        self.assertEqual(fetch.call_count, 2)
+
+    def test_negative_entry_uses_the_missing_lifetime(self):
+        backend = MagicMock()
+        backend.get.return_value = None
+        cache = MetaLibraryTemplateCache(cache_backend=backend)
+
+        cache.get_template("weni_order_shipped", "es_MX", MagicMock(return_value=None))
+        cache.get_template("weni_order_shipped", "pt_BR", lambda: self.payload)
+
+        missing, found = backend.set.call_args_list
+        self.assertEqual(missing.args[1], {"template": None})
+        self.assertEqual(missing.kwargs["timeout"], cache.missing_cache_seconds)
+        self.assertEqual(found.args[1], {"template": self.payload})
+        self.assertEqual(found.kwargs["timeout"], cache.cache_seconds)
+
+    def test_fetch_errors_propagate_without_caching(self):
+        fetch = MagicMock(side_effect=[RuntimeError("meta down"), self.payload])
+
+        with self.assertRaises(RuntimeError):
+            self.cache.get_template("weni_order_shipped", "pt_BR", fetch)
+
+        self.assertEqual(
+            self.cache.get_template("weni_order_shipped", "pt_BR", fetch), self.payload
+        )
+        self.assertEqual(fetch.call_count, 2)
+
+    @override_settings(META_LIBRARY_TEMPLATE_MISSING_CACHE_SECONDS=0)
+    def test_missing_translations_are_refetched_when_negative_cache_is_disabled(self):
+        fetch = MagicMock(return_value=None)
+
+        for _ in range(3):
+            self.cache.get_template("weni_order_shipped", "es_MX", fetch)
+
+        self.assertEqual(fetch.call_count, 3)
+
+    @override_settings(
+        META_LIBRARY_TEMPLATE_CACHE_SECONDS=0,
+        META_LIBRARY_TEMPLATE_MISSING_CACHE_SECONDS=0,
+    )
+    def test_disabled_cache_is_not_read(self):
+        self.shared.set(
+            self.cache.cache_key("weni_order_shipped", "pt_BR"), {"template": None}
+        )
+        fetch = MagicMock(return_value=self.payload)
+
+        self.assertEqual(
+            self.cache.get_template("weni_order_shipped", "pt_BR", fetch), self.payload
+        )
+
+    def test_fetches_directly_when_the_cache_is_down(self):
+        backend = MagicMock()
+        backend.get.side_effect = ConnectionError("redis down")
+        cache = MetaLibraryTemplateCache(cache_backend=backend)
+        fetch = MagicMock(return_value=self.payload)
+
+        with self.assertLogs("retail.services.meta.library_template_cache", "WARNING"):
+            cache.get_template("weni_order_shipped", "pt_BR", fetch)
+        cache.get_template("weni_order_shipped", "pt_BR", fetch)
+
+        self.assertEqual(fetch.call_count, 2)
+        backend.get.assert_called_once()
+        backend.set.assert_not_called()
@@ -0,0 +1,136 @@
+from unittest.mock import MagicMock, patch
+
+from django.core.cache.backends.locmem import LocMemCache
+from django.test import TestCase, override_settings
+
+from retail.agents.domains.agent_webhook.services.broadcast import Broadcast
+from retail.services.aws_s3.presigned_url_cache import PresignedUrlCache
+
+
+def _local_cache(location: str) -> LocMemCache:
+    backend = LocMemCache(location, {})
+    backend.clear()
+    return backend
+
+
+class PresignedUrlCacheTest(TestCase):
+    def setUp(self):
+        self.shared = _local_cache("presigned-url-cache-test")
+        self.cache = PresignedUrlCache(cache_backend=self.shared)
+        self.s3_service = MagicMock()
+        self.s3_service.generate_presigned_url.side_effect = (
+            lambda key: f"https://bucket.s3/{key}?sig={self.s3_service.generate_presigned_url.call_count}"
+        )
+        self.factory = MagicMock(return_value=self.s3_service)
+
+    def test_signs_once_per_key(self):
+        urls = {
+            self.cache.get_url("headers/promo.png", self.factory) for _ in range(50)
+        }
+
+        self.assertEqual(urls, {"https://bucket.s3/headers/promo.png?sig=1"})
+        self.factory.assert_called_once()
+        self.cache.get_url("headers/other.png", self.factory)
+        self.assertEqual(self.s3_service.generate_presigned_url.call_count, 2)
+
+    def test_other_processes_reuse_the_shared_entry(self):
+        url = self.cache.get_url("headers/promo.png", self.factory)
+        other_worker = PresignedUrlCache(cache_backend=self.shared)
+        other_factory = MagicMock()
+
+        self.assertEqual(other_worker.get_url("headers/promo.png", other_factory), url)
+        other_factory.assert_not_called()
+
+    def test_resigns_after_the_entry_deadline(self):
+        with patch("retail.services.aws_s3.presigned_url_cache.time.time") as now:
+            now.return_value = 1_000_000.0
+            first = self.cache.get_url("headers/promo.png", self.factory)
+            now.return_value += self.cache.cache_seconds + 1
+            second = self.cache.get_url("headers/promo.png", self.factory)
+
+        self.assertNotEqual(first, second)
+
+    @override_settings(S3_PRESIGNED_URL_CACHE_SECONDS=86400)
+    def test_cache_lifetime_stays_below_the_signature_lifetime(self):
+        self.assertEqual(
+            self.cache.cache_seconds,
+            PresignedUrlCache.SIGNED_URL_SECONDS
+            - PresignedUrlCache.MIN_REMAINING_SECONDS,
+        )
+
+    @override_settings(S3_PRESIGNED_URL_CACHE_SECONDS=0)
+    def test_disabled_cache_signs_every_time(self):
+        for _ in range(3):
+            self.cache.get_url("headers/promo.png", self.factory)
+
+        self.assertEqual(self.s3_service.generate_presigned_url.call_count, 3)
+
+    def test_signs_directly_when_the_cache_is_down(self):
+        backend = MagicMock()
+        backend.get.side_effect = ConnectionError("redis down")
+        cache = PresignedUrlCache(cache_backend=backend)
+
+        with self.assertLogs("retail.services.aws_s3.presigned_url_cache", "WARNING"):
+            cache.get_url("headers/promo.png", self.factory)
+        cache.get_url("headers/promo.png", self.factory)
+
+        self.assertEqual(self.s3_service.generate_presigned_url.call_count, 2)
+        backend.get.assert_called_once()
+        backend.set.assert_not_called()
+
+
+class BroadcastHeaderPresignedUrlTest(TestCase):
+    def setUp(self):
+        self.presigned_urls = PresignedUrlCache(
+            cache_backend=_local_cache("broadcast-header-presign-test")
+        )
+        patcher = patch(
+            "retail.agents.domains.agent_webhook.services.broadcast."
+            "get_presigned_url_cache",
+            return_value=self.presigned_urls,
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.handler = Broadcast(flows_service=MagicMock(), audit_func=MagicMock())
+
+        self.template = MagicMock()
+        self.template.current_version.template_name = "weni_campaign_1700000000"
+        self.template.metadata = {
+            "header": {"header_type": "IMAGE", "text": "templates/campaign.png"}
+        }
+
+    @patch("retail.agents.domains.agent_webhook.services.broadcast.S3Service")
+    def test_campaign_signs_the_header_once(self, mock_s3_service_class):
+        mock_s3_service_class.return_value.generate_presigned_url.return_value = (
+            "https://bucket.s3/templates/campaign.png?sig=1"
+        )
+
+        attachments = set()
+        for index in range(20):
+            message = self.handler.build_broadcast_template_message(
+                data={"template_variables": {}, "contact_urn": f"whatsapp:55{index}"},
+                channel_uuid="channel-uuid",
+                project_uuid="project-uuid",
+                template=self.template,
+            )
+            attachments.update(message["msg"]["attachments"])
+
+        self.assertEqual(
+            attachments, {"image/png:https://bucket.s3/templates/campaign.png?sig=1"}
+        )
+        mock_s3_service_class.assert_called_once_with()
+
+    @patch("retail.agents.domains.agent_webhook.services.broadcast.S3Service")
+    def test_messages_without_s3_header_never_build_an_s3_service(
+        self, mock_s3_service_class
+    ):
+        self.template.metadata = {}
+
+        self.handler.build_broadcast_template_message(
+            data={"template_variables": {"1": "Ana"}, "contact_urn": "whatsapp:55"},
+            channel_uuid="channel-uuid",
+            project_uuid="project-uuid",
+            template=self.template,
+        )
+
+        mock_s3_service_class.assert_not_called()
@@ -216,6 +216,14 @@ if USE_EDA:
     EDA_BROKER_USER = env("EDA_BROKER_USER", default="guest")
     EDA_BROKER_PASSWORD = env("EDA_BROKER_PASSWORD", default="guest")
 
+    # Long-lived publishers (one AMQP connection and confirm-mode channel
+    # each) kept per process by ``retail.event_driven.publisher_pool``,
+    # and how long a publish waits for the broker to confirm its batch.
+    EDA_PUBLISHER_POOL_SIZE = env.int("EDA_PUBLISHER_POOL_SIZE", default=2)
+    EDA_PUBLISHER_CONFIRM_TIMEOUT_SECONDS = env.int(
+        "EDA_PUBLISHER_CONFIRM_TIMEOUT_SECONDS", default=10
+    )
+
 USE_OIDC = env.bool("USE_OIDC")
 
 if USE_OIDC:
@@ -235,6 +243,15 @@ if USE_OIDC:
 
 INTEGRATIONS_REST_ENDPOINT = env.str("INTEGRATIONS_REST_ENDPOINT")
 
+# Page size requested when listing an app's templates from Integrations,
+# and how many of the pages after the first are fetched at the same time.
+INTEGRATIONS_TEMPLATES_PAGE_SIZE = env.int(
+    "INTEGRATIONS_TEMPLATES_PAGE_SIZE", default=100
+)
+INTEGRATIONS_TEMPLATES_FETCH_WORKERS = env.int(
+    "INTEGRATIONS_TEMPLATES_FETCH_WORKERS", default=4
+)
+
 FLOWS_REST_ENDPOINT = env.str("FLOWS_REST_ENDPOINT")
 
 EMAILS_CAN_TESTING = env.str("EMAILS_CAN_TESTING", "").split(",")
@@ -325,6 +342,88 @@ AGENT_EXECUTION_CELERY_QUEUE = env.str(
     "AGENT_EXECUTION_CELERY_QUEUE", default="agent-executions"
 )
 
+# Celery queue for contract acceptance PDF rendering. Defaults to the
+# shared ``celery`` queue. Set it (e.g. ``contract-documents``) only
+# once a worker started with ``celery-worker <queue-name>`` consumes it:
+# that worker's pool size (``CELERY_MAX_WORKERS``) then bounds how many
+# PDFs render at once, and the warm WeasyPrint renderer (fonts,
+# stylesheets, templates) stays out of the other workers.
+CONTRACT_PDF_CELERY_QUEUE = env.str("CONTRACT_PDF_CELERY_QUEUE", default="celery")
+
+# Per-task resource accounting (see ``retail.observability.task_metrics``).
+# When enabled, every Celery task records wall time, DB queries/time,
+# Redis commands, outbound HTTP calls per host and Lambda invoke time.
+TASK_METRICS_ENABLED = env.bool("TASK_METRICS_ENABLED", default=True)
+
+# StatsD (DogStatsD tag format) sink for the per-task metrics, e.g. a
+# statsd_exporter sidecar feeding Prometheus. Leave the host empty to
+# skip emission; the slow-task log below still works.
+STATSD_HOST = env.str("STATSD_HOST", default="")
+STATSD_PORT = env.int("STATSD_PORT", default=8125)
+STATSD_PREFIX = env.str("STATSD_PREFIX", default="retail")
+
+# Hosts under these suffixes are per-store (``<account>.<suffix>``);
+# outbound HTTP metrics label them as ``{account}.<suffix>`` to keep
+# the series count independent of the number of stores.
+HTTP_METRICS_TENANT_HOST_SUFFIXES = env.list(
+    "HTTP_METRICS_TENANT_HOST_SUFFIXES",
+    default=["vtexcommercestable.com.br", "vtexpayments.com.br", "myvtex.com"],
+)
+
+# Per-host circuit breaker for RequestClient (see
+# ``retail.clients.circuit_breaker``). Within a fixed window of
+# CIRCUIT_BREAKER_WINDOW_SECONDS, once a host has seen at least
+# CIRCUIT_BREAKER_MIN_CALLS calls and CIRCUIT_BREAKER_FAILURE_RATE of
+# them failed (exception, 5xx/429, or slower than
+# CIRCUIT_BREAKER_SLOW_CALL_SECONDS), calls to it fail fast for
+# CIRCUIT_BREAKER_OPEN_SECONDS before a single probe is let through.
+CIRCUIT_BREAKER_ENABLED = env.bool("CIRCUIT_BREAKER_ENABLED", default=True)
+CIRCUIT_BREAKER_WINDOW_SECONDS = env.int("CIRCUIT_BREAKER_WINDOW_SECONDS", default=30)
+CIRCUIT_BREAKER_MIN_CALLS = env.int("CIRCUIT_BREAKER_MIN_CALLS", default=20)
+CIRCUIT_BREAKER_FAILURE_RATE = env.float("CIRCUIT_BREAKER_FAILURE_RATE", default=0.5)
+CIRCUIT_BREAKER_SLOW_CALL_SECONDS = env.float(
+    "CIRCUIT_BREAKER_SLOW_CALL_SECONDS", default=10.0
+)
+CIRCUIT_BREAKER_OPEN_SECONDS = env.int("CIRCUIT_BREAKER_OPEN_SECONDS", default=30)
+
+# Request timeout (seconds) per RequestClient subclass name, e.g.
+# ``{"VtexIOClient": 10, "FlowsClient": 15}``. Clients not listed keep
+# ``RequestClient.default_timeout`` (60s); explicit ``timeout=`` wins.
+HTTP_CLIENT_TIMEOUTS = env.json("HTTP_CLIENT_TIMEOUTS", default={})
+
+# Tasks slower than this (in milliseconds) log their resource
+# breakdown at WARNING level with the ``[TASK_METRICS]`` prefix.
+TASK_METRICS_SLOW_TASK_MS = env.int("TASK_METRICS_SLOW_TASK_MS", default=5000)
+
+# Also append the resource breakdown as a ``task_resources`` trace to
+# the AgentExecution opened by the task, if any.
+TASK_METRICS_ATTACH_TO_EXECUTION = env.bool(
+    "TASK_METRICS_ATTACH_TO_EXECUTION", default=False
+)
+
+# Onboarding crawls wait for the project link as a pending request on
+# ProjectOnboarding and are dispatched by the link event. The
+# task_resume_pending_crawls beat task runs every
+# PENDING_CRAWL_SWEEP_INTERVAL_SECONDS as a safety net: it dispatches
+# linked requests older than PENDING_CRAWL_RESUME_AFTER_SECONDS and
+# fails onboardings still unlinked after PENDING_CRAWL_LINK_TIMEOUT_SECONDS.
+PENDING_CRAWL_SWEEP_INTERVAL_SECONDS = env.int(
+    "PENDING_CRAWL_SWEEP_INTERVAL_SECONDS", default=300
+)
+PENDING_CRAWL_RESUME_AFTER_SECONDS = env.int(
+    "PENDING_CRAWL_RESUME_AFTER_SECONDS", default=120
+)
+PENDING_CRAWL_LINK_TIMEOUT_SECONDS = env.int(
+    "PENDING_CRAWL_LINK_TIMEOUT_SECONDS", default=600
+)
+
+# IntegratedFeatures whose templates are still pending with Meta are
+# re-checked by task_sweep_templates_synchronization every this many
+# seconds, with one Integrations call per WhatsApp Cloud app.
+TEMPLATES_SYNCHRONIZATION_SWEEP_INTERVAL_SECONDS = env.int(
+    "TEMPLATES_SYNCHRONIZATION_SWEEP_INTERVAL_SECONDS", default=300
+)
+
 CELERY_BEAT_SCHEDULE = {
     "task-cleanup-old-carts": {
         "task": "task_cleanup_old_carts",
@@ -338,11 +437,20 @@ CELERY_BEAT_SCHEDULE = {
         "task": "task_flush_execution_logs",
         "schedule": AGENT_EXECUTION_FLUSH_INTERVAL_SECONDS,
     },
+    "task-resume-pending-crawls": {
+        "task": "task_resume_pending_crawls",
+        "schedule": PENDING_CRAWL_SWEEP_INTERVAL_SECONDS,
+    },
+    "task-sweep-templates-synchronization": {
+        "task": "task_sweep_templates_synchronization",
+        "schedule": TEMPLATES_SYNCHRONIZATION_SWEEP_INTERVAL_SECONDS,
+    },
 }
 
 CELERY_TASK_ROUTES = {
     "task_cleanup_old_executions": {"queue": AGENT_EXECUTION_CELERY_QUEUE},
     "task_flush_execution_logs": {"queue": AGENT_EXECUTION_CELERY_QUEUE},
+    "task_process_contract_acceptance_document": {"queue": CONTRACT_PDF_CELERY_QUEUE},
 }
 
 
@@ -372,6 +480,25 @@ VTEX_IO_OIDC_RP_CLIENT_ID = env.str("VTEX_IO_OIDC_RP_CLIENT_ID", "")
 # Abandoned Cart timeout in minutes
 ABANDONED_CART_COUNTDOWN = env.int("ABANDONED_CART_COUNTDOWN", default=25)
 
+# Retention horizon (in days) for Cart rows. The task_cleanup_old_carts
+# Celery beat task deletes rows older than this. Keep it at or above
+# the abandonment dedup/cooldown lookback windows.
+CART_RETENTION_DAYS = env.int("CART_RETENTION_DAYS", default=15)
+
+# Maximum number of Cart rows the retention sweep deletes per
+# statement. Bounds row-lock time per batch; the use case loops until
+# nothing older than the horizon remains or the runtime budget below
+# is spent.
+CART_CLEANUP_BATCH_SIZE = env.int("CART_CLEANUP_BATCH_SIZE", default=5000)
+
+# Wall-clock budget (in seconds) for a single cart retention sweep.
+# When exceeded the sweep stops after the current batch; already
+# deleted batches stay committed and the next run resumes from the
+# oldest remaining row.
+CART_CLEANUP_MAX_RUNTIME_SECONDS = env.int(
+    "CART_CLEANUP_MAX_RUNTIME_SECONDS", default=600
+)
+
 # Endpoint for Nexus service
 NEXUS_REST_ENDPOINT = env.str("NEXUS_REST_ENDPOINT", default="")
 
@@ -389,6 +516,12 @@ WWC_PROFILE_AVATAR_URL = env.str("WWC_PROFILE_AVATAR_URL", "")
 PASSIVE_AGENTS_WWC = env.json("PASSIVE_AGENTS_WWC", default={})
 PASSIVE_AGENTS_WPP_CLOUD = env.json("PASSIVE_AGENTS_WPP_CLOUD", default={})
 
+# Onboarding agents that only call Nexus are integrated concurrently, at
+# most this many at a time. 1 integrates every agent sequentially.
+ONBOARDING_AGENT_INTEGRATION_WORKERS = env.int(
+    "ONBOARDING_AGENT_INTEGRATION_WORKERS", default=4
+)
+
 
 # VTEX IO workspace configuration
 VTEX_IO_WORKSPACE = env.str("VTEX_IO_WORKSPACE", default="")
@@ -414,6 +547,71 @@ if USE_LAMBDA:
 if USE_S3:
     AWS_STORAGE_BUCKET_NAME = env.str("AWS_STORAGE_BUCKET_NAME")
 
+# How long (seconds) an integrated agent's dispatch snapshot (templates,
+# project rules and credentials) stays cached. Template, Version and
+# Credential writes drop it immediately; this only bounds staleness
+# from writes that bypass signals. 0 disables the snapshot.
+AGENT_DISPATCH_SNAPSHOT_TTL = env.int("AGENT_DISPATCH_SNAPSHOT_TTL", default=600)
+
+# How long (seconds) a presigned URL for a template header image is
+# shared through the cache before it is signed again. URLs are signed
+# for 3600s and the cache caps this at 3300s so a URL is always handed
+# out with at least 5 minutes of validity left. 0 disables the cache.
+S3_PRESIGNED_URL_CACHE_SECONDS = env.int("S3_PRESIGNED_URL_CACHE_SECONDS", default=3000)
+
+# How long (seconds) a downloaded template header image stays cached for
+# ImageUrlToBase64Converter. Cached URLs are revalidated with a
+# conditional GET on every use; images larger than
+# IMAGE_DOWNLOAD_CACHE_MAX_BYTES are never cached. 0 disables the cache.
+IMAGE_DOWNLOAD_CACHE_SECONDS = env.int("IMAGE_DOWNLOAD_CACHE_SECONDS", default=86400)
+IMAGE_DOWNLOAD_CACHE_MAX_BYTES = env.int(
+    "IMAGE_DOWNLOAD_CACHE_MAX_BYTES", default=5 * 1024 * 1024
+)
+
+# Broadcast sends whose Flows payload is identical except for the contact
+# URN are held for this many seconds and dispatched as one multi-URN
+# Flows call. 0 disables batching and every contact is sent on its own.
+FLOWS_BROADCAST_BATCH_WINDOW_SECONDS = env.int(
+    "FLOWS_BROADCAST_BATCH_WINDOW_SECONDS", default=0
+)
+# Maximum number of URNs carried by one batched Flows call; a batch that
+# reaches it is flushed without waiting for the window to close.
+FLOWS_BROADCAST_BATCH_MAX_URNS = env.int("FLOWS_BROADCAST_BATCH_MAX_URNS", default=100)
+
+# BroadcastMessage rows of direct dispatches are buffered in Redis for up
+# to this many seconds and written with one bulk insert. Courier events
+# for a row still buffered are parked and replayed after the write. 0
+# disables buffering and every row is inserted at dispatch time.
+BROADCAST_MESSAGE_BUFFER_WINDOW_SECONDS = env.int(
+    "BROADCAST_MESSAGE_BUFFER_WINDOW_SECONDS", default=0
+)
+# Maximum number of rows written by one flush; a window that reaches it
+# is flushed without waiting for it to close.
+BROADCAST_MESSAGE_BUFFER_MAX_ROWS = env.int(
+    "BROADCAST_MESSAGE_BUFFER_MAX_ROWS", default=500
+)
+
+# Bloom filter of recorded broadcast ids and linked Meta message ids,
+# checked before a courier status event touches the database. Enabled
+# alone it only records members and counts what it would filter; run
+# backfill_broadcast_membership before enforcing it.
+BROADCAST_MEMBERSHIP_FILTER_ENABLED = env.bool(
+    "BROADCAST_MEMBERSHIP_FILTER_ENABLED", default=False
+)
+BROADCAST_MEMBERSHIP_FILTER_ENFORCED = env.bool(
+    "BROADCAST_MEMBERSHIP_FILTER_ENFORCED", default=False
+)
+# Days a member stays in the filter; courier events for older broadcasts
+# are dropped once the filter is enforced.
+BROADCAST_MEMBERSHIP_RETENTION_DAYS = env.int(
+    "BROADCAST_MEMBERSHIP_RETENTION_DAYS", default=7
+)
+# Members expected per daily bucket; sizes each bitmap for a 1% false
+# positive rate (about 1.2MB per million members).
+BROADCAST_MEMBERSHIP_FILTER_CAPACITY = env.int(
+    "BROADCAST_MEMBERSHIP_FILTER_CAPACITY", default=1_000_000
+)
+
 # S3 bucket for storing agent execution traces
 # Defaults to AWS_STORAGE_BUCKET_NAME if not specified
 EXECUTION_TRACES_BUCKET = env.str(
@@ -461,6 +659,21 @@ if USE_META:
     ).rstrip("/")
     META_API_URL = urllib.parse.urljoin(f"{META_GRAPH_BASE_URL}/", META_VERSION)
 
+# How many Meta library templates are fetched at the same time when an
+# agent is assigned with Direct Send.
+META_LIBRARY_FETCH_WORKERS = env.int("META_LIBRARY_FETCH_WORKERS", default=4)
+
+# How long (seconds) a Meta library template is shared through the cache
+# by every project, keyed by (template name, language). Translations Meta
+# does not have are remembered for META_LIBRARY_TEMPLATE_MISSING_CACHE_SECONDS
+# so the pt_BR fallback does not probe them again. 0 disables either entry.
+META_LIBRARY_TEMPLATE_CACHE_SECONDS = env.int(
+    "META_LIBRARY_TEMPLATE_CACHE_SECONDS", default=86400
+)
+META_LIBRARY_TEMPLATE_MISSING_CACHE_SECONDS = env.int(
+    "META_LIBRARY_TEMPLATE_MISSING_CACHE_SECONDS", default=3600
+)
+
 # One-Click Payment microservice (WhatsApp Cloud onboarding final step).
 PAYMENT_REST_ENDPOINT = env.str("PAYMENT_REST_ENDPOINT", default="")
 PAYMENT_FLOW_NAME = env.str("PAYMENT_FLOW_NAME", default="payment_confirmation_flow")
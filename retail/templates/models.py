@@ -1,4 +1,6 @@
 from django.db import models
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 
 from uuid import uuid4
 
@@ -72,3 +74,31 @@ class Version(models.Model):
 
     def __str__(self):
         return f"{self.template_name} [Version] {self.uuid} [Status] {self.status}"
+
+
+@receiver([post_save, post_delete], sender=Template)
+def invalidate_dispatch_snapshot_on_template_change(sender, instance, **kwargs):
+    """Drops the owning agent's cached dispatch snapshot (templates, rules)."""
+    from retail.agents.domains.agent_webhook.services.dispatch_snapshot import (
+        invalidate_dispatch_snapshot,
+    )
+
+    invalidate_dispatch_snapshot(instance.integrated_agent_id)
+
+
+@receiver([post_save, post_delete], sender=Version)
+def invalidate_dispatch_snapshot_on_version_change(sender, instance, **kwargs):
+    """Drops the cached dispatch snapshot that embeds this version's status."""
+    from retail.agents.domains.agent_webhook.services.dispatch_snapshot import (
+        invalidate_dispatch_snapshot,
+    )
+
+    if Version.template.is_cached(instance):
+        integrated_agent_id = instance.template.integrated_agent_id
+    else:
+        integrated_agent_id = (
+            Template.objects.filter(pk=instance.template_id)
+            .values_list("integrated_agent_id", flat=True)
+            .first()
+        )
+    invalidate_dispatch_snapshot(integrated_agent_id)
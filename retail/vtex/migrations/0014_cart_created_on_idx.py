@@ -0,0 +1,27 @@
+# Concurrent index on created_on for the batched retention sweep
+# (CleanupOldCartsUseCase) so production deploys do not block writes
+# on the large Cart table.
+#
+# atomic=False is required: CREATE INDEX CONCURRENTLY cannot run inside
+# a transaction.
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ("vtex", "0013_cart_notification_order_form_id_idx"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="cart",
+            index=models.Index(
+                fields=["created_on"],
+                name="vtex_cart_created_on_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,72 @@
+# Partial unique index backing CartUseCase's lock-free cart creation:
+# at most one ``created`` cart per (project, order_form_id, phone_number).
+#
+# Duplicates left behind by the old lock's races are retired (the most
+# recently modified cart stays open) right before the index is built
+# concurrently, so deploys do not block writes on the large Cart table.
+# atomic=False is required: CREATE INDEX CONCURRENTLY cannot run inside
+# a transaction.
+#
+# The steps are not atomic, so a duplicate inserted by still-running old
+# code between the dedupe and the build makes the build fail and leaves
+# an INVALID index behind. The migration is then not recorded and is
+# safe to rerun: any index left by a previous attempt is dropped first,
+# and the dedupe runs again before the next build.
+
+from django.db import migrations, models
+
+
+RETIRE_DUPLICATE_OPEN_CARTS = """
+UPDATE vtex_cart
+SET status = 'skipped_identical_cart'
+WHERE id IN (
+    SELECT id FROM (
+        SELECT
+            id,
+            row_number() OVER (
+                PARTITION BY project_id, order_form_id, phone_number
+                ORDER BY modified_on DESC, id DESC
+            ) AS position
+        FROM vtex_cart
+        WHERE status = 'created' AND order_form_id IS NOT NULL
+    ) AS open_carts
+    WHERE position > 1
+);
+"""
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ("vtex", "0014_cart_created_on_idx"),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            "DROP INDEX CONCURRENTLY IF EXISTS vtex_cart_unique_open_cart;",
+            migrations.RunSQL.noop,
+        ),
+        migrations.RunSQL(RETIRE_DUPLICATE_OPEN_CARTS, migrations.RunSQL.noop),
+        migrations.SeparateDatabaseAndState(
+            database_operations=[
+                migrations.RunSQL(
+                    "CREATE UNIQUE INDEX CONCURRENTLY "
+                    "vtex_cart_unique_open_cart ON vtex_cart "
+                    "(project_id, order_form_id, phone_number) "
+                    "WHERE status = 'created';",
+                    "DROP INDEX CONCURRENTLY IF EXISTS vtex_cart_unique_open_cart;",
+                ),
+            ],
+            state_operations=[
+                migrations.AddConstraint(
+                    model_name="cart",
+                    constraint=models.UniqueConstraint(
+                        condition=models.Q(status="created"),
+                        fields=("project", "order_form_id", "phone_number"),
+                        name="vtex_cart_unique_open_cart",
+                    ),
+                ),
+            ],
+        ),
+    ]
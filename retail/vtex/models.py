@@ -76,6 +76,21 @@ class Cart(models.Model):
             models.Index(fields=["phone_number"]),
             models.Index(fields=["phone_number", "status", "modified_on"]),
             models.Index(fields=["phone_number", "project", "modified_on"]),
+            # Single-column index used by the nightly retention sweep
+            # (``CleanupOldCartsUseCase``). No other index leads with
+            # ``created_on``, so a ``WHERE created_on < cutoff`` scan
+            # would otherwise read the whole table.
+            models.Index(fields=["created_on"], name="vtex_cart_created_on_idx"),
+        ]
+        constraints = [
+            # At most one open cart per shopper and order form, so
+            # concurrent cart events for it resolve on the insert itself
+            # (``CartUseCase``) instead of behind a lock.
+            models.UniqueConstraint(
+                fields=["project", "order_form_id", "phone_number"],
+                condition=models.Q(status="created"),
+                name="vtex_cart_unique_open_cart",
+            ),
         ]
 
 
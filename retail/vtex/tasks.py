@@ -1,6 +1,5 @@
 import logging
 
-from datetime import timedelta
 from typing import Optional
 
 from django.utils import timezone
@@ -16,6 +15,7 @@ from retail.broadcasts.usecases.mark_broadcast_converted import (
 )
 from retail.vtex.models import Cart
 from retail.vtex.usecases.cart_abandonment import CartAbandonmentUseCase
+from retail.vtex.usecases.cleanup_old_carts import CleanupOldCartsUseCase
 from retail.vtex.usecases.handle_purchase_event import HandlePurchaseEventUseCase
 from retail.webhooks.vtex.usecases.order_status import OrderStatusUseCase
 from retail.webhooks.vtex.usecases.typing import OrderStatusDTO
@@ -301,11 +301,14 @@ def task_notify_lead(lead_uuid: str):
 
 
 @shared_task(name="task_cleanup_old_carts")
-def task_cleanup_old_carts():
-    try:
-        time_threshold = timezone.now() - timedelta(days=15)
-        Cart.objects.filter(created_on__lt=time_threshold).delete()
+def task_cleanup_old_carts() -> int:
+    """Periodic glue around CleanupOldCartsUseCase.
 
-        logger.info("Old cart records have been cleaned up.")
+    Returns the number of rows deleted, or 0 on failure so the beat
+    schedule keeps trying without raising.
+    """
+    try:
+        return CleanupOldCartsUseCase().execute().deleted
     except Exception as e:
         logger.error(f"Error cleaning up old cart records: {str(e)}", exc_info=True)
+        return 0
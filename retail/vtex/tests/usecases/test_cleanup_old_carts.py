@@ -0,0 +1,158 @@
+"""Tests for the Cart retention sweep.
+
+``task_cleanup_old_carts`` delegates to ``CleanupOldCartsUseCase``,
+which deletes carts older than ``CART_RETENTION_DAYS`` in bounded
+batches under a runtime budget. The use case owns the business
+logic; the task is thin glue.
+"""
+
+from datetime import timedelta
+from unittest.mock import patch
+from uuid import uuid4
+
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from retail.projects.models import Project
+from retail.vtex.models import Cart
+from retail.vtex.usecases.cleanup_old_carts import CleanupOldCartsUseCase
+
+
+_LOGGER_NAME = "retail.vtex.usecases.cleanup_old_carts"
+
+
+@override_settings(CART_RETENTION_DAYS=15)
+class CleanupOldCartsUseCaseTests(TestCase):
+    def setUp(self):
+        self.project = Project.objects.create(
+            uuid=uuid4(), name="Store", vtex_account="store"
+        )
+
+    def _make_cart(self, *, days_old: int) -> Cart:
+        """Create a Cart and back-date its ``created_on``.
+
+        ``auto_now_add`` blocks setting ``created_on`` on creation, so
+        we UPDATE the row after insert to simulate aging.
+        """
+        cart = Cart.objects.create(project=self.project, phone_number="5511999999999")
+        Cart.objects.filter(pk=cart.pk).update(
+            created_on=timezone.now() - timedelta(days=days_old)
+        )
+        return cart
+
+    def test_deletes_only_rows_older_than_retention(self):
+        old = self._make_cart(days_old=30)
+        edge_old = self._make_cart(days_old=16)
+        recent = self._make_cart(days_old=5)
+
+        result = CleanupOldCartsUseCase().execute()
+
+        self.assertEqual(result.deleted, 2)
+        self.assertFalse(result.budget_exhausted)
+        self.assertFalse(Cart.objects.filter(pk=old.pk).exists())
+        self.assertFalse(Cart.objects.filter(pk=edge_old.pk).exists())
+        self.assertTrue(Cart.objects.filter(pk=recent.pk).exists())
+
+    def test_explicit_retention_override_takes_precedence_over_settings(self):
+        too_old = self._make_cart(days_old=3)
+        kept = self._make_cart(days_old=0)
+
+        result = CleanupOldCartsUseCase().execute(retention_days=1)
+
+        self.assertEqual(result.deleted, 1)
+        self.assertFalse(Cart.objects.filter(pk=too_old.pk).exists())
+        self.assertTrue(Cart.objects.filter(pk=kept.pk).exists())
+
+    @override_settings(CART_CLEANUP_BATCH_SIZE=5)
+    def test_batched_delete_handles_more_rows_than_batch_size(self):
+        for _ in range(12):
+            self._make_cart(days_old=20)
+        kept = self._make_cart(days_old=1)
+
+        with self.assertLogs(_LOGGER_NAME, level="INFO") as captured:
+            result = CleanupOldCartsUseCase().execute()
+
+        self.assertEqual(result.deleted, 12)
+        self.assertEqual(result.batches, 3)
+        self.assertEqual(Cart.objects.count(), 1)
+        self.assertTrue(Cart.objects.filter(pk=kept.pk).exists())
+        self.assertEqual(len(captured.records), 1)
+        self.assertIn("Cleaned up 12 carts", captured.records[0].getMessage())
+
+    @override_settings(CART_CLEANUP_BATCH_SIZE=5)
+    def test_each_batch_is_a_single_fast_delete(self):
+        """Cart has no inbound FKs or delete signals, so every batch is
+        one SELECT for the PKs plus one DELETE — no collector reads.
+        """
+        for _ in range(5):
+            self._make_cart(days_old=20)
+
+        with CaptureQueriesContext(connection) as ctx:
+            result = CleanupOldCartsUseCase().execute()
+
+        self.assertEqual(result.batches, 1)
+        deletes = [q for q in ctx.captured_queries if q["sql"].startswith("DELETE")]
+        self.assertEqual(len(deletes), 1)
+        # batch select + delete + final empty select
+        self.assertEqual(len(ctx.captured_queries), 3)
+
+    def test_stops_when_runtime_budget_is_spent(self):
+        self._make_cart(days_old=20)
+
+        with self.assertLogs(_LOGGER_NAME, level="INFO"):
+            result = CleanupOldCartsUseCase().execute(max_runtime_seconds=0)
+
+        self.assertTrue(result.budget_exhausted)
+        self.assertEqual(result.deleted, 0)
+        self.assertEqual(Cart.objects.count(), 1)
+
+    @override_settings(CART_CLEANUP_BATCH_SIZE=2)
+    def test_budget_capped_run_is_resumed_by_the_next_one(self):
+        for _ in range(4):
+            self._make_cart(days_old=20)
+
+        ticks = iter([0.0, 0.0, 100.0, 100.0])
+        with patch(
+            "retail.vtex.usecases.cleanup_old_carts.time.monotonic",
+            side_effect=lambda: next(ticks),
+        ):
+            first = CleanupOldCartsUseCase().execute(max_runtime_seconds=10)
+
+        self.assertTrue(first.budget_exhausted)
+        self.assertEqual(first.deleted, 2)
+        self.assertEqual(Cart.objects.count(), 2)
+
+        second = CleanupOldCartsUseCase().execute()
+
+        self.assertFalse(second.budget_exhausted)
+        self.assertEqual(second.deleted, 2)
+        self.assertEqual(Cart.objects.count(), 0)
+
+    def test_no_log_when_nothing_to_delete(self):
+        self._make_cart(days_old=2)
+
+        with self.assertNoLogs(_LOGGER_NAME, level="INFO"):
+            result = CleanupOldCartsUseCase().execute()
+
+        self.assertEqual(result.as_dict()["deleted"], 0)
+
+
+class TaskCleanupOldCartsTests(TestCase):
+    @patch("retail.vtex.tasks.CleanupOldCartsUseCase")
+    def test_task_returns_deleted_count(self, mock_use_case_cls):
+        from retail.vtex.tasks import task_cleanup_old_carts
+
+        mock_use_case_cls.return_value.execute.return_value.deleted = 7
+
+        self.assertEqual(task_cleanup_old_carts(), 7)
+        mock_use_case_cls.return_value.execute.assert_called_once_with()
+
+    @patch("retail.vtex.tasks.CleanupOldCartsUseCase")
+    def test_task_swallows_exception_and_returns_zero(self, mock_use_case_cls):
+        from retail.vtex.tasks import task_cleanup_old_carts
+
+        mock_use_case_cls.return_value.execute.side_effect = RuntimeError("boom")
+
+        self.assertEqual(task_cleanup_old_carts(), 0)
@@ -225,20 +225,6 @@ class AbandonedCartWebhookViewTest(APITestCase):
         mock_process_cart_cls.assert_not_called()
 
 
-class FakeRedisLock:
-    def __init__(self):
-        self.store = {}
-
-    def set(self, key, value, nx=False, ex=None):
-        if nx and key in self.store:
-            return None
-        self.store[key] = value
-        return True
-
-    def delete(self, key):
-        self.store.pop(key, None)
-
-
 @override_settings(
     CACHES={
         "default": {
@@ -272,14 +258,9 @@ class AbandonedCartWebhookIntegrationTest(APITestCase):
         )
 
     @patch("retail.webhooks.vtex.usecases.cart.task_abandoned_cart_update.apply_async")
-    @patch("retail.webhooks.vtex.usecases.cart.get_redis_connection")
-    def test_post_runs_cart_pipeline_end_to_end(
-        self, mock_get_redis_connection, mock_apply_async
-    ):
+    def test_post_runs_cart_pipeline_end_to_end(self, mock_apply_async):
         from retail.vtex.models import Cart
 
-        mock_get_redis_connection.return_value = FakeRedisLock()
-
         response = self.client.post(
             self.url,
             data={
@@ -0,0 +1,116 @@
+"""Concurrent cart events for the same order form and phone.
+
+``CartUseCase`` has no lock: the partial unique constraint on open carts
+decides which event inserts, and the others return that cart.
+"""
+
+import threading
+import uuid
+from unittest.mock import patch
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import connection
+from django.test import TransactionTestCase, override_settings
+
+from retail.features.models import Feature, IntegratedFeature
+from retail.projects.models import Project
+from retail.vtex.models import Cart
+from retail.webhooks.vtex.usecases.cart import CartUseCase
+
+
+@override_settings(
+    CACHES={
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "cart-usecase-concurrency-tests",
+        }
+    }
+)
+class TestCartUseCaseConcurrency(TransactionTestCase):
+    EVENTS = 8
+
+    def setUp(self):
+        cache.clear()
+        feature = Feature.objects.create(can_vtex_integrate=True, code="abandoned_cart")
+        self.project = Project.objects.create(
+            uuid=uuid.uuid4(), vtex_account="test-account"
+        )
+        self.integrated_feature = IntegratedFeature.objects.create(
+            feature=feature,
+            project=self.project,
+            user=User.objects.create(),
+            config={"templates_synchronization_status": "synchronized"},
+        )
+
+    def tearDown(self):
+        cache.clear()
+
+    def _build_cart_use_case(self) -> CartUseCase:
+        cart_use_case = CartUseCase(account="test-account")
+        cart_use_case.project = self.project
+        cart_use_case.integrated_feature = self.integrated_feature
+        cart_use_case.integrated_agent = None
+        return cart_use_case
+
+    def test_parallel_events_create_exactly_one_cart_without_sleeping(self):
+        use_cases = [self._build_cart_use_case() for _ in range(self.EVENTS)]
+        # Every event sees "no open cart" before any of them inserts, so
+        # all of them race on the insert.
+        barrier = threading.Barrier(self.EVENTS)
+        find_open_cart = CartUseCase._find_open_cart
+
+        def find_then_wait(use_case, *args):
+            found = find_open_cart(use_case, *args)
+            barrier.wait(timeout=10)
+            return found
+
+        carts, errors = [], []
+
+        def fire(use_case):
+            try:
+                carts.append(
+                    use_case.process_cart_notification(
+                        "order-123", "5584987654321", "Test User"
+                    )
+                )
+            except Exception as exc:  # pragma: no cover - surfaced below
+                errors.append(exc)
+            finally:
+                connection.close()
+
+        with patch.object(CartUseCase, "_find_open_cart", find_then_wait), patch(
+            "retail.webhooks.vtex.usecases.cart.CartUseCase._schedule_abandonment_task"
+        ) as mock_schedule, patch("time.sleep") as mock_sleep:
+            threads = [
+                threading.Thread(target=fire, args=(use_case,))
+                for use_case in use_cases
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        self.assertEqual(errors, [])
+        self.assertEqual(Cart.objects.count(), 1)
+        cart = Cart.objects.get()
+        self.assertEqual({c.uuid for c in carts}, {cart.uuid})
+        mock_schedule.assert_called_once_with(str(cart.uuid))
+        mock_sleep.assert_not_called()
+
+    def test_second_event_renews_the_open_cart(self):
+        use_case = self._build_cart_use_case()
+
+        with patch(
+            "retail.webhooks.vtex.usecases.cart.CartUseCase._schedule_abandonment_task"
+        ) as mock_schedule:
+            first = use_case.process_cart_notification(
+                "order-123", "5584987654321", "Test User"
+            )
+            second = use_case.process_cart_notification(
+                "order-123", "5584987654321", "Test User"
+            )
+
+        self.assertEqual(first.uuid, second.uuid)
+        self.assertEqual(Cart.objects.count(), 1)
+        self.assertEqual(mock_schedule.call_count, 2)
@@ -0,0 +1,137 @@
+"""Use case: drop Cart rows past their retention horizon.
+
+Carts only matter for the abandonment/dedup windows (see
+``services_cart_abandonment_unified``), so rows older than
+``CART_RETENTION_DAYS`` (default 15 days) are pruned nightly.
+
+The sweep mirrors ``CleanupOldExecutionsUseCase``: it deletes in
+bounded primary-key batches instead of a single
+``DELETE WHERE created_on < $1``. Each batch is selected through the
+``created_on`` index in ascending order with a keyset cursor, so the
+scan never revisits rows already handled in the same run and never
+falls back to a sequential scan of the table. ``Cart`` has no inbound
+FKs and no ``pre_delete``/``post_delete`` receivers, so each batch
+DELETE takes Django's fast-delete path (one SQL statement, no
+collector reads).
+
+The run stops once ``CART_CLEANUP_MAX_RUNTIME_SECONDS`` elapses so it
+cannot spill into the early-morning traffic window or hit the Celery
+time limits. Every batch commits on its own, so an interrupted or
+budget-capped run is resumed by the next one from the oldest row
+still left.
+"""
+
+import logging
+import time
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Dict, Optional, Union
+
+from django.conf import settings
+from django.utils import timezone
+
+from retail.vtex.models import Cart
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CleanupOldCartsResult:
+    """Outcome of a single cart retention sweep."""
+
+    deleted: int = 0
+    batches: int = 0
+    elapsed_seconds: float = 0.0
+    budget_exhausted: bool = False
+
+    def as_dict(self) -> Dict[str, Union[int, float, bool]]:
+        return {
+            "deleted": self.deleted,
+            "batches": self.batches,
+            "elapsed_seconds": round(self.elapsed_seconds, 3),
+            "budget_exhausted": self.budget_exhausted,
+        }
+
+
+class CleanupOldCartsUseCase:
+    """Delete Cart rows older than the retention horizon in batches."""
+
+    DEFAULT_RETENTION_DAYS = 15
+    DEFAULT_BATCH_SIZE = 5000
+    DEFAULT_MAX_RUNTIME_SECONDS = 600
+
+    def execute(
+        self,
+        retention_days: Optional[int] = None,
+        max_runtime_seconds: Optional[float] = None,
+    ) -> CleanupOldCartsResult:
+        """Delete carts older than ``retention_days`` within the runtime budget.
+
+        Args:
+            retention_days: Override for the retention horizon (in
+                days). When ``None``, falls back to
+                ``settings.CART_RETENTION_DAYS``, then to
+                ``DEFAULT_RETENTION_DAYS``.
+            max_runtime_seconds: Override for the wall-clock budget.
+                When ``None``, falls back to
+                ``settings.CART_CLEANUP_MAX_RUNTIME_SECONDS``, then to
+                ``DEFAULT_MAX_RUNTIME_SECONDS``.
+
+        Returns:
+            A ``CleanupOldCartsResult`` with the number of rows and
+            batches deleted, the elapsed time and whether the run
+            stopped because the budget ran out.
+        """
+        if retention_days is None:
+            retention_days = getattr(
+                settings, "CART_RETENTION_DAYS", self.DEFAULT_RETENTION_DAYS
+            )
+        if max_runtime_seconds is None:
+            max_runtime_seconds = getattr(
+                settings,
+                "CART_CLEANUP_MAX_RUNTIME_SECONDS",
+                self.DEFAULT_MAX_RUNTIME_SECONDS,
+            )
+
+        batch_size = getattr(
+            settings, "CART_CLEANUP_BATCH_SIZE", self.DEFAULT_BATCH_SIZE
+        )
+
+        cutoff = timezone.now() - timedelta(days=retention_days)
+        result = CleanupOldCartsResult()
+        started = time.monotonic()
+        cursor = None
+
+        while True:
+            if time.monotonic() - started >= max_runtime_seconds:
+                result.budget_exhausted = True
+                break
+
+            queryset = Cart.objects.filter(created_on__lt=cutoff)
+            if cursor is not None:
+                queryset = queryset.filter(created_on__gte=cursor)
+            batch = list(
+                queryset.order_by("created_on").values_list("pk", "created_on")[
+                    :batch_size
+                ]
+            )
+            if not batch:
+                break
+
+            deleted, _ = Cart.objects.filter(pk__in=[pk for pk, _ in batch]).delete()
+            result.deleted += deleted
+            result.batches += 1
+            cursor = batch[-1][1]
+
+        result.elapsed_seconds = time.monotonic() - started
+
+        if result.deleted or result.budget_exhausted:
+            logger.info(
+                f"[CART_CLEANUP] Cleaned up {result.deleted} carts older than "
+                f"{retention_days} days in {result.batches} batches "
+                f"({result.elapsed_seconds:.1f}s, "
+                f"budget_exhausted={result.budget_exhausted})"
+            )
+
+        return result
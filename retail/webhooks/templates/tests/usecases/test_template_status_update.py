@@ -0,0 +1,109 @@
+from uuid import uuid4
+
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from retail.features.models import Feature, IntegratedFeature
+from retail.projects.models import Project
+from retail.webhooks.templates.usecases.template_status_update import (
+    TemplateStatusUpdateUseCase,
+)
+
+
+class TemplateStatusUpdateUseCaseTest(TestCase):
+    APP_UUID = "33333333-3333-3333-3333-333333333333"
+
+    def setUp(self):
+        self.project = Project.objects.create(name="Store", uuid=uuid4())
+        self.user = User.objects.create(username="status-webhook")
+        self.feature = Feature.objects.create(name="Order Status")
+        self.usecase = TemplateStatusUpdateUseCase()
+
+    def _create_features(self, count, app_uuid=APP_UUID, **config):
+        return [
+            IntegratedFeature.objects.create(
+                feature=self.feature,
+                project=self.project,
+                user=self.user,
+                config={
+                    "wpp_cloud_app_uuid": app_uuid,
+                    "order_status_templates": {"invoiced": "order_invoiced"},
+                    "abandoned_cart_template": "abandoned_cart",
+                    **config,
+                },
+            )
+            for _ in range(count)
+        ]
+
+    def _handle(self, template_statuses):
+        with CaptureQueriesContext(connection) as queries:
+            result = self.usecase.handle(self.APP_UUID, template_statuses)
+        return result, len(queries)
+
+    def test_query_count_does_not_grow_with_matching_features(self):
+        statuses = {"order_invoiced": "APPROVED", "abandoned_cart": "APPROVED"}
+        self._create_features(1)
+        _, queries_for_one = self._handle(statuses)
+
+        self._create_features(20)
+        result, queries_for_many = self._handle(statuses)
+
+        self.assertEqual(queries_for_one, 2)
+        self.assertEqual(queries_for_many, queries_for_one)
+        self.assertEqual(len(result["integrated_features_updated"]), 21)
+
+    def test_only_the_synchronization_status_key_is_written(self):
+        pending, rejected = self._create_features(2)
+        pending.config["order_status_templates"] = {"invoiced": "order_pending"}
+        pending.save()
+        (other_app,) = self._create_features(1, app_uuid=str(uuid4()))
+        (untracked,) = self._create_features(
+            1, order_status_templates={}, abandoned_cart_template=None
+        )
+
+        result = self._handle(
+            {
+                "order_invoiced": "REJECTED",
+                "order_pending": "PENDING",
+                "abandoned_cart": "APPROVED",
+            }
+        )[0]
+
+        self.assertCountEqual(
+            result["integrated_features_updated"],
+            [
+                {"uuid": str(pending.uuid), "status": "pending"},
+                {"uuid": str(rejected.uuid), "status": "rejected"},
+            ],
+        )
+        rejected.refresh_from_db()
+        self.assertEqual(
+            rejected.config,
+            {
+                "wpp_cloud_app_uuid": self.APP_UUID,
+                "order_status_templates": {"invoiced": "order_invoiced"},
+                "abandoned_cart_template": "abandoned_cart",
+                "templates_synchronization_status": "rejected",
+            },
+        )
+        pending.refresh_from_db()
+        self.assertEqual(pending.config["templates_synchronization_status"], "pending")
+        for feature in (other_app, untracked):
+            feature.refresh_from_db()
+            self.assertNotIn("templates_synchronization_status", feature.config)
+
+    def test_no_matching_features(self):
+        result, queries = self._handle({"order_invoiced": "APPROVED"})
+
+        self.assertEqual(result["integrated_features_updated"], [])
+        self.assertEqual(queries, 1)
+
+    def test_lookup_uses_the_app_uuid_expression_index(self):
+        queryset = self.usecase._find_integrated_features(self.APP_UUID)
+        with connection.cursor() as cursor:
+            cursor.execute("SET LOCAL enable_seqscan = off")
+            plan = queryset.explain()
+
+        self.assertIn("intfeature_wpp_app_uuid_idx", plan)
@@ -2,12 +2,63 @@ import logging
 
 from typing import Dict
 
+from django.db.models import Case, F, Func, JSONField, Value, When
+from django.db.models.fields.json import KeyTextTransform
+
 from retail.features.models import IntegratedFeature
 
 
 logger = logging.getLogger(__name__)
 
 
+def collect_tracked_templates(config: dict) -> list:
+    """
+    Gathers all template names tracked by an IntegratedFeature config.
+    """
+    templates_dict = config.get("order_status_templates", {})
+    templates_list = list(templates_dict.values())
+
+    abandoned_cart_template = config.get("abandoned_cart_template")
+    if abandoned_cart_template:
+        templates_list.append(abandoned_cart_template)
+
+    return templates_list
+
+
+def save_templates_synchronization_statuses(updated_features: list) -> None:
+    """
+    Writes every ``{"uuid", "status"}`` in ``updated_features`` in a
+    single UPDATE.
+
+    Only the ``templates_synchronization_status`` key is replaced
+    (``jsonb_set``), so concurrent writes to other config keys are kept.
+    """
+    if not updated_features:
+        return
+
+    status_by_feature = Case(
+        *[
+            When(
+                uuid=feature["uuid"],
+                then=Value(feature["status"], output_field=JSONField()),
+            )
+            for feature in updated_features
+        ],
+        output_field=JSONField(),
+    )
+    IntegratedFeature.objects.filter(
+        uuid__in=[feature["uuid"] for feature in updated_features]
+    ).update(
+        config=Func(
+            F("config"),
+            Value("{templates_synchronization_status}"),
+            status_by_feature,
+            function="jsonb_set",
+            output_field=JSONField(),
+        )
+    )
+
+
 class TemplateStatusUpdateUseCase:
     """
     Processes the template statuses received via webhook and updates
@@ -25,10 +76,8 @@ class TemplateStatusUpdateUseCase:
         if not app_uuid or not template_statuses:
             raise ValueError("app_uuid or template_statuses missing.")
 
-        integrated_features = IntegratedFeature.objects.filter(
-            config__wpp_cloud_app_uuid=app_uuid
-        )
-        if not integrated_features.exists():
+        integrated_features = list(self._find_integrated_features(app_uuid))
+        if not integrated_features:
             logger.warning(f"No IntegratedFeature found with app_uuid={app_uuid}")
             return {
                 "integrated_features_updated": [],
@@ -38,7 +87,7 @@ class TemplateStatusUpdateUseCase:
         updated_features = []
 
         for integrated_feature in integrated_features:
-            tracked_templates = self._collect_tracked_templates(integrated_feature)
+            tracked_templates = collect_tracked_templates(integrated_feature.config)
             if not tracked_templates:
                 logger.warning(
                     f"No tracked templates found for this IntegratedFeature."
@@ -49,15 +98,16 @@ class TemplateStatusUpdateUseCase:
             final_status = self._compute_final_status(
                 tracked_templates, template_statuses
             )
+            updated_features.append(
+                {"uuid": str(integrated_feature.uuid), "status": final_status}
+            )
 
-            integrated_feature.config["templates_synchronization_status"] = final_status
-            integrated_feature.save()
+        save_templates_synchronization_statuses(updated_features)
 
+        for updated_feature in updated_features:
             logger.info(
-                f"IntegratedFeature {integrated_feature.uuid} updated to {final_status} via webhook."
-            )
-            updated_features.append(
-                {"uuid": str(integrated_feature.uuid), "status": final_status}
+                f"IntegratedFeature {updated_feature['uuid']} updated to "
+                f"{updated_feature['status']} via webhook."
             )
 
         return {
@@ -65,19 +115,18 @@ class TemplateStatusUpdateUseCase:
             "final_details": "Webhook processed successfully.",
         }
 
-    def _collect_tracked_templates(self, integrated_feature) -> list:
+    def _find_integrated_features(self, app_uuid: str):
         """
-        Gathers all template names tracked by this IntegratedFeature.
+        Matches ``config->>'wpp_cloud_app_uuid'`` so the lookup is served by
+        the ``intfeature_wpp_app_uuid_idx`` expression index.
         """
-        config = integrated_feature.config
-        templates_dict = config.get("order_status_templates", {})
-        templates_list = list(templates_dict.values())
-
-        abandoned_cart_template = config.get("abandoned_cart_template")
-        if abandoned_cart_template:
-            templates_list.append(abandoned_cart_template)
-
-        return templates_list
+        return (
+            IntegratedFeature.objects.alias(
+                wpp_cloud_app_uuid=KeyTextTransform("wpp_cloud_app_uuid", "config")
+            )
+            .filter(wpp_cloud_app_uuid=app_uuid)
+            .only("uuid", "config")
+        )
 
     def _compute_final_status(
         self, tracked_templates: list, template_statuses: Dict[str, str]
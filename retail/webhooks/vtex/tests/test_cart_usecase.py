@@ -1,5 +1,5 @@
 import uuid
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
 from django.contrib.auth.models import User
 from django.core.cache import cache
@@ -227,10 +227,7 @@ class TestCartUseCase(TestCase):
 
         with patch(
             "retail.webhooks.vtex.usecases.cart.CartUseCase._schedule_abandonment_task"
-        ), patch(
-            "retail.webhooks.vtex.usecases.cart.get_redis_connection"
-        ) as mock_redis:
-            mock_redis.return_value = MagicMock()
+        ):
             cart_use_case = self._build_cart_use_case(integrated_feature)
 
             # Should raise ValidationError when cart creation is blocked
@@ -1,14 +1,12 @@
 import logging
-import time
 
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 from rest_framework.exceptions import ValidationError
 from retail.features.models import Feature, IntegratedFeature
 from retail.projects.models import Project
 from retail.vtex.models import Cart
 from retail.vtex.tasks import task_abandoned_cart_update
-from django_redis import get_redis_connection
 
 from retail.webhooks.vtex.services import (
     CartTimeRestrictionService,
@@ -126,59 +124,25 @@ class CartUseCase(BaseAgentWebhookUseCase):
             f"phone={phone} project_uuid={self.project.uuid}"
         )
 
-        # Get Redis connection for distributed lock
-        redis = get_redis_connection()
-        lock_key = f"cart_creation_lock:{self.account}:{order_form_id}:{phone}"
-
-        # Try to acquire distributed lock (30 seconds TTL)
-        if not redis.set(lock_key, "locked", nx=True, ex=30):
-            logger.info(
-                f"[CART_USECASE] Lock acquisition failed (concurrent request): {log_context} "
-                f"reason=cart_creation_already_in_progress"
-            )
-            # Wait a bit and try to get the existing cart
-            time.sleep(1)
-            try:
-                cart = Cart.objects.get(
-                    order_form_id=order_form_id,
-                    project=self.project,
-                    phone_number=phone,
-                    status="created",
-                )
+        try:
+            cart = self._find_open_cart(order_form_id, phone)
+            if cart is not None:
                 logger.info(
-                    f"[CART_USECASE] Found existing cart after lock wait: {log_context} "
-                    f"cart_uuid={cart.uuid}"
+                    f"[CART_USECASE] Existing cart found, renewing task: {log_context} "
+                    f"cart_uuid={cart.uuid} action=renew_abandonment_task"
                 )
+                # Renew abandonment task
+                self._schedule_abandonment_task(str(cart.uuid))
                 return cart
-            except Cart.DoesNotExist:
-                logger.error(
-                    f"[CART_USECASE] Lock failed and no cart found: {log_context} "
-                    f"reason=cart_creation_lock_failed"
-                )
-                raise ValidationError(f"Cart creation failed to lock {lock_key}")
 
-        try:
-            # Check if the cart already exists
-            cart = Cart.objects.get(
-                order_form_id=order_form_id,
-                project=self.project,
-                phone_number=phone,
-                status="created",
-            )
-            logger.info(
-                f"[CART_USECASE] Existing cart found, renewing task: {log_context} "
-                f"cart_uuid={cart.uuid} action=renew_abandonment_task"
-            )
-            # Renew abandonment task
-            self._schedule_abandonment_task(str(cart.uuid))
-            return cart
-        except Cart.DoesNotExist:
             logger.info(
                 f"[CART_USECASE] No existing cart, creating new: {log_context} "
                 f"action=create_new_cart"
             )
             # Create new cart if it doesn't exist
             return self._create_cart(order_form_id, phone, name)
+        except ValidationError:
+            raise
         except Exception as e:
             logger.error(
                 f"[CART_USECASE] Unexpected error processing cart: {log_context} "
@@ -186,9 +150,39 @@ class CartUseCase(BaseAgentWebhookUseCase):
                 exc_info=True,
             )
             raise
-        finally:
-            # Release the lock
-            redis.delete(lock_key)
+
+    def _find_open_cart(self, order_form_id: str, phone: str) -> Optional[Cart]:
+        """
+        Return the cart still open (``created``) for this order form and phone.
+        """
+        return Cart.objects.filter(
+            order_form_id=order_form_id,
+            project=self.project,
+            phone_number=phone,
+            status="created",
+        ).first()
+
+    def _insert_cart(
+        self, order_form_id: str, phone: str, name: str, **integration
+    ) -> Tuple[Cart, bool]:
+        """
+        Insert the open cart, or return the one a concurrent event inserted.
+
+        The partial unique constraint ``vtex_cart_unique_open_cart`` makes the
+        insert itself the arbiter: ``get_or_create`` runs it in a savepoint and,
+        on ``IntegrityError``, returns the winner's row. No lock or retry wait
+        is needed.
+
+        Returns:
+            Tuple[Cart, bool]: The cart and whether this call created it.
+        """
+        return Cart.objects.get_or_create(
+            order_form_id=order_form_id,
+            project=self.project,
+            phone_number=phone,
+            status="created",
+            defaults={"config": {"client_name": name}, **integration},
+        )
 
     def _create_service_context(
         self, entity_type: str, entity_uuid: str, config: Dict[str, Any]
@@ -315,14 +309,17 @@ class CartUseCase(BaseAgentWebhookUseCase):
             self.integrated_agent.config,
         )
 
-        cart = Cart.objects.create(
-            order_form_id=order_form_id,
-            status="created",
-            project=self.project,
-            integrated_agent=self.integrated_agent,
-            phone_number=phone,
-            config={"client_name": name},
+        cart, created = self._insert_cart(
+            order_form_id, phone, name, integrated_agent=self.integrated_agent
         )
+        if not created:
+            # A concurrent event for the same cart won the insert and
+            # scheduled the abandonment task already.
+            logger.info(
+                f"[CART_USECASE] Cart created by concurrent event: {log_context} "
+                f"cart_uuid={cart.uuid}"
+            )
+            return cart
 
         logger.info(
             f"[CART_USECASE] Cart created with agent: {log_context} "
@@ -369,14 +366,17 @@ class CartUseCase(BaseAgentWebhookUseCase):
             self.integrated_feature.config,
         )
 
-        cart = Cart.objects.create(
-            order_form_id=order_form_id,
-            status="created",
-            project=self.project,
-            integrated_feature=self.integrated_feature,
-            phone_number=phone,
-            config={"client_name": name},
+        cart, created = self._insert_cart(
+            order_form_id, phone, name, integrated_feature=self.integrated_feature
         )
+        if not created:
+            # A concurrent event for the same cart won the insert and
+            # scheduled the abandonment task already.
+            logger.info(
+                f"[CART_USECASE] Cart created by concurrent event: {log_context} "
+                f"cart_uuid={cart.uuid}"
+            )
+            return cart
 
         logger.info(
             f"[CART_USECASE] Cart created with feature: {log_context} "